@@ -33,7 +33,10 @@ SET row_security = off;
 
 SET default_table_access_method = heap;
 
+CREATE EXTENSION IF NOT EXISTS pg_trgm WITH SCHEMA public;
 
+
+DROP TABLE IF EXISTS public.outbox_message;
 DROP TABLE IF EXISTS public.serialized_part;
 DROP TABLE IF EXISTS public.jis_part;
 DROP TABLE IF EXISTS public.batch_business_partner;
@@ -125,7 +128,8 @@ CREATE TABLE public.twin (
     created_date timestamp without time zone DEFAULT (now() AT TIME ZONE 'utc'::text) NOT NULL,
     modified_date timestamp without time zone DEFAULT (now() AT TIME ZONE 'utc'::text) NOT NULL,
     asset_class character varying,
-    additional_context character varying
+    additional_context character varying,
+    status smallint DEFAULT 0 NOT NULL
 );
 
 CREATE TABLE public.twin_aspect (
@@ -170,7 +174,23 @@ CREATE TABLE public.serialized_part (
     partner_catalog_part_id integer NOT NULL,
     part_instance_id character varying NOT NULL,
     van character varying,
-    twin_id integer
+    twin_id integer,
+    created_date timestamp without time zone DEFAULT (now() AT TIME ZONE 'utc'::text) NOT NULL
+);
+
+CREATE TABLE public.outbox_message (
+    id integer NOT NULL,
+    idempotency_key character varying NOT NULL,
+    operation character varying NOT NULL,
+    payload json NOT NULL,
+    status smallint DEFAULT 0 NOT NULL,
+    attempts integer DEFAULT 0 NOT NULL,
+    claim_token integer DEFAULT 0 NOT NULL,
+    rerun boolean DEFAULT false NOT NULL,
+    next_attempt_date timestamp without time zone DEFAULT (now() AT TIME ZONE 'utc'::text) NOT NULL,
+    last_error character varying,
+    created_date timestamp without time zone DEFAULT (now() AT TIME ZONE 'utc'::text) NOT NULL,
+    modified_date timestamp without time zone DEFAULT (now() AT TIME ZONE 'utc'::text) NOT NULL
 );
 
 ALTER TABLE public.batch ALTER COLUMN id ADD GENERATED ALWAYS AS IDENTITY (
@@ -241,6 +261,16 @@ ALTER TABLE public.legal_entity ALTER COLUMN id ADD GENERATED ALWAYS AS IDENTITY
 );
 
 
+ALTER TABLE public.outbox_message ALTER COLUMN id ADD GENERATED ALWAYS AS IDENTITY (
+    SEQUENCE NAME public.outbox_message_id_seq
+    START WITH 1
+    INCREMENT BY 1
+    NO MINVALUE
+    NO MAXVALUE
+    CACHE 1
+);
+
+
 ALTER TABLE public.partner_catalog_part ALTER COLUMN id ADD GENERATED ALWAYS AS IDENTITY (
     SEQUENCE NAME public.part_share_id_seq
     START WITH 1
@@ -309,6 +339,9 @@ ALTER TABLE ONLY public.jis_part
 ALTER TABLE ONLY public.legal_entity
     ADD CONSTRAINT pk_legal_entity PRIMARY KEY (id);
 
+ALTER TABLE ONLY public.outbox_message
+    ADD CONSTRAINT pk_outbox_message PRIMARY KEY (id);
+
 ALTER TABLE ONLY public.partner_catalog_part
     ADD CONSTRAINT pk_partner_catalog_part PRIMARY KEY (id);
 
@@ -360,6 +393,9 @@ ALTER TABLE ONLY public.jis_part
 ALTER TABLE ONLY public.legal_entity
     ADD CONSTRAINT uk_legal_entity_bpnl UNIQUE (bpnl);
 
+ALTER TABLE ONLY public.outbox_message
+    ADD CONSTRAINT uk_outbox_message_idempotency_key UNIQUE (idempotency_key);
+
 ALTER TABLE ONLY public.partner_catalog_part
     ADD CONSTRAINT uk_partner_catalog_part_business_partner_id_catalog_part_id UNIQUE (business_partner_id, catalog_part_id);
 
@@ -387,6 +423,11 @@ CREATE INDEX idx_business_partner_name ON public.business_partner USING btree (n
 
 CREATE INDEX idx_catalog_part_legal_entitiy_id ON public.catalog_part USING btree (legal_entity_id);
 CREATE INDEX idx_catalog_part_manufacturer_part_id ON public.catalog_part USING btree (manufacturer_part_id) WITH (deduplicate_items='true');
+CREATE INDEX idx_catalog_part_name_lower ON public.catalog_part USING btree (lower((name)::text) COLLATE "C");
+CREATE INDEX idx_catalog_part_manufacturer_part_id_lower ON public.catalog_part USING btree (lower((manufacturer_part_id)::text) COLLATE "C");
+CREATE INDEX idx_catalog_part_name_trgm ON public.catalog_part USING gin (name public.gin_trgm_ops);
+CREATE INDEX idx_catalog_part_description_trgm ON public.catalog_part USING gin (description public.gin_trgm_ops);
+CREATE INDEX idx_catalog_part_manufacturer_part_id_trgm ON public.catalog_part USING gin (manufacturer_part_id public.gin_trgm_ops);
 
 CREATE INDEX idx_enablement_service_stack_legal_entity_id ON public.enablement_service_stack USING btree (legal_entity_id);
 
@@ -397,13 +438,23 @@ CREATE INDEX idx_jis_part_partner_catalog_part_id ON public.jis_part USING btree
 
 CREATE INDEX idx_legal_entity_bpnl ON public.legal_entity USING btree (bpnl) WITH (deduplicate_items='true');
 
+CREATE INDEX idx_outbox_message_status_next_attempt_date ON public.outbox_message USING btree (status, next_attempt_date);
+
 CREATE INDEX idx_partner_catalog_part_business_partner_id ON public.partner_catalog_part USING btree (business_partner_id);
 CREATE INDEX idx_partner_catalog_part_catalog_part_id ON public.partner_catalog_part USING btree (catalog_part_id);
 CREATE INDEX idx_partner_catalog_part_customer_part_id ON public.partner_catalog_part USING btree (customer_part_id) WITH (deduplicate_items='true');
+CREATE INDEX idx_partner_catalog_part_customer_part_id_lower ON public.partner_catalog_part USING btree (lower((customer_part_id)::text) COLLATE "C");
+CREATE INDEX idx_partner_catalog_part_customer_part_id_trgm ON public.partner_catalog_part USING gin (customer_part_id public.gin_trgm_ops);
 
 CREATE INDEX idx_serialized_part_part_instance_id ON public.serialized_part USING btree (part_instance_id) WITH (deduplicate_items='true');
 CREATE INDEX idx_serialized_part_partner_catalog_part_id ON public.serialized_part USING btree (partner_catalog_part_id);
 CREATE INDEX idx_serialized_part_van ON public.serialized_part USING btree (van) WITH (deduplicate_items='true');
+CREATE INDEX idx_serialized_part_created_date_id ON public.serialized_part USING btree (created_date, id);
+CREATE INDEX idx_serialized_part_partner_catalog_part_id_van ON public.serialized_part USING btree (partner_catalog_part_id, van) WHERE (van IS NOT NULL);
+CREATE INDEX idx_serialized_part_part_instance_id_lower ON public.serialized_part USING btree (lower((part_instance_id)::text) COLLATE "C");
+CREATE INDEX idx_serialized_part_van_lower ON public.serialized_part USING btree (lower((van)::text) COLLATE "C");
+CREATE INDEX idx_serialized_part_part_instance_id_trgm ON public.serialized_part USING gin (part_instance_id public.gin_trgm_ops);
+CREATE INDEX idx_serialized_part_van_trgm ON public.serialized_part USING gin (van public.gin_trgm_ops);
 
 CREATE INDEX idx_twin_aspect_registration_created_date ON public.twin_aspect_registration USING btree (created_date) WITH (deduplicate_items='true');
 CREATE INDEX idx_twin_aspect_registration_modified_date ON public.twin_aspect_registration USING btree (modified_date) WITH (deduplicate_items='true');
@@ -415,11 +466,14 @@ CREATE INDEX idx_twin_aspect_twin_id ON public.twin_aspect USING btree (twin_id)
 
 CREATE INDEX idx_twin_created_date ON public.twin USING btree (created_date) WITH (deduplicate_items='true');
 CREATE INDEX idx_twin_modified_date ON public.twin USING btree (modified_date) WITH (deduplicate_items='true');
+CREATE INDEX idx_twin_created_date_id ON public.twin USING btree (created_date, id);
+CREATE INDEX idx_twin_status ON public.twin USING btree (status);
 
 CREATE INDEX idx_twin_exchange_data_exchange_agreement_id ON public.twin_exchange USING btree (data_exchange_agreement_id);
 CREATE INDEX idx_twin_exchange_twin_id ON public.twin_exchange USING btree (twin_id);
 
 CREATE INDEX idx_twin_registration_dtr_registered ON public.twin_registration USING btree (dtr_registered);
+CREATE INDEX idx_twin_registration_twin_id_dtr_registered ON public.twin_registration USING btree (twin_id, dtr_registered);
 
 
 ALTER TABLE ONLY public.batch
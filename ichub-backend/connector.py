@@ -29,7 +29,7 @@ from managers.enablement_services.provider import ConnectorProviderManager
 from managers.config.config_manager import ConfigManager
 from tractusx_sdk.dataspace.managers import OAuth2Manager
 
-from managers.enablement_services.consumer import ConsumerConnectorSyncPostgresMemoryManager
+from managers.enablement_services.consumer import ConsumerConnectorSyncPostgresMemoryManager, PostgresCacheInvalidationChannel
 import logging
 
 logger = logging.getLogger("connector")
@@ -48,6 +48,7 @@ connector_consumer_manager:ConsumerConnectorSyncPostgresMemoryManager = None
 connector_discovery_service:ConnectorDiscoveryService = None
 discovery_finder_service:DiscoveryFinderService = None
 discovery_oauth:OAuth2Manager = None
+consumer_cache_invalidation:PostgresCacheInvalidationChannel = None
 database_error:bool = False
 
 try:
@@ -166,6 +167,16 @@ try:
     )
 
 
+    # Share the consumer cache changes between the uvicorn workers
+    if ConfigManager.get_config("consumer.cache_invalidation.enabled", True):
+        consumer_cache_invalidation = PostgresCacheInvalidationChannel(
+            engine=engine,
+            channel=ConfigManager.get_config("consumer.cache_invalidation.channel", "ichub_consumer_cache"),
+            logger=logger,
+            verbose=True
+        )
+        consumer_cache_invalidation.start()
+
     # Create the consumer manager
     connector_consumer_manager = ConsumerConnectorSyncPostgresMemoryManager(
         connector_consumer_service=consumer_connector_service,
@@ -173,7 +184,10 @@ try:
         connector_discovery=connector_discovery_service,
         expiration_time=60,  # 60 minutes cache expiration
         logger=logger,
-        verbose=True
+        verbose=True,
+        stale_while_revalidate=ConfigManager.get_config("consumer.discovery.stale_while_revalidate", False),
+        invalidation_channel=consumer_cache_invalidation,
+        full_reload_interval=ConfigManager.get_config("consumer.cache_invalidation.full_reload_interval", 300)
     )
 
     # Create the main connector manager
@@ -26,11 +26,18 @@ from fastapi import FastAPI, Request, APIRouter
 from fastapi.responses import JSONResponse
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
+from contextlib import asynccontextmanager
+import asyncio
 import os
 
 from tools.exceptions import BaseError, ValidationError
-from tools.constants import API_V1
+from tools.constants import API_V1, NEXT_CURSOR_HEADER
 from managers.config.config_manager import ConfigManager
+from utils.thread_pools import ThreadPools, DEFAULT_POOL
+from jobs.outbox_worker import OutboxWorker
+from managers.metadata_database.manager import RepositoryManagerFactory
+from database import engine, get_async_engine, dispose_async_engine, replica_router
+from models.metadata_database.provider.models import OutboxMessageStatus
 
 from tractusx_sdk.dataspace.tools import op
 
@@ -77,7 +84,33 @@ tags_metadata = [
     }
 ]
 
-app = FastAPI(title="Industry Core Hub Backend API", version="0.0.1", openapi_tags=tags_metadata)
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Starts the named thread pools on the event loop served by uvicorn
+    and installs the default pool as the default executor of the loop.
+    Starts the outbox worker applying the DTR, EDC and submodel service calls, if enabled.
+    Starts checking the lag of the read replicas, if configured.
+    Closes the connections of the async engine on shutdown.
+    """
+    ThreadPools.start(ConfigManager.get_config("server.workers", {}))
+    asyncio.get_running_loop().set_default_executor(ThreadPools.get(DEFAULT_POOL))
+    replica_router.start()
+    outbox_worker = None
+    outbox_config = ConfigManager.get_config("provider.outbox", {})
+    if outbox_config.get("enabled", False):
+        outbox_worker = OutboxWorker.from_config(twin_management.twin_management_service.outbox_handlers(), outbox_config)
+        outbox_worker.start()
+    try:
+        yield
+    finally:
+        if outbox_worker:
+            outbox_worker.stop()
+        replica_router.stop()
+        await dispose_async_engine()
+        ThreadPools.shutdown(wait=False)
+
+app = FastAPI(title="Industry Core Hub Backend API", version="0.0.1", openapi_tags=tags_metadata, lifespan=lifespan)
 
 # Configure CORS middleware based on environment and configuration
 def get_cors_origins():
@@ -136,6 +169,8 @@ if cors_enabled:
         allow_credentials=True,
         allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS", "PATCH"],
         allow_headers=["*"],
+        # Let the frontend read the cursor of the next page
+        expose_headers=[NEXT_CURSOR_HEADER],
     )
 
 ## Include here all the routers for the application.
@@ -180,3 +215,58 @@ def check_health():
         "status": "RUNNING",
         "timestamp": op.timestamp() 
     }
+
+@app.get("/health/thread-pools")
+def check_thread_pools():
+    """
+    Retrieves the usage of the thread pools running the blocking calls
+
+    Returns:
+        response: :obj:`size, active and queued tasks and saturation per pool`
+    """
+    return {
+        "pools": ThreadPools.stats(),
+        "timestamp": op.timestamp()
+    }
+
+@app.get("/health/database-pool")
+def check_database_pool():
+    """
+    Retrieves the usage of the database connection pools, of the sync engine and of the async engine
+
+    Returns:
+        response: :obj:`size, checked out and overflow connections and the time waited for a connection`
+    """
+    return {
+        "pool": engine.pool.stats(),
+        "asyncPool": get_async_engine().pool.stats(),
+        "timestamp": op.timestamp()
+    }
+
+@app.get("/health/database-replicas")
+def check_database_replicas():
+    """
+    Retrieves the routing of the read-only queries to the read replicas
+
+    Returns:
+        response: :obj:`lag and reads per replica, and the reads sent to the primary per reason`
+    """
+    return {
+        "routing": replica_router.stats(),
+        "timestamp": op.timestamp()
+    }
+
+@app.get("/health/outbox")
+def check_outbox():
+    """
+    Retrieves the number of outbox messages per status
+
+    Returns:
+        response: :obj:`pending, processing, done and failed messages`
+    """
+    with RepositoryManagerFactory.create() as repo:
+        counts = repo.outbox_message_repository.count_by_status()
+    return {
+        "messages": {status.name.lower(): counts.get(status, 0) for status in OutboxMessageStatus},
+        "timestamp": op.timestamp()
+    }
@@ -25,6 +25,8 @@ from connector import connector_consumer_manager
 
 from fastapi.responses import Response
 from tractusx_sdk.dataspace.tools.http_tools import HttpTools
+from utils.async_utils import run_in_pool
+from utils.thread_pools import HTTP_POOL
 #from services.consumer import ConnectionService
 from models.services.consumer.connection_management import (
     DoGetParams,
@@ -110,7 +112,10 @@ async def forget_connection(
 @router.post("/data/get")
 async def data_get(get_request: DoGetParams) -> Response:
     ## Check if the api key is present and if it is authenticated
-    return HttpTools.proxy(connector_consumer_manager.connector_service.do_get(
+    # The negotiation and the data request run in the thread pool to keep the event loop free
+    response = await run_in_pool(
+        HTTP_POOL,
+        connector_consumer_manager.connector_service.do_get,
         counter_party_id=get_request.counter_party_id,
         counter_party_address=get_request.counter_party_address,
         filter_expression=get_request.filter_expression,
@@ -121,12 +126,16 @@ async def data_get(get_request: DoGetParams) -> Response:
         timeout=get_request.timeout,
         allow_redirects=get_request.allow_redirects,
         headers=get_request.headers
-    ))
+    )
+    return HttpTools.proxy(response)
 
 @router.post("/data/post")
 async def data_post(post_request: DoPostParams) -> Response:
     ## Check if the api key is present and if it is authenticated
-    return HttpTools.proxy(connector_consumer_manager.connector_service.do_post(
+    # The negotiation and the data request run in the thread pool to keep the event loop free
+    response = await run_in_pool(
+        HTTP_POOL,
+        connector_consumer_manager.connector_service.do_post,
         counter_party_id=post_request.counter_party_id,
         counter_party_address=post_request.counter_party_address,
         filter_expression=post_request.filter_expression,
@@ -138,5 +147,6 @@ async def data_post(post_request: DoPostParams) -> Response:
         headers=post_request.headers,
         body=post_request.body,
         content_type=post_request.content_type
-    ))
+    )
+    return HttpTools.proxy(response)
 
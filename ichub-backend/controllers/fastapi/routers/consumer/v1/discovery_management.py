@@ -44,15 +44,15 @@ router = APIRouter(
 )
 #connection_service = ConnectionService()
 
-from dtr import dtr_manager  # Use the original manager
+from dtr import async_dtr_consumer  # Runs the blocking manager calls in the thread pool
 
 
 
 @router.post("/registries")
 async def discover_registries(request: DiscoverRegistriesRequest) -> Response:
     ## Check if the api key is present and if it is authenticated
-    # Clean, simple async call - no manual thread pool management needed!
-    result = dtr_manager.consumer.get_dtrs(request.counter_party_id)
+    # Offloaded to the thread pool, the DSP negotiations must not block the event loop
+    result = await async_dtr_consumer.get_dtrs(request.counter_party_id)
     return result
 
 @router.post("/shells")
@@ -76,8 +76,8 @@ async def discover_shells(search_request: DiscoverShellsRequest) -> Response:
         for spec in search_request.query_spec
     ]
     
-    # Clean, simple async call - no manual thread pool management needed!
-    result = dtr_manager.consumer.discover_shells(
+    # Offloaded to the thread pool, the DSP negotiations must not block the event loop
+    result = await async_dtr_consumer.discover_shells(
         counter_party_id=search_request.counter_party_id,
         query_spec=query_spec_dict,
         dtr_policies=search_request.dtr_policies,
@@ -108,8 +108,8 @@ async def discover_shell(search_request: DiscoverShellRequest) -> Response:
         Response containing discovered shells and metadata
     """
     
-    # Clean, simple async call - no manual thread pool management needed!
-    result = dtr_manager.consumer.discover_shell(
+    # Offloaded to the thread pool, the DSP negotiations must not block the event loop
+    result = await async_dtr_consumer.discover_shell(
         counter_party_id=search_request.counter_party_id,
         id=search_request.id,
         dtr_policies=search_request.dtr_policies
@@ -191,8 +191,8 @@ async def discover_submodels(search_request: DiscoverSubmodelsDataRequest) -> Re
     }
     """
     
-    # Clean, simple async call - no manual thread pool management needed!
-    result = dtr_manager.consumer.discover_submodels(
+    # Offloaded to the thread pool, the DSP negotiations must not block the event loop
+    result = await async_dtr_consumer.discover_submodels(
         counter_party_id=search_request.counter_party_id,
         id=search_request.id,
         dtr_policies=search_request.dtr_policies,
@@ -257,8 +257,8 @@ async def discover_submodel(search_request: DiscoverSubmodelDataRequest) -> Resp
         )
     
     try:
-        # Clean, simple async call - no manual thread pool management needed!
-        result = dtr_manager.consumer.discover_submodel(
+        # Offloaded to the thread pool, the DSP negotiations must not block the event loop
+        result = await async_dtr_consumer.discover_submodel(
             counter_party_id=search_request.counter_party_id,
             id=search_request.id,
             dtr_policies=search_request.dtr_policies,
@@ -386,12 +386,13 @@ async def discover_submodels_by_semantic_id(search_request: DiscoverSubmodelSema
         )
     
     try:
-        # Clean, simple async call - no manual thread pool management needed!
-        result = dtr_manager.consumer.discover_submodel_by_semantic_ids(
+        # Offloaded to the thread pool, the DSP negotiations must not block the event loop
+        result = await async_dtr_consumer.discover_submodel_by_semantic_ids(
             counter_party_id=search_request.counter_party_id,
             id=search_request.id,
             dtr_policies=search_request.dtr_policies,
-            semantic_id_policies=normalized_semantic_ids
+            governance=search_request.governance,
+            semantic_ids=normalized_semantic_ids
         )
         
         # Return the response as JSON
@@ -20,23 +20,38 @@
 # SPDX-License-Identifier: Apache-2.0
 #################################################################################
 
-from fastapi import APIRouter, Query, Depends
+from fastapi import APIRouter, Query, Depends, Header, Request, Response
 from typing import List, Optional
 
 from services.provider.part_management_service import PartManagementService
 from models.services.provider.part_management import (
+    CatalogPartBatchRead,
     CatalogPartCreate,
     CatalogPartDetailsReadWithStatus,
-    CatalogPartReadWithStatus,
+    CatalogPartField,
+    CatalogPartListRead,
+    CatalogPartListQuery,
     CatalogPartUpdate,
     PartnerCatalogPartCreate,
     PartnerCatalogPartRead,
+    PartSearchResult,
+    PartSearchResultType,
     SerializedPartCreate,
+    SerializedPartImportRead,
     SerializedPartQuery,
     SerializedPartRead,
     SerializedPartUpdate,
+    SharingStatus,
 )
 from tools.exceptions import exception_responses
+from tools.constants import (
+    DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, NEXT_CURSOR_HEADER,
+    DEFAULT_SEARCH_PAGE_SIZE, MAX_SEARCH_PAGE_SIZE, MAX_SEARCH_OFFSET, MIN_SEARCH_LENGTH,
+    CSV_CONTENT_TYPE, JSON_CONTENT_TYPE, NDJSON_CONTENT_TYPE
+)
+from utils.async_utils import AsyncManagerWrapper
+from utils.thread_pools import DATABASE_POOL
+from managers.metadata_database.manager import RepositoryManagerFactory
 from fastapi.responses import JSONResponse
 from controllers.fastapi.routers.authentication.auth_api import get_authentication_dependency
 
@@ -47,53 +62,112 @@ router = APIRouter(
 )
 part_management_service = PartManagementService()
 
+# Create universal async wrapper - works with any service!
+async_part_service = AsyncManagerWrapper(part_management_service, "PartManagement", pool=DATABASE_POOL, scope=RepositoryManagerFactory.session_scope)
+
 
 @router.get("/catalog-part/{manufacturer_id}/{manufacturer_part_id}", response_model=CatalogPartDetailsReadWithStatus, responses=exception_responses)
 async def part_management_get_catalog_part_details(manufacturer_id: str, manufacturer_part_id: str) -> Optional[CatalogPartDetailsReadWithStatus]:
-    return part_management_service.get_catalog_part_details(manufacturer_id, manufacturer_part_id)
+    return await async_part_service.get_catalog_part_details(manufacturer_id, manufacturer_part_id)
 
-@router.get("/catalog-part", response_model=List[CatalogPartReadWithStatus], responses=exception_responses)
-async def part_management_get_catalog_parts() -> List[CatalogPartReadWithStatus]:
-    return part_management_service.get_catalog_parts()
+@router.get("/catalog-part", response_model=List[CatalogPartListRead], response_model_exclude_unset=True, responses=exception_responses)
+async def part_management_get_catalog_parts(
+    manufacturer_id: Optional[str] = Query(None, alias="manufacturerId", description="Only return the catalog parts of this manufacturer (BPNL)."),
+    manufacturer_part_id: Optional[str] = Query(None, alias="manufacturerPartId", description="Only return the catalog parts with this manufacturer part ID."),
+    category: Optional[str] = Query(None, description="Only return the catalog parts of this category."),
+    status: Optional[SharingStatus] = Query(None, description="Only return the catalog parts with this status."),
+    prefix: Optional[str] = Query(None, description="Only return the catalog parts whose name or manufacturer part ID starts with this text, ignoring case."),
+    sort: Optional[List[str]] = Query(None, description=f"Sort keys, applied in the given order, '-' in front of a key sorts in descending order. Keys: {', '.join(field.value for field in CatalogPartField)}."),
+    fields: Optional[List[str]] = Query(None, description="Fields returned for each catalog part, all of them by default.")
+) -> List[CatalogPartListRead]:
+    query = CatalogPartListQuery(manufacturerId=manufacturer_id, manufacturerPartId=manufacturer_part_id, category=category, status=status, prefix=prefix)
+    # Read natively on the async engine, without a database pool thread
+    return await part_management_service.get_catalog_part_list_async(query, fields=fields, sort=sort)
 
 @router.post("/catalog-part", response_model=CatalogPartDetailsReadWithStatus, responses=exception_responses)
 async def part_management_create_catalog_part(catalog_part_create: CatalogPartCreate) -> CatalogPartDetailsReadWithStatus:
-    return part_management_service.create_catalog_part(catalog_part_create)
+    return await async_part_service.create_catalog_part(catalog_part_create)
+
+@router.post("/catalog-part/batch", response_model=CatalogPartBatchRead, responses=exception_responses)
+async def part_management_upsert_catalog_parts(catalog_parts: List[CatalogPartCreate]) -> CatalogPartBatchRead:
+    return await async_part_service.upsert_catalog_parts(catalog_parts)
 
 @router.post("/catalog-part/create-partner-mapping", response_model=PartnerCatalogPartRead, responses=exception_responses)
 async def part_management_create_partner_mapping(partner_catalog_part_create: PartnerCatalogPartCreate) -> PartnerCatalogPartRead:
-    return part_management_service.create_partner_catalog_part_mapping(partner_catalog_part_create)
+    return await async_part_service.create_partner_catalog_part_mapping(partner_catalog_part_create)
 
 @router.put("/catalog-part/{manufacturer_id}/{manufacturer_part_id}", response_model=CatalogPartDetailsReadWithStatus, responses=exception_responses)
 async def part_management_update_catalog_part(manufacturer_id: str, manufacturer_part_id: str, catalog_part_update: CatalogPartUpdate) -> CatalogPartDetailsReadWithStatus:
-    return part_management_service.update_catalog_part(manufacturer_id, manufacturer_part_id, catalog_part_update)
+    return await async_part_service.update_catalog_part(manufacturer_id, manufacturer_part_id, catalog_part_update)
 
 @router.delete("/catalog-part/{manufacturer_id}/{manufacturer_part_id}", responses=exception_responses)
 async def part_management_delete_catalog_part(manufacturer_id: str, manufacturer_part_id: str) -> JSONResponse:
-    if part_management_service.delete_catalog_part(manufacturer_id, manufacturer_part_id):
+    if await async_part_service.delete_catalog_part(manufacturer_id, manufacturer_part_id):
         return JSONResponse(status_code=204, content={"description":"Deleted catalog part successfully"})
     else:
         return JSONResponse(status_code=404, content={"description":"Catalog part not found"})
 
+@router.get("/search", response_model=List[PartSearchResult], responses=exception_responses)
+async def part_management_search_parts(
+    q: str = Query(..., min_length=MIN_SEARCH_LENGTH, description="The searched text, matched against the start of, within or similar to the names, descriptions, manufacturer, customer and part instance IDs and VANs of the parts."),
+    type: Optional[PartSearchResultType] = Query(None, description="Only search the parts of this kind."),
+    limit: int = Query(DEFAULT_SEARCH_PAGE_SIZE, ge=1, le=MAX_SEARCH_PAGE_SIZE, description="Maximum number of results returned in one page."),
+    offset: int = Query(0, ge=0, le=MAX_SEARCH_OFFSET, description="Number of better ranked results to skip.")
+) -> List[PartSearchResult]:
+    return await async_part_service.search_parts(q, limit=limit, offset=offset, part_type=type)
+
 @router.get("/serialized-part", response_model=List[SerializedPartRead], responses=exception_responses)
-async def part_management_get_serialized_parts() -> List[SerializedPartRead]:
-    return part_management_service.get_serialized_parts()
+async def part_management_get_serialized_parts(
+    response: Response,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE, description="Maximum number of serialized parts returned in one page."),
+    cursor: Optional[str] = Query(None, description=f"Cursor of the page to return, taken from the {NEXT_CURSOR_HEADER} header of the previous page."),
+    status: Optional[SharingStatus] = Query(None, description="Only return the serialized parts with this status.")
+) -> List[SerializedPartRead]:
+    # Read natively on the async engine, without a database pool thread
+    serialized_parts, next_cursor = await part_management_service.get_serialized_parts_page_async(limit=limit, cursor=cursor, status=status)
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    return serialized_parts
 
 @router.post("/serialized-part/query", response_model=List[SerializedPartRead], responses=exception_responses)
 async def part_management_query_serialized_parts(query: SerializedPartQuery) -> List[SerializedPartRead]:
-    return part_management_service.get_serialized_parts(query)
+    return await async_part_service.get_serialized_parts(query)
 
 @router.post("/serialized-part", response_model=SerializedPartRead, responses=exception_responses)
 async def part_management_create_serialized_part(serialized_part_create: SerializedPartCreate,  auto_generate_catalog_part: bool = Query(False, alias="autoGenerateCatalogPart", description="Automatically create the catalog part for this serialized part"), auto_generate_partner_part: bool = Query(True, alias="autoGeneratePartnerPart", description="Automatically create a catalog partner part")) -> SerializedPartRead:
-    return part_management_service.create_serialized_part(serialized_part_create, auto_generate_catalog_part=auto_generate_catalog_part, auto_generate_partner_part=auto_generate_partner_part)
+    return await async_part_service.create_serialized_part(serialized_part_create, auto_generate_catalog_part=auto_generate_catalog_part, auto_generate_partner_part=auto_generate_partner_part)
+
+async def _read_body(request: Request) -> bytes:
+    return await request.body()
+
+@router.post("/serialized-part/import", response_model=SerializedPartImportRead, responses=exception_responses, openapi_extra={
+    "requestBody": {
+        "required": True,
+        "description": "The serialized parts to create, with the fields of POST /serialized-part. CSV documents use the field names as header row.",
+        "content": {
+            JSON_CONTENT_TYPE: {"schema": {"type": "array", "items": {"$ref": "#/components/schemas/SerializedPartCreate"}}},
+            NDJSON_CONTENT_TYPE: {"schema": {"type": "string"}},
+            CSV_CONTENT_TYPE: {"schema": {"type": "string"}},
+        }
+    }
+})
+async def part_management_import_serialized_parts(
+    content: bytes = Depends(_read_body),
+    content_type: Optional[str] = Header(None),
+    auto_generate_catalog_part: bool = Query(False, alias="autoGenerateCatalogPart", description="Automatically create the missing catalog parts"),
+    auto_generate_partner_part: bool = Query(True, alias="autoGeneratePartnerPart", description="Automatically create the missing catalog partner parts")
+) -> SerializedPartImportRead:
+    return await async_part_service.import_serialized_parts(
+        content, content_type, auto_generate_catalog_part=auto_generate_catalog_part, auto_generate_partner_part=auto_generate_partner_part
+    )
 
 @router.put("/serialized-part/{partner_catalog_part_id}/{part_instance_id}", response_model=SerializedPartRead, responses=exception_responses)
 async def part_management_update_serialized_part(partner_catalog_part_id: int, part_instance_id: str, serialized_part_update: SerializedPartUpdate) -> SerializedPartRead:
-    return part_management_service.update_serialized_part(partner_catalog_part_id, part_instance_id, serialized_part_update)
+    return await async_part_service.update_serialized_part(partner_catalog_part_id, part_instance_id, serialized_part_update)
 
 @router.delete("/serialized-part/{partner_catalog_part_id}/{part_instance_id}", responses=exception_responses)
 async def part_management_delete_serialized_part(partner_catalog_part_id: int, part_instance_id: str) -> JSONResponse:
-    if part_management_service.delete_serialized_part(partner_catalog_part_id, part_instance_id):
+    if await async_part_service.delete_serialized_part(partner_catalog_part_id, part_instance_id):
         return JSONResponse(status_code=204, content={"description":"Deleted serialized part successfully"})
     else:
         return JSONResponse(status_code=404, content={"description":"Serialized part not found"})
@@ -27,6 +27,8 @@ from services.provider.partner_management_service import PartnerManagementServic
 from models.services.provider.partner_management import BusinessPartnerRead, BusinessPartnerCreate, DataExchangeAgreementRead
 from tools.exceptions import exception_responses
 from utils.async_utils import AsyncManagerWrapper
+from utils.thread_pools import DATABASE_POOL
+from managers.metadata_database.manager import RepositoryManagerFactory
 from controllers.fastapi.routers.authentication.auth_api import get_authentication_dependency
 
 router = APIRouter(
@@ -37,7 +39,7 @@ router = APIRouter(
 partner_management_service = PartnerManagementService()
 
 # Create universal async wrapper - works with any service/manager!
-async_partner_service = AsyncManagerWrapper(partner_management_service, "PartnerManagement")
+async_partner_service = AsyncManagerWrapper(partner_management_service, "PartnerManagement", pool=DATABASE_POOL, scope=RepositoryManagerFactory.session_scope)
 
 @router.get("/business-partner", response_model=List[BusinessPartnerRead], responses=exception_responses)
 async def partner_management_get_business_partners() -> List[BusinessPartnerRead]:
@@ -28,6 +28,9 @@ from models.services.provider.sharing_management import (
     ShareCatalogPart,
 )
 from tools.exceptions import exception_responses
+from utils.async_utils import AsyncManagerWrapper
+from utils.thread_pools import DATABASE_POOL
+from managers.metadata_database.manager import RepositoryManagerFactory
 from controllers.fastapi.routers.authentication.auth_api import get_authentication_dependency
 
 router = APIRouter(
@@ -37,8 +40,11 @@ router = APIRouter(
 )
 part_sharing_service = SharingService()
 
+# Create universal async wrapper - works with any service!
+async_sharing_service = AsyncManagerWrapper(part_sharing_service, "Sharing", pool=DATABASE_POOL, scope=RepositoryManagerFactory.session_scope)
+
 @router.post("/catalog-part", response_model=SharedPartBase, responses=exception_responses)
 async def share_catalog_part(catalog_part_to_share: ShareCatalogPart) -> SharedPartBase:
-    return part_sharing_service.share_catalog_part(
+    return await async_sharing_service.share_catalog_part(
         catalog_part_to_share=catalog_part_to_share
     )
\ No newline at end of file
@@ -27,6 +27,8 @@ from uuid import UUID
 from services.provider.submodel_dispatcher_service import SubmodelDispatcherService
 from managers.config.config_manager import ConfigManager
 from tools.exceptions import exception_responses
+from utils.async_utils import AsyncManagerWrapper
+from utils.thread_pools import FILE_IO_POOL
 from controllers.fastapi.routers.authentication.auth_api import get_authentication_dependency
 
 path_submodel_dispatcher = ConfigManager.get_config("provider.submodel_dispatcher.apiPath", default="/submodel-dispatcher")
@@ -37,6 +39,9 @@ router = APIRouter(
 )
 submodel_dispatcher_service = SubmodelDispatcherService()
 
+# Create universal async wrapper - the submodel files are read from and written to the filesystem
+async_submodel_dispatcher_service = AsyncManagerWrapper(submodel_dispatcher_service, "SubmodelDispatcher", pool=FILE_IO_POOL)
+
 @router.get("/{semantic_id}/{submodel_id}/submodel/$value", response_model=Dict[str, Any], responses=exception_responses)
 @router.get("/{semantic_id}/{submodel_id}/submodel", response_model=Dict[str, Any], responses=exception_responses)
 @router.get("/{semantic_id}/{submodel_id}", response_model=Dict[str, Any], responses=exception_responses)
@@ -47,7 +52,7 @@ async def submodel_dispatcher_get_submodel_content_submodel_value(
     edc_contract_agreement_id: Optional[str] = Header(default=None, alias="Edc-Contract-Agreement-Id", description="The contract agreement id of the consumer delivered by the EDC Data Plane")
     ) -> Dict[str, Any]:
 
-    return submodel_dispatcher_service.get_submodel_content(edc_bpn, edc_contract_agreement_id, semantic_id, submodel_id)
+    return await async_submodel_dispatcher_service.get_submodel_content(edc_bpn, edc_contract_agreement_id, semantic_id, submodel_id)
 
 
 @router.post("/{semantic_id}/{submodel_id}/submodel", status_code=204, responses=exception_responses)
@@ -56,11 +61,11 @@ async def submodel_dispatcher_upload_submodel(
     submodel_id: UUID,
     submodel_payload: Dict[str, Any] = Body(..., description="The submodel JSON payload")
 ) -> None:
-    return submodel_dispatcher_service.upload_submodel(submodel_id, semantic_id, submodel_payload)
+    return await async_submodel_dispatcher_service.upload_submodel(submodel_id, semantic_id, submodel_payload)
 
 @router.delete("/{semantic_id}/{submodel_id}/submodel", status_code=204, responses=exception_responses)
 async def submodel_dispatcher_delete_submodel(
     semantic_id: str,
     submodel_id: UUID
 ) -> None:
-    return submodel_dispatcher_service.delete_submodel(submodel_id, semantic_id)
\ No newline at end of file
+    return await async_submodel_dispatcher_service.delete_submodel(submodel_id, semantic_id)
\ No newline at end of file
@@ -21,7 +21,7 @@
 # SPDX-License-Identifier: Apache-2.0
 #################################################################################
 
-from fastapi import APIRouter, Query, Depends
+from fastapi import APIRouter, Query, Depends, Response
 from fastapi.responses import JSONResponse
 from typing import List, Optional
 from uuid import UUID
@@ -33,10 +33,15 @@ from models.services.provider.twin_management import (
     CatalogPartTwinCreate, CatalogPartTwinShareCreate,
     SerializedPartTwinRead, SerializedPartTwinDetailsRead,
     SerializedPartTwinCreate, SerializedPartTwinShareCreate,
-    SerializedPartTwinUnshareCreate
+    SerializedPartTwinUnshareCreate,
+    SerializedPartTwinBatchCreate, SerializedPartTwinShareBatchCreate, BatchJobRead
 )
+from models.services.provider.part_management import SerializedPartQuery
 from tools.exceptions import exception_responses
+from tools.constants import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, NEXT_CURSOR_HEADER
 from utils.async_utils import AsyncManagerWrapper
+from utils.thread_pools import DATABASE_POOL
+from managers.metadata_database.manager import RepositoryManagerFactory
 from controllers.fastapi.routers.authentication.auth_api import get_authentication_dependency
 
 router = APIRouter(
@@ -47,7 +52,7 @@ router = APIRouter(
 twin_management_service = TwinManagementService()
 
 # Create universal async wrapper - works with any service!
-async_twin_service = AsyncManagerWrapper(twin_management_service, "TwinManagement")
+async_twin_service = AsyncManagerWrapper(twin_management_service, "TwinManagement", pool=DATABASE_POOL, scope=RepositoryManagerFactory.session_scope)
 
 @router.get("/catalog-part-twin", response_model=List[CatalogPartTwinRead], responses=exception_responses)
 async def twin_management_get_catalog_part_twins(include_data_exchange_agreements: bool = False) -> List[CatalogPartTwinRead]:
@@ -61,14 +66,14 @@ async def twin_management_get_catalog_part_twin(global_id: UUID) -> Optional[Cat
 
 @router.get("/catalog-part-twin/{manufacturer_id}/{manufacturer_part_id}", response_model=Optional[CatalogPartTwinDetailsRead], responses=exception_responses)
 async def twin_management_get_catalog_part_twin_from_manufacturer(manufacturer_id: str, manufacturer_part_id: str) -> Optional[CatalogPartTwinDetailsRead]:
-    return twin_management_service.get_catalog_part_twin_details(manufacturer_id, manufacturer_part_id)
+    return await async_twin_service.get_catalog_part_twin_details(manufacturer_id, manufacturer_part_id)
 
 @router.post("/catalog-part-twin", response_model=TwinRead, responses=exception_responses)
 async def twin_management_create_catalog_part_twin(
     catalog_part_twin_create: CatalogPartTwinCreate,
     auto_create_part_type_information: bool = Query(True, alias="autoCreatePartTypeInformation", description="Automatically create part type information submodel if not present.")
 ) -> TwinRead:
-    return twin_management_service.create_catalog_part_twin(
+    return await async_twin_service.create_catalog_part_twin(
         catalog_part_twin_create,
         auto_create_part_type_information
     )
@@ -79,23 +84,24 @@ async def twin_management_create_catalog_part_twin(
     **exception_responses
 })
 async def twin_management_share_catalog_part_twin(catalog_part_twin_share: CatalogPartTwinShareCreate):
-    if twin_management_service.create_catalog_part_twin_share(catalog_part_twin_share):
+    if await async_twin_service.create_catalog_part_twin_share(catalog_part_twin_share):
         return JSONResponse(status_code=201, content={"description":"Catalog part twin shared successfully"})
     else:
         return JSONResponse(status_code=204, content={"description":"Catalog part twin already shared"})
 
 @router.get("/serialized-part-twin", response_model=List[SerializedPartTwinRead], responses=exception_responses)
 async def twin_management_get_all_serialized_part_twins(
+    response: Response,
     include_data_exchange_agreements: bool = False,
     manufacturerId: Optional[str] = None,
     manufacturerPartId: Optional[str] = None,
     customerPartId: Optional[str] = None,
     partInstanceId: Optional[str] = None,
     van: Optional[str] = None,
-    businessPartnerNumber: Optional[str] = None
+    businessPartnerNumber: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE, description="Maximum number of twins returned in one page."),
+    cursor: Optional[str] = Query(None, description=f"Cursor of the page to return, taken from the {NEXT_CURSOR_HEADER} header of the previous page.")
 ) -> List[SerializedPartTwinRead]:
-    from models.services.provider.part_management import SerializedPartQuery
-    
     # Create a dynamic query object using all provided filter parameters
     query_data = {}
     
@@ -116,24 +122,37 @@ async def twin_management_get_all_serialized_part_twins(
     
     query = SerializedPartQuery(**query_data)
     
-    return twin_management_service.get_serialized_part_twins(
+    twins, next_cursor = await async_twin_service.get_serialized_part_twins_page(
         serialized_part_query=query,
-        include_data_exchange_agreements=include_data_exchange_agreements
+        include_data_exchange_agreements=include_data_exchange_agreements,
+        limit=limit,
+        cursor=cursor
     )
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    return twins
 
 @router.get("/serialized-part-twin/{global_id}", response_model=Optional[SerializedPartTwinDetailsRead], responses=exception_responses)
 async def twin_management_get_serialized_part_twin(global_id: UUID) -> Optional[SerializedPartTwinDetailsRead]:
-    return twin_management_service.get_serialized_part_twin_details(global_id)
+    return await async_twin_service.get_serialized_part_twin_details(global_id)
 
 @router.post("/serialized-part-twin", response_model=TwinRead, responses=exception_responses)
 async def twin_management_create_serialized_part_twin(serialized_part_twin_create: SerializedPartTwinCreate, auto_create_serial_part: bool = Query(True, alias="autoCreatePartTypeInformation", description="Automatically create part type information submodel if not present.")) -> TwinRead:
-    return twin_management_service.create_serialized_part_twin(serialized_part_twin_create, auto_create_serial_part)
+    return await async_twin_service.create_serialized_part_twin(serialized_part_twin_create, auto_create_serial_part)
+
+@router.post("/serialized-part-twin/batch", status_code=202, response_model=BatchJobRead, responses=exception_responses)
+async def twin_management_create_serialized_part_twins_batch(serialized_part_twin_batch_create: SerializedPartTwinBatchCreate) -> BatchJobRead:
+    return await async_twin_service.create_serialized_part_twins_batch(serialized_part_twin_batch_create)
+
+@router.get("/batch-job/{job_id}", response_model=BatchJobRead, responses=exception_responses)
+async def twin_management_get_batch_job(job_id: UUID) -> BatchJobRead:
+    return await async_twin_service.get_batch_job(job_id)
 
 @router.post("/twin-aspect", response_model=TwinAspectRead, responses=exception_responses)
 async def twin_management_create_twin_aspect(twin_aspect_create: TwinAspectCreate, default: bool = True) -> TwinAspectRead:
     if default:
-        return twin_management_service.create_twin_aspect(twin_aspect_create)
-    return twin_management_service.create_or_update_twin_aspect_not_default(twin_aspect_create)
+        return await async_twin_service.create_twin_aspect(twin_aspect_create)
+    return await async_twin_service.create_or_update_twin_aspect_not_default(twin_aspect_create)
 
 @router.post("/serialized-part-twin/share", responses={
     201: {"description": "Catalog part twin shared successfully"},
@@ -141,7 +160,7 @@ async def twin_management_create_twin_aspect(twin_aspect_create: TwinAspectCreat
     **exception_responses
 })
 async def twin_management_share_serialized_part_twin(serialized_part_twin_share: SerializedPartTwinShareCreate):
-    if twin_management_service.create_serialized_part_twin_share(serialized_part_twin_share):
+    if await async_twin_service.create_serialized_part_twin_share(serialized_part_twin_share):
         return JSONResponse(status_code=201, content={"description":"Serialized part twin shared successfully"})
     else:
         return JSONResponse(status_code=204, content=None)
@@ -152,7 +171,15 @@ async def twin_management_share_serialized_part_twin(serialized_part_twin_share:
     **exception_responses
 })
 async def twin_management_unshare_serialized_part_twin(serialized_part_twin_unshare: SerializedPartTwinUnshareCreate):
-    if twin_management_service.part_twin_unshare(serialized_part_twin_unshare):
+    if await async_twin_service.part_twin_unshare(serialized_part_twin_unshare):
         return JSONResponse(status_code=201, content={"description":"Serialized part twin unshared successfully"})
     else:
         return JSONResponse(status_code=204, content=None)
+
+@router.post("/serialized-part-twin/share/batch", status_code=202, response_model=BatchJobRead, responses=exception_responses)
+async def twin_management_share_serialized_part_twins_batch(serialized_part_twin_share_batch: SerializedPartTwinShareBatchCreate) -> BatchJobRead:
+    return await async_twin_service.share_serialized_part_twins_batch(serialized_part_twin_share_batch)
+
+@router.post("/serialized-part-twin/unshare/batch", status_code=202, response_model=BatchJobRead, responses=exception_responses)
+async def twin_management_unshare_serialized_part_twins_batch(serialized_part_twin_share_batch: SerializedPartTwinShareBatchCreate) -> BatchJobRead:
+    return await async_twin_service.unshare_serialized_part_twins_batch(serialized_part_twin_share_batch)
@@ -22,8 +22,14 @@
 
 from managers.config.config_manager import ConfigManager
 from managers.config.log_manager import LoggingManager
+from sqlalchemy.engine import URL, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
 from sqlmodel import SQLModel, create_engine, text
 from tools import env_tools
+from utils.connection_pool import MonitoredAsyncQueuePool, MonitoredQueuePool
+from utils.replica_router import ReplicaRouter
+from typing import Any, Dict, Optional, Union
+import ssl
 import time
 
 base_dsn = ConfigManager.get_config("database.connectionString", default={})
@@ -34,9 +40,159 @@ connection_string = env_tools.substitute_env_vars(string=base_dsn)
 db_echo = ConfigManager.get_config("database.echo", default={False})
 db_timeout = ConfigManager.get_config("database.timeout", default=8)
 db_retry_interval = ConfigManager.get_config("database.retry_interval", default=5)
+db_statement_timeout = ConfigManager.get_config("database.statement_timeout", default=0)
+db_pool = ConfigManager.get_config("database.pool", default={}) or {}
+db_replicas = ConfigManager.get_config("database.replicas", default={}) or {}
+
+connect_args = {"connect_timeout": db_timeout}
+if db_statement_timeout:
+    # Let the server abort the statements running longer than the timeout (in milliseconds)
+    connect_args["options"] = f"-c statement_timeout={int(db_statement_timeout)}"
+
+def create_database_engine(url: Union[str, URL]):
+    """Create a sync engine with the configured connection pool, for the primary or a replica."""
+    return create_engine(
+        url,
+        echo=db_echo,
+        connect_args=connect_args,
+        poolclass=MonitoredQueuePool,
+        pool_size=db_pool.get("size", 5),
+        max_overflow=db_pool.get("max_overflow", 10),
+        pool_timeout=db_pool.get("timeout", 30),
+        pool_recycle=db_pool.get("recycle", -1),
+        pool_pre_ping=db_pool.get("pre_ping", False)
+    )
 
 logger.info("Attempting database connection... with timeout %s seconds", db_timeout)
-engine = create_engine(str(connection_string), echo=db_echo, connect_args={"connect_timeout": db_timeout})
+engine = create_database_engine(str(connection_string))
+
+# Async driver of the async engine, per driver of the connection string
+ASYNC_DRIVERS = {
+    "postgresql": "postgresql+asyncpg",
+    "postgresql+psycopg2": "postgresql+asyncpg",
+    "sqlite": "sqlite+aiosqlite",
+}
+
+_async_engine: Optional[AsyncEngine] = None
+
+# Query parameters of the connection string read by the asyncpg dialect of SQLAlchemy itself, host and port as in libpq
+ASYNCPG_DIALECT_PARAMETERS = {"host", "port", "prepared_statement_cache_size"}
+# Query parameters of the connection string passed to asyncpg.connect, with their type
+ASYNCPG_CONNECT_PARAMETERS = {
+    "command_timeout": float, "statement_cache_size": int, "max_cached_statement_lifetime": int,
+    "max_cacheable_statement_size": int, "target_session_attrs": str, "krbsrvname": str, "gsslib": str,
+}
+LIBPQ_SSL_PARAMETERS = ("sslmode", "sslrootcert", "sslcert", "sslkey")
+
+def to_async_url(url: Union[str, URL]) -> URL:
+    """
+    Return the connection string with the async driver of its database.
+
+    For asyncpg, only the query parameters of the SQLAlchemy dialect are kept, the others are passed
+    as connect arguments, see asyncpg_connect_args.
+    """
+    url = url if isinstance(url, URL) else make_url(str(url))
+    url = url.set(drivername=ASYNC_DRIVERS.get(url.drivername, url.drivername))
+    if url.get_dialect().driver != "asyncpg":
+        return url
+    return url.set(query={key: value for key, value in url.query.items() if key in ASYNCPG_DIALECT_PARAMETERS})
+
+def asyncpg_connect_args(url: Union[str, URL]) -> Dict[str, Any]:
+    """
+    Translate the query parameters of a PostgreSQL connection string to the arguments of asyncpg.connect.
+
+    The parameters of asyncpg are converted to their type. Of the libpq parameters, sslmode is passed as ssl,
+    connect_timeout as timeout and application_name as server setting. The other libpq parameters are not
+    supported by asyncpg and are dropped.
+
+    The certificate files are loaded in an SSL context for the modes requiring SSL. For allow and prefer
+    the mode itself is passed, so asyncpg falls back to a plain connection like libpq, and the files are
+    ignored.
+    """
+    url = url if isinstance(url, URL) else make_url(str(url))
+    query = {key: value if isinstance(value, str) else value[-1] for key, value in url.query.items()}
+    args: Dict[str, Any] = {
+        key: parameter_type(query[key]) for key, parameter_type in ASYNCPG_CONNECT_PARAMETERS.items() if key in query
+    }
+    if "connect_timeout" in query:
+        args["timeout"] = float(query["connect_timeout"])
+    if "application_name" in query:
+        args["server_settings"] = {"application_name": query["application_name"]}
+    sslmode = query.get("sslmode")
+    certificates = [parameter for parameter in LIBPQ_SSL_PARAMETERS[1:] if parameter in query]
+    if certificates and sslmode in ("require", "verify-ca", "verify-full"):
+        args["ssl"] = _ssl_context(sslmode, query)
+    else:
+        if certificates and sslmode != "disable":
+            logger.warning(f"The connection string parameters {certificates} are ignored by the async engine with sslmode={sslmode or 'prefer'}.")
+        if sslmode:
+            # asyncpg accepts the SSL modes of libpq
+            args["ssl"] = sslmode
+    dropped = sorted(
+        set(query) - ASYNCPG_DIALECT_PARAMETERS - ASYNCPG_CONNECT_PARAMETERS.keys() - set(LIBPQ_SSL_PARAMETERS) - {"connect_timeout", "application_name"}
+    )
+    if dropped:
+        logger.warning(f"The connection string parameters {dropped} are not supported by the async engine and are ignored.")
+    return args
+
+def _ssl_context(sslmode: str, query: Dict[str, str]) -> ssl.SSLContext:
+    """Create the SSL context of an SSL mode of libpq requiring SSL, with the given certificate files."""
+    context = ssl.create_default_context(cafile=query.get("sslrootcert"))
+    if sslmode != "verify-full":
+        context.check_hostname = False
+    if sslmode == "require" and "sslrootcert" not in query:
+        # Encrypted without verifying the server, with a root certificate libpq verifies the CA like verify-ca
+        context.verify_mode = ssl.CERT_NONE
+    if "sslcert" in query:
+        context.load_cert_chain(query["sslcert"], query.get("sslkey"))
+    return context
+
+def create_async_database_engine(url: Union[str, URL]) -> AsyncEngine:
+    """Create an async engine with the configured connection pool, for the primary or a replica."""
+    async_url = to_async_url(url)
+    async_connect_args = {"timeout": db_timeout}
+    if async_url.get_dialect().driver == "asyncpg":
+        async_connect_args.update(asyncpg_connect_args(url))
+    if db_statement_timeout:
+        async_connect_args.setdefault("server_settings", {})["statement_timeout"] = str(int(db_statement_timeout))
+    return create_async_engine(
+        async_url,
+        echo=db_echo,
+        connect_args=async_connect_args,
+        poolclass=MonitoredAsyncQueuePool,
+        pool_size=db_pool.get("size", 5),
+        max_overflow=db_pool.get("max_overflow", 10),
+        pool_timeout=db_pool.get("timeout", 30),
+        pool_recycle=db_pool.get("recycle", -1),
+        pool_pre_ping=db_pool.get("pre_ping", False)
+    )
+
+def get_async_engine() -> AsyncEngine:
+    """
+    Return the engine of the async repository managers, created on first use.
+
+    It has its own connection pool, configured like the one of the sync engine,
+    so the native async endpoints do not compete with the database pool threads for connections.
+    """
+    global _async_engine
+    if _async_engine is None:
+        _async_engine = create_async_database_engine(connection_string)
+    return _async_engine
+
+# Routes the read-only repository managers to the read replicas, if configured
+replica_router = ReplicaRouter.from_config(
+    db_replicas,
+    engine_factory=lambda replica_dsn: create_database_engine(str(env_tools.substitute_env_vars(string=replica_dsn))),
+    async_engine_factory=lambda replica_engine: create_async_database_engine(replica_engine.url)
+)
+
+async def dispose_async_engine() -> None:
+    """Close the connections of the async engines of the primary and of the replicas, if they were created."""
+    global _async_engine
+    if _async_engine is not None:
+        await _async_engine.dispose()
+        _async_engine = None
+    await replica_router.dispose_async_engines()
 
 database_error:bool = False
 
@@ -30,10 +30,11 @@ import logging
 logger = logging.getLogger("connector")
 logger.setLevel(logging.INFO)
 
-from connector import connector_manager
+from connector import connector_manager, consumer_cache_invalidation
 from database import engine
 from managers.config.config_manager import ConfigManager
 from utils.async_utils import AsyncManagerWrapper
+from utils.thread_pools import HTTP_POOL
     
 # Get DTR discovery configuration parameter
 
@@ -49,6 +50,15 @@ try:
     dtr_filter_operand_left = ConfigManager.get_config('consumer.discovery.digitalTwinRegistry.dct_type_filter.operandLeft')
     dtr_filter_operator = ConfigManager.get_config('consumer.discovery.digitalTwinRegistry.dct_type_filter.operator')
     dtr_dct_type = ConfigManager.get_config('consumer.discovery.digitalTwinRegistry.dct_type_filter.operandRight')
+    dtr_max_parallel = ConfigManager.get_config('consumer.discovery.digitalTwinRegistry.shell_discovery.max_parallel_dtrs', 5)
+    dtr_discovery_timeout = ConfigManager.get_config('consumer.discovery.digitalTwinRegistry.shell_discovery.timeout', None)
+    dtr_max_parallel_requests = ConfigManager.get_config('consumer.discovery.digitalTwinRegistry.shell_discovery.max_parallel_requests', 20)
+    dtr_request_timeout = ConfigManager.get_config('consumer.discovery.digitalTwinRegistry.shell_discovery.request_timeout', 30)
+    dtr_shell_cache_max_entries = ConfigManager.get_config('consumer.discovery.digitalTwinRegistry.shell_discovery.cache.max_entries', 10000)
+    dtr_shell_cache_max_bytes = ConfigManager.get_config('consumer.discovery.digitalTwinRegistry.shell_discovery.cache.max_bytes', 64 * 1024 * 1024)
+    dtr_shell_cache_ttl = ConfigManager.get_config('consumer.discovery.digitalTwinRegistry.shell_discovery.cache.ttl', 300)
+    dtr_stale_while_revalidate = ConfigManager.get_config('consumer.discovery.stale_while_revalidate', False)
+    dtr_full_reload_interval = ConfigManager.get_config('consumer.cache_invalidation.full_reload_interval', 300)
     if(engine is None or connector_manager is None or connector_manager.consumer is None):
         dtr_start_up_error = True
 
@@ -61,7 +71,17 @@ try:
             dct_type_id=dtr_dct_type_id,
             dct_type_key=dtr_filter_operand_left,
             operator=dtr_filter_operator,
-            dct_type=dtr_dct_type
+            dct_type=dtr_dct_type,
+            max_parallel_dtrs=dtr_max_parallel,
+            discovery_timeout=dtr_discovery_timeout,
+            max_parallel_requests=dtr_max_parallel_requests,
+            request_timeout=dtr_request_timeout,
+            shell_cache_max_entries=dtr_shell_cache_max_entries,
+            shell_cache_max_bytes=dtr_shell_cache_max_bytes,
+            shell_cache_ttl=dtr_shell_cache_ttl,
+            stale_while_revalidate=dtr_stale_while_revalidate,
+            invalidation_channel=consumer_cache_invalidation,
+            full_reload_interval=dtr_full_reload_interval
         )
 
     """
@@ -90,8 +110,8 @@ try:
     )
 
     # Create universal async wrappers - works with any manager!
-    async_dtr_consumer = AsyncManagerWrapper(dtr_manager.consumer, "DTRConsumer")
-    async_dtr_provider = AsyncManagerWrapper(dtr_manager.provider, "DTRProvider")
+    async_dtr_consumer = AsyncManagerWrapper(dtr_manager.consumer, "DTRConsumer", pool=HTTP_POOL)
+    async_dtr_provider = AsyncManagerWrapper(dtr_manager.provider, "DTRProvider", pool=HTTP_POOL)
 except Exception as e:
     dtr_start_up_error = True
     logger.critical(f"Failed to initialize DTR managers: {e}")
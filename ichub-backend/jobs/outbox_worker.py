@@ -0,0 +1,181 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from managers.config.log_manager import LoggingManager
+from managers.metadata_database.manager import RepositoryManager, RepositoryManagerFactory
+from models.metadata_database.provider.models import OutboxMessageStatus
+
+logger = LoggingManager.get_logger(__name__)
+
+OutboxHandler = Callable[[RepositoryManager, Dict[str, Any]], None]
+
+
+class OutboxWorker:
+    """
+    Background worker applying the side effects written to the outbox by the services.
+
+    The messages are claimed in batches with a lease and handled concurrently, each one in its
+    own transaction. A failed message is retried with exponential backoff until max_attempts,
+    then kept as failed. The handlers must be idempotent: a message is handled again when the
+    worker dies before marking it done, and the same idempotency key can be enqueued again.
+    Only the worker holding the latest claim of a message finishes it, the outcome of an attempt
+    which outlived its lease is dropped. A message enqueued again while it is handled is due
+    again with the latest payload when the attempt finishes.
+    """
+
+    def __init__(self,
+        handlers: Dict[str, OutboxHandler],
+        repository_manager_factory: Callable[[], RepositoryManager] = RepositoryManagerFactory.create,
+        poll_interval: float = 1,
+        batch_size: int = 20,
+        max_parallel: int = 10,
+        max_attempts: int = 10,
+        retry_delay: float = 5,
+        max_retry_delay: float = 600,
+        lease: float = 300
+    ):
+        """
+        Initialize the outbox worker.
+
+        Args:
+            handlers: The handler of each operation, called with the repository manager and the payload of the message.
+            repository_manager_factory: Factory creating the repository manager used for each transaction.
+            poll_interval (float): Seconds to wait for new messages when the outbox is drained.
+            batch_size (int): Number of messages claimed at once.
+            max_parallel (int): Number of messages handled concurrently.
+            max_attempts (int): Number of attempts before a message is failed.
+            retry_delay (float): Seconds before the first retry, doubled on each further retry.
+            max_retry_delay (float): Maximum number of seconds between two retries.
+            lease (float): Seconds after which a claimed message is due again if it was not finished.
+        """
+        self.handlers = handlers
+        self.repository_manager_factory = repository_manager_factory
+        self.poll_interval = poll_interval
+        self.batch_size = max(1, int(batch_size))
+        self.max_parallel = max(1, int(max_parallel))
+        self.max_attempts = max(1, int(max_attempts))
+        self.retry_delay = retry_delay
+        self.max_retry_delay = max_retry_delay
+        self.lease = lease
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @classmethod
+    def from_config(cls, handlers: Dict[str, OutboxHandler], outbox_config: Dict[str, Any]) -> "OutboxWorker":
+        """Create the worker from the "provider.outbox" configuration."""
+        return cls(handlers, **{
+            key: outbox_config[key]
+            for key in ("poll_interval", "batch_size", "max_parallel", "max_attempts", "retry_delay", "max_retry_delay", "lease")
+            if key in outbox_config
+        })
+
+    def start(self) -> None:
+        """Start the background thread draining the outbox."""
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run_loop, name="outbox-worker", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the background thread, the claimed messages not finished by then are due again after their lease."""
+        self._stop_event.set()
+        if self._thread:
+            self._thread.join(timeout=self.poll_interval + 1)
+
+    def _run_loop(self) -> None:
+        logger.info("[OutboxWorker] Started draining the outbox.")
+        while not self._stop_event.is_set():
+            try:
+                # Continue right away while full batches are claimed
+                if self.run_once() == self.batch_size:
+                    continue
+            except Exception as e:
+                logger.error(f"[OutboxWorker] Failed to claim the outbox messages: {e}")
+            self._stop_event.wait(self.poll_interval)
+
+    def run_once(self) -> int:
+        """
+        Claim one batch of due messages and handle them.
+
+        Returns:
+            int: The number of handled messages.
+        """
+        with self.repository_manager_factory() as repo:
+            messages: List[Tuple[int, str, int, int, Dict[str, Any]]] = [
+                (message.id, message.operation, message.attempts, message.claim_token, message.payload)
+                for message in repo.outbox_message_repository.claim_due(self.batch_size, self.lease)
+            ]
+        if not messages:
+            return 0
+        with ThreadPoolExecutor(max_workers=min(self.max_parallel, len(messages)), thread_name_prefix="outbox") as executor:
+            list(executor.map(lambda message: self._handle(*message), messages))
+        return len(messages)
+
+    def _handle(self, message_id: int, operation: str, attempts: int, claim_token: int, payload: Dict[str, Any]) -> None:
+        error = None
+        with self.repository_manager_factory() as repo:
+            handler = self.handlers.get(operation)
+            try:
+                if handler is None:
+                    raise ValueError(f"No handler for the operation '{operation}'.")
+                handler(repo, payload)
+            except Exception as e:
+                error = e
+                repo.rollback()
+
+            message = repo.outbox_message_repository.get_claimed(message_id, claim_token)
+            if message is None:
+                logger.warning(f"[OutboxWorker] Message {message_id} ({operation}) was claimed again after the lease of attempt {attempts} expired, its outcome is dropped.")
+                return
+            now = datetime.utcnow()
+            message.modified_date = now
+            if message.rerun:
+                # Enqueued again meanwhile, the latest payload is applied by a new attempt
+                message.status = OutboxMessageStatus.PENDING
+                message.attempts = 0
+                message.rerun = False
+                message.next_attempt_date = now
+                message.last_error = None
+                return
+            if error is None:
+                message.status = OutboxMessageStatus.DONE
+                message.last_error = None
+                return
+            message.last_error = str(error)
+            if handler is None or attempts >= self.max_attempts:
+                message.status = OutboxMessageStatus.FAILED
+                logger.error(f"[OutboxWorker] Message {message_id} ({operation}) failed after {attempts} attempts: {error}")
+                return
+            delay = self._retry_delay(attempts)
+            message.status = OutboxMessageStatus.PENDING
+            message.next_attempt_date = now + timedelta(seconds=delay)
+            logger.warning(f"[OutboxWorker] Message {message_id} ({operation}) failed (attempt {attempts}/{self.max_attempts}), retrying in {delay}s: {error}")
+
+    def _retry_delay(self, attempts: int) -> float:
+        return min(self.retry_delay * 2 ** (attempts - 1), self.max_retry_delay)
@@ -0,0 +1,79 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+from typing import Callable, List, Tuple
+from managers.config.log_manager import LoggingManager
+from managers.metadata_database.manager import RepositoryManager, RepositoryManagerFactory
+
+logger = LoggingManager.get_logger(__name__)
+
+
+class PartStatusJob:
+    """
+    Job that maintains the part status stored on the twins.
+
+    The status is refreshed by the services at every registration and sharing transition,
+    this job fills it for existing databases (backfill) and verifies that it matches the
+    registrations and exchanges (check), optionally repairing the differences.
+    """
+
+    def __init__(self, repository_manager_factory: Callable[[], RepositoryManager] = RepositoryManagerFactory.create):
+        """
+        Initialize the part status job.
+
+        Args:
+            repository_manager_factory: Factory creating the repository manager used for each run.
+        """
+        self.repository_manager_factory = repository_manager_factory
+
+    def backfill(self) -> int:
+        """
+        Recompute the status of all twins.
+
+        Returns:
+            int: The number of updated twins.
+        """
+        with self.repository_manager_factory() as repo:
+            updated = repo.twin_repository.refresh_status()
+        logger.info(f"[PartStatusJob] Refreshed the status of {updated} twins.")
+        return updated
+
+    def check(self, repair: bool = False) -> List[Tuple[int, int, int]]:
+        """
+        Find the twins whose stored status does not match their registrations and exchanges.
+
+        Args:
+            repair (bool): Refresh the status of the inconsistent twins. Defaults to False.
+
+        Returns:
+            List[Tuple[int, int, int]]: The (twin id, stored status, derived status) of the inconsistent twins.
+        """
+        with self.repository_manager_factory() as repo:
+            inconsistencies = repo.twin_repository.find_inconsistent_status()
+            for twin_id, stored, derived in inconsistencies:
+                logger.warning(f"[PartStatusJob] Twin {twin_id} has status {stored} instead of {derived}.")
+            if repair and inconsistencies:
+                repo.twin_repository.refresh_status([twin_id for twin_id, _, _ in inconsistencies])
+                logger.info(f"[PartStatusJob] Repaired the status of {len(inconsistencies)} twins.")
+        if not inconsistencies:
+            logger.info("[PartStatusJob] The status of all twins is consistent.")
+        return inconsistencies
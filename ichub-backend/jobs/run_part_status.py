@@ -0,0 +1,72 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+import argparse
+import sys
+from pathlib import Path
+
+# Add parent directory to path to import modules
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+sys.dont_write_bytecode = True
+
+from managers.config.log_manager import LoggingManager
+from managers.config.config_manager import ConfigManager
+
+LoggingManager.init_logging()
+logger = LoggingManager.get_logger(__name__)
+
+ConfigManager.load_config()
+
+from database import wait_for_db_connection
+from jobs.part_status_job import PartStatusJob
+
+
+def run_part_status_job(check: bool = False, repair: bool = False) -> int:
+    """
+    Backfill or check the part status stored on the twins.
+
+    Args:
+        check (bool): Only report the inconsistent twins instead of refreshing all of them.
+        repair (bool): Together with check, refresh the status of the inconsistent twins.
+
+    Returns:
+        int: Exit code - 0 for success, 1 for failure or for inconsistencies found by an unrepaired check.
+    """
+    try:
+        wait_for_db_connection()
+        job = PartStatusJob()
+        if not check:
+            job.backfill()
+            return 0
+        inconsistencies = job.check(repair=repair)
+        return 1 if inconsistencies and not repair else 0
+    except Exception as e:
+        logger.error(f"✗ Part status job failed with exception: {e}", exc_info=True)
+        return 1
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Backfill or check the part status stored on the twins.")
+    parser.add_argument("--check", action="store_true", help="Only report the twins whose status is inconsistent.")
+    parser.add_argument("--repair", action="store_true", help="With --check, refresh the status of the inconsistent twins.")
+    args = parser.parse_args()
+    sys.exit(run_part_status_job(check=args.check, repair=args.repair))
@@ -27,6 +27,7 @@ __license__ = "Apache License, Version 2.0"
 
 from .base_connector_consumer_manager import BaseConnectorConsumerManager
 from .base_dtr_consumer_manager import BaseDtrConsumerManager
+from .cache_invalidation import PostgresCacheInvalidationChannel
 
 from .connector.memory.connector_consumer_memory_manager import ConnectorConsumerMemoryManager
 from .connector.database.connector_consumer_postgres_memory_manager import ConsumerConnectorPostgresMemoryManager
@@ -0,0 +1,171 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+
+import json
+import logging
+import select
+import threading
+import uuid
+from typing import Callable, Dict, List, Optional
+
+from sqlalchemy import text
+from sqlalchemy.engine import Engine as E
+
+class PostgresCacheInvalidationChannel:
+    """
+    Cross-process invalidation channel for the consumer caches, based on Postgres LISTEN/NOTIFY.
+
+    Every uvicorn worker keeps its own in-memory copy of the known connectors and DTRs, synchronized
+    with Postgres. When a worker persists a change it publishes the changed topic (the table name),
+    and the other workers reload it right away instead of waiting for their next persistence cycle.
+    Notifications published by this process are ignored.
+    """
+
+    def __init__(self, engine: E, channel: str = "ichub_consumer_cache", retry_interval: float = 5, logger: logging.Logger = None, verbose: bool = False):
+        """
+        Initialize the channel.
+
+        Args:
+            engine (E): SQLAlchemy engine of the Postgres database
+            channel (str, optional): Name of the Postgres notification channel. Defaults to "ichub_consumer_cache".
+            retry_interval (float, optional): Seconds to wait before reconnecting the listener. Defaults to 5.
+            logger (logging.Logger, optional): Logger instance for debug output. Defaults to None.
+            verbose (bool, optional): Flag for enabling verbose logging. Defaults to False.
+        """
+        self.engine = engine
+        self.channel = channel
+        self.retry_interval = retry_interval
+        self.logger = logger
+        self.verbose = verbose
+        self.instance_id = uuid.uuid4().hex
+        self._subscribers: Dict[str, List[Callable[[Optional[str]], None]]] = {}
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def subscribe(self, topic: str, callback: Callable[[Optional[str]], None]) -> None:
+        """
+        Register a callback for the changes of a topic published by other processes.
+
+        The callback receives the changed key, or None if the whole topic must be reloaded.
+        """
+        with self._lock:
+            self._subscribers.setdefault(topic, []).append(callback)
+
+    def publish(self, topic: str, key: Optional[str] = None) -> bool:
+        """
+        Notify the other processes that a topic has changed.
+
+        Args:
+            topic (str): The changed topic
+            key (Optional[str]): The changed key inside the topic, None for the whole topic
+
+        Returns:
+            bool: True if the notification was sent
+        """
+        payload = json.dumps({"source": self.instance_id, "topic": topic, "key": key})
+        try:
+            with self.engine.connect() as connection:
+                connection.execute(text("SELECT pg_notify(:channel, :payload)"), {"channel": self.channel, "payload": payload})
+                connection.commit()
+            return True
+        except Exception as e:
+            if self.logger and self.verbose:
+                self.logger.error(f"[PostgresCacheInvalidationChannel] Failed to publish [{topic}]: {e}")
+            return False
+
+    def start(self) -> None:
+        """Start the background listener thread."""
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._listen_loop, name="cache-invalidation", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the background listener thread."""
+        self._stop_event.set()
+        if self._thread:
+            self._thread.join(timeout=self.retry_interval + 1)
+
+    def _listen_loop(self) -> None:
+        first_connection = True
+        while not self._stop_event.is_set():
+            connection = None
+            try:
+                connection = self.engine.raw_connection()
+                # The listener connection is kept open, it must not block a slot of the pool
+                connection.detach()
+                dbapi_connection = connection.driver_connection
+                dbapi_connection.autocommit = True
+                with dbapi_connection.cursor() as cursor:
+                    cursor.execute(f'LISTEN "{self.channel}"')
+                if self.logger and self.verbose:
+                    self.logger.info(f"[PostgresCacheInvalidationChannel] Listening on channel [{self.channel}]")
+                # Notifications may have been missed while the listener was disconnected
+                if not first_connection:
+                    self._dispatch_all()
+                first_connection = False
+                while not self._stop_event.is_set():
+                    if select.select([dbapi_connection], [], [], 1.0) == ([], [], []):
+                        continue
+                    dbapi_connection.poll()
+                    while dbapi_connection.notifies:
+                        self._dispatch(dbapi_connection.notifies.pop(0).payload)
+            except Exception as e:
+                if self.logger and self.verbose:
+                    self.logger.error(f"[PostgresCacheInvalidationChannel] Listener error, reconnecting in {self.retry_interval} seconds: {e}")
+                self._stop_event.wait(self.retry_interval)
+            finally:
+                if connection is not None:
+                    try:
+                        connection.close()
+                    except Exception:
+                        pass
+
+    def _dispatch(self, payload: str) -> None:
+        try:
+            message = json.loads(payload)
+        except (TypeError, ValueError):
+            return
+        if message.get("source") == self.instance_id:
+            return
+        topic = message.get("topic")
+        with self._lock:
+            callbacks = list(self._subscribers.get(topic, []))
+        for callback in callbacks:
+            self._call(topic, callback, message.get("key"))
+
+    def _dispatch_all(self) -> None:
+        with self._lock:
+            subscribers = {topic: list(callbacks) for topic, callbacks in self._subscribers.items()}
+        for topic, callbacks in subscribers.items():
+            for callback in callbacks:
+                self._call(topic, callback, None)
+
+    def _call(self, topic: str, callback: Callable[[Optional[str]], None], key: Optional[str]) -> None:
+        try:
+            callback(key)
+        except Exception as e:
+            if self.logger and self.verbose:
+                self.logger.error(f"[PostgresCacheInvalidationChannel] Invalidation of [{topic}] failed: {e}")
@@ -22,12 +22,13 @@
 ## Code created partially using a LLM (GPT 4o) and reviewed by a human committer
 
 import threading
-import hashlib
 import copy
-from typing import List, Dict
-import json
-from datetime import datetime
+from typing import List, Dict, Optional, Iterable
+from datetime import datetime, timedelta
 from sqlmodel import select, delete, Session, SQLModel
+from sqlalchemy import inspect
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.exc import SQLAlchemyError
 import logging
 from ..memory import ConnectorConsumerMemoryManager
@@ -37,12 +38,18 @@ from sqlalchemy.engine import Engine as E
 from sqlalchemy.orm import Session as S
 from models.metadata_database.consumer.models import KnownConnectors
 
+# The table models are declared once per table name, declaring them again duplicates their indexes
+_known_connectors_models: Dict[str, type] = {}
+
 class ConsumerConnectorPostgresMemoryManager(ConnectorConsumerMemoryManager):
     """
     Connection manager for storing and synchronizing EDR connections between memory and a Postgres database.
     Inherits from MemoryConnectionManager to maintain an in-memory cache and extends it with persistent storage functionality.
     """
 
+    # Maximum number of rows written or BPNs loaded by a single statement
+    BATCH_SIZE = 1000
+
     def __init__(self, 
                  connector_consumer_service: BaseConnectorConsumerService,
                  engine: E | S, 
@@ -51,7 +58,8 @@ class ConsumerConnectorPostgresMemoryManager(ConnectorConsumerMemoryManager):
                  table_name: str = "known_connectors", 
                  connectors_key: str = "connectors", 
                  logger: logging.Logger = None, 
-                 verbose: bool = False):
+                 verbose: bool = False,
+                 stale_while_revalidate: bool = False):
         """
         Initialize the Postgres memory-backed connection manager.
 
@@ -64,6 +72,7 @@ class ConsumerConnectorPostgresMemoryManager(ConnectorConsumerMemoryManager):
             connectors_key: Key used to store EDR counts within open_connections.
             logger: Optional logger instance for debug output.
             verbose: Flag for enabling verbose logging.
+            stale_while_revalidate: Return expired connectors while they are rediscovered in the background.
         """
         # Initialize base memory connection manager and configure database.
         # Dynamically define the SQLModel table for EDR connections.
@@ -73,7 +82,8 @@ class ConsumerConnectorPostgresMemoryManager(ConnectorConsumerMemoryManager):
             connector_discovery=connector_discovery, 
             expiration_time=expiration_time, 
             logger=logger, 
-            verbose=verbose
+            verbose=verbose,
+            stale_while_revalidate=stale_while_revalidate
         )
         self.engine = engine
         self.table_name = table_name
@@ -81,14 +91,22 @@ class ConsumerConnectorPostgresMemoryManager(ConnectorConsumerMemoryManager):
         self._stop_event = threading.Event()
         self.connectors_key = connectors_key
         self._save_thread = None
-        self._last_saved_hash = None
+        # BPNs changed in memory since the last save, only their rows are written to the database
+        self._dirty_bpns = set()
+        self._purge_all = False
+        # Start time of the last reload, used to load only the rows changed since then
+        self._last_loaded_at: Optional[datetime] = None
+        self.reload_overlap = timedelta(seconds=30)
         SQLModel.metadata.create_all(engine)
-        class DynamicKnownConnectors(KnownConnectors, table=True):
-            __tablename__ = table_name
-            __table_args__ = {"extend_existing": True}
+        if table_name not in _known_connectors_models:
+            class DynamicKnownConnectors(KnownConnectors, table=True):
+                __tablename__ = table_name
+                __table_args__ = {"extend_existing": True}
+            _known_connectors_models[table_name] = DynamicKnownConnectors
 
-        self.KnownConnectorsModel = DynamicKnownConnectors
-        DynamicKnownConnectors.metadata.create_all(engine)
+        self.KnownConnectorsModel = _known_connectors_models[table_name]
+        self._drop_outdated_table()
+        self.KnownConnectorsModel.metadata.create_all(engine, tables=[self.KnownConnectorsModel.__table__])
         self._load_from_db()
 
     def add_connectors(self, bpn: str, connectors: List[str]) -> None:
@@ -105,7 +123,9 @@ class ConsumerConnectorPostgresMemoryManager(ConnectorConsumerMemoryManager):
         Returns:
             None
         """
-        super().add_connectors(bpn, connectors)  # Call the base class method to handle in-memory caching
+        with self._lock:
+            super().add_connectors(bpn, connectors)  # Call the base class method to handle in-memory caching
+            self._dirty_bpns.add(bpn)
         self._trigger_save()
 
     def delete_connector(self, bpn: str, connector_id: str) -> Dict:
@@ -119,7 +139,9 @@ class ConsumerConnectorPostgresMemoryManager(ConnectorConsumerMemoryManager):
         Returns:
             Dict: Updated cache state after deletion
         """
-        super().delete_connector(bpn, connector_id)
+        with self._lock:
+            super().delete_connector(bpn, connector_id)
+            self._dirty_bpns.add(bpn)
         self._trigger_save()
         return self.known_connectors
 
@@ -134,7 +156,9 @@ class ConsumerConnectorPostgresMemoryManager(ConnectorConsumerMemoryManager):
         Returns:
             None
         """
-        super().purge_bpn(bpn)
+        with self._lock:
+            super().purge_bpn(bpn)
+            self._dirty_bpns.add(bpn)
         self._trigger_save()
 
     
@@ -148,7 +172,10 @@ class ConsumerConnectorPostgresMemoryManager(ConnectorConsumerMemoryManager):
         Returns:
             None
         """
-        super().purge_cache()
+        with self._lock:
+            super().purge_cache()
+            self._purge_all = True
+            self._dirty_bpns.clear()
         self._trigger_save()
 
 
@@ -161,98 +188,202 @@ class ConsumerConnectorPostgresMemoryManager(ConnectorConsumerMemoryManager):
             return
         self._save_thread = threading.Thread(target=self._save_to_db, daemon=True)
         self._save_thread.start()
+
+    def _drop_outdated_table(self):
+        """
+        Drop a connector table created before the rows were tracked by their update time.
+
+        The table only caches discovery results, the connectors are discovered again when needed.
+        """
+        inspector = inspect(self.engine)
+        if not inspector.has_table(self.table_name):
+            return
+        columns = {column["name"] for column in inspector.get_columns(self.table_name)}
+        if "updated_at" in columns:
+            return
+        if self.logger:
+            self.logger.warning(f"[ConsumerConnectorPostgresMemoryManager] Recreating outdated table [{self.table_name}], the cached connectors will be discovered again.")
+        self.KnownConnectorsModel.__table__.drop(self.engine)
+
+    def _row_to_entry(self, row) -> Dict:
+        """
+        Convert a database row into the in-memory structure of known_connectors.
+        """
+        return {
+            # Convert datetime back to timestamp for the SDK
+            self.REFRESH_INTERVAL_KEY: row.expires_at.timestamp(),
+            self.CONNECTOR_LIST_KEY: row.connectors
+        }
         
     def _load_from_db(self):
         """
-        Reload known_connectors from the DB and restore them to memory.
+        Reload all known_connectors from the DB and restore them to memory.
+
+        BPNs with changes not yet saved keep their in-memory state.
         """
         self.logger.debug(f"[ConsumerConnectorPostgresMemoryManager] [{threading.get_ident()}] Trying to acquire lock (_load_from_db)")
         with self._lock:
             self.logger.debug(f"[ConsumerConnectorPostgresMemoryManager] [{threading.get_ident()}] Acquired lock (_load_from_db)")
             try:
-                loaded_bpns = 0
+                started_at = datetime.now()
                 with Session(self.engine) as session:
                     result = session.exec(select(self.KnownConnectorsModel)).all()
-                    
-                    # Store current state to compare for changes
-                    old_connectors = self.known_connectors.copy()
-                    
-                    # Clear current known_connectors
-                    self.known_connectors = {}
-                    
-                    for row in result:
-                        bpn = row.bpnl
-                        connectors_list = row.connectors
-                        expires_at = row.expires_at
-                        
-                        # Convert datetime back to timestamp for the SDK
-                        timestamp = expires_at.timestamp()
-
-                        self.known_connectors[bpn] = {
-                            self.REFRESH_INTERVAL_KEY: timestamp,
-                            self.CONNECTOR_LIST_KEY: connectors_list
-                        }
-                        loaded_bpns += 1
-
-                # Only log if there's a change in the data
-                new_hash = hashlib.sha256(json.dumps(self.known_connectors, sort_keys=True, default=str).encode()).hexdigest()
-                if self.logger and self.verbose and (self._last_saved_hash is None or new_hash != self._last_saved_hash):
-                    self.logger.info(f"[ConsumerConnectorPostgresMemoryManager] Loaded {loaded_bpns} BPN connector entries from the database.")
-                    
-                self._last_saved_hash = new_hash
+
+                known_connectors = {row.bpnl: self._row_to_entry(row) for row in result}
+                for bpn in self._dirty_bpns:
+                    known_connectors.pop(bpn, None)
+                    if bpn in self.known_connectors:
+                        known_connectors[bpn] = self.known_connectors[bpn]
+                self.known_connectors = known_connectors
+                self._last_loaded_at = started_at
+
+                if self.logger and self.verbose:
+                    self.logger.info(f"[ConsumerConnectorPostgresMemoryManager] Loaded {len(result)} BPN connector entries from the database.")
             except SQLAlchemyError as e:
                 if self.logger and self.verbose:
                     self.logger.error(f"[ConsumerConnectorPostgresMemoryManager] Error loading from db: {e}")
         self.logger.debug(f"[ConsumerConnectorPostgresMemoryManager] [{threading.get_ident()}] Released lock (_load_from_db)")
 
-    def _save_to_db(self):
+    def _load_bpns_from_db(self, bpns: Iterable[str]) -> int:
         """
-        Persist current in-memory known_connectors to the DB only if changes are detected.
+        Reload the connectors of the given BPNs from the DB, including their deletions.
+
+        Args:
+            bpns (Iterable[str]): The BPNs to reload
+
+        Returns:
+            int: Number of reloaded BPNs
         """
-        connectors_to_save = {}
-        current_hash = ""
-        self.logger.debug(f"[ConsumerConnectorPostgresMemoryManager] [{threading.get_ident()}] Trying to acquire lock (_save_to_db)")
+        bpns = [bpn for bpn in set(bpns) if bpn]
+        if not bpns:
+            return 0
+        entries = {}
+        try:
+            with Session(self.engine) as session:
+                for start in range(0, len(bpns), self.BATCH_SIZE):
+                    batch = bpns[start:start + self.BATCH_SIZE]
+                    for row in session.exec(select(self.KnownConnectorsModel).where(self.KnownConnectorsModel.bpnl.in_(batch))).all():
+                        entries[row.bpnl] = self._row_to_entry(row)
+        except SQLAlchemyError as e:
+            if self.logger and self.verbose:
+                self.logger.error(f"[ConsumerConnectorPostgresMemoryManager] Error loading BPNs from db: {e}")
+            return 0
+
+        reloaded = 0
         with self._lock:
-            self.logger.debug(f"[ConsumerConnectorPostgresMemoryManager] [{threading.get_ident()}] Acquired lock (_save_to_db)")
-            current_hash = hashlib.sha256(json.dumps(self.known_connectors, sort_keys=True, default=str).encode()).hexdigest()
+            for bpn in bpns:
+                # Changes not yet saved win over the database state
+                if bpn in self._dirty_bpns or self._purge_all:
+                    continue
+                if bpn in entries:
+                    self.known_connectors[bpn] = entries[bpn]
+                else:
+                    self.known_connectors.pop(bpn, None)
+                reloaded += 1
+        return reloaded
 
-            if current_hash == self._last_saved_hash:
-                return
-            
-            connectors_to_save = copy.deepcopy(self.known_connectors)
+    def _load_changes_from_db(self) -> int:
+        """
+        Reload the BPNs whose rows changed in the DB since the last reload.
+
+        Returns:
+            int: Number of reloaded BPNs
+        """
+        if self._last_loaded_at is None:
+            self._load_from_db()
+            return len(self.known_connectors)
+        started_at = datetime.now()
+        # The overlap covers rows committed late and clock differences between the workers
+        since = self._last_loaded_at - self.reload_overlap
+        try:
+            with Session(self.engine) as session:
+                bpns = session.exec(select(self.KnownConnectorsModel.bpnl).where(self.KnownConnectorsModel.updated_at > since)).all()
+        except SQLAlchemyError as e:
+            if self.logger and self.verbose:
+                self.logger.error(f"[ConsumerConnectorPostgresMemoryManager] Error loading changes from db: {e}")
+            return 0
+        reloaded = self._load_bpns_from_db(bpns)
+        self._last_loaded_at = started_at
+        return reloaded
+
+    def _save_to_db(self) -> List[Optional[str]]:
+        """
+        Persist the BPNs changed in memory since the last save.
+
+        The changed BPNs are upserted in batches and the purged BPNs are deleted,
+        the rows of the other BPNs are not touched.
 
+        Returns:
+            List[Optional[str]]: The saved BPNs, None stands for the whole table being purged.
+                                 Empty if nothing was saved.
+        """
+        self.logger.debug(f"[ConsumerConnectorPostgresMemoryManager] [{threading.get_ident()}] Trying to acquire lock (_save_to_db)")
+        with self._lock:
+            self.logger.debug(f"[ConsumerConnectorPostgresMemoryManager] [{threading.get_ident()}] Acquired lock (_save_to_db)")
+            if not self._dirty_bpns and not self._purge_all:
+                return []
+            purge_all = self._purge_all
+            dirty_bpns = self._dirty_bpns
+            self._purge_all = False
+            self._dirty_bpns = set()
+            changed_entries = {bpn: copy.deepcopy(self.known_connectors.get(bpn)) for bpn in dirty_bpns}
         self.logger.debug(f"[ConsumerConnectorPostgresMemoryManager] [{threading.get_ident()}] Released lock (_save_to_db)")
+
+        model = self.KnownConnectorsModel
+        updated_at = datetime.now()
+        rows = []
+        deleted_bpns = []
+        for bpn, bpn_data in changed_entries.items():
+            if bpn_data and self.CONNECTOR_LIST_KEY in bpn_data and self.REFRESH_INTERVAL_KEY in bpn_data:
+                rows.append({
+                    "bpnl": bpn,
+                    "connectors": bpn_data[self.CONNECTOR_LIST_KEY],
+                    # Convert timestamp to datetime object instead of using the formatted string
+                    "expires_at": datetime.fromtimestamp(bpn_data[self.REFRESH_INTERVAL_KEY]),
+                    "updated_at": updated_at
+                })
+            else:
+                deleted_bpns.append(bpn)
         try:
-            saved_connectors = 0
             with Session(self.engine) as session:
-                # Clear existing data
-                session.exec(delete(self.KnownConnectorsModel))
-                
-                # Save each BPN's connector data
-                for bpn, bpn_data in connectors_to_save.items():
-                    if self.CONNECTOR_LIST_KEY in bpn_data and self.REFRESH_INTERVAL_KEY in bpn_data:
-                        # Convert timestamp to datetime object instead of using the formatted string
-                        timestamp = bpn_data[self.REFRESH_INTERVAL_KEY]
-                        expires_at = datetime.fromtimestamp(timestamp)
-                        connectors_list = bpn_data[self.CONNECTOR_LIST_KEY]
-                        
-                        session.add(self.KnownConnectorsModel(
-                            bpnl=bpn,
-                            connectors=connectors_list,
-                            expires_at=expires_at
-                        ))
-                        saved_connectors += 1
-                                
+                if purge_all:
+                    session.exec(delete(model))
+                for start in range(0, len(deleted_bpns), self.BATCH_SIZE):
+                    session.exec(delete(model).where(model.bpnl.in_(deleted_bpns[start:start + self.BATCH_SIZE])))
+                for start in range(0, len(rows), self.BATCH_SIZE):
+                    self._upsert_rows(session, rows[start:start + self.BATCH_SIZE])
                 session.commit()
 
-                with self._lock:
-                    self._last_saved_hash = current_hash
-
-                if self.logger and self.verbose:
-                    self.logger.info(f"[ConsumerConnectorPostgresMemoryManager] Saved {saved_connectors} BPN connector entries to the database.")
+            if self.logger and self.verbose:
+                self.logger.info(f"[ConsumerConnectorPostgresMemoryManager] Saved {len(rows)} and deleted {len(deleted_bpns)} BPN connector entries in the database.")
         except SQLAlchemyError as e:
             if self.logger and self.verbose:
                 self.logger.error(f"[ConsumerConnectorPostgresMemoryManager] Error saving to db: {e}")
+            # Keep the changes to retry them with the next save
+            with self._lock:
+                self._dirty_bpns.update(dirty_bpns)
+                self._purge_all = self._purge_all or purge_all
+            return []
+        return [None] if purge_all else sorted(dirty_bpns)
+
+    def _upsert_rows(self, session: Session, rows: List[Dict]):
+        """
+        Insert the connector rows or update them if they already exist.
+        """
+        if not rows:
+            return
+        # Both dialects support INSERT ... ON CONFLICT DO UPDATE
+        insert = {"postgresql": pg_insert, "sqlite": sqlite_insert}.get(self.engine.dialect.name)
+        if insert is not None:
+            statement = insert(self.KnownConnectorsModel.__table__).values(rows)
+            statement = statement.on_conflict_do_update(
+                index_elements=["bpnl"],
+                set_={column: statement.excluded[column] for column in ("connectors", "expires_at", "updated_at")}
+            )
+            session.execute(statement)
+        else:
+            for row in rows:
+                session.merge(self.KnownConnectorsModel(**row))
 
     def stop(self):
         """
@@ -260,4 +391,4 @@ class ConsumerConnectorPostgresMemoryManager(ConnectorConsumerMemoryManager):
         """
         if self._save_thread:
             self._save_thread.join()
-        self._save_to_db()
\ No newline at end of file
+        self._save_to_db()
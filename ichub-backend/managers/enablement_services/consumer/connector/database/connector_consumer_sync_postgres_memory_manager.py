@@ -27,14 +27,18 @@ from sqlalchemy.orm import Session as S
 import threading
 import time
 import logging
+from typing import List, Optional
 from tractusx_sdk.dataspace.services.discovery import ConnectorDiscoveryService
 from tractusx_sdk.dataspace.services.connector import BaseConnectorConsumerService
+from ...cache_invalidation import PostgresCacheInvalidationChannel
 
 class ConsumerConnectorSyncPostgresMemoryManager(ConsumerConnectorPostgresMemoryManager):
     """
     Manages EDR connections using an in-memory cache synchronized with a Postgres database.
     Periodically persists changes and reloads updates from the database to ensure consistency.
     """
+    MAX_INVALIDATION_KEYS = 50
+
     def __init__(self, 
                  connector_consumer_service: BaseConnectorConsumerService,
                  engine: E | S, 
@@ -44,7 +48,10 @@ class ConsumerConnectorSyncPostgresMemoryManager(ConsumerConnectorPostgresMemory
                  table_name: str = "known_connectors", 
                  connectors_key: str = "connectors", 
                  logger: logging.Logger = None, 
-                 verbose: bool = False):
+                 verbose: bool = False,
+                 stale_while_revalidate: bool = False,
+                 invalidation_channel: Optional[PostgresCacheInvalidationChannel] = None,
+                 full_reload_interval: int = 300):
 
         super().__init__(
             connector_consumer_service=connector_consumer_service,
@@ -54,10 +61,16 @@ class ConsumerConnectorSyncPostgresMemoryManager(ConsumerConnectorPostgresMemory
             verbose=verbose, 
             table_name=table_name, 
             connectors_key=connectors_key, 
-            engine=engine
+            engine=engine,
+            stale_while_revalidate=stale_while_revalidate
         )
         self.persist_interval = persist_interval
+        self.full_reload_interval = full_reload_interval
         self._stop_event = threading.Event()
+        self.invalidation_channel = invalidation_channel
+        if self.invalidation_channel is not None:
+            # Reload the connectors as soon as another worker has persisted a change
+            self.invalidation_channel.subscribe(self.table_name, self._on_invalidation)
         self._start_background_tasks()
 
     def _start_background_tasks(self):
@@ -69,11 +82,42 @@ class ConsumerConnectorSyncPostgresMemoryManager(ConsumerConnectorPostgresMemory
     def _persistence_loop(self):
         """
         Periodically save current in-memory connections to DB and reload any changes.
+
+        Only the BPNs changed since the last reload are loaded, the whole table is reloaded
+        every full_reload_interval seconds to also pick up rows deleted by other workers.
         """
+        last_full_reload = time.monotonic()
         while not self._stop_event.is_set():
             time.sleep(self.persist_interval)
             self._save_to_db()
+            if time.monotonic() - last_full_reload >= self.full_reload_interval:
+                self._load_from_db()
+                last_full_reload = time.monotonic()
+            else:
+                self._load_changes_from_db()
+
+    def _save_to_db(self) -> List[Optional[str]]:
+        """
+        Persist the changed connections and notify the other workers about the saved BPNs.
+        """
+        saved_bpns = super()._save_to_db()
+        if saved_bpns and self.invalidation_channel is not None:
+            if None in saved_bpns or len(saved_bpns) > self.MAX_INVALIDATION_KEYS:
+                # Let the other workers reload everything instead of sending one notification per BPN
+                self.invalidation_channel.publish(self.table_name)
+            else:
+                for bpn in saved_bpns:
+                    self.invalidation_channel.publish(self.table_name, bpn)
+        return saved_bpns
+
+    def _on_invalidation(self, key: Optional[str] = None):
+        """
+        Reload the connections persisted by another worker, only for the given BPN if any.
+        """
+        if key is None:
             self._load_from_db()
+        else:
+            self._load_bpns_from_db([key])
 
     def stop(self):
         """
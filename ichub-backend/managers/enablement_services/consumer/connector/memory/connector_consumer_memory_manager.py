@@ -31,6 +31,7 @@ from tractusx_sdk.dataspace.services.discovery import ConnectorDiscoveryService
 from tractusx_sdk.dataspace.services.connector import BaseConnectorConsumerService
 from tractusx_sdk.dataspace.tools import op
 from managers.enablement_services.consumer.base_connector_consumer_manager import BaseConnectorConsumerManager
+from managers.enablement_services.consumer.single_flight import SingleFlight
 from typing import List, Dict, Optional
 import copy
 import logging
@@ -55,7 +56,8 @@ class ConnectorConsumerMemoryManager(BaseConnectorConsumerManager):
                  connector_discovery: ConnectorDiscoveryService, 
                  expiration_time: int = 60, 
                  logger: logging.Logger = None, 
-                 verbose: bool = False):
+                 verbose: bool = False,
+                 stale_while_revalidate: bool = False):
         """
         Initialize the memory-based connector consumer manager.
         
@@ -65,12 +67,16 @@ class ConnectorConsumerMemoryManager(BaseConnectorConsumerManager):
             expiration_time (int, optional): Cache expiration time in minutes. Defaults to 60.
             logger (logging.Logger, optional): Logger instance
             verbose (bool, optional): Verbose flag
+            stale_while_revalidate (bool, optional): Return expired connectors while they are rediscovered in the background. Defaults to False.
         """
         super().__init__(connector_consumer_service, connector_discovery, expiration_time)
         self.known_connectors = {}
         self.logger = logger if logger else None
         self.verbose = verbose
         self._lock = threading.RLock()
+        self.stale_while_revalidate = stale_while_revalidate
+        # Only one discovery per BPN runs at a time, concurrent callers share its result
+        self._discovery_flight = SingleFlight(name="connector-discovery")
         
     def add_connectors(self, bpn: str, connectors: List[str]) -> None:
         """
@@ -227,6 +233,10 @@ class ConnectorConsumerMemoryManager(BaseConnectorConsumerManager):
         or expired, uses the connector discovery service to find and cache new
         connectors for the given BPN.
         
+        Concurrent callers for the same BPN share a single discovery. With
+        ``stale_while_revalidate`` enabled, expired connectors are returned right
+        away while the discovery refreshes them in the background.
+        
         Args:
             bpn (str): The Business Partner Number to get connectors for
             
@@ -249,9 +259,29 @@ class ConnectorConsumerMemoryManager(BaseConnectorConsumerManager):
                 self.logger.debug(f"[CONNECTOR Manager] [{bpn}] Returning [{len(self.known_connectors[bpn][self.CONNECTOR_LIST_KEY])}] CONNECTORs from cache. Next refresh at [{op.timestamp_to_datetime(self.known_connectors[bpn][self.REFRESH_INTERVAL_KEY])}] UTC")
             return self.known_connectors[bpn][self.CONNECTOR_LIST_KEY] ## Return the urls from the connectors
             
+        ## Serve the expired connectors while a single background discovery refreshes them
+        if(self.stale_while_revalidate) and (known_connectors.get(self.CONNECTOR_LIST_KEY)):
+            started = self._discovery_flight.do_async(bpn, self._discover_connectors, bpn)
+            if(self.logger and self.verbose):
+                self.logger.debug(f"[CONNECTOR Manager] [{bpn}] Returning [{len(known_connectors[self.CONNECTOR_LIST_KEY])}] expired CONNECTORs from cache, {'started' if started else 'waiting for'} background refresh")
+            return known_connectors[self.CONNECTOR_LIST_KEY]
+            
         if(self.logger and self.verbose):
             self.logger.info(f"[CONNECTOR Manager] No cached CONNECTOR were found, discoverying CONNECTORs for bpn [{bpn}]...")
 
+        ## Only one discovery per BPN, concurrent callers wait for its result
+        return list(self._discovery_flight.do(bpn, self._discover_connectors, bpn))
+
+    def _discover_connectors(self, bpn: str) -> List[str]:
+        """
+        Discover the connectors of a BPN using the connector discovery service and cache them.
+        
+        Args:
+            bpn (str): The Business Partner Number to discover connectors for
+            
+        Returns:
+            List[str]: List of connector URLs/endpoints for the BPN
+        """
         connectors: Optional[List[str]] = self.connector_discovery.find_connector_by_bpn(bpn=bpn)
         if(connectors is None or len(connectors) == 0):
             return []
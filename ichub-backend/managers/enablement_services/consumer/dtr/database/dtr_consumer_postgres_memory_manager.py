@@ -22,11 +22,13 @@
 ## Code created partially using a LLM (GPT 4o) and reviewed by a human committer
 
 import threading
-import hashlib
-from typing import List, Dict, TYPE_CHECKING
-import json
-from datetime import datetime
+import copy
+from typing import List, Dict, Optional, Iterable, TYPE_CHECKING
+from datetime import datetime, timedelta
 from sqlmodel import select, delete, Session, SQLModel
+from sqlalchemy import inspect
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.exc import SQLAlchemyError
 import logging
 from ..memory import DtrConsumerMemoryManager
@@ -37,13 +39,16 @@ from models.metadata_database.consumer.models import KnownDtrs
 if TYPE_CHECKING:
     from managers.enablement_services.connector_manager import BaseConnectorConsumerManager
 
+# The table models are declared once per table name, declaring them again duplicates their indexes
+_known_dtrs_models: Dict[str, type] = {}
+
 class DtrConsumerPostgresMemoryManager(DtrConsumerMemoryManager):
     """
     DTR manager for storing and synchronizing DTR data between memory and a Postgres database.
     Inherits from DtrConsumerMemoryManager to maintain an in-memory cache and extends it with persistent storage functionality.
     """
 
-    def __init__(self, engine: E | S, connector_consumer_manager: 'BaseConnectorConsumerManager', expiration_time:int=3600, table_name="known_dtrs", dtrs_key="dtrs", logger:logging.Logger=None, verbose:bool=False, dct_type_id="dct:type", dct_type_key:str="'http://purl.org/dc/terms/type'.'@id'", operator:str="=", dct_type:str="https://w3id.org/catenax/taxonomy#DigitalTwinRegistry"):
+    def __init__(self, engine: E | S, connector_consumer_manager: 'BaseConnectorConsumerManager', expiration_time:int=3600, table_name="known_dtrs", dtrs_key="dtrs", logger:logging.Logger=None, verbose:bool=False, dct_type_id="dct:type", dct_type_key:str="'http://purl.org/dc/terms/type'.'@id'", operator:str="=", dct_type:str="https://w3id.org/catenax/taxonomy#DigitalTwinRegistry", max_parallel_dtrs:int=5, discovery_timeout:Optional[float]=None, max_parallel_requests:int=20, request_timeout:Optional[float]=30, shell_cache_max_entries:int=10000, shell_cache_max_bytes:Optional[int]=64*1024*1024, shell_cache_ttl:Optional[float]=300, stale_while_revalidate:bool=False):
         """
         Initialize the Postgres memory-backed DTR manager.
 
@@ -54,23 +59,39 @@ class DtrConsumerPostgresMemoryManager(DtrConsumerMemoryManager):
             dtrs_key: Key used to store DTR data within known_dtrs.
             logger: Optional logger instance for debug output.
             verbose: Flag for enabling verbose logging.
+            max_parallel_dtrs: Maximum number of DTRs queried concurrently during shell discovery.
+            discovery_timeout: Default deadline in seconds for a shell discovery request.
+            max_parallel_requests: Size of the shared pool for descriptor fetches, data fetches and negotiations.
+            request_timeout: Timeout in seconds for each HTTP request to a dataplane.
+            shell_cache_max_entries: Maximum number of cached shell descriptors.
+            shell_cache_max_bytes: Maximum size of the cached shell descriptors in bytes.
+            shell_cache_ttl: Time to live of a cached shell descriptor in seconds.
+            stale_while_revalidate: Return expired DTRs while they are rediscovered in the background.
         """
         # Initialize base memory DTR manager and configure database.
         # Dynamically define the SQLModel table for DTR data.
         # Load existing data from the database into memory.
-        super().__init__(connector_consumer_manager=connector_consumer_manager, expiration_time=expiration_time, logger=logger, verbose=verbose, dct_type_id=dct_type_id, dct_type_key=dct_type_key, operator=operator, dct_type=dct_type)
+        super().__init__(connector_consumer_manager=connector_consumer_manager, expiration_time=expiration_time, logger=logger, verbose=verbose, dct_type_id=dct_type_id, dct_type_key=dct_type_key, operator=operator, dct_type=dct_type, max_parallel_dtrs=max_parallel_dtrs, discovery_timeout=discovery_timeout, max_parallel_requests=max_parallel_requests, request_timeout=request_timeout, shell_cache_max_entries=shell_cache_max_entries, shell_cache_max_bytes=shell_cache_max_bytes, shell_cache_ttl=shell_cache_ttl, stale_while_revalidate=stale_while_revalidate)
         self.engine = engine
         self.table_name = table_name
         self.dtrs_key = dtrs_key
         self._save_thread = None
-        self._last_saved_hash = None
+        # BPNs changed in memory since the last save, only their rows are written to the database
+        self._dirty_bpns = set()
+        self._purge_all = False
+        # Start time of the last reload, used to load only the rows changed since then
+        self._last_loaded_at: Optional[datetime] = None
+        self.reload_overlap = timedelta(seconds=30)
         SQLModel.metadata.create_all(engine)
-        class DynamicKnownDtrs(KnownDtrs, table=True):
-            __tablename__ = table_name
-            __table_args__ = {"extend_existing": True}
+        if table_name not in _known_dtrs_models:
+            class DynamicKnownDtrs(KnownDtrs, table=True):
+                __tablename__ = table_name
+                __table_args__ = {"extend_existing": True}
+            _known_dtrs_models[table_name] = DynamicKnownDtrs
 
-        self.KnownDtrsModel = DynamicKnownDtrs
-        DynamicKnownDtrs.metadata.create_all(engine)
+        self.KnownDtrsModel = _known_dtrs_models[table_name]
+        self._drop_outdated_table()
+        self.KnownDtrsModel.metadata.create_all(engine, tables=[self.KnownDtrsModel.__table__])
         self._load_from_db()
 
     def add_dtr(self, bpn: str, connector_url: str, asset_id: str, policies: List[str]) -> None:
@@ -89,7 +110,9 @@ class DtrConsumerPostgresMemoryManager(DtrConsumerMemoryManager):
         Returns:
             None
         """
-        super().add_dtr(bpn, connector_url, asset_id, policies)  # Call the base class method to handle in-memory caching
+        with self._dtrs_lock:
+            super().add_dtr(bpn, connector_url, asset_id, policies)  # Call the base class method to handle in-memory caching
+            self._dirty_bpns.add(bpn)
         self._trigger_save()
 
     def delete_dtr(self, bpn: str, asset_id: str) -> Dict:
@@ -103,7 +126,9 @@ class DtrConsumerPostgresMemoryManager(DtrConsumerMemoryManager):
         Returns:
             Dict: Updated cache state after deletion
         """
-        super().delete_dtr(bpn, asset_id)
+        with self._dtrs_lock:
+            super().delete_dtr(bpn, asset_id)
+            self._dirty_bpns.add(bpn)
         self._trigger_save()
         return self.known_dtrs
 
@@ -118,7 +143,9 @@ class DtrConsumerPostgresMemoryManager(DtrConsumerMemoryManager):
         Returns:
             None
         """
-        super().purge_bpn(bpn)
+        with self._dtrs_lock:
+            super().purge_bpn(bpn)
+            self._dirty_bpns.add(bpn)
         self._trigger_save()
 
     
@@ -132,7 +159,19 @@ class DtrConsumerPostgresMemoryManager(DtrConsumerMemoryManager):
         Returns:
             None
         """
-        super().purge_cache()
+        with self._dtrs_lock:
+            super().purge_cache()
+            self._purge_all = True
+            self._dirty_bpns.clear()
+        self._trigger_save()
+
+    def _delete_connection(self, connector_service, counter_party_id: str, connector_url: str, policies: List, filter_expression: Dict, bpn: str, asset_id: str):
+        """
+        Delete the failed connection and persist the removal of the DTR from the cache.
+        """
+        super()._delete_connection(connector_service, counter_party_id, connector_url, policies, filter_expression, bpn, asset_id)
+        with self._dtrs_lock:
+            self._dirty_bpns.add(bpn)
         self._trigger_save()
 
 
@@ -145,111 +184,227 @@ class DtrConsumerPostgresMemoryManager(DtrConsumerMemoryManager):
             return
         self._save_thread = threading.Thread(target=self._save_to_db, daemon=True)
         self._save_thread.start()
-        
+
+    def _drop_outdated_table(self):
+        """
+        Drop a DTR table created before DTRs were keyed by BPN and asset ID.
+
+        The table only caches discovery results, the DTRs are discovered again when needed.
+        """
+        inspector = inspect(self.engine)
+        if not inspector.has_table(self.table_name):
+            return
+        primary_key = inspector.get_pk_constraint(self.table_name).get("constrained_columns", [])
+        columns = {column["name"] for column in inspector.get_columns(self.table_name)}
+        if set(primary_key) == {"bpnl", "asset_id"} and "updated_at" in columns:
+            return
+        if self.logger:
+            self.logger.warning(f"[DtrConsumerPostgresMemoryManager] Recreating outdated table [{self.table_name}], the cached DTRs will be discovered again.")
+        self.KnownDtrsModel.__table__.drop(self.engine)
+
+    def _rows_to_entries(self, rows) -> Dict:
+        """
+        Convert the database rows into the in-memory structure of known_dtrs.
+        """
+        entries = {}
+        for row in rows:
+            # Convert datetime back to timestamp for the SDK
+            timestamp = row.expires_at.timestamp()
+
+            # Initialize BPN structure if it doesn't exist
+            entry = entries.setdefault(row.bpnl, {
+                self.REFRESH_INTERVAL_KEY: timestamp,
+                self.DTR_DATA_KEY: {}
+            })
+
+            # Update refresh interval to the latest timestamp
+            if timestamp > entry[self.REFRESH_INTERVAL_KEY]:
+                entry[self.REFRESH_INTERVAL_KEY] = timestamp
+
+            # Add DTR using asset_id as key
+            entry[self.DTR_DATA_KEY][row.asset_id] = {
+                self.DTR_CONNECTOR_URL_KEY: row.edc_url,
+                self.DTR_ASSET_ID_KEY: row.asset_id,
+                self.DTR_POLICIES_KEY: row.policies
+            }
+        return entries
+
     def _load_from_db(self):
         """
-        Reload known_dtrs from the DB and restore them to memory.
+        Reload all known_dtrs from the DB and restore them to memory.
+
+        BPNs with changes not yet saved keep their in-memory state.
         """
         self.logger.debug(f"[DtrConsumerPostgresMemoryManager] [{threading.get_ident()}] Trying to acquire lock (load_from_db)")
         with self._dtrs_lock:
             self.logger.debug(f"[DtrConsumerPostgresMemoryManager] [{threading.get_ident()}] Acquired lock (load_from_db)")
             try:
-                loaded_dtrs = 0
+                started_at = datetime.now()
                 with Session(self.engine) as session:
                     result = session.exec(select(self.KnownDtrsModel)).all()
-                    
-                    # Store current state to compare for changes
-                    old_dtrs = self.known_dtrs.copy()
-                    
-                    # Clear current known_dtrs
-                    self.known_dtrs = {}
-                    
-                    for row in result:
-                        bpn = row.bpnl
-                        edc_url = row.edc_url
-                        asset_id = row.asset_id
-                        policies = row.policies
-                        expires_at = row.expires_at
-                        
-                        # Convert datetime back to timestamp for the SDK
-                        timestamp = expires_at.timestamp()
-
-                        # Initialize BPN structure if it doesn't exist
-                        if bpn not in self.known_dtrs:
-                            self.known_dtrs[bpn] = {
-                                self.REFRESH_INTERVAL_KEY: timestamp,
-                                self.DTR_DATA_KEY: {}
-                            }
-                        
-                        # Update refresh interval to the latest timestamp
-                        if timestamp > self.known_dtrs[bpn][self.REFRESH_INTERVAL_KEY]:
-                            self.known_dtrs[bpn][self.REFRESH_INTERVAL_KEY] = timestamp
-                        
-                        # Add DTR using asset_id as key
-                        self.known_dtrs[bpn][self.DTR_DATA_KEY][asset_id] = {
-                            self.DTR_CONNECTOR_URL_KEY: edc_url,
-                            self.DTR_ASSET_ID_KEY: asset_id,
-                            self.DTR_POLICIES_KEY: policies
-                        }
-                        loaded_dtrs += 1
-
-                # Only log if there's a change in the data
-                new_hash = hashlib.sha256(json.dumps(self.known_dtrs, sort_keys=True, default=str).encode()).hexdigest()
-                if self.logger and self.verbose and (self._last_saved_hash is None or new_hash != self._last_saved_hash):
-                    self.logger.info(f"[DtrConsumerPostgresMemoryManager] Loaded {loaded_dtrs} DTR entries from the database.")
-                    
-                self._last_saved_hash = new_hash
+                entries = self._rows_to_entries(result)
+                for bpn in self._dirty_bpns:
+                    entries.pop(bpn, None)
+                    if bpn in self.known_dtrs:
+                        entries[bpn] = self.known_dtrs[bpn]
+                self.known_dtrs = entries
+                self._last_loaded_at = started_at
+
+                if self.logger and self.verbose:
+                    self.logger.info(f"[DtrConsumerPostgresMemoryManager] Loaded {len(result)} DTR entries from the database.")
             except SQLAlchemyError as e:
                 if self.logger and self.verbose:
                     self.logger.error(f"[DtrConsumerPostgresMemoryManager] Error loading from db: {e}")
         self.logger.debug(f"[DtrConsumerPostgresMemoryManager] [{threading.get_ident()}] Released lock (load_from_db)")
-          
-    def _save_to_db(self):
+
+    def _load_bpns_from_db(self, bpns: Iterable[str]) -> int:
         """
-        Persist current in-memory known_dtrs to the DB only if changes are detected.
+        Reload the DTRs of the given BPNs from the DB, including their deletions.
+
+        Args:
+            bpns (Iterable[str]): The BPNs to reload
+
+        Returns:
+            int: Number of reloaded BPNs
+        """
+        bpns = [bpn for bpn in set(bpns) if bpn]
+        if not bpns:
+            return 0
+        try:
+            with Session(self.engine) as session:
+                result = session.exec(select(self.KnownDtrsModel).where(self.KnownDtrsModel.bpnl.in_(bpns))).all()
+        except SQLAlchemyError as e:
+            if self.logger and self.verbose:
+                self.logger.error(f"[DtrConsumerPostgresMemoryManager] Error loading BPNs from db: {e}")
+            return 0
+
+        entries = self._rows_to_entries(result)
+        reloaded = 0
+        with self._dtrs_lock:
+            for bpn in bpns:
+                # Changes not yet saved win over the database state
+                if bpn in self._dirty_bpns or self._purge_all:
+                    continue
+                if bpn in entries:
+                    self.known_dtrs[bpn] = entries[bpn]
+                else:
+                    self.known_dtrs.pop(bpn, None)
+                reloaded += 1
+        return reloaded
+
+    def _load_changes_from_db(self) -> int:
+        """
+        Reload the BPNs whose rows changed in the DB since the last reload.
+
+        Returns:
+            int: Number of reloaded BPNs
+        """
+        if self._last_loaded_at is None:
+            self._load_from_db()
+            return len(self.known_dtrs)
+        started_at = datetime.now()
+        # The overlap covers rows committed late and clock differences between the workers
+        since = self._last_loaded_at - self.reload_overlap
+        try:
+            with Session(self.engine) as session:
+                bpns = session.exec(select(self.KnownDtrsModel.bpnl).where(self.KnownDtrsModel.updated_at > since).distinct()).all()
+        except SQLAlchemyError as e:
+            if self.logger and self.verbose:
+                self.logger.error(f"[DtrConsumerPostgresMemoryManager] Error loading changes from db: {e}")
+            return 0
+        reloaded = self._load_bpns_from_db(bpns)
+        self._last_loaded_at = started_at
+        return reloaded
+
+    def _save_to_db(self) -> List[Optional[str]]:
+        """
+        Persist the BPNs changed in memory since the last save.
+
+        Only the rows of the changed BPNs are written: their DTRs are upserted and
+        the DTRs removed from memory are deleted.
+
+        Returns:
+            List[Optional[str]]: The saved BPNs, None stands for the whole table being purged.
+                                 Empty if nothing was saved.
         """
         self.logger.debug(f"[DtrConsumerPostgresMemoryManager] [{threading.get_ident()}] Trying to acquire lock (save_to_db)")
         with self._dtrs_lock:
             self.logger.debug(f"[DtrConsumerPostgresMemoryManager] [{threading.get_ident()}] Acquired lock (save_to_db)")
-            current_hash = hashlib.sha256(json.dumps(self.known_dtrs, sort_keys=True, default=str).encode()).hexdigest()
-            if current_hash == self._last_saved_hash:
-                return
-            try:
-                saved_dtrs = 0
-                with Session(self.engine) as session:
-                    # Clear existing data
-                    session.exec(delete(self.KnownDtrsModel))
-                    
-                    # Save each BPN's DTR data
-                    for bpn, bpn_data in self.known_dtrs.items():
-                        if self.DTR_DATA_KEY in bpn_data and self.REFRESH_INTERVAL_KEY in bpn_data:
-                            # Convert timestamp to datetime object instead of using the formatted string
-                            timestamp = bpn_data[self.REFRESH_INTERVAL_KEY]
-                            expires_at = datetime.fromtimestamp(timestamp)
-                            dtr_dict = bpn_data[self.DTR_DATA_KEY]
-                            
-                            # Iterate through all DTRs for this BPN (now a dictionary keyed by asset_id)
-                            if isinstance(dtr_dict, dict):
-                                for asset_id, dtr_data in dtr_dict.items():
-                                    if dtr_data is not None:
-                                        session.add(self.KnownDtrsModel(
-                                            bpnl=bpn,
-                                            edc_url=dtr_data[self.DTR_CONNECTOR_URL_KEY],
-                                            asset_id=dtr_data[self.DTR_ASSET_ID_KEY],
-                                            policies=dtr_data[self.DTR_POLICIES_KEY],
-                                            expires_at=expires_at
-                                        ))
-                                        saved_dtrs += 1
-                                    
-                    session.commit()
-                    self._last_saved_hash = current_hash
-                    if self.logger and self.verbose:
-                        self.logger.info(f"[DtrConsumerPostgresMemoryManager] Saved {saved_dtrs} DTR entries to the database.")
-            except SQLAlchemyError as e:
-                if self.logger and self.verbose:
-                    self.logger.error(f"[DtrConsumerPostgresMemoryManager] Error saving to db: {e}")
+            if not self._dirty_bpns and not self._purge_all:
+                return []
+            purge_all = self._purge_all
+            dirty_bpns = self._dirty_bpns
+            self._purge_all = False
+            self._dirty_bpns = set()
+            changed_entries = {bpn: copy.deepcopy(self.known_dtrs.get(bpn)) for bpn in dirty_bpns}
         self.logger.debug(f"[DtrConsumerPostgresMemoryManager] [{threading.get_ident()}] Released lock (save_to_db)")
 
+        model = self.KnownDtrsModel
+        try:
+            saved_dtrs = 0
+            updated_at = datetime.now()
+            with Session(self.engine) as session:
+                if purge_all:
+                    session.exec(delete(model))
+
+                for bpn, entry in changed_entries.items():
+                    dtr_dict = (entry or {}).get(self.DTR_DATA_KEY) or {}
+                    # Delete the DTRs which are no longer known for this BPN
+                    statement = delete(model).where(model.bpnl == bpn)
+                    if dtr_dict:
+                        statement = statement.where(model.asset_id.not_in(list(dtr_dict.keys())))
+                    session.exec(statement)
+
+                    if not dtr_dict:
+                        continue
+                    # Convert timestamp to datetime object instead of using the formatted string
+                    expires_at = datetime.fromtimestamp(entry[self.REFRESH_INTERVAL_KEY])
+                    rows = [
+                        {
+                            "bpnl": bpn,
+                            "edc_url": dtr_data[self.DTR_CONNECTOR_URL_KEY],
+                            "asset_id": dtr_data[self.DTR_ASSET_ID_KEY],
+                            "policies": dtr_data[self.DTR_POLICIES_KEY],
+                            "expires_at": expires_at,
+                            "updated_at": updated_at
+                        }
+                        for dtr_data in dtr_dict.values() if dtr_data is not None
+                    ]
+                    self._upsert_rows(session, rows)
+                    saved_dtrs += len(rows)
+
+                session.commit()
+            if self.logger and self.verbose:
+                self.logger.info(f"[DtrConsumerPostgresMemoryManager] Saved {saved_dtrs} DTR entries of {len(changed_entries)} BPNs to the database.")
+        except SQLAlchemyError as e:
+            if self.logger and self.verbose:
+                self.logger.error(f"[DtrConsumerPostgresMemoryManager] Error saving to db: {e}")
+            # Keep the changes to retry them with the next save
+            with self._dtrs_lock:
+                self._dirty_bpns.update(dirty_bpns)
+                self._purge_all = self._purge_all or purge_all
+            return []
+        return [None] if purge_all else sorted(dirty_bpns)
+
+    def _upsert_rows(self, session: Session, rows: List[Dict]):
+        """
+        Insert the DTR rows or update them if they already exist.
+        """
+        if not rows:
+            return
+        # Both dialects support INSERT ... ON CONFLICT DO UPDATE
+        insert = {"postgresql": pg_insert, "sqlite": sqlite_insert}.get(self.engine.dialect.name)
+        if insert is not None:
+            statement = insert(self.KnownDtrsModel.__table__).values(rows)
+            statement = statement.on_conflict_do_update(
+                index_elements=["bpnl", "asset_id"],
+                set_={column: statement.excluded[column] for column in ("edc_url", "policies", "expires_at", "updated_at")}
+            )
+            session.execute(statement)
+        else:
+            for row in rows:
+                session.merge(self.KnownDtrsModel(**row))
+
     def stop(self):
         """
         Stop the background thread and perform a final save to the database.
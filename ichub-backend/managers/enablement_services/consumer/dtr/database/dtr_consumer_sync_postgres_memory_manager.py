@@ -22,12 +22,13 @@
 ## Code created partially using a LLM (GPT 4o) and reviewed by a human committer
 
 from .dtr_consumer_postgres_memory_manager import DtrConsumerPostgresMemoryManager
+from ...cache_invalidation import PostgresCacheInvalidationChannel
 from sqlalchemy.engine import Engine as E
 from sqlalchemy.orm import Session as S
 import threading
 import time
 import logging
-from typing import TYPE_CHECKING
+from typing import List, Optional, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from managers.enablement_services.connector_manager import BaseConnectorConsumerManager
@@ -37,7 +38,8 @@ class DtrConsumerSyncPostgresMemoryManager(DtrConsumerPostgresMemoryManager):
     Manages DTR data using an in-memory cache synchronized with a Postgres database.
     Periodically persists changes and reloads updates from the database to ensure consistency.
     """
-    def __init__(self, engine: E | S, connector_consumer_manager: 'BaseConnectorConsumerManager', persist_interval:int = 5, expiration_time:int=3600, table_name="known_dtrs", dtrs_key="dtrs", logger:logging.Logger=None, verbose:bool=False, dct_type_id="dct:type",dct_type_key:str="'http://purl.org/dc/terms/type'.'@id'", operator:str="=", dct_type:str="https://w3id.org/catenax/taxonomy#DigitalTwinRegistry"):
+    MAX_INVALIDATION_KEYS = 50
+    def __init__(self, engine: E | S, connector_consumer_manager: 'BaseConnectorConsumerManager', persist_interval:int = 5, expiration_time:int=3600, table_name="known_dtrs", dtrs_key="dtrs", logger:logging.Logger=None, verbose:bool=False, dct_type_id="dct:type",dct_type_key:str="'http://purl.org/dc/terms/type'.'@id'", operator:str="=", dct_type:str="https://w3id.org/catenax/taxonomy#DigitalTwinRegistry", max_parallel_dtrs:int=5, discovery_timeout:Optional[float]=None, max_parallel_requests:int=20, request_timeout:Optional[float]=30, shell_cache_max_entries:int=10000, shell_cache_max_bytes:Optional[int]=64*1024*1024, shell_cache_ttl:Optional[float]=300, stale_while_revalidate:bool=False, invalidation_channel:Optional[PostgresCacheInvalidationChannel]=None, full_reload_interval:int=300):
         """Initialize the DTR consumer synchronization manager.
 
         Args:
@@ -49,10 +51,25 @@ class DtrConsumerSyncPostgresMemoryManager(DtrConsumerPostgresMemoryManager):
             dtrs_key (str, optional): Key used to store DTR data within known_dtrs. Defaults to "dtrs".
             logger (logging.Logger, optional): Logger instance for debug output. Defaults to None.
             verbose (bool, optional): Flag for enabling verbose logging. Defaults to False.
+            max_parallel_dtrs (int, optional): Maximum number of DTRs queried concurrently during shell discovery. Defaults to 5.
+            discovery_timeout (Optional[float], optional): Default deadline in seconds for a shell discovery request. Defaults to None.
+            max_parallel_requests (int, optional): Size of the shared pool for descriptor fetches, data fetches and negotiations. Defaults to 20.
+            request_timeout (Optional[float], optional): Timeout in seconds for each HTTP request to a dataplane. Defaults to 30.
+            shell_cache_max_entries (int, optional): Maximum number of cached shell descriptors. Defaults to 10000.
+            shell_cache_max_bytes (Optional[int], optional): Maximum size of the cached shell descriptors in bytes. Defaults to 64 MiB.
+            shell_cache_ttl (Optional[float], optional): Time to live of a cached shell descriptor in seconds. Defaults to 300.
+            stale_while_revalidate (bool, optional): Return expired DTRs while they are rediscovered in the background. Defaults to False.
+            invalidation_channel (Optional[PostgresCacheInvalidationChannel], optional): Channel notifying the other workers about persisted changes. Defaults to None.
+            full_reload_interval (int, optional): Interval in seconds for reloading the whole table instead of only the changed rows. Defaults to 300.
         """
-        super().__init__(connector_consumer_manager=connector_consumer_manager, expiration_time=expiration_time, logger=logger, verbose=verbose, table_name=table_name, dtrs_key=dtrs_key, engine=engine, dct_type_id=dct_type_id, dct_type_key=dct_type_key, operator=operator, dct_type=dct_type)
+        super().__init__(connector_consumer_manager=connector_consumer_manager, expiration_time=expiration_time, logger=logger, verbose=verbose, table_name=table_name, dtrs_key=dtrs_key, engine=engine, dct_type_id=dct_type_id, dct_type_key=dct_type_key, operator=operator, dct_type=dct_type, max_parallel_dtrs=max_parallel_dtrs, discovery_timeout=discovery_timeout, max_parallel_requests=max_parallel_requests, request_timeout=request_timeout, shell_cache_max_entries=shell_cache_max_entries, shell_cache_max_bytes=shell_cache_max_bytes, shell_cache_ttl=shell_cache_ttl, stale_while_revalidate=stale_while_revalidate)
         self.persist_interval = persist_interval
+        self.full_reload_interval = full_reload_interval
         self._stop_event = threading.Event()
+        self.invalidation_channel = invalidation_channel
+        if self.invalidation_channel is not None:
+            # Reload the DTRs as soon as another worker has persisted a change
+            self.invalidation_channel.subscribe(self.table_name, self._on_invalidation)
         self._start_background_tasks()
 
     def _start_background_tasks(self):
@@ -64,11 +81,42 @@ class DtrConsumerSyncPostgresMemoryManager(DtrConsumerPostgresMemoryManager):
     def _persistence_loop(self):
         """
         Periodically save current in-memory DTR data to DB and reload any changes.
+
+        Only the BPNs changed since the last reload are loaded, the whole table is reloaded
+        every full_reload_interval seconds to also pick up rows deleted by other workers.
         """
+        last_full_reload = time.monotonic()
         while not self._stop_event.is_set():
             time.sleep(self.persist_interval)
             self._save_to_db()
+            if time.monotonic() - last_full_reload >= self.full_reload_interval:
+                self._load_from_db()
+                last_full_reload = time.monotonic()
+            else:
+                self._load_changes_from_db()
+
+    def _save_to_db(self) -> List[Optional[str]]:
+        """
+        Persist the changed DTR data and notify the other workers about the saved BPNs.
+        """
+        saved_bpns = super()._save_to_db()
+        if saved_bpns and self.invalidation_channel is not None:
+            if None in saved_bpns or len(saved_bpns) > self.MAX_INVALIDATION_KEYS:
+                # Let the other workers reload everything instead of sending one notification per BPN
+                self.invalidation_channel.publish(self.table_name)
+            else:
+                for bpn in saved_bpns:
+                    self.invalidation_channel.publish(self.table_name, bpn)
+        return saved_bpns
+
+    def _on_invalidation(self, key: Optional[str] = None):
+        """
+        Reload the DTR data persisted by another worker, only for the given BPN if any.
+        """
+        if key is None:
             self._load_from_db()
+        else:
+            self._load_bpns_from_db([key])
 
     def stop(self):
         """
@@ -28,17 +28,20 @@ import logging
 import threading
 import json
 import base64
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 from typing import TYPE_CHECKING, Dict, List, Optional, Union, Any
 from tractusx_sdk.dataspace.tools import op
 from tractusx_sdk.dataspace.services.connector import BaseConnectorConsumerService
 from managers.enablement_services.consumer.base_dtr_consumer_manager import BaseDtrConsumerManager
+from managers.enablement_services.consumer.single_flight import SingleFlight
 from managers.enablement_services.consumer.dtr.pagination_manager import PaginationManager, DtrPaginationState, PageState
+from managers.enablement_services.consumer.dtr.parallel_fetcher import ParallelFetcher
+from managers.enablement_services.consumer.dtr.shell_descriptor_cache import ShellDescriptorCache
 if TYPE_CHECKING:
     from managers.enablement_services.connector_manager import BaseConnectorConsumerManager
 from requests import Response
 from tractusx_sdk.dataspace.models.connector.base_catalog_model import BaseCatalogModel
-from tractusx_sdk.dataspace.tools import HttpTools
 
 class DtrConsumerMemoryManager(BaseDtrConsumerManager):
     """
@@ -54,19 +57,37 @@ class DtrConsumerMemoryManager(BaseDtrConsumerManager):
     logger: logging.Logger
     verbose: bool
 
-    def __init__(self, connector_consumer_manager: 'BaseConnectorConsumerManager', expiration_time: int = 60, logger:logging.Logger=None, verbose:bool=False, dct_type_id="dct:type", dct_type_key:str="'http://purl.org/dc/terms/type'.'@id'", operator:str="=", dct_type:str="https://w3id.org/catenax/taxonomy#DigitalTwinRegistry"):
+    def __init__(self, connector_consumer_manager: 'BaseConnectorConsumerManager', expiration_time: int = 60, logger:logging.Logger=None, verbose:bool=False, dct_type_id="dct:type", dct_type_key:str="'http://purl.org/dc/terms/type'.'@id'", operator:str="=", dct_type:str="https://w3id.org/catenax/taxonomy#DigitalTwinRegistry", max_parallel_dtrs:int=5, discovery_timeout:Optional[float]=None, max_parallel_requests:int=20, request_timeout:Optional[float]=30, shell_cache_max_entries:int=10000, shell_cache_max_bytes:Optional[int]=64*1024*1024, shell_cache_ttl:Optional[float]=300, stale_while_revalidate:bool=False):
         """
         Initialize the memory-based DTR consumer manager.
         
         Args:
             connector_consumer_manager (BaseConnectorConsumerManager): Connector manager with consumer capabilities
             expiration_time (int, optional): Cache expiration time in minutes. Defaults to 60.
+            max_parallel_dtrs (int, optional): Maximum number of DTRs queried concurrently during shell discovery.
+                                               A value of 1 processes the DTRs one after the other. Defaults to 5.
+            discovery_timeout (Optional[float], optional): Default deadline in seconds for a shell discovery request.
+                                                           DTRs not answering in time are reported as "timeout". Defaults to None (no deadline).
+            max_parallel_requests (int, optional): Size of the shared pool used for descriptor fetches, submodel data fetches
+                                                   and asset negotiations. Defaults to 20.
+            request_timeout (Optional[float], optional): Timeout in seconds for each HTTP request to a dataplane. Defaults to 30.
+            shell_cache_max_entries (int, optional): Maximum number of cached shell descriptors. Defaults to 10000.
+            shell_cache_max_bytes (Optional[int], optional): Maximum size of the cached shell descriptors in bytes. Defaults to 64 MiB.
+            shell_cache_ttl (Optional[float], optional): Time to live of a cached shell descriptor in seconds. Defaults to 300.
+            stale_while_revalidate (bool, optional): Return expired DTRs while they are rediscovered in the background. Defaults to False.
         """
         super().__init__(connector_consumer_manager, expiration_time, dct_type_id=dct_type_id, dct_type_key=dct_type_key, operator=operator, dct_type=dct_type)
         self.known_dtrs = {}
-        self.shell_descriptors = {}  # Central storage for shell descriptors by shell ID
+        # Central storage for shell descriptors by (counter party ID, shell ID)
+        self.shell_descriptors = ShellDescriptorCache(max_entries=shell_cache_max_entries, max_bytes=shell_cache_max_bytes, ttl=shell_cache_ttl)
         self.logger = logger if logger else None
         self.verbose = verbose
+        self.max_parallel_dtrs = max(1, max_parallel_dtrs)
+        self.discovery_timeout = discovery_timeout
+        self.stale_while_revalidate = stale_while_revalidate
+        # Only one DTR discovery per BPN runs at a time, concurrent callers share its result
+        self._discovery_flight = SingleFlight(name="dtr-discovery")
+        self.fetcher = ParallelFetcher(max_workers=max_parallel_requests, timeout=request_timeout, logger=logger, verbose=verbose)
         # Use separate locks for different data structures to reduce contention
         self._dtrs_lock = threading.RLock()  # Only for known_dtrs modifications
         self._shells_lock = threading.RLock()  # Only for shell_descriptors modifications
@@ -253,6 +274,15 @@ class DtrConsumerMemoryManager(BaseDtrConsumerManager):
             self.logger.debug(f"[DTR Manager] [{threading.get_ident()}] Released lock (purge_cache - shells)")        
         self.logger.debug(f"[DTR Manager] [{threading.get_ident()}] Released locks (purge_cache)")
 
+    def get_shell_cache_stats(self) -> Dict:
+        """
+        Get the size and the hit/miss/eviction counters of the shell descriptor cache.
+        
+        Returns:
+            Dict: The statistics of the shell descriptor cache
+        """
+        return self.shell_descriptors.stats()
+
     def get_dtrs_by_connector(self, bpn: str, connector_url: str) -> List[Dict]:
         """
         Retrieve DTRs for a specific BPN from a specific connector.
@@ -436,6 +466,10 @@ class DtrConsumerMemoryManager(BaseDtrConsumerManager):
         or expired, it uses the connector manager to get connectors for the BPN,
         then queries each connector's catalog to find DTR assets.
         
+        Concurrent callers for the same BPN share a single discovery. With
+        ``stale_while_revalidate`` enabled, expired DTRs are returned right away
+        while the discovery refreshes them in the background.
+        
         Args:
             bpn (str): The Business Partner Number to get DTRs for
             timeout (int): Timeout for catalog requests
@@ -444,94 +478,126 @@ class DtrConsumerMemoryManager(BaseDtrConsumerManager):
             List[Dict]: List of DTR data for the BPN, each containing connector_url, asset_id, and policies
         """
         # Check if we have cached data that hasn't expired (read operation - no lock needed)
-        if bpn in self.known_dtrs and not self._is_cache_expired(bpn):
-            if self.DTR_DATA_KEY in self.known_dtrs[bpn] and isinstance(self.known_dtrs[bpn][self.DTR_DATA_KEY], dict):
-                cached_dtrs_dict = self.known_dtrs[bpn][self.DTR_DATA_KEY]
-                if len(cached_dtrs_dict) > 0:
-                    if(self.logger and self.verbose):
-                        self.logger.debug(f"[DTR Manager] [{bpn}] Returning {len(cached_dtrs_dict)} DTRs from cache. Next refresh at [{op.timestamp_to_datetime(self.known_dtrs[bpn][self.REFRESH_INTERVAL_KEY])}] UTC")
-                    # Return list of DTR values
-                    return [copy.deepcopy(dtr) for dtr in cached_dtrs_dict.values()]
+        cached_dtrs_dict = self._get_cached_dtrs(bpn)
+        if cached_dtrs_dict and not self._is_cache_expired(bpn):
+            if(self.logger and self.verbose):
+                self.logger.debug(f"[DTR Manager] [{bpn}] Returning {len(cached_dtrs_dict)} DTRs from cache. Next refresh at [{op.timestamp_to_datetime(self.known_dtrs[bpn][self.REFRESH_INTERVAL_KEY])}] UTC")
+            # Return list of DTR values
+            return [copy.deepcopy(dtr) for dtr in cached_dtrs_dict.values()]
         
-        # Cache is expired or doesn't exist, discover DTRs
+        # Serve the expired DTRs while a single background discovery refreshes them
+        if cached_dtrs_dict and self.stale_while_revalidate:
+            started = self._discovery_flight.do_async(bpn, self._discover_dtrs, bpn, timeout)
+            if(self.logger and self.verbose):
+                self.logger.debug(f"[DTR Manager] [{bpn}] Returning {len(cached_dtrs_dict)} expired DTRs from cache, {'started' if started else 'waiting for'} background refresh")
+            return [copy.deepcopy(dtr) for dtr in cached_dtrs_dict.values()]
+        
+        # Cache is expired or doesn't exist, discover DTRs (once for all concurrent callers)
         if(self.logger and self.verbose):
             self.logger.info(f"[DTR Manager] No cached DTRs were found, discovering DTRs for bpn [{bpn}]...")
+        dtrs = self._discovery_flight.do(bpn, self._discover_dtrs, bpn, timeout)
+        return [copy.deepcopy(dtr) for dtr in dtrs]
+    
+    def _get_cached_dtrs(self, bpn: str) -> Optional[Dict]:
+        """Return the cached DTRs of the BPN by asset ID, regardless of their expiration."""
+        bpn_entry = self.known_dtrs.get(bpn)
+        if not bpn_entry:
+            return None
+        cached_dtrs_dict = bpn_entry.get(self.DTR_DATA_KEY)
+        if isinstance(cached_dtrs_dict, dict) and len(cached_dtrs_dict) > 0:
+            return cached_dtrs_dict
+        return None
+    
+    def _discover_dtrs(self, bpn: str, timeout:int=30) -> List[Dict]:
+        """
+        Discover the DTRs of a BPN by searching the catalogs of its connectors and cache them.
+        
+        Args:
+            bpn (str): The Business Partner Number to discover DTRs for
+            timeout (int): Timeout for catalog requests
             
-            # Get connectors from the connector manager
-            try:
-                connectors = self.connector_consumer_manager.get_connectors(bpn)
-                if not connectors or len(connectors) == 0:
-                    if(self.logger and self.verbose):
-                        self.logger.warning(f"[DTR Manager] [{bpn}] No connectors found for DTR discovery")
-                    return []
-                
+        Returns:
+            List[Dict]: The cached DTR entries of the BPN after the discovery
+        """
+        # Get connectors from the connector manager
+        try:
+            connectors = self.connector_consumer_manager.get_connectors(bpn)
+            if not connectors or len(connectors) == 0:
                 if(self.logger and self.verbose):
-                    self.logger.debug(f"[DTR Manager] [{bpn}] Found {len(connectors)} connectors, searching for DTR assets")
-                
-                # Search for DTR assets in each connector's catalog
-                connector_service:BaseConnectorConsumerService = self.connector_consumer_manager.connector_service
-                
-                # Get catalogs in parallel from all the connectors 
-                catalogs:dict = self.get_catalogs_by_filter_expression(
-                                        connector_service=connector_service,
-                                        edcs=connectors,
-                                        counter_party_id=bpn,
-                                        filter_expression=connector_service.get_filter_expression(
-                                            key=self.dct_type_key,
-                                            operator=self.operator,
-                                            value=self.dct_type
-                                        ),
-                                        timeout=timeout
-                                        ) 
-            
-                # Iterate over catalogs and extract DTR information
-                for connector_url, catalog in catalogs.items():
-                    if catalog and not catalog.get("error"):
-                        # Get datasets from the catalog - using DCAT dataset key
-                        datasets = catalog.get(self.DCAT_DATASET_KEY, [])
-                        if not isinstance(datasets, list):
-                            datasets = [datasets] if datasets else []
-                        
-                        for dataset in datasets:
-                            if self._is_dtr_asset(dataset):
-                                # Extract asset ID
-                                asset_id = dataset.get(self.ID_KEY, "")
-                                if not asset_id:
-                                    continue
-                                
-                                # Extract policies
-                                policies = self._extract_policies(dataset)
-                                
-                                # Create DTR data structure
-                                self.add_dtr(bpn=bpn, connector_url=connector_url, asset_id=asset_id, policies=policies)
+                    self.logger.warning(f"[DTR Manager] [{bpn}] No connectors found for DTR discovery")
+                return []
+            
+            if(self.logger and self.verbose):
+                self.logger.debug(f"[DTR Manager] [{bpn}] Found {len(connectors)} connectors, searching for DTR assets")
+            
+            # Search for DTR assets in each connector's catalog
+            connector_service:BaseConnectorConsumerService = self.connector_consumer_manager.connector_service
+            
+            # Get catalogs in parallel from all the connectors 
+            catalogs:dict = self.get_catalogs_by_filter_expression(
+                                    connector_service=connector_service,
+                                    edcs=connectors,
+                                    counter_party_id=bpn,
+                                    filter_expression=connector_service.get_filter_expression(
+                                        key=self.dct_type_key,
+                                        operator=self.operator,
+                                        value=self.dct_type
+                                    ),
+                                    timeout=timeout
+                                    ) 
+        
+            # Iterate over catalogs and extract DTR information
+            for connector_url, catalog in catalogs.items():
+                if catalog and not catalog.get("error"):
+                    # Get datasets from the catalog - using DCAT dataset key
+                    datasets = catalog.get(self.DCAT_DATASET_KEY, [])
+                    if not isinstance(datasets, list):
+                        datasets = [datasets] if datasets else []
+                    
+                    for dataset in datasets:
+                        if self._is_dtr_asset(dataset):
+                            # Extract asset ID
+                            asset_id = dataset.get(self.ID_KEY, "")
+                            if not asset_id:
+                                continue
+                            
+                            # Extract policies
+                            policies = self._extract_policies(dataset)
+                            
+                            # Create DTR data structure
+                            self.add_dtr(bpn=bpn, connector_url=connector_url, asset_id=asset_id, policies=policies)
 
-                                if(self.logger and self.verbose):
-                                    self.logger.info(f"[DTR Manager] [{bpn}] Found DTR asset [{asset_id}] in connector [{connector_url}] added to cache")
-                
-                # Return the cached DTRs for this BPN
-                if bpn in self.known_dtrs and self.DTR_DATA_KEY in self.known_dtrs[bpn]:
-                    cached_dtrs_dict = self.known_dtrs[bpn][self.DTR_DATA_KEY]
-                    if isinstance(cached_dtrs_dict, dict):
-                        cached_dtrs_list = list(cached_dtrs_dict.values())
-                        if(self.logger and self.verbose):
-                            self.logger.info(f"[DTR Manager] [{bpn}] Discovery complete. Found {len(cached_dtrs_list)} DTR(s) total")
-                        return [copy.deepcopy(dtr) for dtr in cached_dtrs_list]
-                    else:
-                        return []
-                else:
+                            if(self.logger and self.verbose):
+                                self.logger.info(f"[DTR Manager] [{bpn}] Found DTR asset [{asset_id}] in connector [{connector_url}] added to cache")
+            
+            # Return the cached DTRs for this BPN
+            if bpn in self.known_dtrs and self.DTR_DATA_KEY in self.known_dtrs[bpn]:
+                cached_dtrs_dict = self.known_dtrs[bpn][self.DTR_DATA_KEY]
+                if isinstance(cached_dtrs_dict, dict):
+                    cached_dtrs_list = list(cached_dtrs_dict.values())
                     if(self.logger and self.verbose):
-                        self.logger.info(f"[DTR Manager] [{bpn}] No DTR assets found in any connector catalogs")
+                        self.logger.info(f"[DTR Manager] [{bpn}] Discovery complete. Found {len(cached_dtrs_list)} DTR(s) total")
+                    return cached_dtrs_list
+                else:
                     return []
-        
-            except Exception as e:
+            else:
                 if(self.logger and self.verbose):
-                    self.logger.error(f"[DTR Manager] [{bpn}] Error discovering DTRs: {e}")
+                    self.logger.info(f"[DTR Manager] [{bpn}] No DTR assets found in any connector catalogs")
                 return []
+    
+        except Exception as e:
+            if(self.logger and self.verbose):
+                self.logger.error(f"[DTR Manager] [{bpn}] Error discovering DTRs: {e}")
+            return []
 
-    def discover_shells(self, counter_party_id: str, query_spec: List[Dict[str, str]], dtr_policies: Optional[List[Dict]] = None, limit: Optional[int] = None, cursor: Optional[str] = None) -> Dict:
+    def discover_shells(self, counter_party_id: str, query_spec: List[Dict[str, str]], dtr_policies: Optional[List[Dict]] = None, limit: Optional[int] = None, cursor: Optional[str] = None, timeout: Optional[float] = None) -> Dict:
         """
         Discover digital twin shells using query specifications with DTR tracking and pagination.
         
+        The DTRs of the counter party are queried concurrently (bounded by ``max_parallel_dtrs``),
+        while the results are merged in the order returned by ``get_dtrs`` so that the pagination
+        cursors stay stable between requests.
+        
         Args:
             counter_party_id (str): The Business Partner Number
             query_spec (List[Dict[str, str]]): Query specifications for shell discovery
@@ -539,6 +605,7 @@ class DtrConsumerMemoryManager(BaseDtrConsumerManager):
                                                If None, will use policies from cached DTR entries for automatic contract negotiation.
             limit (Optional[int]): Maximum number of shells to return
             cursor (Optional[str]): Pagination cursor for continuing previous queries
+            timeout (Optional[float]): Deadline in seconds for the whole request. Defaults to ``discovery_timeout``.
         """
         dtrs = self.get_dtrs(counter_party_id)
         if not dtrs:
@@ -566,6 +633,7 @@ class DtrConsumerMemoryManager(BaseDtrConsumerManager):
             current_page = PageState(dtr_states={}, page_number=0, limit=limit)
         
         all_shells = []
+        fetched_descriptors = {}
         dtr_results = []
         connector_service = self.connector_consumer_manager.connector_service
         
@@ -573,8 +641,9 @@ class DtrConsumerMemoryManager(BaseDtrConsumerManager):
         active_dtrs = len([dtr for dtr in dtrs if not current_page.dtr_states.get(dtr.get(self.DTR_ASSET_ID_KEY), DtrPaginationState("")).exhausted])
         per_dtr_limit = PaginationManager.distribute_limit(limit or 50, active_dtrs) if limit else None
         
-        # Process DTRs
+        # Select the DTRs which still have data, keeping the order of get_dtrs
         new_dtr_states = {}
+        pending_dtrs = []
         for dtr in dtrs:
             asset_id = dtr.get(self.DTR_ASSET_ID_KEY)
             dtr_state = current_page.dtr_states.get(asset_id, DtrPaginationState(asset_id))
@@ -582,18 +651,43 @@ class DtrConsumerMemoryManager(BaseDtrConsumerManager):
             if dtr_state.exhausted:
                 new_dtr_states[asset_id] = dtr_state
                 continue
+            pending_dtrs.append((asset_id, dtr, dtr_state))
+        
+        # Process DTRs concurrently
+        processed = self._process_dtr_parallel(
+            connector_service, counter_party_id, pending_dtrs, query_spec, dtr_policies,
+            limit=limit, per_dtr_limit=per_dtr_limit,
+            timeout=timeout if timeout is not None else self.discovery_timeout
+        )
+        
+        # Merge the results in a stable order
+        for asset_id, dtr, dtr_state in pending_dtrs:
+            result = processed.get(asset_id)
+            
+            # Limit reached before this DTR was needed: keep its state for the next page
+            if limit and len(all_shells) >= limit:
+                new_dtr_states[asset_id] = dtr_state
+                continue
             
-            dtr = self._process_dtr_with_retry(
-                connector_service, counter_party_id, dtr, query_spec, dtr_policies,
-                limit=per_dtr_limit, cursor=dtr_state.cursor
-            )
+            # DTR did not answer within the deadline: report it and retry it on the next page
+            if result is None:
+                new_dtr_states[asset_id] = dtr_state
+                dtr_results.append({
+                    "connectorUrl": dtr.get(self.DTR_CONNECTOR_URL_KEY),
+                    "assetId": asset_id,
+                    "status": "timeout",
+                    "shellsFound": 0,
+                    "shells": []
+                })
+                continue
             
-            dtr_results.append(dtr)
-            shells = dtr.get("shells", [])
+            fetched_descriptors.update(result.pop("_shell_descriptors", {}))
+            dtr_results.append(result)
+            shells = result.get("shells", [])
             all_shells.extend(shells)
             
             # Update DTR state
-            paging_metadata = dtr.get("paging_metadata", {})
+            paging_metadata = result.get("paging_metadata", {})
             new_cursor = paging_metadata.get("cursor")
             new_dtr_states[asset_id] = DtrPaginationState(
                 asset_id=asset_id,
@@ -604,7 +698,6 @@ class DtrConsumerMemoryManager(BaseDtrConsumerManager):
             # Stop if we've reached the total limit
             if limit and len(all_shells) >= limit:
                 all_shells = all_shells[:limit]
-                break
         
         # Create new page state with reference to current page as previous
         new_page = PageState(
@@ -615,7 +708,7 @@ class DtrConsumerMemoryManager(BaseDtrConsumerManager):
         )
         
         # Get shell descriptors
-        shell_descriptors = [self.shell_descriptors.get(shell_id) for shell_id in all_shells if shell_id in self.shell_descriptors]
+        shell_descriptors = [fetched_descriptors[shell_id] for shell_id in all_shells if shell_id in fetched_descriptors]
         
         # Generate pagination tokens - only include pagination if limit or cursor was provided
         pagination_enabled = limit is not None or cursor is not None
@@ -658,14 +751,83 @@ class DtrConsumerMemoryManager(BaseDtrConsumerManager):
         
         return response
 
-    def _process_dtr_parallel(self, connector_service, counter_party_id: str, dtr: Dict, query_spec: List[Dict], dtr_policies: Optional[List[Dict]] = None, dtr_results: List = None, limit: Optional[int] = None, cursor: Optional[str] = None) -> None:
-        """Process a single DTR in parallel and append result to shared list."""
-        dtr = self._process_dtr_with_retry(connector_service, counter_party_id, dtr, query_spec, dtr_policies, limit=limit, cursor=cursor)
-        self.logger.debug(f"[DTR Manager] [{threading.get_ident()}] Trying to acquire lock (_process_dtr_parallel)")
-        with self._list_lock:  # Thread-safe append to shared list
-            self.logger.debug(f"[DTR Manager] [{threading.get_ident()}] Acquired lock (_process_dtr_parallel)")
-            dtr_results.append(dtr)
-        self.logger.debug(f"[DTR Manager] [{threading.get_ident()}] Released lock (_process_dtr_parallel)")
+    def _process_dtr_parallel(self, connector_service, counter_party_id: str, pending_dtrs: List[tuple], query_spec: List[Dict], dtr_policies: Optional[List[Dict]] = None, limit: Optional[int] = None, per_dtr_limit: Optional[int] = None, timeout: Optional[float] = None) -> Dict[str, Dict]:
+        """
+        Process the pending DTRs concurrently with a bounded worker pool.
+        
+        Args:
+            connector_service: The connector consumer service used for the negotiations
+            counter_party_id (str): The Business Partner Number
+            pending_dtrs (List[tuple]): Ordered list of (asset_id, dtr, dtr_state) tuples to process
+            query_spec (List[Dict]): Query specifications for shell discovery
+            dtr_policies (Optional[List[Dict]]): DTR policies to use for connection negotiation
+            limit (Optional[int]): Total number of shells requested. Once the DTRs at the head of
+                                   the list deliver enough shells, the remaining DTR calls are cancelled.
+            per_dtr_limit (Optional[int]): Maximum number of shells requested from each DTR
+            timeout (Optional[float]): Deadline in seconds, DTRs not finished in time are left out
+            
+        Returns:
+            Dict[str, Dict]: The DTR results by asset ID, only for the DTRs which completed
+        """
+        results: Dict[str, Dict] = {}
+        if not pending_dtrs:
+            return results
+        
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        executor = ThreadPoolExecutor(max_workers=min(len(pending_dtrs), self.max_parallel_dtrs), thread_name_prefix="dtr-discovery")
+        try:
+            future_to_dtr = {
+                executor.submit(
+                    self._process_dtr_with_retry, connector_service, counter_party_id, dtr, query_spec, dtr_policies,
+                    limit=per_dtr_limit, cursor=dtr_state.cursor
+                ): (asset_id, dtr)
+                for asset_id, dtr, dtr_state in pending_dtrs
+            }
+            not_done = set(future_to_dtr)
+            
+            while not_done:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    if self.logger and self.verbose:
+                        self.logger.warning(f"[DTR Manager] [{counter_party_id}] Shell discovery deadline reached, {len(not_done)} DTR(s) did not answer in time")
+                    break
+                
+                done, not_done = wait(not_done, timeout=remaining, return_when=FIRST_COMPLETED)
+                for future in done:
+                    asset_id, dtr = future_to_dtr[future]
+                    try:
+                        results[asset_id] = future.result()
+                    except Exception as e:
+                        results[asset_id] = {
+                            "connectorUrl": dtr.get(self.DTR_CONNECTOR_URL_KEY),
+                            "assetId": asset_id,
+                            "status": "failed",
+                            "shellsFound": 0,
+                            "shells": [],
+                            "error": str(e)
+                        }
+                
+                # Early termination: the DTRs at the head of the list already satisfy the limit
+                if limit and self._is_limit_satisfied(pending_dtrs, results, limit):
+                    if self.logger and self.verbose:
+                        self.logger.debug(f"[DTR Manager] [{counter_party_id}] Limit of {limit} shells reached, cancelling {len(not_done)} outstanding DTR call(s)")
+                    break
+        finally:
+            # Do not wait for outstanding DTR calls, cancel the ones which did not start yet
+            executor.shutdown(wait=False, cancel_futures=True)
+        
+        return results
+    
+    def _is_limit_satisfied(self, pending_dtrs: List[tuple], results: Dict[str, Dict], limit: int) -> bool:
+        """Check if the completed DTRs at the head of the ordered DTR list deliver enough shells."""
+        shells_found = 0
+        for asset_id, _, _ in pending_dtrs:
+            if asset_id not in results:
+                return False
+            shells_found += len(results[asset_id].get("shells", []))
+            if shells_found >= limit:
+                return True
+        return False
 
     def _process_dtr_with_retry(self, connector_service, counter_party_id: str, dtr: Dict, query_spec: List[Dict], dtr_policies: Optional[List[Dict]] = None, max_retries: int = 2, limit: Optional[int] = None, cursor: Optional[str] = None) -> Dict:
         """Process a single DTR with retry mechanism."""
@@ -711,7 +873,7 @@ class DtrConsumerMemoryManager(BaseDtrConsumerManager):
                         query_params.append(f"cursor={cursor}")
                     url += "?" + "&".join(query_params)
                 
-                response = HttpTools.do_post(
+                response = self.fetcher.post(
                     url=url,
                     headers={"Authorization": f"{access_token}"},
                     json=query_spec
@@ -720,20 +882,29 @@ class DtrConsumerMemoryManager(BaseDtrConsumerManager):
                 if response.status_code == 200:
                     response_data = response.json()
                     shell_ids = self._extract_shell_ids(response_data)
-                    shells = self._fetch_shell_descriptors(response_data, dataplane_url, access_token)
+                    shells, shell_errors = self._fetch_shell_descriptors(response_data, dataplane_url, access_token)
                     
-                    # Store shell descriptors in central memory
+                    # Store shell descriptors in the central cache
+                    descriptors = {}
                     for shell in shells:
                         shell_id = shell.get("id")
                         if shell_id:
-                            self.shell_descriptors[shell_id] = shell
+                            descriptors[shell_id] = shell
+                            self.shell_descriptors.put(
+                                (counter_party_id, shell_id), copy.deepcopy(shell),
+                                dtr={"connectorUrl": connector_url, "assetId": asset_id}
+                            )
                     
                     dtr.update({
                         "status": "connected",
                         "shellsFound": len(shell_ids),
                         "shells": shell_ids,  # Store just IDs in DTR info
-                        "paging_metadata": response_data.get("paging_metadata", {})
+                        "paging_metadata": response_data.get("paging_metadata", {}),
+                        # Removed by discover_shells, so the response does not depend on the cache eviction
+                        "_shell_descriptors": descriptors
                     })
+                    if shell_errors:
+                        dtr["shellErrors"] = shell_errors
                     return dtr
                 else:
                     # Delete failed connection for retry
@@ -753,14 +924,18 @@ class DtrConsumerMemoryManager(BaseDtrConsumerManager):
     
     def _fetch_shell_descriptor(self, shell_uuid: str, dataplane_url: str, access_token: str) -> Dict:
         """Fetch single shell descriptor by UUID."""
+        response = self._get_shell_descriptor_response(shell_uuid, dataplane_url, access_token)
+        if response.status_code == 200:
+            return response.json()
+        return None
+    
+    def _get_shell_descriptor_response(self, shell_uuid: str, dataplane_url: str, access_token: str) -> Response:
+        """Request a single shell descriptor by UUID over the pooled session of the dataplane."""
         encoded_uuid = base64.b64encode(shell_uuid.encode('utf-8')).decode('utf-8')
-        response = HttpTools.do_get(
+        return self.fetcher.get(
             url=f"{dataplane_url}/shell-descriptors/{encoded_uuid}",
             headers={"Authorization": f"{access_token}"}
         )
-        if response.status_code == 200:
-            return response.json()
-        return None
     
     def _fetch_submodel_descriptor(self, shell_id: str, submodel_id: str, dataplane_url: str, access_token: str) -> Optional[Dict]:
         """Fetch single submodel descriptor by shell ID and submodel ID.
@@ -777,7 +952,7 @@ class DtrConsumerMemoryManager(BaseDtrConsumerManager):
         encoded_shell_id = base64.b64encode(shell_id.encode('utf-8')).decode('utf-8')
         encoded_submodel_id = base64.b64encode(submodel_id.encode('utf-8')).decode('utf-8')
         
-        response = HttpTools.do_get(
+        response = self.fetcher.get(
             url=f"{dataplane_url}/shell-descriptors/{encoded_shell_id}/submodel-descriptors/{encoded_submodel_id}",
             headers={"Authorization": f"{access_token}"}
         )
@@ -843,40 +1018,40 @@ class DtrConsumerMemoryManager(BaseDtrConsumerManager):
         
         return response
     
-    def _fetch_shell_descriptors(self, shells_response: Dict, dataplane_url: str, access_token: str) -> List[Dict]:
-        """Fetch shell descriptors from shell UUIDs in parallel."""
+    def _fetch_shell_descriptors(self, shells_response: Dict, dataplane_url: str, access_token: str) -> tuple[List[Dict], Dict[str, str]]:
+        """
+        Fetch shell descriptors from shell UUIDs in parallel using the shared fetcher.
+        
+        Returns:
+            tuple[List[Dict], Dict[str, str]]: The fetched shell descriptors (in lookup order)
+                                               and the error message for every shell which could not be fetched
+        """
         shell_uuids = shells_response.get('result', []) if isinstance(shells_response, dict) else shells_response
         if not shell_uuids:
-            return []
+            return [], {}
         
-        shells = []
-        threads = []
+        def fetch_single_shell(shell_uuid: str) -> Dict:
+            response = self._get_shell_descriptor_response(shell_uuid, dataplane_url, access_token)
+            if response.status_code != 200:
+                raise ValueError(f"HTTP {response.status_code}")
+            return response.json()
         
-        # Use a thread-safe list to collect results
-        def fetch_single_shell(shell_uuid: str, results_list: List[Dict]):
-            try:
-                shell = self._fetch_shell_descriptor(shell_uuid, dataplane_url, access_token)
-                if shell:
-                    self.logger.debug(f"[DTR Manager] [{threading.get_ident()}] Trying to acquire lock (fetch_single_shell)")
-                    with self._list_lock:  # Thread-safe append
-                        self.logger.debug(f"[DTR Manager] [{threading.get_ident()}] Acquired lock (fetch_single_shell)")
-                        results_list.append(shell)
-                    self.logger.debug(f"[DTR Manager] [{threading.get_ident()}] Released lock (fetch_single_shell)")
-            except Exception:
-                # Silently continue on error
-                pass
-        
-        # Start threads for parallel fetching
-        for shell_uuid in shell_uuids:
-            thread = threading.Thread(target=fetch_single_shell, args=(shell_uuid, shells))
-            thread.start()
-            threads.append(thread)
+        results = self.fetcher.run_all(
+            {shell_uuid: (lambda shell_uuid=shell_uuid: fetch_single_shell(shell_uuid)) for shell_uuid in shell_uuids}
+        )
         
-        # Wait for all threads to complete
-        for thread in threads:
-            thread.join()
+        shells = []
+        shell_errors = {}
+        for shell_uuid, result in results.items():
+            if result.ok and result.value:
+                shells.append(result.value)
+            else:
+                shell_errors[shell_uuid] = result.error or "Empty shell descriptor"
+        
+        if shell_errors and self.logger and self.verbose:
+            self.logger.warning(f"[DTR Manager] Failed to fetch {len(shell_errors)} of {len(shell_uuids)} shell descriptor(s) from [{dataplane_url}]")
         
-        return shells
+        return shells, shell_errors
         
     def _extract_shell_ids(self, shells_response: Dict) -> List[str]:
         """Extract shell IDs from the lookup response."""
@@ -919,12 +1094,23 @@ class DtrConsumerMemoryManager(BaseDtrConsumerManager):
             dtr_policies (Optional[List[Dict]]): DTR policies to use for connection negotiation.
                                                If None, will use policies from cached DTR entries for automatic contract negotiation.
         """
+        if not id:
+            return {"status": 400, "error": "No shell ID provided"}
+        
+        # Serve the descriptor from the cache to skip the DTR discovery and the DSP negotiation,
+        # a copy so that changing the response does not change the cached descriptor
+        cached = self.shell_descriptors.get_entry((counter_party_id, id))
+        if cached:
+            if self.logger and self.verbose:
+                self.logger.debug(f"[DTR Manager] [{counter_party_id}] Returning shell {id} from cache")
+            return {
+                "shell_descriptor": copy.deepcopy(cached.descriptor),
+                "dtr": dict(cached.dtr) if cached.dtr else {}
+            }
+
         dtrs = self.get_dtrs(counter_party_id)
         if not dtrs:
             return {"status": 404, "error": "No DTRs found for this counterPartyId"}
-
-        if not id:
-            return {"status": 400, "error": "No shell ID provided"}
         
         connector_service = self.connector_consumer_manager.connector_service
         
@@ -952,6 +1138,10 @@ class DtrConsumerMemoryManager(BaseDtrConsumerManager):
                 # Fetch specific shell descriptor
                 shell = self._fetch_shell_descriptor(id, dataplane_url, access_token)
                 if shell:
+                    self.shell_descriptors.put(
+                        (counter_party_id, id), copy.deepcopy(shell),
+                        dtr={"connectorUrl": connector_url, "assetId": asset_id}
+                    )
                     return {
                         "shell_descriptor": shell,
                         "dtr": {
@@ -1380,33 +1570,28 @@ class DtrConsumerMemoryManager(BaseDtrConsumerManager):
         if not assets_to_negotiate:
             return asset_tokens, asset_errors
             
-        with ThreadPoolExecutor(max_workers=min(len(assets_to_negotiate), 10)) as executor:
-            future_to_asset = {
-                executor.submit(
-                    self._negotiate_asset,
-                    counter_party_id,
-                    asset_id,
-                    asset_info["connectorUrl"],
-                    asset_info["policies"]
-                ): asset_id
-                for asset_id, asset_info in assets_to_negotiate.items()
-            }
-            
-            for future in as_completed(future_to_asset):
-                asset_id = future_to_asset[future]
-                try:
-                    token = future.result()
-                    if token:
-                        asset_tokens[asset_id] = token
-                    else:
-                        asset_errors[asset_id] = "Asset negotiation failed. You may not have enough access permissions to this submodel."
-                except Exception as e:
-                    error_message = str(e)
-                    # Concatenate the specific error with the generic message
-                    combined_message = f"Asset negotiation failed. You may not have enough access permissions to this submodel. {error_message}"
-                    asset_errors[asset_id] = combined_message
-                    if self.logger and self.verbose:
-                        self.logger.error(f"[DTR Manager] [{counter_party_id}] Error negotiating asset {asset_id}: {e}")
+        results = self.fetcher.run_all({
+            asset_id: (lambda asset_id=asset_id, asset_info=asset_info: self._negotiate_asset(
+                counter_party_id,
+                asset_id,
+                asset_info["connectorUrl"],
+                asset_info["policies"]
+            ))
+            for asset_id, asset_info in assets_to_negotiate.items()
+        })
+        
+        for asset_id, result in results.items():
+            if result.ok:
+                if result.value:
+                    asset_tokens[asset_id] = result.value
+                else:
+                    asset_errors[asset_id] = "Asset negotiation failed. You may not have enough access permissions to this submodel."
+            else:
+                # Concatenate the specific error with the generic message
+                combined_message = f"Asset negotiation failed. You may not have enough access permissions to this submodel. {result.error}"
+                asset_errors[asset_id] = combined_message
+                if self.logger and self.verbose:
+                    self.logger.error(f"[DTR Manager] [{counter_party_id}] Error negotiating asset {asset_id}: {result.error}")
         
         return asset_tokens, asset_errors
     
@@ -1432,32 +1617,27 @@ class DtrConsumerMemoryManager(BaseDtrConsumerManager):
         if not fetch_tasks:
             return
             
-        with ThreadPoolExecutor(max_workers=min(len(fetch_tasks), 20)) as executor:
-            future_to_submodel = {
-                executor.submit(
-                    self._fetch_submodel_data_with_token,
-                    item["submodel_id"],
-                    item["href"],
-                    asset_tokens[item["assetId"]]
-                ): item["submodel_id"]
-                for item in fetch_tasks
-            }
-            
-            for future in as_completed(future_to_submodel):
-                submodel_id = future_to_submodel[future]
-                try:
-                    data = future.result()
-                    if data:
-                        response["submodels"][submodel_id] = data
-                        response["submodelDescriptors"][submodel_id]["status"] = "success"
-                    else:
-                        response["submodelDescriptors"][submodel_id]["status"] = "error"
-                        response["submodelDescriptors"][submodel_id]["error"] = "Data fetch returned no data"
-                except Exception as e:
-                    response["submodelDescriptors"][submodel_id]["status"] = "error"
-                    response["submodelDescriptors"][submodel_id]["error"] = f"Data fetch failed: {str(e)}"
-                    if self.logger and self.verbose:
-                        self.logger.error(f"[DTR Manager] Error fetching submodel {submodel_id}: {e}")
+        results = self.fetcher.run_all({
+            item["submodel_id"]: (lambda item=item: self._fetch_submodel_data_with_token(
+                item["submodel_id"],
+                item["href"],
+                asset_tokens[item["assetId"]]
+            ))
+            for item in fetch_tasks
+        })
+        
+        for submodel_id, result in results.items():
+            if result.ok and result.value:
+                response["submodels"][submodel_id] = result.value
+                response["submodelDescriptors"][submodel_id]["status"] = "success"
+            elif result.ok:
+                response["submodelDescriptors"][submodel_id]["status"] = "error"
+                response["submodelDescriptors"][submodel_id]["error"] = "Data fetch returned no data"
+            else:
+                response["submodelDescriptors"][submodel_id]["status"] = "error"
+                response["submodelDescriptors"][submodel_id]["error"] = f"Data fetch failed: {result.error}"
+                if self.logger and self.verbose:
+                    self.logger.error(f"[DTR Manager] Error fetching submodel {submodel_id}: {result.error}")
     
     def _mark_remaining_pending_as_failed(self, submodels_to_fetch: List[Dict], response: Dict) -> None:
         """Mark any remaining pending submodels as failed."""
@@ -1605,7 +1785,7 @@ class DtrConsumerMemoryManager(BaseDtrConsumerManager):
         """Fetch submodel data using a pre-negotiated access token."""
         try:
             headers = {"Authorization": f"{access_token}"}
-            response = HttpTools.do_get(href, headers=headers)
+            response = self.fetcher.get(href, headers=headers)
             
             if response.status_code == 200:
                 return response.json()
@@ -0,0 +1,154 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional
+from urllib.parse import urlsplit
+
+import requests
+from requests import Response
+from requests.adapters import HTTPAdapter
+from tractusx_sdk.dataspace.tools import HttpTools
+
+@dataclass
+class FetchResult:
+    key: str
+    value: Any = None
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+class ParallelFetcher:
+    """
+    Bounded executor with keep-alive HTTP sessions, shared by the consumer DTR manager.
+
+    All the parallel work of the manager (shell descriptor fetches, submodel data fetches
+    and asset negotiations) runs in one pool of ``max_workers`` threads, so the number of
+    threads and open connections stays constant independent of the amount of shells requested.
+    HTTP requests reuse one connection pool per dataplane host.
+    """
+
+    def __init__(self, max_workers: int = 20, pool_maxsize: Optional[int] = None, timeout: Optional[float] = 30, logger: logging.Logger = None, verbose: bool = False):
+        """
+        Initialize the fetcher.
+
+        Args:
+            max_workers (int, optional): Maximum number of tasks running concurrently. Defaults to 20.
+            pool_maxsize (Optional[int], optional): Maximum keep-alive connections per host. Defaults to max_workers.
+            timeout (Optional[float], optional): Timeout in seconds for each HTTP request. Defaults to 30.
+        """
+        self.max_workers = max(1, max_workers)
+        self.pool_maxsize = pool_maxsize if pool_maxsize else self.max_workers
+        self.timeout = timeout
+        self.logger = logger
+        self.verbose = verbose
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._sessions: Dict[str, requests.Session] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        """Lazily create the shared worker pool."""
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="dtr-fetcher")
+            return self._executor
+
+    def get_session(self, url: str) -> requests.Session:
+        """Return the keep-alive session for the host of the given URL."""
+        parts = urlsplit(url)
+        host = f"{parts.scheme}://{parts.netloc}"
+        with self._lock:
+            session = self._sessions.get(host)
+            if session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_maxsize)
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                self._sessions[host] = session
+            return session
+
+    def get(self, url: str, headers: Optional[Dict] = None, timeout: Optional[float] = None) -> Response:
+        """Do a GET request over the pooled session of the host."""
+        return HttpTools.do_get_with_session(
+            url=url,
+            session=self.get_session(url),
+            headers=headers,
+            timeout=timeout if timeout is not None else self.timeout
+        )
+
+    def post(self, url: str, json: Any = None, headers: Optional[Dict] = None, timeout: Optional[float] = None) -> Response:
+        """Do a POST request over the pooled session of the host."""
+        return HttpTools.do_post_with_session(
+            url=url,
+            session=self.get_session(url),
+            json=json,
+            headers=headers,
+            timeout=timeout if timeout is not None else self.timeout
+        )
+
+    def run_all(self, tasks: Dict[str, Callable[[], Any]], timeout: Optional[float] = None) -> Dict[str, FetchResult]:
+        """
+        Run the tasks in the shared pool and wait for their results.
+
+        Args:
+            tasks (Dict[str, Callable[[], Any]]): The tasks to run by key
+            timeout (Optional[float]): Maximum time in seconds to wait for all the tasks
+
+        Returns:
+            Dict[str, FetchResult]: One result per task key, in the order of the tasks.
+                                    Failed tasks carry the error message instead of a value.
+        """
+        if not tasks:
+            return {}
+
+        future_to_key = {self.executor.submit(task): key for key, task in tasks.items()}
+        done, not_done = wait(future_to_key, timeout=timeout)
+
+        results: Dict[str, FetchResult] = {}
+        for future, key in future_to_key.items():
+            if future in not_done:
+                future.cancel()
+                results[key] = FetchResult(key=key, error=f"Timeout after {timeout} seconds")
+                continue
+            try:
+                results[key] = FetchResult(key=key, value=future.result())
+            except Exception as e:
+                results[key] = FetchResult(key=key, error=str(e))
+                if self.logger and self.verbose:
+                    self.logger.debug(f"[Parallel Fetcher] Task [{key}] failed: {e}")
+        return results
+
+    def close(self) -> None:
+        """Shut down the worker pool and close the pooled sessions."""
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+            for session in self._sessions.values():
+                session.close()
+            self._sessions.clear()
@@ -0,0 +1,164 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+
+import json
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Hashable, Optional
+
+@dataclass
+class CachedShellDescriptor:
+    descriptor: Dict
+    dtr: Optional[Dict]
+    size: int
+    expires_at: Optional[float]
+
+class ShellDescriptorCache:
+    """
+    Thread-safe LRU cache for shell descriptors with a time to live per entry.
+
+    The cache is bounded both by the number of entries and by the (estimated) size
+    of the serialized descriptors. When one of the bounds is exceeded, the least
+    recently used entries are evicted.
+    """
+
+    def __init__(self, max_entries: int = 10000, max_bytes: Optional[int] = 64 * 1024 * 1024, ttl: Optional[float] = 300):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries (int, optional): Maximum number of cached descriptors. Defaults to 10000.
+            max_bytes (Optional[int], optional): Maximum total size of the cached descriptors in bytes. Defaults to 64 MiB.
+            ttl (Optional[float], optional): Time to live of a descriptor in seconds, None keeps it until evicted. Defaults to 300.
+        """
+        self.max_entries = max(1, max_entries)
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._entries: "OrderedDict[Hashable, CachedShellDescriptor]" = OrderedDict()
+        self._size = 0
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get_entry(self, key: Hashable) -> Optional[CachedShellDescriptor]:
+        """Return the cached entry for the key, or None if it is unknown or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            if entry.expires_at is not None and entry.expires_at <= time.monotonic():
+                self._remove(key)
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def get(self, key: Hashable) -> Optional[Dict]:
+        """Return the cached descriptor for the key, or None if it is unknown or expired."""
+        entry = self.get_entry(key)
+        return entry.descriptor if entry else None
+
+    def put(self, key: Hashable, descriptor: Dict, dtr: Optional[Dict] = None) -> None:
+        """
+        Store a descriptor, evicting the least recently used entries if needed.
+
+        Args:
+            key (Hashable): The cache key of the descriptor
+            descriptor (Dict): The shell descriptor
+            dtr (Optional[Dict]): The DTR the descriptor was fetched from (connectorUrl and assetId)
+        """
+        size = self._estimate_size(descriptor)
+        if self.max_bytes is not None and size > self.max_bytes:
+            # Never cache a descriptor which alone exceeds the size limit
+            return
+        expires_at = time.monotonic() + self.ttl if self.ttl is not None else None
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = CachedShellDescriptor(descriptor=descriptor, dtr=dtr, size=size, expires_at=expires_at)
+            self._size += size
+            self._evict()
+
+    def delete(self, key: Hashable) -> bool:
+        """Remove an entry, returns True if it existed."""
+        with self._lock:
+            if key not in self._entries:
+                return False
+            self._remove(key)
+            return True
+
+    def clear(self) -> None:
+        """Remove all the entries, the counters are kept."""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def stats(self) -> Dict[str, int]:
+        """Return the current size and the hit/miss/eviction counters."""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._size,
+                "maxEntries": self.max_entries,
+                "maxBytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations
+            }
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry is not None and (entry.expires_at is None or entry.expires_at > time.monotonic())
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def _remove(self, key: Hashable) -> None:
+        entry = self._entries.pop(key)
+        self._size -= entry.size
+
+    def _evict(self) -> None:
+        while self._entries and (
+            len(self._entries) > self.max_entries
+            or (self.max_bytes is not None and self._size > self.max_bytes)
+        ):
+            _, entry = self._entries.popitem(last=False)
+            self._size -= entry.size
+            self.evictions += 1
+
+    @staticmethod
+    def _estimate_size(descriptor: Dict) -> int:
+        try:
+            return len(json.dumps(descriptor, separators=(",", ":")).encode("utf-8"))
+        except (TypeError, ValueError):
+            return len(str(descriptor).encode("utf-8"))
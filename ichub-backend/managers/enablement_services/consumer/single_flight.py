@@ -0,0 +1,116 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+
+import threading
+from typing import Any, Callable, Dict, Hashable, Optional
+
+class _Call:
+    """A call in flight, shared by the leader and the waiting callers."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+        self.waiters = 0
+
+class SingleFlight:
+    """
+    Per-key de-duplication of concurrent calls.
+
+    While a call for a key is running, further callers for the same key do not
+    start their own call but wait for the running one and receive its result
+    (or its exception). Once the call completed, the next caller starts a new one.
+    """
+
+    def __init__(self, name: str = "single-flight"):
+        self.name = name
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+
+    def do(self, key: Hashable, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        Run fn for the key, or wait for the call already running for the key.
+
+        Args:
+            key (Hashable): The de-duplication key (e.g. the BPN)
+            fn (Callable): The function to run
+            *args, **kwargs: The arguments for fn
+
+        Returns:
+            Any: The result of the call, shared by all the callers of the same flight
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = _Call()
+                self._calls[key] = call
+            else:
+                call.waiters += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        self._run(key, call, fn, *args, **kwargs)
+        if call.error is not None:
+            raise call.error
+        return call.result
+
+    def do_async(self, key: Hashable, fn: Callable[..., Any], *args, **kwargs) -> bool:
+        """
+        Start fn for the key in a background thread, unless a call for the key is already running.
+
+        Errors of the background call are not raised, waiting callers of the same flight receive them.
+
+        Returns:
+            bool: True if a new call was started, False if one was already in flight
+        """
+        with self._lock:
+            if key in self._calls:
+                return False
+            call = _Call()
+            self._calls[key] = call
+
+        threading.Thread(
+            target=self._run, args=(key, call, fn, *args), kwargs=kwargs,
+            name=f"{self.name}-{key}", daemon=True
+        ).start()
+        return True
+
+    def in_flight(self, key: Hashable) -> bool:
+        """Check if a call for the key is currently running."""
+        with self._lock:
+            return key in self._calls
+
+    def _run(self, key: Hashable, call: _Call, fn: Callable[..., Any], *args, **kwargs) -> None:
+        try:
+            call.result = fn(*args, **kwargs)
+        except BaseException as e:
+            call.error = e
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
@@ -364,6 +364,81 @@ class DtrProviderManager:
             raise ExternalAPIError("Error creating or updating shell descriptor: " + "\n" + res.to_json_string())
 
         return res
+
+    def update_shell_descriptor_shares(self,
+        aas_id: UUID,
+        manufacturer_id: str,
+        share_with: Optional[list[str]] = None,
+        unshare_with: Optional[list[str]] = None,
+        asset_id_names: Optional[list[str]] = None,
+    ) -> bool:
+        """
+        Adds and removes business partners from the externalSubjectId of the specific asset IDs of a twin in the DTR.
+
+        Only the specific asset IDs named in asset_id_names are changed, all of them if not given. The shell
+        descriptor is only updated if its specific asset IDs change.
+
+        Returns whether the shell descriptor was updated.
+        """
+        existing_shell = self.aas_service.get_asset_administration_shell_descriptor_by_id(
+            aas_identifier=aas_id.urn, bpn=manufacturer_id
+        )
+        if isinstance(existing_shell, Result):
+            raise ExternalAPIError("Error retrieving shell descriptor: " + "\n" + existing_shell.to_json_string())
+
+        if not self._update_specific_asset_id_shares(
+            existing_shell.specific_asset_ids or [], manufacturer_id, share_with or [], unshare_with or [], asset_id_names
+        ):
+            return False
+
+        logger.info(f"Updating the shares of Asset Administration Shell [{aas_id.urn}]: shared with {share_with or []}, unshared with {unshare_with or []}")
+        res = self.aas_service.update_asset_administration_shell_descriptor(
+            shell_descriptor=existing_shell, aas_identifier=aas_id.urn, bpn=manufacturer_id
+        )
+        if isinstance(res, Result):
+            raise ExternalAPIError("Error updating shell descriptor: " + "\n" + res.to_json_string())
+        return True
+
+    @staticmethod
+    def _update_specific_asset_id_shares(
+        specific_asset_ids: list[SpecificAssetId],
+        manufacturer_id: str,
+        share_with: list[str],
+        unshare_with: list[str],
+        asset_id_names: Optional[list[str]] = None,
+    ) -> bool:
+        """
+        Computes the new BPN keys of the externalSubjectId of each specific asset ID in place.
+
+        A customerPartId belongs to a single business partner and is never shared with further ones. The
+        manufacturer is never unshared, and is kept as only key when the last business partner is unshared,
+        like the fallback of _reference_from_bpn_list.
+
+        Returns whether any specific asset ID changed.
+        """
+        changed = False
+        unshare = set(unshare_with) - {manufacturer_id}
+        for sa_id in specific_asset_ids:
+            if asset_id_names is not None and sa_id.name not in asset_id_names:
+                continue
+            existing_keys = sa_id.external_subject_id.keys if sa_id.external_subject_id else []
+            keys = [key for key in existing_keys if key.value not in unshare]
+            if sa_id.name != "customerPartId":
+                key_values = {key.value for key in keys}
+                keys += [
+                    ReferenceKey(type=ReferenceKeyTypes.GLOBAL_REFERENCE, value=bpn)
+                    for bpn in dict.fromkeys(share_with) if bpn not in key_values
+                ]
+            if not keys and existing_keys:
+                keys = [ReferenceKey(type=ReferenceKeyTypes.GLOBAL_REFERENCE, value=manufacturer_id)]
+            if [key.value for key in keys] == [key.value for key in existing_keys]:
+                continue
+            sa_id.external_subject_id = Reference(type=ReferenceTypes.EXTERNAL_REFERENCE, keys=keys)
+            # Normalize supplementalSemanticIds if empty
+            if not sa_id.supplemental_semantic_ids:
+                sa_id.supplemental_semantic_ids = None
+            changed = True
+        return changed
         
     def create_submodel_descriptor(
         self,
@@ -0,0 +1,113 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+
+from typing import Optional
+
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlmodel.ext.asyncio.session import AsyncSession
+from database import get_async_engine, replica_router
+
+class AsyncRepositoryManager:
+    """
+    Repository manager for managing the async repositories and handling the async session.
+
+    The async counterpart of the RepositoryManager, used as async context manager by the service
+    methods running natively on the event loop. Only the repositories with an async implementation
+    are available.
+    """
+
+    def __init__(self, session: AsyncSession):
+        self._session = session
+        self._catalog_part_repository = None
+        self._serialized_part_repository = None
+
+    # Context Manager Methods
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        """Exit the context, committing or rolling back the session."""
+        try:
+            if exc_type is None:
+                await self._session.commit()
+            else:
+                await self._session.rollback()
+        finally:
+            await self._session.close()
+
+    # Manual Session Control
+    async def commit(self):
+        """Manually commit the session."""
+        await self._session.commit()
+
+    async def flush(self):
+        """Manually flush the pending changes of the session, without committing."""
+        await self._session.flush()
+
+    async def rollback(self):
+        """Manually roll back the session."""
+        await self._session.rollback()
+
+    async def close(self):
+        """Manually close the session."""
+        await self._session.close()
+
+    async def refresh(self, obj):
+        """Refresh the state of an instance from the database."""
+        await self._session.refresh(obj)
+
+    # Lazy Initialization of Repositories
+    @property
+    def catalog_part_repository(self):
+        """Lazy initialization of the async catalog part repository."""
+        if self._catalog_part_repository is None:
+            from managers.metadata_database.async_repositories import AsyncCatalogPartRepository
+            self._catalog_part_repository = AsyncCatalogPartRepository(self._session)
+        return self._catalog_part_repository
+
+    @property
+    def serialized_part_repository(self):
+        """Lazy initialization of the async serialized part repository."""
+        if self._serialized_part_repository is None:
+            from managers.metadata_database.async_repositories import AsyncSerializedPartRepository
+            self._serialized_part_repository = AsyncSerializedPartRepository(self._session)
+        return self._serialized_part_repository
+
+class AsyncRepositoryManagerFactory:
+    """Factory class for creating async repository managers."""
+
+    @staticmethod
+    def create(engine: Optional[AsyncEngine] = None) -> AsyncRepositoryManager:
+        """
+        Create an async repository manager on the async engine.
+
+        The objects are not expired on commit, since reloading their attributes lazily would need
+        a database round trip which an async session cannot do implicitly.
+        """
+        return AsyncRepositoryManager(AsyncSession(engine or get_async_engine(), expire_on_commit=False))
+
+    @staticmethod
+    def create_read_only() -> AsyncRepositoryManager:
+        """Create an async repository manager for reading only, on a read replica if one is within the allowed lag."""
+        replica = replica_router.route()
+        return AsyncRepositoryManagerFactory.create(replica.async_engine if replica is not None else None)
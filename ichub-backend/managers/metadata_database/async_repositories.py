@@ -0,0 +1,124 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+
+from datetime import datetime
+from typing import Any, Dict, Generic, List, Optional, Sequence, Tuple, Type
+
+from sqlalchemy.orm import selectinload
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from managers.metadata_database.repositories import (
+    ModelType,
+    _select_catalog_part_listing,
+    _select_serialized_parts_with_status
+)
+from models.metadata_database.provider.models import (
+    CatalogPart,
+    PartnerCatalogPart,
+    SerializedPart
+)
+
+class AsyncBaseRepository(Generic[ModelType]):
+    """
+    Async counterpart of the BaseRepository.
+
+    An async session cannot load relationships lazily, the queries load eagerly
+    every relationship read from their results.
+    """
+
+    def __init__(self, session: AsyncSession):
+        self._session = session
+
+    def __init_subclass__(cls) -> None:
+        # Fetch the model type from the first argument of the generic class
+
+        # pylint: disable=no-member
+        cls._type = cls.__orig_bases__[0].__args__[0]  # type: ignore
+
+    @classmethod
+    def get_type(cls) -> Type[ModelType]:
+        return cls._type  # type: ignore
+
+    def create(self, obj_in: ModelType) -> ModelType:
+        self._session.add(obj_in)
+        return obj_in
+
+    async def find_by_id(self, obj_id: int) -> Optional[ModelType]:
+        stmt = select(self.get_type()).where(
+            self.get_type().id == obj_id)  # type: ignore
+        return (await self._session.exec(stmt)).first()
+
+    async def find_all(self, limit: Optional[int] = 100, after_id: Optional[int] = None) -> List[ModelType]:
+        """Find the rows ordered by their ID, one page at a time, see BaseRepository.find_all."""
+        model = self.get_type()
+        stmt = select(model).order_by(model.id)  # type: ignore
+        if after_id is not None:
+            stmt = stmt.where(model.id > after_id)  # type: ignore
+
+        if limit is not None:
+            stmt = stmt.limit(limit)
+
+        return list((await self._session.exec(stmt)).all())
+
+class AsyncCatalogPartRepository(AsyncBaseRepository[CatalogPart]):
+
+    async def find_listing(self,
+        columns: Sequence[str],
+        manufacturer_id: Optional[str] = None,
+        manufacturer_part_id: Optional[str] = None,
+        category: Optional[str] = None,
+        status: Optional[int] = None,
+        prefix: Optional[str] = None,
+        sort: Sequence[Tuple[str, bool]] = ()) -> List[Dict[str, Any]]:
+        """Find the catalog parts of the listing, see CatalogPartRepository.find_listing."""
+        stmt = _select_catalog_part_listing(columns, manufacturer_id, manufacturer_part_id, category, status, prefix, sort)
+        return [dict(row) for row in (await self._session.exec(stmt)).mappings()]
+
+class AsyncSerializedPartRepository(AsyncBaseRepository[SerializedPart]):
+
+    async def find_with_status(self,
+        manufacturer_id: Optional[str] = None,
+        manufacturer_part_id: Optional[str] = None,
+        business_partner_number: Optional[str] = None,
+        customer_part_id: Optional[str] = None,
+        part_instance_id: Optional[str] = None,
+        van: Optional[str] = None,
+        status: Optional[int] = None,
+        limit: Optional[int] = None,
+        after: Optional[Tuple[datetime, int]] = None) -> List[tuple[SerializedPart, int]]:
+        """
+        Find serialized parts with their status, see SerializedPartRepository.find_with_status.
+
+        The partner catalog part, its business partner, catalog part and legal entity are loaded with them.
+        """
+        stmt = _select_serialized_parts_with_status(
+            manufacturer_id, manufacturer_part_id, business_partner_number, customer_part_id,
+            part_instance_id, van, status, limit, after
+        )
+        partner_catalog_part = selectinload(SerializedPart.partner_catalog_part)
+        stmt = stmt.options(
+            partner_catalog_part.selectinload(PartnerCatalogPart.business_partner),
+            partner_catalog_part.selectinload(PartnerCatalogPart.catalog_part).selectinload(CatalogPart.legal_entity)
+        )
+        return list((await self._session.exec(stmt)).all())
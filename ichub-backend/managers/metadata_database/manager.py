@@ -22,19 +22,36 @@
 # SPDX-License-Identifier: Apache-2.0
 #################################################################################
 
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional
+
+from sqlalchemy import event
 from sqlmodel import Session
-from database import engine
+from database import engine, replica_router
+from utils.replica_router import FALLBACK_READ_YOUR_WRITES
+
+# Session of the current session scope, see RepositoryManagerFactory.session_scope
+_scoped_session: ContextVar[Optional[Session]] = ContextVar("scoped_session", default=None)
+
+# Set in the info of a scoped session once it flushed changes, its reads then stay on the primary
+_WROTE = "wrote"
+
+def _mark_wrote(session, flush_context):
+    session.info[_WROTE] = True
 
 class RepositoryManager:
     """Repository manager for managing repositories and handling the session."""
 
-    def __init__(self, session: Session):
+    def __init__(self, session: Session, owns_session: bool = True):
         self._session = session
+        self._owns_session = owns_session
         self._business_partner_repository = None
         self._catalog_part_repository = None
         self._data_exchange_agreement_repository = None
         self._enablement_service_stack_repository = None
         self._legal_entity_repository = None
+        self._outbox_message_repository = None
         self._partner_catalog_part_repository = None
         self._serialized_part_repository = None
         self._twin_repository = None
@@ -56,13 +73,19 @@ class RepositoryManager:
             self._session.commit()
         else:
             self._session.rollback()
-        self._session.close()
+        # The session of a session scope is closed by the scope
+        if self._owns_session:
+            self._session.close()
 
     # Manual Session Control
     def commit(self):
         """Manually commit the session."""
         self._session.commit()
 
+    def flush(self):
+        """Manually flush the pending changes of the session, without committing."""
+        self._session.flush()
+
     def rollback(self):
         """Manually roll back the session."""
         self._session.rollback()
@@ -116,6 +139,14 @@ class RepositoryManager:
             self._legal_entity_repository = LegalEntityRepository(self._session)
         return self._legal_entity_repository
 
+    @property
+    def outbox_message_repository(self):
+        """Lazy initialization of the outbox message repository."""
+        if self._outbox_message_repository is None:
+            from managers.metadata_database.repositories import OutboxMessageRepository
+            self._outbox_message_repository = OutboxMessageRepository(self._session)
+        return self._outbox_message_repository
+
     @property
     def partner_catalog_part_repository(self):
         """Lazy initialization of the partner catalog part repository."""
@@ -177,6 +208,48 @@ class RepositoryManagerFactory:
 
     @staticmethod
     def create() -> RepositoryManager:
-        """Create or return the singleton instance of RepositoryManager."""
+        """Create a repository manager, using the session of the current session scope if there is one."""
+        session = _scoped_session.get()
+        if session is not None:
+            return RepositoryManager(session, owns_session=False)
+        return RepositoryManager(Session(engine))
+
+    @staticmethod
+    def create_read_only() -> RepositoryManager:
+        """
+        Create a repository manager for reading only, on a read replica if one is within the allowed lag.
+
+        Falls back to the primary when no replica is usable, see ReplicaRouter, and when the session
+        of the current session scope already wrote, so that a request reads its own writes.
+        """
+        session = _scoped_session.get()
+        if session is not None and session.info.get(_WROTE):
+            replica_router.record_primary_read(FALLBACK_READ_YOUR_WRITES)
+            return RepositoryManager(session, owns_session=False)
+        replica = replica_router.route()
+        if replica is None:
+            return RepositoryManagerFactory.create()
+        return RepositoryManager(Session(replica.engine))
+
+    @staticmethod
+    @contextmanager
+    def session_scope() -> Iterator[None]:
+        """
+        Share one session, and so one connection at a time, between all the repository managers created within the scope.
+
+        The nested service calls of a request reuse the session of the request instead of checking out
+        a connection each. Every repository manager still commits or rolls back when it exits, the scope
+        only closes the session at its end. The scope is bound to the current thread or task, entering
+        it again within the scope has no effect.
+        """
+        if _scoped_session.get() is not None:
+            yield
+            return
         session = Session(engine)
-        return RepositoryManager(session)
+        event.listen(session, "after_flush", _mark_wrote)
+        token = _scoped_session.set(session)
+        try:
+            yield
+        finally:
+            _scoped_session.reset(token)
+            session.close()
@@ -23,12 +23,16 @@
 # SPDX-License-Identifier: Apache-2.0
 #################################################################################
 
-from sqlalchemy import case
+from sqlalchemy import String, case, delete, exists, func, insert, literal, or_, tuple_, union_all, update
+from sqlalchemy import select as sa_select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlmodel import SQLModel, Session, select, desc
-from sqlalchemy.orm import selectinload, aliased
-from typing import TypeVar, Type, List, Optional, Generic
+from sqlalchemy.orm import joinedload, selectinload, aliased
+from typing import Any, Dict, TypeVar, Type, List, Optional, Generic, Sequence, Tuple
+from enum import Enum
 from uuid import UUID, uuid4
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 
 from models.metadata_database.provider.models import (
     BusinessPartner,
@@ -42,12 +46,223 @@ from models.metadata_database.provider.models import (
     CatalogPart,
     SerializedPart,
     PartnerCatalogPart,
-    DataExchangeAgreement
+    DataExchangeAgreement,
+    OutboxMessage,
+    OutboxMessageStatus
 )
 
 
 ModelType = TypeVar("ModelType", bound=SQLModel)
 
+def _twin_status_expr():
+    """
+    Derive the status of a twin from its registrations and exchanges.
+
+    Only used to maintain twin.status, the part listings read the stored column.
+    """
+    registered = exists().where(TwinRegistration.twin_id == Twin.id, TwinRegistration.dtr_registered.is_(True))
+    pending = exists().where(TwinRegistration.twin_id == Twin.id, TwinRegistration.dtr_registered.is_(False))
+    shared = exists().where(TwinExchange.twin_id == Twin.id)
+
+    return case(
+        # 3: DTR-registered AND appears in TwinExchange (shared)
+        (registered & shared, 3),
+        # 2: DTR-registered but not yet in any TwinExchange row (registered)
+        (registered, 2),
+        # 1: twin exists, but not yet DTR-registered (pending)
+        (pending, 1),
+        # 0: no registration at all (draft)
+        else_=0
+    )
+
+def _part_status_expr(twin_id_column):
+    """Status of a part, read from its twin, 0 (draft) when it has no twin."""
+    return case((twin_id_column.is_(None), 0), else_=func.coalesce(Twin.status, 0)).label("status")
+
+def _part_status_filter(twin_id_column, status: int):
+    """
+    Condition of the parts with the status, see _part_status_expr.
+
+    Compares twin.status itself instead of the derived status, so the status index of the twins is used.
+    """
+    if status == 0:
+        return or_(twin_id_column.is_(None), Twin.status == 0)
+    return Twin.status == status
+
+def _apply_keyset(stmt, created_date_column, id_column, limit: Optional[int], after: Optional[Tuple[datetime, int]]):
+    """
+    Order the statement from the newest to the oldest row and continue after the given keyset.
+
+    The (created_date, id) row value comparison is resolved by the (created_date, id) index,
+    so a page costs the same no matter how deep it is.
+    """
+    stmt = stmt.order_by(desc(created_date_column), desc(id_column))
+    if after is not None:
+        stmt = stmt.where(tuple_(created_date_column, id_column) < tuple_(*after))
+    if limit is not None:
+        stmt = stmt.limit(limit)
+    return stmt
+
+def _select_catalog_parts_with_status(manufacturer_id: Optional[str], manufacturer_part_id: Optional[str], join_partner_catalog_parts: bool = False, status: Optional[int] = None):
+    """Select the catalog parts with their status, shared by the sync and async catalog part repositories."""
+    stmt = select(CatalogPart, _part_status_expr(CatalogPart.twin_id))
+    stmt = stmt.outerjoin(Twin, Twin.id == CatalogPart.twin_id)
+
+    if status is not None:
+        stmt = stmt.where(_part_status_filter(CatalogPart.twin_id, status))
+
+    if manufacturer_id:
+        stmt = stmt.join(LegalEntity, LegalEntity.id == CatalogPart.legal_entity_id).where(LegalEntity.bpnl == manufacturer_id)
+
+    if manufacturer_part_id:
+        stmt = stmt.where(CatalogPart.manufacturer_part_id == manufacturer_part_id)
+
+    if join_partner_catalog_parts:
+        subquery = select(PartnerCatalogPart).join(BusinessPartner, BusinessPartner.id == PartnerCatalogPart.business_partner_id).where(PartnerCatalogPart.catalog_part_id == CatalogPart.id).subquery()
+        stmt = stmt.join(subquery, subquery.c.catalog_part_id == CatalogPart.id, isouter=True).distinct(CatalogPart.id)
+
+    return stmt
+
+# The columns of the catalog part listing, by the names they are selected, filtered and sorted on
+CATALOG_PART_LISTING_COLUMNS = {
+    "manufacturer_id": LegalEntity.bpnl,
+    "manufacturer_part_id": CatalogPart.manufacturer_part_id,
+    "name": CatalogPart.name,
+    "category": CatalogPart.category,
+    "bpns": CatalogPart.bpns,
+    "status": _part_status_expr(CatalogPart.twin_id),
+}
+
+def _select_catalog_part_listing(
+    columns: Sequence[str],
+    manufacturer_id: Optional[str] = None,
+    manufacturer_part_id: Optional[str] = None,
+    category: Optional[str] = None,
+    status: Optional[int] = None,
+    prefix: Optional[str] = None,
+    sort: Sequence[Tuple[str, bool]] = ()):
+    """
+    Select only the given columns of the catalog parts, shared by the sync and async catalog part repositories.
+
+    The legal entity and the twin are only joined when their columns are needed. The rows are sorted by
+    the (column, descending) pairs of sort, then by ID so the order is stable.
+    """
+    used = set(columns) | {column for column, _ in sort}
+    # The select of SQLAlchemy, so that a single selected column is returned as a row as well
+    stmt = sa_select(*(CATALOG_PART_LISTING_COLUMNS[column].label(column) for column in columns)).select_from(CatalogPart)
+
+    if manufacturer_id or "manufacturer_id" in used:
+        stmt = stmt.join(LegalEntity, LegalEntity.id == CatalogPart.legal_entity_id)
+    if status is not None or "status" in used:
+        stmt = stmt.outerjoin(Twin, Twin.id == CatalogPart.twin_id)
+
+    if manufacturer_id:
+        stmt = stmt.where(LegalEntity.bpnl == manufacturer_id)
+
+    if manufacturer_part_id:
+        stmt = stmt.where(CatalogPart.manufacturer_part_id == manufacturer_part_id)
+
+    if category:
+        stmt = stmt.where(CatalogPart.category == category)
+
+    if status is not None:
+        stmt = stmt.where(_part_status_filter(CatalogPart.twin_id, status))
+
+    if prefix:
+        stmt = stmt.where(or_(
+            CatalogPart.name.istartswith(prefix, autoescape=True),
+            CatalogPart.manufacturer_part_id.istartswith(prefix, autoescape=True)
+        ))
+
+    for column, descending in sort:
+        expression = CATALOG_PART_LISTING_COLUMNS[column]
+        stmt = stmt.order_by(desc(expression) if descending else expression)
+    return stmt.order_by(CatalogPart.id)
+
+# Length of a trigram, shorter search texts have no fuzzy matches
+TRIGRAM_LENGTH = 3
+
+def _search_key(column, dialect: str):
+    """The lowered value of the column, in the "C" collation of the lower(column) search indexes on PostgreSQL."""
+    key = func.lower(column)
+    return key.collate("C") if dialect == "postgresql" else key
+
+def _select_search_matches(id_column, column, name: str, text: str, dialect: str, limit: int, fuzzy: bool = False):
+    """
+    Select the (ID, column name, value, score) of the first limit matches of the text in the column.
+
+    Without fuzzy, the values starting with the text, ignoring case, in the order of the values: the exact
+    match scores 4, the other prefixes 3. On PostgreSQL they are read in the order of the lower(column)
+    search index, so a short prefix matching many values costs no more than the page.
+
+    With fuzzy, the other values containing the text score 1, best first. On PostgreSQL values containing a
+    word similar to the text match too, served by the trigram index, and the word similarity (at most 1)
+    is added to the score. Other databases have no similarity.
+    """
+    key = _search_key(column, dialect)
+    prefix = key.startswith(text.lower(), autoescape=True)
+    if not fuzzy:
+        score = case((key == text.lower(), 4), else_=3)
+        condition, order = prefix, key
+    else:
+        contains = column.icontains(text, autoescape=True)
+        score = case((contains, 1), else_=0)
+        condition = contains
+        if dialect == "postgresql":
+            condition = or_(contains, column.op("%>")(text))
+            score = score + func.word_similarity(text, column)
+        condition, order = ~prefix & condition, score.desc()
+    return sa_select(
+        id_column.label("id"), literal(name, String).label("column"), column.label("value"), score.label("score")
+    ).where(condition).order_by(order).limit(limit)
+
+def _search_matches(session: Session, selects) -> List[Tuple[int, str, str, float]]:
+    """Run the selects of _select_search_matches as one query."""
+    stmt = union_all(*(stmt.subquery().select() for stmt in selects))
+    return [(id, column, value, float(score)) for id, column, value, score in session.exec(stmt)]
+
+def _select_serialized_parts_with_status(
+    manufacturer_id: Optional[str] = None,
+    manufacturer_part_id: Optional[str] = None,
+    business_partner_number: Optional[str] = None,
+    customer_part_id: Optional[str] = None,
+    part_instance_id: Optional[str] = None,
+    van: Optional[str] = None,
+    status: Optional[int] = None,
+    limit: Optional[int] = None,
+    after: Optional[Tuple[datetime, int]] = None):
+    """Select the serialized parts with their status, shared by the sync and async serialized part repositories."""
+    stmt = select(SerializedPart, _part_status_expr(SerializedPart.twin_id))
+    stmt = stmt.outerjoin(Twin, Twin.id == SerializedPart.twin_id)
+
+    stmt = stmt.join(PartnerCatalogPart, PartnerCatalogPart.id == SerializedPart.partner_catalog_part_id)
+    stmt = stmt.join(CatalogPart, CatalogPart.id == PartnerCatalogPart.catalog_part_id)
+    stmt = stmt.join(LegalEntity, LegalEntity.id == CatalogPart.legal_entity_id)
+
+    if business_partner_number:
+        stmt = stmt.join(BusinessPartner, BusinessPartner.id == PartnerCatalogPart.business_partner_id
+            ).where(BusinessPartner.bpnl == business_partner_number)
+
+    if manufacturer_id:
+        stmt = stmt.where(LegalEntity.bpnl == manufacturer_id)
+
+    if manufacturer_part_id:
+        stmt = stmt.where(CatalogPart.manufacturer_part_id == manufacturer_part_id)
+
+    if part_instance_id:
+        stmt = stmt.where(SerializedPart.part_instance_id == part_instance_id)
+
+    if van:
+        stmt = stmt.where(SerializedPart.van == van)
+
+    if customer_part_id:
+        stmt = stmt.where(PartnerCatalogPart.customer_part_id == customer_part_id)
+
+    if status is not None:
+        stmt = stmt.where(_part_status_filter(SerializedPart.twin_id, status))
+
+    return _apply_keyset(stmt, SerializedPart.created_date, SerializedPart.id, limit, after)
+
 class BaseRepository(Generic[ModelType]):
     def __init__(self, session: Session):
         self._session = session
@@ -71,10 +286,17 @@ class BaseRepository(Generic[ModelType]):
             self.get_type().id == obj_id)  # type: ignore
         return self._session.scalars(stmt).first()
 
-    def find_all(self, offset: Optional[int] = None, limit: Optional[int] = 100) -> List[ModelType]:
-        stmt = select(self.get_type())  # select(Author)
-        if offset is not None:
-            stmt = stmt.offset(offset)
+    def find_all(self, limit: Optional[int] = 100, after_id: Optional[int] = None) -> List[ModelType]:
+        """
+        Find the rows ordered by their ID, one page at a time.
+
+        The next page starts after the ID of the last returned row instead of skipping
+        an offset, so each page reads only the rows it returns.
+        """
+        model = self.get_type()
+        stmt = select(model).order_by(model.id)  # type: ignore
+        if after_id is not None:
+            stmt = stmt.where(model.id > after_id)  # type: ignore
 
         if limit is not None:
             stmt = stmt.limit(limit)
@@ -92,6 +314,39 @@ class BaseRepository(Generic[ModelType]):
         self._session.refresh(db_obj)
         return db_obj
 
+    def create_many(self, objs_in: List[ModelType]) -> List[ModelType]:
+        """Add the objects in one flush, so they are inserted with multi-row INSERTs, without committing."""
+        self._session.add_all(objs_in)
+        self._session.flush()
+        return objs_in
+
+    def _upsert_many(self, rows: List[dict], index_elements: List[str], update_columns: List[str], returning: Sequence) -> List[Tuple]:
+        """
+        Insert the rows given as column values, or update the update_columns of the existing rows conflicting
+        on the unique index_elements, with multi-row INSERT ... ON CONFLICT DO UPDATE statements, without committing.
+
+        Returns the returning columns of all inserted and updated rows.
+        """
+        if not rows:
+            return []
+        model = self.get_type()
+        dialect = self._session.get_bind().dialect.name
+        # Both dialects support INSERT ... ON CONFLICT DO UPDATE
+        dialect_insert = {"postgresql": pg_insert, "sqlite": sqlite_insert}.get(dialect)
+        if dialect_insert is None:
+            raise ValueError(f"Upserts are not supported by the '{dialect}' database dialect!")
+        stmt = dialect_insert(model)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=index_elements,
+            set_={column: stmt.excluded[column] for column in update_columns}
+        ).returning(*returning)
+        result = [tuple(row) for row in self._session.execute(stmt, rows)]
+        # The objects already loaded in the session hold the old values, reload them on next access
+        for obj in list(self._session.identity_map.values()):
+            if isinstance(obj, model):
+                self._session.expire(obj, update_columns)
+        return result
+
     def commit(self) -> None:
         self._session.commit()
 
@@ -129,6 +384,12 @@ class BusinessPartnerRepository(BaseRepository[BusinessPartner]):
             BusinessPartner.name == name)  # type: ignore
         return self._session.scalars(stmt).first()
 
+    def find_by_bpnls(self, bpnls: List[str]) -> List[BusinessPartner]:
+        if not bpnls:
+            return []
+        stmt = select(BusinessPartner).where(BusinessPartner.bpnl.in_(bpnls))
+        return self._session.scalars(stmt).all()
+
     def get_by_bpnl(self, bpnl: str) -> Optional[BusinessPartner]:
         stmt = select(BusinessPartner).where(
             BusinessPartner.bpnl == bpnl)  # type: ignore
@@ -136,50 +397,98 @@ class BusinessPartnerRepository(BaseRepository[BusinessPartner]):
 
 class CatalogPartRepository(BaseRepository[CatalogPart]):
 
+    def find_by_ids(self, ids: List[int]) -> List[CatalogPart]:
+        """Retrieve the catalog parts with their legal entity and twin."""
+        if not ids:
+            return []
+        stmt = select(CatalogPart).where(CatalogPart.id.in_(ids)).order_by(CatalogPart.id).options(
+            joinedload(CatalogPart.legal_entity), joinedload(CatalogPart.twin)
+        )
+        return self._session.scalars(stmt).unique().all()
+
+    def search(self, text: str, limit: int, fuzzy: bool = False) -> List[Tuple[int, str, str, float]]:
+        """
+        Search the text in the names, descriptions and manufacturer part IDs of the catalog parts
+        and in their customer part IDs, with one query.
+
+        Without fuzzy the values starting with the text are found, with fuzzy the others containing
+        or resembling it, see _select_search_matches. Descriptions are only searched with fuzzy.
+
+        Returns the (catalog part ID, column name, value, score) of the first limit matches of each column,
+        a catalog part matching in several columns is returned for each of them.
+        """
+        if fuzzy and len(text) < TRIGRAM_LENGTH:
+            return []
+        dialect = self._session.get_bind().dialect.name
+        columns = [
+            (CatalogPart.id, CatalogPart.name, "name"),
+            (CatalogPart.id, CatalogPart.manufacturer_part_id, "manufacturer_part_id"),
+            (PartnerCatalogPart.catalog_part_id, PartnerCatalogPart.customer_part_id, "customer_part_id"),
+        ]
+        if fuzzy:
+            columns.append((CatalogPart.id, CatalogPart.description, "description"))
+        return _search_matches(self._session, [
+            _select_search_matches(id_column, column, name, text, dialect, limit, fuzzy) for id_column, column, name in columns
+        ])
+
     def get_by_legal_entity_id_manufacturer_part_id(self, legal_entity_id: int, manufacturer_part_id: str) -> Optional[CatalogPart]:
         stmt = select(CatalogPart).where(
             CatalogPart.legal_entity_id == legal_entity_id).where(
             CatalogPart.manufacturer_part_id == manufacturer_part_id)
         return self._session.scalars(stmt).first()
 
-    def find_by_manufacturer_id_manufacturer_part_id(self, manufacturer_id: Optional[str], manufacturer_part_id: Optional[str], join_partner_catalog_parts : bool = False) -> List[tuple[CatalogPart, int]]:
+    def find_by_legal_entity_id_manufacturer_part_ids(self, keys: List[Tuple[int, str]]) -> List[CatalogPart]:
+        """Retrieve the catalog parts of all the given (legal entity ID, manufacturer part ID) pairs in one query."""
+        if not keys:
+            return []
+        stmt = select(CatalogPart).where(tuple_(CatalogPart.legal_entity_id, CatalogPart.manufacturer_part_id).in_(keys))
+        return self._session.scalars(stmt).all()
+
+    def upsert_many(self, rows: List[dict]) -> List[Tuple[int, int, str]]:
+        """
+        Insert the catalog parts given as column values or update the given columns if they already exist,
+        resolving conflicts on uk_catalog_part_legal_entity_id_manufacturer_part_id.
+
+        Returns (ID, legal entity ID, manufacturer part ID) tuples of the upserted catalog parts.
+        """
+        return self._upsert_many(
+            rows,
+            index_elements=["legal_entity_id", "manufacturer_part_id"],
+            update_columns=[column for column in rows[0] if column not in ("legal_entity_id", "manufacturer_part_id")] if rows else [],
+            returning=(CatalogPart.id, CatalogPart.legal_entity_id, CatalogPart.manufacturer_part_id)
+        )
+
+    def find_by_manufacturer_id_manufacturer_part_id(self, manufacturer_id: Optional[str], manufacturer_part_id: Optional[str], join_partner_catalog_parts : bool = False, status: Optional[int] = None) -> List[tuple[CatalogPart, int]]:
         """
         Find catalog parts by manufacturer ID and manufacturer part ID.
         If manufacturer ID is not provided, all catalog parts are returned.
         If manufacturer part ID is not provided, all catalog parts with the given manufacturer ID are returned.
         
-        The result is a list of tuples, where each tuple contains the CatalogPart object and its status.
+        The result is a list of tuples, where each tuple contains the CatalogPart object and its status,
+        read from the status maintained on its twin.
         """
 
-        # Case to determine the status of the catalog part
-        status_expr = case(
-            # 0: no twin at all (draft)
-            (CatalogPart.twin_id.is_(None), 0),
-            # 1: twin exists, but not yet DTR-registered (pending)
-            (TwinRegistration.dtr_registered.is_(False), 1),
-            # 2: DTR-registered but not yet in any TwinExchange row (registered)
-            ((TwinRegistration.dtr_registered.is_(True)) & (TwinExchange.twin_id.is_(None)), 2),
-            # 3: DTR-registered AND appears in TwinExchange (shared)
-            ((TwinRegistration.dtr_registered.is_(True)) & (TwinExchange.twin_id.is_not(None)), 3),
-            else_=0
-        ).label("status")
-
-        stmt = select(CatalogPart, status_expr).distinct(CatalogPart.id)
-
-        stmt = stmt.outerjoin(TwinRegistration, TwinRegistration.twin_id == CatalogPart.twin_id)
-        stmt = stmt.outerjoin(TwinExchange, TwinExchange.twin_id == CatalogPart.twin_id)
-
-        if manufacturer_id:
-            stmt = stmt.join(LegalEntity, LegalEntity.id == CatalogPart.legal_entity_id).where(LegalEntity.bpnl == manufacturer_id)
+        stmt = _select_catalog_parts_with_status(manufacturer_id, manufacturer_part_id, join_partner_catalog_parts, status)
+        return self._session.exec(stmt).all()
 
-        if manufacturer_part_id:
-            stmt = stmt.where(CatalogPart.manufacturer_part_id == manufacturer_part_id)
+    def find_listing(self,
+        columns: Sequence[str],
+        manufacturer_id: Optional[str] = None,
+        manufacturer_part_id: Optional[str] = None,
+        category: Optional[str] = None,
+        status: Optional[int] = None,
+        prefix: Optional[str] = None,
+        sort: Sequence[Tuple[str, bool]] = ()) -> List[Dict[str, Any]]:
+        """
+        Find the catalog parts of the listing, reading only the given columns of CATALOG_PART_LISTING_COLUMNS.
 
-        if join_partner_catalog_parts:
-            subquery = select(PartnerCatalogPart).join(BusinessPartner, BusinessPartner.id == PartnerCatalogPart.business_partner_id).where(PartnerCatalogPart.catalog_part_id == CatalogPart.id).subquery()
-            stmt = stmt.join(subquery, subquery.c.catalog_part_id == CatalogPart.id, isouter=True)
+        The materials and dimensions of the catalog parts are not read. The prefix matches the start of
+        the name or of the manufacturer part ID, ignoring case.
 
-        return self._session.exec(stmt).all()
+        Returns one dict of the selected column values per catalog part.
+        """
+        stmt = _select_catalog_part_listing(columns, manufacturer_id, manufacturer_part_id, category, status, prefix, sort)
+        return [dict(row) for row in self._session.exec(stmt).mappings()]
 
 class DataExchangeAgreementRepository(BaseRepository[DataExchangeAgreement]):
     def get_by_business_partner_id(self, business_partner_id: int) -> List[DataExchangeAgreement]:
@@ -188,6 +497,15 @@ class DataExchangeAgreementRepository(BaseRepository[DataExchangeAgreement]):
         )
         return self._session.scalars(stmt).all()
 
+    def find_by_business_partner_ids(self, business_partner_ids: List[int]) -> List[DataExchangeAgreement]:
+        """Retrieve the data exchange agreements of all the given business partners in one query, ordered by ID."""
+        if not business_partner_ids:
+            return []
+        stmt = select(DataExchangeAgreement).where(
+            DataExchangeAgreement.business_partner_id.in_(business_partner_ids)
+        ).order_by(DataExchangeAgreement.id)
+        return self._session.scalars(stmt).all()
+
 class LegalEntityRepository(BaseRepository[LegalEntity]):
 
     def get_by_bpnl(self, bpnl: str) -> Optional[LegalEntity]:
@@ -195,12 +513,39 @@ class LegalEntityRepository(BaseRepository[LegalEntity]):
             LegalEntity.bpnl == bpnl)  # type: ignore
         return self._session.scalars(stmt).first()
 
+    def find_by_bpnls(self, bpnls: List[str]) -> List[LegalEntity]:
+        if not bpnls:
+            return []
+        stmt = select(LegalEntity).where(LegalEntity.bpnl.in_(bpnls))
+        return self._session.scalars(stmt).all()
+
 class PartnerCatalogPartRepository(BaseRepository[PartnerCatalogPart]):
     def get_by_catalog_part_id_business_partner_id(self, catalog_part_id: int, business_partner_id: int) -> Optional[PartnerCatalogPart]:
         stmt = select(PartnerCatalogPart).where(
             PartnerCatalogPart.catalog_part_id == catalog_part_id).where(
             PartnerCatalogPart.business_partner_id == business_partner_id)
         return self._session.scalars(stmt).first()
+
+    def find_by_catalog_part_id_business_partner_ids(self, keys: List[Tuple[int, int]]) -> List[PartnerCatalogPart]:
+        """Retrieve the partner catalog parts of all the given (catalog part ID, business partner ID) pairs in one query."""
+        if not keys:
+            return []
+        stmt = select(PartnerCatalogPart).where(tuple_(PartnerCatalogPart.catalog_part_id, PartnerCatalogPart.business_partner_id).in_(keys))
+        return self._session.scalars(stmt).all()
+
+    def upsert_many(self, rows: List[dict]) -> int:
+        """
+        Insert the partner catalog parts given as column values or update their customer part ID if they already exist,
+        resolving conflicts on uk_partner_catalog_part_business_partner_id_catalog_part_id.
+
+        Returns the number of upserted partner catalog parts.
+        """
+        return len(self._upsert_many(
+            rows,
+            index_elements=["business_partner_id", "catalog_part_id"],
+            update_columns=["customer_part_id"],
+            returning=(PartnerCatalogPart.id,)
+        ))
     
     def create_new(self, catalog_part_id: int, business_partner_id: int, customer_part_id: str) -> PartnerCatalogPart:
         """Create a new PartnerCatalogPart instance."""
@@ -271,6 +616,101 @@ class SerializedPartRepository(BaseRepository[SerializedPart]):
             SerializedPart.part_instance_id == part_instance_id)
         return self._session.scalars(stmt).first()
 
+    def find_by_partner_catalog_part_id_part_instance_ids(self, keys: List[Tuple[int, str]]) -> List[Tuple[int, str]]:
+        """Return which of the given (partner catalog part ID, part instance ID) pairs already exist, in one query."""
+        if not keys:
+            return []
+        stmt = select(SerializedPart.partner_catalog_part_id, SerializedPart.part_instance_id).where(
+            tuple_(SerializedPart.partner_catalog_part_id, SerializedPart.part_instance_id).in_(keys))
+        return [tuple(row) for row in self._session.exec(stmt).all()]
+
+    def insert_many(self, rows: List[dict]) -> None:
+        """Insert the serialized parts given as column values with multi-row INSERTs, without loading them in the session."""
+        if rows:
+            self._session.execute(insert(SerializedPart), rows)
+
+    def find_ids(self,
+        manufacturer_id: Optional[str] = None,
+        manufacturer_part_id: Optional[str] = None,
+        business_partner_number: Optional[str] = None,
+        customer_part_id: Optional[str] = None,
+        keys: Optional[List[Tuple[str, str, str]]] = None,
+        without_twin: bool = False) -> List[int]:
+        """
+        Find the IDs of the serialized parts matching the filters, in ascending order.
+
+        keys optionally restricts the result to the given (manufacturer ID, manufacturer part ID, part instance ID)
+        triples, which are looked up in slices of 1000 to stay below the bind parameter limits of the databases.
+        """
+        return list(self.find_keys(manufacturer_id, manufacturer_part_id, business_partner_number, customer_part_id, keys, without_twin))
+
+    def find_keys(self,
+        manufacturer_id: Optional[str] = None,
+        manufacturer_part_id: Optional[str] = None,
+        business_partner_number: Optional[str] = None,
+        customer_part_id: Optional[str] = None,
+        keys: Optional[List[Tuple[str, str, str]]] = None,
+        without_twin: bool = False) -> Dict[int, Tuple[str, str, str]]:
+        """
+        Find the (manufacturer ID, manufacturer part ID, part instance ID) keys of the serialized parts matching the filters,
+        by serialized part ID in ascending order. The filters work like in find_ids.
+        """
+        stmt = sa_select(SerializedPart.id, LegalEntity.bpnl, CatalogPart.manufacturer_part_id, SerializedPart.part_instance_id).select_from(SerializedPart).join(
+            PartnerCatalogPart, PartnerCatalogPart.id == SerializedPart.partner_catalog_part_id).join(
+            CatalogPart, CatalogPart.id == PartnerCatalogPart.catalog_part_id).join(
+            LegalEntity, LegalEntity.id == CatalogPart.legal_entity_id)
+
+        if business_partner_number:
+            stmt = stmt.join(BusinessPartner, BusinessPartner.id == PartnerCatalogPart.business_partner_id
+                ).where(BusinessPartner.bpnl == business_partner_number)
+        if manufacturer_id:
+            stmt = stmt.where(LegalEntity.bpnl == manufacturer_id)
+        if manufacturer_part_id:
+            stmt = stmt.where(CatalogPart.manufacturer_part_id == manufacturer_part_id)
+        if customer_part_id:
+            stmt = stmt.where(PartnerCatalogPart.customer_part_id == customer_part_id)
+        if without_twin:
+            stmt = stmt.where(SerializedPart.twin_id.is_(None))
+
+        if keys is None:
+            rows = list(self._session.exec(stmt.order_by(SerializedPart.id)).all())
+        else:
+            rows = []
+            for start in range(0, len(keys), 1000):
+                rows.extend(self._session.exec(stmt.where(
+                    tuple_(LegalEntity.bpnl, CatalogPart.manufacturer_part_id, SerializedPart.part_instance_id).in_(keys[start:start + 1000])
+                )).all())
+            rows.sort(key=lambda row: row[0])
+        return {serialized_part_id: (bpnl, manufacturer_part_id, part_instance_id) for serialized_part_id, bpnl, manufacturer_part_id, part_instance_id in rows}
+
+    def search(self, text: str, limit: int, fuzzy: bool = False) -> List[Tuple[int, str, str, float]]:
+        """
+        Search the text in the part instance IDs and VANs of the serialized parts, with one query.
+
+        Without fuzzy the values starting with the text are found, with fuzzy the others containing
+        or resembling it, see _select_search_matches.
+
+        Returns the (serialized part ID, column name, value, score) of the first limit matches of each column.
+        """
+        if fuzzy and len(text) < TRIGRAM_LENGTH:
+            return []
+        dialect = self._session.get_bind().dialect.name
+        return _search_matches(self._session, [
+            _select_search_matches(SerializedPart.id, SerializedPart.part_instance_id, "part_instance_id", text, dialect, limit, fuzzy),
+            _select_search_matches(SerializedPart.id, SerializedPart.van, "van", text, dialect, limit, fuzzy),
+        ])
+
+    def find_by_ids(self, ids: List[int]) -> List[SerializedPart]:
+        """Retrieve the serialized parts with their twin, catalog part, legal entity and business partner, with one query per level."""
+        if not ids:
+            return []
+        stmt = select(SerializedPart).where(SerializedPart.id.in_(ids)).order_by(SerializedPart.id).options(
+            selectinload(SerializedPart.twin),
+            joinedload(SerializedPart.partner_catalog_part).joinedload(PartnerCatalogPart.catalog_part).joinedload(CatalogPart.legal_entity),
+            joinedload(SerializedPart.partner_catalog_part).joinedload(PartnerCatalogPart.business_partner),
+        )
+        return self._session.scalars(stmt).unique().all()
+
     def find_by_partner_catalog_part_id(self, partner_catalog_part_id: int) -> List[SerializedPart]:
         stmt = select(SerializedPart).where(
             SerializedPart.partner_catalog_part_id == partner_catalog_part_id)
@@ -336,53 +776,23 @@ class SerializedPartRepository(BaseRepository[SerializedPart]):
         business_partner_number: Optional[str] = None,
         customer_part_id: Optional[str] = None,
         part_instance_id: Optional[str] = None,
-        van: Optional[str] = None) -> List[tuple[SerializedPart, int]]:
+        van: Optional[str] = None,
+        status: Optional[int] = None,
+        limit: Optional[int] = None,
+        after: Optional[Tuple[datetime, int]] = None) -> List[tuple[SerializedPart, int]]:
         """
         Find serialized parts with status information.
-        The result is a list of tuples, where each tuple contains the SerializedPart object and its status.
-        """
-        
-        # Case to determine the status of the serialized part
-        status_expr = case(
-            # 0: no twin at all (draft)
-            (SerializedPart.twin_id.is_(None), 0),
-            # 1: twin exists, but not yet DTR-registered (pending)
-            (TwinRegistration.dtr_registered.is_(False), 1),
-            # 2: DTR-registered but not yet in any TwinExchange row (registered)
-            ((TwinRegistration.dtr_registered.is_(True)) & (TwinExchange.twin_id.is_(None)), 2),
-            # 3: DTR-registered AND appears in TwinExchange (shared)
-            ((TwinRegistration.dtr_registered.is_(True)) & (TwinExchange.twin_id.is_not(None)), 3),
-            else_=0
-        ).label("status")
-
-        stmt = select(SerializedPart, status_expr).distinct(SerializedPart.id)
-        
-        stmt = stmt.join(PartnerCatalogPart, PartnerCatalogPart.id == SerializedPart.partner_catalog_part_id)
-        stmt = stmt.join(CatalogPart, CatalogPart.id == PartnerCatalogPart.catalog_part_id)
-        stmt = stmt.join(LegalEntity, LegalEntity.id == CatalogPart.legal_entity_id)
-        
-        stmt = stmt.outerjoin(TwinRegistration, TwinRegistration.twin_id == SerializedPart.twin_id)
-        stmt = stmt.outerjoin(TwinExchange, TwinExchange.twin_id == SerializedPart.twin_id)
-
-        if business_partner_number:
-            stmt = stmt.join(BusinessPartner, BusinessPartner.id == PartnerCatalogPart.business_partner_id
-                ).where(BusinessPartner.bpnl == business_partner_number)
-        
-        if manufacturer_id:
-            stmt = stmt.where(LegalEntity.bpnl == manufacturer_id)
+        The result is a list of tuples, where each tuple contains the SerializedPart object and its status,
+        read from the status maintained on its twin.
 
-        if manufacturer_part_id:
-            stmt = stmt.where(CatalogPart.manufacturer_part_id == manufacturer_part_id)
+        The serialized parts are ordered from the newest to the oldest. With a limit, the next page
+        is requested by passing the (created_date, id) of the last returned serialized part as after.
+        """
         
-        if part_instance_id:
-            stmt = stmt.where(SerializedPart.part_instance_id == part_instance_id)
-
-        if van:
-            stmt = stmt.where(SerializedPart.van == van)
-
-        if customer_part_id:
-            stmt = stmt.where(PartnerCatalogPart.customer_part_id == customer_part_id)
-
+        stmt = _select_serialized_parts_with_status(
+            manufacturer_id, manufacturer_part_id, business_partner_number, customer_part_id,
+            part_instance_id, van, status, limit, after
+        )
         return self._session.exec(stmt).all()
 
     def create_new(self, partner_catalog_part_id: int, part_instance_id: str, van: Optional[str]) -> SerializedPart:
@@ -395,6 +805,55 @@ class SerializedPartRepository(BaseRepository[SerializedPart]):
         self.create(serialized_part)
         return serialized_part
 
+class TwinLoadProfile(str, Enum):
+    """
+    Named sets of relationships loaded together with the twins.
+
+    Each profile loads its relationships with one query per level for all the twins,
+    instead of one query per twin when the relationships are accessed lazily.
+    """
+    MANUFACTURER = "manufacturer"
+    CATALOG_PART = "catalog_part"
+    SERIALIZED_PART = "serialized_part"
+    CUSTOMER_PARTS = "customer_parts"
+    SHARES = "shares"
+    REGISTRATIONS = "registrations"
+    ASPECTS = "aspects"
+
+
+_TWIN_LOAD_OPTIONS = {
+    # Only the manufacturer of the catalog part or serialized part, joined into the query of the twins
+    TwinLoadProfile.MANUFACTURER: (
+        joinedload(Twin.catalog_part).joinedload(CatalogPart.legal_entity),
+        joinedload(Twin.serialized_part).joinedload(SerializedPart.partner_catalog_part).joinedload(PartnerCatalogPart.catalog_part).joinedload(CatalogPart.legal_entity),
+    ),
+    # Catalog part with its manufacturer and the customer part IDs of the business partners
+    TwinLoadProfile.CATALOG_PART: (
+        selectinload(Twin.catalog_part).joinedload(CatalogPart.legal_entity),
+        selectinload(Twin.catalog_part).selectinload(CatalogPart.partner_catalog_parts).joinedload(PartnerCatalogPart.business_partner),
+    ),
+    # Serialized part with its partner catalog part, business partner, catalog part and manufacturer
+    TwinLoadProfile.SERIALIZED_PART: (
+        selectinload(Twin.serialized_part).joinedload(SerializedPart.partner_catalog_part).joinedload(PartnerCatalogPart.business_partner),
+        selectinload(Twin.serialized_part).joinedload(SerializedPart.partner_catalog_part).joinedload(PartnerCatalogPart.catalog_part).joinedload(CatalogPart.legal_entity),
+    ),
+    # All the customer part IDs of the catalog part of a serialized part
+    TwinLoadProfile.CUSTOMER_PARTS: (
+        selectinload(Twin.serialized_part).joinedload(SerializedPart.partner_catalog_part).joinedload(PartnerCatalogPart.catalog_part)
+            .selectinload(CatalogPart.partner_catalog_parts).joinedload(PartnerCatalogPart.business_partner),
+    ),
+    TwinLoadProfile.SHARES: (
+        selectinload(Twin.twin_exchanges).joinedload(TwinExchange.data_exchange_agreement).joinedload(DataExchangeAgreement.business_partner),
+    ),
+    TwinLoadProfile.REGISTRATIONS: (
+        selectinload(Twin.twin_registrations).joinedload(TwinRegistration.enablement_service_stack),
+    ),
+    TwinLoadProfile.ASPECTS: (
+        selectinload(Twin.twin_aspects).selectinload(TwinAspect.twin_aspect_registrations).joinedload(TwinAspectRegistration.enablement_service_stack),
+    ),
+}
+
+
 class TwinRepository(BaseRepository[Twin]):
     def create_new(self, global_id: UUID = None, dtr_aas_id: UUID = None):
         """Create a new Twin instance with the given global_id and dtr_aas_id."""
@@ -414,10 +873,26 @@ class TwinRepository(BaseRepository[Twin]):
         self.create(twin)
         
         return twin
+
+    def insert_many(self, twins: List[Twin]) -> None:
+        """
+        Insert the new twins with multi-row INSERTs without adding them to the session, then set their IDs.
+
+        Unlike create_many, the inserts do not depend on the database returning the generated IDs in
+        insertion order, the IDs are read back by the unique global IDs with one more query.
+        """
+        if not twins:
+            return
+        self._session.execute(insert(Twin), [twin.model_dump(exclude={"id"}) for twin in twins])
+        stmt = select(Twin.global_id, Twin.id).where(Twin.global_id.in_([twin.global_id for twin in twins]))
+        ids = dict(self._session.exec(stmt).all())
+        for twin in twins:
+            twin.id = ids[twin.global_id]
     
-    def find_by_global_id(self, global_id: UUID) -> Optional[Twin]:
+    def find_by_global_id(self, global_id: UUID, load: Sequence[TwinLoadProfile] = ()) -> Optional[Twin]:
         stmt = select(Twin).where(
             Twin.global_id == global_id)
+        stmt = self._apply_load_profiles(stmt, load)
         return self._session.scalars(stmt).first()
     
     def find_by_aas_id(self, aas_id: UUID) -> Optional[Twin]:
@@ -425,20 +900,53 @@ class TwinRepository(BaseRepository[Twin]):
             Twin.aas_id == aas_id)
         return self._session.scalars(stmt).first()
     
+    def refresh_status(self, twin_ids: Optional[List[int]] = None) -> int:
+        """
+        Recompute the status of the given twins, or of all twins, from their registrations and exchanges.
+
+        Must be called whenever a twin registration or twin exchange is created, changed or deleted.
+        Returns the number of updated twins.
+        """
+        stmt = update(Twin).values(status=_twin_status_expr()).execution_options(synchronize_session=False)
+        if twin_ids is not None:
+            if not twin_ids:
+                return 0
+            stmt = stmt.where(Twin.id.in_(twin_ids))
+        result = self._session.execute(stmt)
+        # The twins already loaded in the session hold the old status, reload it on next access
+        for identity_key, twin in list(self._session.identity_map.items()):
+            # Read the ID from the identity key, accessing it on an expired twin would reload the twin
+            if isinstance(twin, Twin) and (twin_ids is None or identity_key[1][0] in twin_ids):
+                self._session.expire(twin, ["status"])
+        return result.rowcount
+
+    def find_inconsistent_status(self) -> List[Tuple[int, int, int]]:
+        """
+        Find the twins whose stored status differs from the status derived from their registrations and exchanges.
+
+        Returns (twin id, stored status, derived status) tuples.
+        """
+        derived = _twin_status_expr()
+        stmt = select(Twin.id, Twin.status, derived).where(Twin.status != derived).order_by(Twin.id)
+        return [tuple(row) for row in self._session.exec(stmt).all()]
+
     def find_catalog_part_twins(self,
             manufacturer_id: Optional[str] = None,
             manufacturer_part_id: Optional[str] = None,
             global_id: Optional[UUID] = None,
             include_data_exchange_agreements: bool = False,
-            include_aspects: bool = False,
-            include_registrations: bool = False) -> List[Twin]:
+            load: Sequence[TwinLoadProfile] = ()) -> List[Twin]:
+        """
+        Find the twins of catalog parts, with the relationships of the given load profiles.
+        """
         
         stmt = select(Twin).join(
             CatalogPart, CatalogPart.twin_id == Twin.id).join(
             LegalEntity, LegalEntity.id == CatalogPart.legal_entity_id
         ).distinct()
 
-        stmt = self._apply_subquery_filters(stmt, include_data_exchange_agreements, include_aspects, include_registrations)
+        stmt = self._apply_subquery_filters(stmt, include_data_exchange_agreements)
+        stmt = self._apply_load_profiles(stmt, load)
 
         if manufacturer_id:
             stmt = stmt.where(LegalEntity.bpnl == manufacturer_id)
@@ -462,12 +970,18 @@ class TwinRepository(BaseRepository[Twin]):
             enablement_service_stack_id: Optional[int] = None,
             min_incl_created_date: Optional[datetime] = None,
             max_excl_created_date: Optional[datetime] = None,
-            limit: int = 50,
-            offset: int = 0,
+            limit: Optional[int] = None,
+            after: Optional[Tuple[datetime, int]] = None,
             include_data_exchange_agreements: bool = False,
-            include_aspects: bool = False,
-            include_registrations: bool = False,
-            include_all_partner_catalog_parts: bool = False) -> List[Twin]:
+            include_all_partner_catalog_parts: bool = False,
+            load: Sequence[TwinLoadProfile] = ()) -> List[Twin]:
+        """
+        Find the twins of serialized parts, ordered from the newest to the oldest,
+        with the relationships of the given load profiles.
+
+        With a limit, the next page is requested by passing the (created_date, id)
+        of the last returned twin as after.
+        """
         
         stmt = select(Twin).join(
             SerializedPart, SerializedPart.twin_id == Twin.id).join(
@@ -476,7 +990,8 @@ class TwinRepository(BaseRepository[Twin]):
             LegalEntity, LegalEntity.id == CatalogPart.legal_entity_id
         ).distinct()
 
-        stmt = self._apply_subquery_filters(stmt, include_data_exchange_agreements, include_aspects, include_registrations)
+        stmt = self._apply_subquery_filters(stmt, include_data_exchange_agreements)
+        stmt = self._apply_load_profiles(stmt, load)
 
         if manufacturer_id:
             stmt = stmt.where(LegalEntity.bpnl == manufacturer_id)
@@ -519,17 +1034,12 @@ class TwinRepository(BaseRepository[Twin]):
         if max_excl_created_date:
             stmt = stmt.where(Twin.created_date < max_excl_created_date)
 
-        if limit or offset:
-            stmt = stmt.order_by(desc(Twin.created_date))
-            if offset:
-                stmt = stmt.offset(offset)
-            if limit:
-                stmt = stmt.limit(limit)
+        stmt = _apply_keyset(stmt, Twin.created_date, Twin.id, limit, after)
 
         return self._session.scalars(stmt).all()
 
     @staticmethod
-    def _apply_subquery_filters(stmt, include_data_exchange_agreements: bool, include_aspects: bool, include_registrations: bool):
+    def _apply_subquery_filters(stmt, include_data_exchange_agreements: bool):
         if include_data_exchange_agreements:
             subquery = select(TwinExchange).join(
                 DataExchangeAgreement, TwinExchange.data_exchange_agreement_id == DataExchangeAgreement.id
@@ -537,17 +1047,13 @@ class TwinRepository(BaseRepository[Twin]):
                 BusinessPartner, BusinessPartner.id == DataExchangeAgreement.business_partner_id
             ).subquery()
             stmt = stmt.join(subquery, subquery.c.twin_id == Twin.id, isouter=True)
-
-        if include_registrations:
-            stmt = stmt.options(selectinload(Twin.twin_registrations))
         
-        if include_aspects:
-            if include_registrations:
-                stmt = stmt.options(selectinload(Twin.twin_aspects).selectinload(TwinAspect.twin_aspect_registrations))
-            else:
-                stmt = stmt.options(selectinload(Twin.twin_aspects))
+        return stmt
 
-        
+    @staticmethod
+    def _apply_load_profiles(stmt, load: Sequence[TwinLoadProfile]):
+        for profile in load:
+            stmt = stmt.options(*_TWIN_LOAD_OPTIONS[profile])
         return stmt
 
 
@@ -647,7 +1153,52 @@ class TwinExchangeRepository(BaseRepository[TwinExchange]):
         )
         return self._session.scalars(stmt).first()  
 
+    def find_by_twin_ids(self, twin_ids: List[int]) -> List[TwinExchange]:
+        """Retrieve the exchanges of all the given twins in one query."""
+        if not twin_ids:
+            return []
+        stmt = select(TwinExchange).where(TwinExchange.twin_id.in_(twin_ids))
+        return self._session.scalars(stmt).all()
+
+    def delete_many(self, twin_ids: List[int], data_exchange_agreement_ids: List[int]) -> int:
+        """
+        Delete the exchanges of the given twins under the given data exchange agreements with one DELETE.
+
+        Returns the number of deleted exchanges.
+        """
+        if not twin_ids or not data_exchange_agreement_ids:
+            return 0
+        stmt = delete(TwinExchange).where(
+            TwinExchange.twin_id.in_(twin_ids),
+            TwinExchange.data_exchange_agreement_id.in_(data_exchange_agreement_ids)
+        ).execution_options(synchronize_session=False)
+        result = self._session.execute(stmt)
+        # The exchanges already loaded in the session are gone
+        for identity_key, twin_exchange in list(self._session.identity_map.items()):
+            if not isinstance(twin_exchange, TwinExchange):
+                continue
+            twin_id, data_exchange_agreement_id = identity_key[1]
+            if twin_id in twin_ids and data_exchange_agreement_id in data_exchange_agreement_ids:
+                self._session.expunge(twin_exchange)
+        return result.rowcount
+
 class TwinRegistrationRepository(BaseRepository[TwinRegistration]):
+    def find_by_twin_ids(self, twin_ids: List[int]) -> List[TwinRegistration]:
+        """Retrieve the registrations of all the given twins in one query."""
+        if not twin_ids:
+            return []
+        stmt = select(TwinRegistration).where(TwinRegistration.twin_id.in_(twin_ids))
+        return self._session.scalars(stmt).all()
+
+    def set_dtr_registered(self, keys: List[Tuple[int, int]]) -> None:
+        """Flag the registrations of the given (twin ID, enablement service stack ID) pairs as registered in the DTR with one UPDATE."""
+        if not keys:
+            return
+        stmt = update(TwinRegistration).where(
+            tuple_(TwinRegistration.twin_id, TwinRegistration.enablement_service_stack_id).in_(keys)
+        ).values(dtr_registered=True).execution_options(synchronize_session=False)
+        self._session.execute(stmt)
+
     def get_by_twin_id_enablement_service_stack_id(self, twin_id: int, enablement_service_stack_id: int) -> Optional[TwinRegistration]:
         stmt = select(TwinRegistration).where(
             TwinRegistration.twin_id == twin_id).where(
@@ -662,3 +1213,79 @@ class TwinRegistrationRepository(BaseRepository[TwinRegistration]):
         )
         self.create(twin_registration)
         return twin_registration
+
+class OutboxMessageRepository(BaseRepository[OutboxMessage]):
+    def get_by_idempotency_key(self, idempotency_key: str, for_update: bool = False) -> Optional[OutboxMessage]:
+        stmt = select(OutboxMessage).where(OutboxMessage.idempotency_key == idempotency_key)
+        if for_update:
+            stmt = stmt.with_for_update()
+        return self._session.scalars(stmt).first()
+
+    def enqueue(self, operation: str, idempotency_key: str, payload: Dict[str, Any]) -> OutboxMessage:
+        """
+        Add a message for the side effect identified by the idempotency key, in the transaction of the session.
+
+        A message with the same key is replaced and due again right away, so the side effect
+        is applied once with the latest payload, also after it was done or failed before.
+        A message being processed keeps its claim and is only marked to run again with the
+        latest payload once the current attempt finishes.
+        """
+        now = datetime.utcnow()
+        # Locked, so a worker finishing the message waits for this transaction or is waited for
+        message = self.get_by_idempotency_key(idempotency_key, for_update=True)
+        if not message:
+            message = self.create(OutboxMessage(idempotency_key=idempotency_key, operation=operation, payload=payload))
+            return message
+        message.operation = operation
+        message.payload = payload
+        message.modified_date = now
+        if message.status == OutboxMessageStatus.PROCESSING:
+            message.rerun = True
+            return message
+        message.status = OutboxMessageStatus.PENDING
+        message.attempts = 0
+        message.next_attempt_date = now
+        message.last_error = None
+        return message
+
+    def claim_due(self, limit: int, lease_seconds: float) -> List[OutboxMessage]:
+        """
+        Claim the oldest due messages for one attempt, until the lease expires.
+
+        The rows locked by other workers are skipped, and a message whose worker died
+        before finishing it is due again when its lease expires. Every claim gets a new
+        claim token, so a worker whose lease expired can no longer finish the message.
+        """
+        now = datetime.utcnow()
+        stmt = select(OutboxMessage).where(
+            OutboxMessage.status.in_([OutboxMessageStatus.PENDING, OutboxMessageStatus.PROCESSING]),
+            OutboxMessage.next_attempt_date <= now
+        ).order_by(OutboxMessage.next_attempt_date, OutboxMessage.id).limit(limit).with_for_update(skip_locked=True)
+        messages = list(self._session.scalars(stmt).all())
+        for message in messages:
+            message.status = OutboxMessageStatus.PROCESSING
+            message.attempts += 1
+            message.claim_token += 1
+            # The attempt reads the latest payload
+            message.rerun = False
+            message.next_attempt_date = now + timedelta(seconds=lease_seconds)
+            message.modified_date = now
+        return messages
+
+    def get_claimed(self, message_id: int, claim_token: int) -> Optional[OutboxMessage]:
+        """
+        Lock the message to finish the attempt of a claim, if the message is still processed under that claim.
+
+        Returns None if the message was claimed again after the lease expired, or finished meanwhile.
+        """
+        stmt = select(OutboxMessage).where(
+            OutboxMessage.id == message_id,
+            OutboxMessage.status == OutboxMessageStatus.PROCESSING,
+            OutboxMessage.claim_token == claim_token
+        ).with_for_update()
+        return self._session.scalars(stmt).first()
+
+    def count_by_status(self) -> Dict[int, int]:
+        """Count the messages per status in one query."""
+        stmt = select(OutboxMessage.status, func.count()).group_by(OutboxMessage.status)
+        return dict(self._session.exec(stmt).all())
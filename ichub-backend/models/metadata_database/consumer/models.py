@@ -37,6 +37,7 @@ class KnownConnectors(SQLModel):
     bpnl: str = Field(primary_key=True, index=True, description="Business Partner Number Legal Entity")
     connectors: List[str] = Field(sa_column=Column(JSON), description="List of connector URLs for this BPNL")
     expires_at: datetime = Field(index=True, description="When this cache entry expires")
+    updated_at: datetime = Field(default_factory=datetime.now, index=True, description="When this cache entry was last written")
 
 
 class KnownDtrs(SQLModel):
@@ -45,11 +46,13 @@ class KnownDtrs(SQLModel):
     
     This table stores the discovered DTRs for each BPNL along with timestamps
     for cache management and expiration, including the EDC URL, asset ID, and policies.
+    A BPNL can have several DTRs, one row per asset ID.
     """
 
     bpnl: str = Field(primary_key=True, index=True, description="Business Partner Number Legal Entity")
     edc_url: str = Field(description="URL of the EDC where the DTR is stored")
-    asset_id: str = Field(description="Asset ID of the DTR")
+    asset_id: str = Field(primary_key=True, description="Asset ID of the DTR")
     policies: List[str] = Field(sa_column=Column(JSON), description="List of policies for this DTR")
     expires_at: datetime = Field(index=True, description="When this cache entry expires")
+    updated_at: datetime = Field(default_factory=datetime.now, index=True, description="When this cache entry was last written")
 
@@ -26,6 +26,6 @@ from .models import (
     LegalEntity, BusinessPartner, EnablementServiceStack,
     Twin, TwinAspect, TwinAspectRegistration, TwinExchange, TwinRegistration,
     CatalogPart, PartnerCatalogPart, SerializedPart, JISPart, Batch, BatchBusinessPartner,
-    DataExchangeAgreement, DataExchangeContract
+    DataExchangeAgreement, DataExchangeContract, OutboxMessage, OutboxMessageStatus
 )
 
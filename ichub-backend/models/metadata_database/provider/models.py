@@ -28,13 +28,13 @@ These models are designed to interact with a PostgreSQL database using
 SQLAlchemy and SQLModel.
 """
 
-from enum import Enum
+from enum import Enum, IntEnum
 from typing import Any, Dict, List, Optional
 from uuid import UUID, uuid4
 from datetime import datetime
 from pydantic import BaseModel, Field as PydField
 from sqlmodel import Field, SQLModel, Relationship
-from sqlalchemy import Column, JSON, UniqueConstraint, SmallInteger
+from sqlalchemy import Column, DDL, JSON, UniqueConstraint, SmallInteger, Index, event, text
 from tools.constants import TWIN_ID_DESCRIPTION, BUSINESS_PARTNER_ID_DESCRIPTION
 
 class Unit(str, Enum):
@@ -123,6 +123,7 @@ class Twin(SQLModel, table=True):
         modified_date (datetime): The last modification date of the twin. The date fields could be auto-created at insert time by the DB. 
         asset_class (Optional[str]): The asset class of the twin. This field is used at DRÄXLMAIER but might not be necessary in IC-Hub. It could be removed them from the table if no necessary.
         additional_context (Optional[str]): Additional context for the twin. This field is used at DRÄXLMAIER but might not be necessary in IC-Hub. It could be removed them from the table if no necessary.
+        status (int): The status of the part of the twin (0: draft, 1: pending, 2: registered, 3: shared). It is derived from twin_registration and twin_exchange and refreshed whenever those change.
 
     Relationships:
         catalog_parts (List["CatalogPart"]): A list of catalog parts associated with this twin.
@@ -142,6 +143,7 @@ class Twin(SQLModel, table=True):
     modified_date: datetime = Field(index=True, default_factory=datetime.utcnow, description="The last modification date of the twin.")
     asset_class: Optional[str] = Field(default=None, description="The asset class of the twin.")
     additional_context: Optional[str] = Field(default=None, description="Additional context for the twin.")
+    status: int = Field(index=True, default=0, description="The status of the part of the twin, derived from its registrations and exchanges.", sa_type=SmallInteger)
 
     # Relationships
     batch: Optional["Batch"] = Relationship(back_populates="twin")
@@ -152,6 +154,11 @@ class Twin(SQLModel, table=True):
     twin_exchanges: List["TwinExchange"] = Relationship(back_populates="twin")
     twin_registrations: List["TwinRegistration"] = Relationship(back_populates="twin")
 
+    __table_args__ = (
+        # Keyset for the paginated twin listings
+        Index("idx_twin_created_date_id", "created_date", "id"),
+    )
+
     __tablename__ = "twin"
 
 
@@ -207,6 +214,12 @@ class CatalogPart(SQLModel, table=True):
 
     __table_args__ = (
         UniqueConstraint("legal_entity_id", "manufacturer_part_id", name="uk_catalog_part_legal_entity_id_manufacturer_part_id"),
+        # Prefix and trigram indexes of the part search, see CatalogPartRepository.search
+        Index("idx_catalog_part_name_lower", text('lower(name) COLLATE "C"')).ddl_if(dialect="postgresql"),
+        Index("idx_catalog_part_manufacturer_part_id_lower", text('lower(manufacturer_part_id) COLLATE "C"')).ddl_if(dialect="postgresql"),
+        Index("idx_catalog_part_name_trgm", "name", postgresql_using="gin", postgresql_ops={"name": "gin_trgm_ops"}).ddl_if(dialect="postgresql"),
+        Index("idx_catalog_part_description_trgm", "description", postgresql_using="gin", postgresql_ops={"description": "gin_trgm_ops"}).ddl_if(dialect="postgresql"),
+        Index("idx_catalog_part_manufacturer_part_id_trgm", "manufacturer_part_id", postgresql_using="gin", postgresql_ops={"manufacturer_part_id": "gin_trgm_ops"}).ddl_if(dialect="postgresql"),
     )
 
     __tablename__ = "catalog_part"
@@ -267,6 +280,9 @@ class PartnerCatalogPart(SQLModel, table=True):
     # Composite Unique Constraint
     __table_args__ = (
         UniqueConstraint("business_partner_id", "catalog_part_id", name="uk_partner_catalog_part_business_partner_id_catalog_part_id"),
+        # Prefix and trigram indexes of the part search, see CatalogPartRepository.search
+        Index("idx_partner_catalog_part_customer_part_id_lower", text('lower(customer_part_id) COLLATE "C"')).ddl_if(dialect="postgresql"),
+        Index("idx_partner_catalog_part_customer_part_id_trgm", "customer_part_id", postgresql_using="gin", postgresql_ops={"customer_part_id": "gin_trgm_ops"}).ddl_if(dialect="postgresql"),
     )
 
     __tablename__ = "partner_catalog_part"
@@ -286,6 +302,7 @@ class SerializedPart(SQLModel, table=True):
         part_instance_id (str): The part instance ID. 
         van (Optional[str]): The optional VAN (Vehicle Assembly Number). This is the vehicle number given by the Industry Core KIT.
         twin_id (int): The ID of the associated twin. 
+        created_date (datetime): The creation date of the serialized part. Auto-generated in the DB.
 
     Relationships:
         partner_catalog_part (PartnerCatalogPart): The partner catalog part this serial part is related to.
@@ -299,6 +316,7 @@ class SerializedPart(SQLModel, table=True):
     part_instance_id: str = Field(index=True, description="The part instance ID.")
     van: Optional[str] = Field(index=True, default=None, description="The optional VAN (Vehicle Assembly Number).")
     twin_id: Optional[int] = Field(unique=True, foreign_key="twin.id", description=TWIN_ID_DESCRIPTION)
+    created_date: datetime = Field(default_factory=datetime.utcnow, description="The creation date of the serialized part.")
 
     # Relationships
     partner_catalog_part: PartnerCatalogPart = Relationship(back_populates="serialized_parts")
@@ -306,6 +324,18 @@ class SerializedPart(SQLModel, table=True):
 
     __table_args__ = (
         UniqueConstraint("part_instance_id", "partner_catalog_part_id", name="uk_serialized_part_partner_catalog_part_id_part_instance_id"),
+        # Keyset for the paginated serialized part listings
+        Index("idx_serialized_part_created_date_id", "created_date", "id"),
+        # Serialized parts of a partner catalog part filtered by VAN, only the parts having one
+        Index(
+            "idx_serialized_part_partner_catalog_part_id_van", "partner_catalog_part_id", "van",
+            postgresql_where=text("van IS NOT NULL"), sqlite_where=text("van IS NOT NULL")
+        ),
+        # Prefix and trigram indexes of the part search, see SerializedPartRepository.search
+        Index("idx_serialized_part_part_instance_id_lower", text('lower(part_instance_id) COLLATE "C"')).ddl_if(dialect="postgresql"),
+        Index("idx_serialized_part_van_lower", text('lower(van) COLLATE "C"')).ddl_if(dialect="postgresql"),
+        Index("idx_serialized_part_part_instance_id_trgm", "part_instance_id", postgresql_using="gin", postgresql_ops={"part_instance_id": "gin_trgm_ops"}).ddl_if(dialect="postgresql"),
+        Index("idx_serialized_part_van_trgm", "van", postgresql_using="gin", postgresql_ops={"van": "gin_trgm_ops"}).ddl_if(dialect="postgresql"),
     )
 
     __tablename__ = "serialized_part"
@@ -649,6 +679,11 @@ class TwinExchange(SQLModel, table=True):
     twin: Twin = Relationship(back_populates="twin_exchanges")
     data_exchange_agreement: DataExchangeAgreement = Relationship(back_populates="twin_exchanges")
 
+    __table_args__ = (
+        # Exchanges of a twin, the primary key of the DDL starts with the data exchange agreement
+        Index("idx_twin_exchange_twin_id", "twin_id"),
+    )
+
     __tablename__ = "twin_exchange"
 
 
@@ -679,4 +714,73 @@ class TwinRegistration(SQLModel, table=True):
     twin: Twin = Relationship(back_populates="twin_registrations")
     enablement_service_stack: EnablementServiceStack = Relationship(back_populates="twin_registrations")
 
-    __tablename__ = "twin_registration"
\ No newline at end of file
+    __table_args__ = (
+        # Registered and pending registrations of a twin, read by the twin status from the index alone
+        Index("idx_twin_registration_twin_id_dtr_registered", "twin_id", "dtr_registered"),
+    )
+
+    __tablename__ = "twin_registration"
+
+
+class OutboxMessageStatus(IntEnum):
+    """The state of an outbox message."""
+
+    PENDING = 0
+    """The message waits for its (next) attempt."""
+
+    PROCESSING = 1
+    """A worker claimed the message, it is due again once its lease expires."""
+
+    DONE = 2
+    """The side effect of the message was applied."""
+
+    FAILED = 3
+    """All the attempts failed, the message is no longer retried."""
+
+
+class OutboxMessage(SQLModel, table=True):
+    """
+    Represents a side effect in the DTR, EDC or submodel service which is written in the same
+    transaction as the rows it belongs to, and applied afterwards by the outbox worker.
+
+    Attributes:
+        id (Optional[int]): The unique identifier for the message.
+        idempotency_key (str): Identifies the side effect, enqueueing the same key again replaces the pending message
+            or, while the message is processed, marks it to be run again.
+        operation (str): The name of the handler applying the side effect.
+        payload (Dict[str, Any]): The arguments of the handler.
+        status (int): The status of the message (0: pending, 1: processing, 2: done, 3: failed).
+        attempts (int): The number of attempts so far.
+        claim_token (int): Incremented on every claim, only the worker holding the latest claim may finish the message.
+        rerun (bool): The message was enqueued again while it was processed, it is due again when the attempt finishes.
+        next_attempt_date (datetime): When the message is due, or when the lease of the claiming worker expires.
+        last_error (Optional[str]): The error of the last failed attempt.
+        created_date (datetime): The creation date of the message.
+        modified_date (datetime): The last modification date of the message.
+
+    Table Name:
+        outbox_message
+    """
+    id: Optional[int] = Field(default=None, primary_key=True)
+    idempotency_key: str = Field(unique=True, description="Identifies the side effect of the message.")
+    operation: str = Field(description="The name of the handler applying the side effect.")
+    payload: Dict[str, Any] = Field(default_factory=dict, sa_column=Column(JSON, nullable=False), description="The arguments of the handler.")
+    status: int = Field(default=OutboxMessageStatus.PENDING, description="The status of the message.", sa_type=SmallInteger)
+    attempts: int = Field(default=0, description="The number of attempts so far.")
+    claim_token: int = Field(default=0, description="Incremented on every claim of the message.")
+    rerun: bool = Field(default=False, description="Whether the message is due again when the current attempt finishes.")
+    next_attempt_date: datetime = Field(default_factory=datetime.utcnow, description="When the message is due.")
+    last_error: Optional[str] = Field(default=None, description="The error of the last failed attempt.")
+    created_date: datetime = Field(default_factory=datetime.utcnow, description="The creation date of the message.")
+    modified_date: datetime = Field(default_factory=datetime.utcnow, description="The last modification date of the message.")
+
+    __table_args__ = (
+        # Due messages polled by the outbox worker
+        Index("idx_outbox_message_status_next_attempt_date", "status", "next_attempt_date"),
+    )
+
+    __tablename__ = "outbox_message"
+
+
+# The trigram indexes of the part search need the pg_trgm extension
+event.listen(SQLModel.metadata, "before_create", DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql"))
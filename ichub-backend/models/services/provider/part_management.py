@@ -24,6 +24,7 @@
 
 from datetime import datetime
 from typing import Dict, Optional, List
+from uuid import UUID
 
 import enum
 
@@ -75,6 +76,25 @@ class CatalogPartRead(CatalogPartBase):
 class CatalogPartReadWithStatus(CatalogPartRead, StatusBase):
     """Simple catalog part read model with status information."""
 
+class CatalogPartField(str, enum.Enum):
+    """The fields of a catalog part which can be selected and sorted on in the catalog part listing."""
+
+    MANUFACTURER_ID = "manufacturerId"
+    MANUFACTURER_PART_ID = "manufacturerPartId"
+    NAME = "name"
+    CATEGORY = "category"
+    BPNS = "bpns"
+    STATUS = "status"
+
+class CatalogPartListRead(BaseModel):
+    """Catalog part of the catalog part listing, holding only the selected fields."""
+    manufacturer_id: Optional[str] = Field(alias="manufacturerId", description="The BPNL (manufactuer ID) of the part.", default=None)
+    manufacturer_part_id: Optional[str] = Field(alias="manufacturerPartId", description="The manufacturer part ID of the part.", default=None)
+    name: Optional[str] = Field(description="The name of the part.", default=None)
+    category: Optional[str] = Field(description="The category of the part.", default=None)
+    bpns: Optional[str] = Field(description="The site number (BPNS) the part is attached to.", default=None)
+    status: Optional[SharingStatus] = Field(description="The status of the part. (0: draft, 1: pending, 2: registered, 3: shared)", default=None)
+
 class CatalogPartDetailsRead(CatalogPartRead):
     description: Optional[str] = Field(description="The decription of the part.", default=None)
     materials: Optional[List[Material]] = Field(description="List of materials, e.g. [{'name':'aluminum','share':20.5}, {'name':'steel','share':75.25}]", default=[])
@@ -96,10 +116,30 @@ class CatalogPartDelete(CatalogPartBase):
 class CatalogPartUpdate(CatalogPartCreate):
     pass
 
+class UpsertSummary(BaseModel):
+    created: int = Field(description="The number of created entries.", default=0)
+    updated: int = Field(description="The number of existing entries which were changed.", default=0)
+    unchanged: int = Field(description="The number of existing entries which already had the given values.", default=0)
+
+class CatalogPartBatchError(CatalogPartBase):
+    index: int = Field(description="The position of the catalog part in the batch, starting at 0.")
+    error: str = Field(description="The reason why the catalog part could not be stored.")
+
+class CatalogPartBatchRead(BaseModel):
+    catalog_parts: UpsertSummary = Field(alias="catalogParts", description="The outcome for the catalog parts, including their materials and dimensions.")
+    partner_catalog_parts: UpsertSummary = Field(alias="partnerCatalogParts", description="The outcome for the customer part IDs mapped to the business partners.")
+    failed: int = Field(description="The number of catalog parts which could not be stored.")
+    errors: List[CatalogPartBatchError] = Field(description="The catalog parts which could not be stored, in the order of the batch.", default=[])
+
 class CatalogPartQuery(BaseModel):
     manufacturer_id: Optional[str] = Field(alias="manufacturerId", description="The BPNL (manufactuer ID) of the part to register.", default=None)
     manufacturer_part_id: Optional[str] = Field(alias="manufacturerPartId", description="The manufacturer part ID of the part.", default=None)
 
+class CatalogPartListQuery(CatalogPartQuery):
+    category: Optional[str] = Field(description="The category of the part.", default=None)
+    status: Optional[SharingStatus] = Field(description="The status of the part. (0: draft, 1: pending, 2: registered, 3: shared)", default=None)
+    prefix: Optional[str] = Field(description="The start of the name or of the manufacturer part ID of the part, ignoring case.", default=None)
+
 class PartnerCatalogPartCreate(CatalogPartBase, PartnerCatalogPartBase):
     pass
 
@@ -155,6 +195,30 @@ class SerializedPartCreate(SerializedPartBase, PartnerRelatedPartCreateBase):
 class SerializedPartDelete(SerializedPartBase, PartnerRelatedPartCreateBase):
     pass
 
+class ImportRowStatus(str, enum.Enum):
+    """The outcome of one row of a bulk import."""
+
+    CREATED = "created"
+    """The part was created."""
+
+    EXISTING = "existing"
+    """The part already existed and was left unchanged."""
+
+    FAILED = "failed"
+    """The part could not be imported, see the error of the row."""
+
+class SerializedPartImportResult(BaseModel):
+    row: int = Field(description="The number of the row in the imported document, starting at 1.")
+    status: ImportRowStatus = Field(description="The outcome of the import of the row.")
+    part_instance_id: Optional[str] = Field(alias="partInstanceId", description="The part instance ID of the serialized part.", default=None)
+    error: Optional[str] = Field(description="The reason why the row could not be imported.", default=None)
+
+class SerializedPartImportRead(BaseModel):
+    created: int = Field(description="The number of created serialized parts.")
+    existing: int = Field(description="The number of serialized parts which already existed.")
+    failed: int = Field(description="The number of rows which could not be imported.")
+    results: List[SerializedPartImportResult] = Field(description="The outcome of each row, in the order of the document.")
+
 class SerializedPartUpdate(SerializedPartCreate):
     pass
 
@@ -162,6 +226,37 @@ class SerializedPartQuery(PartnerCatalogPartQuery):
     part_instance_id: Optional[str] = Field(alias="partInstanceId", description="The part instance ID of the serialized part.", default=None)
     van: Optional[str] = Field(description=VAN_DESCRIPTION, default=None)
 
+class PartSearchResultType(str, enum.Enum):
+    """The kind of part found by the part search."""
+
+    CATALOG_PART = "catalogPart"
+    SERIALIZED_PART = "serializedPart"
+
+class PartSearchField(str, enum.Enum):
+    """The fields of the parts searched by the part search."""
+
+    NAME = "name"
+    DESCRIPTION = "description"
+    MANUFACTURER_PART_ID = "manufacturerPartId"
+    CUSTOMER_PART_ID = "customerPartId"
+    PART_INSTANCE_ID = "partInstanceId"
+    VAN = "van"
+
+class PartSearchHighlight(BaseModel):
+    start: int = Field(description="The position of the first highlighted character of the matched value.")
+    end: int = Field(description="The position after the last highlighted character of the matched value.")
+
+class PartSearchResult(CatalogPartRead):
+    type: PartSearchResultType = Field(description="The kind of the found part.")
+    customer_part_id: Optional[str] = Field(alias="customerPartId", description="The customer part ID of the part, if it matched or the part is a serialized part.", default=None)
+    part_instance_id: Optional[str] = Field(alias="partInstanceId", description="The part instance ID of the serialized part.", default=None)
+    van: Optional[str] = Field(description=VAN_DESCRIPTION, default=None)
+    global_id: Optional[UUID] = Field(alias="globalId", description="The Catena-X ID / global ID of the digital twin of the part, if it has one.", default=None)
+    matched_field: PartSearchField = Field(alias="matchedField", description="The field of the part which matched the searched text best.")
+    matched_value: str = Field(alias="matchedValue", description="The value of the matched field.")
+    highlights: List[PartSearchHighlight] = Field(description="The ranges of the matched value matching the searched text.", default=[])
+    score: float = Field(description="The relevance of the match, exact matches rank first, then prefixes, then similar values.")
+
 class JISPartBase(CatalogPartBase, CustomerPartIdBase):
     jis_number: str = Field(alias="jisNumber", description="The JIS number of the JIS part.")
 
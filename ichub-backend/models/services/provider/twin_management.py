@@ -38,6 +38,7 @@ from models.services.provider.part_management import (
     SerializedPartDetailsRead,
 )
 from models.services.provider.partner_management import DataExchangeAgreementRead
+from utils.batch_jobs import BatchJobStatus
 
 class TwinAspectRegistrationStatus(enum.Enum):
     """An enumeration of potential status values when a twin aspect is registered within the system"""
@@ -149,3 +150,41 @@ class SerializedPartTwinUnshareCreate(BaseModel):
     business_partner_number_to_unshare: list[str] = Field(alias="businessPartnerNumberToUnshare", description="The business partner number of the business partner with which the serialized part twin should be unshared.")
     manufacturer_id: str = Field(alias="manufacturerId", description="The manufacturer ID of the serialized part twin to unshare.")
     asset_id_names_filter: Optional[List[str]] = Field(alias="assetIdNamesFilter", description="An optional list of asset ID names to filter the serialized part twin unshare operation. If provided, only asset IDs with names in this list will be considered for unsharing.", default=None)
+
+class SerializedPartTwinBatchCreate(BaseModel):
+    """Selects the serialized parts to create and register twins for, by filter and/or explicit list."""
+
+    manufacturer_id: Optional[str] = Field(alias="manufacturerId", description="Only select the serialized parts of this manufacturer.", default=None)
+    manufacturer_part_id: Optional[str] = Field(alias="manufacturerPartId", description="Only select the serialized parts of this manufacturer part ID.", default=None)
+    business_partner_number: Optional[str] = Field(alias="businessPartnerNumber", description="Only select the serialized parts of this business partner.", default=None)
+    customer_part_id: Optional[str] = Field(alias="customerPartId", description="Only select the serialized parts of this customer part ID.", default=None)
+    without_twin: bool = Field(alias="withoutTwin", description="Only select the serialized parts which do not have a twin yet. Otherwise the twins of the selected parts not yet registered in the DTR are registered as well.", default=True)
+    parts: Optional[List[SerializedPartBase]] = Field(description="Optionally the explicit list of serialized parts to select, combined with the filters.", default=None)
+
+class SerializedPartTwinShareBatchCreate(BaseModel):
+    """Selects the serialized part twins to share with or unshare from several business partners at once."""
+
+    parts: List[SerializedPartBase] = Field(description="The serialized parts whose twins are shared or unshared.", min_length=1)
+    business_partner_numbers: List[str] = Field(alias="businessPartnerNumbers", description="The business partner numbers of the business partners to share the twins with or unshare them from.", min_length=1)
+    asset_id_names_filter: Optional[List[str]] = Field(alias="assetIdNamesFilter", description="An optional list of asset ID names. If provided, only the asset IDs with names in this list are shared or unshared.", default=None)
+
+class BatchJobError(BaseModel):
+    key: str = Field(description="The key of the item which failed.")
+    error: str = Field(description="The reason why the item failed.")
+
+class BatchJobRead(BaseModel):
+    """Represents the progress of a batch job running in the background."""
+
+    job_id: UUID = Field(alias="jobId", description="The ID of the job, used to poll its progress.")
+    operation: str = Field(description="The operation the job performs.")
+    status: BatchJobStatus = Field(description="The state of the job.")
+    total: int = Field(description="The number of items selected for the job so far.")
+    processed: int = Field(description="The number of items processed so far.")
+    succeeded: int = Field(description="The number of items processed successfully.")
+    skipped: int = Field(description="The number of items which did not need any change.")
+    failed: int = Field(description="The number of items which failed.")
+    errors: List[BatchJobError] = Field(description="The failed items with their error, limited to the first 1000.", default=[])
+    error: Optional[str] = Field(description="The reason why the whole job failed.", default=None)
+    created_date: datetime = Field(alias="createdDate", description="The date when the job was submitted.")
+    started_date: Optional[datetime] = Field(alias="startedDate", description="The date when the job started.", default=None)
+    finished_date: Optional[datetime] = Field(alias="finishedDate", description="The date when the job finished.", default=None)
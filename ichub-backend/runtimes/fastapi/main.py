@@ -27,10 +27,6 @@ from managers.config.config_manager import ConfigManager
 from connector import connector_start_up_error
 from dtr import dtr_start_up_error
 
-# Set up asyncio default thread pool for blocking operations
-import asyncio
-import concurrent.futures
-
 app = api
 
 
@@ -71,17 +67,14 @@ def start():
         logger.info(f"[UVICORN] Thread pool size: {worker_threads}")
         logger.info(f"[UVICORN] Timeouts: keep_alive={timeout_keep_alive}s, graceful_shutdown={timeout_graceful_shutdown}s")
         
-        # Configure asyncio's default thread pool executor globally
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        executor = concurrent.futures.ThreadPoolExecutor(max_workers=worker_threads)
-        loop.set_default_executor(executor)
-        
-        logger.info(f"[ASYNCIO] Configured default thread pool with {worker_threads} threads - blocking calls handled automatically!")
+        # The thread pools are created in the application lifespan, on the event loop run by uvicorn
+        for pool_name, pool_size in workers_config.get("pools", {}).items():
+            logger.info(f"[UVICORN] Thread pool [{pool_name}] size: {pool_size}")
         
         # Uvicorn configuration with server settings
         uvicorn_config = {
-            "app": app,
+            # Worker processes import the application themselves, which requires the import string
+            "app": app if max_workers <= 1 else "controllers.fastapi:app",
             "host": args.host,
             "port": args.port,
             "log_level": ("debug" if args.debug else "info"),
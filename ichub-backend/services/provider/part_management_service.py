@@ -22,15 +22,28 @@
 # SPDX-License-Identifier: Apache-2.0
 #################################################################################
 
-from typing import List, Optional, Tuple
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from pydantic import ValidationError as PydanticValidationError
 from models.services.provider.part_management import (
     BatchCreate,
     BatchRead,
+    CatalogPartBatchError,
+    CatalogPartBatchRead,
     CatalogPartCreate,
     CatalogPartUpdate,
     CatalogPartDetailsRead,
     CatalogPartReadWithStatus,
     CatalogPartDetailsReadWithStatus,
+    CatalogPartField,
+    CatalogPartListRead,
+    CatalogPartListQuery,
+    ImportRowStatus,
+    PartSearchField,
+    PartSearchHighlight,
+    PartSearchResult,
+    PartSearchResultType,
     JISPartCreate,
     JISPartDelete,
     JISPartRead,
@@ -39,22 +52,53 @@ from models.services.provider.part_management import (
     PartnerCatalogPartDelete,
     PartnerCatalogPartRead,
     SerializedPartCreate,
+    SerializedPartImportRead,
+    SerializedPartImportResult,
     SerializedPartUpdate,
     SerializedPartDetailsReadWithStatus,
     SerializedPartQuery,
     SerializedPartRead,
     SerializedPartReadWithStatus,
     SharingStatus,
+    UpsertSummary,
 )
 
 from models.services.provider.partner_management import BusinessPartnerRead
 from managers.metadata_database.manager import RepositoryManagerFactory, RepositoryManager
-from models.metadata_database.provider.models import CatalogPart, SerializedPart, PartnerCatalogPart, LegalEntity
+from managers.metadata_database.async_manager import AsyncRepositoryManagerFactory
+from models.metadata_database.provider.models import BusinessPartner, CatalogPart, SerializedPart, PartnerCatalogPart, LegalEntity
 from managers.config.log_manager import LoggingManager
 from tools.exceptions import InvalidError, NotFoundError, AlreadyExistsError
+from tools.constants import DEFAULT_PAGE_SIZE, DEFAULT_SEARCH_PAGE_SIZE, IMPORT_CHUNK_SIZE, MIN_SEARCH_LENGTH
+from tools.import_tools import parse_records
+from tools.pagination_tools import decode_cursor, split_page
+from tools.search_tools import highlight
 
 logger = LoggingManager.get_logger(__name__)
 
+# The columns of a catalog part which are written by the batch upsert, besides its unique key
+_CATALOG_PART_UPSERT_COLUMNS = ("name", "description", "category", "bpns", "materials", "width", "height", "length", "weight")
+
+# The fields of the repository columns searched by the part search
+_PART_SEARCH_FIELDS: Dict[str, PartSearchField] = {
+    "name": PartSearchField.NAME,
+    "description": PartSearchField.DESCRIPTION,
+    "manufacturer_part_id": PartSearchField.MANUFACTURER_PART_ID,
+    "customer_part_id": PartSearchField.CUSTOMER_PART_ID,
+    "part_instance_id": PartSearchField.PART_INSTANCE_ID,
+    "van": PartSearchField.VAN,
+}
+
+# The repository columns of the fields of the catalog part listing
+_CATALOG_PART_LISTING_COLUMNS: Dict[CatalogPartField, str] = {
+    CatalogPartField.MANUFACTURER_ID: "manufacturer_id",
+    CatalogPartField.MANUFACTURER_PART_ID: "manufacturer_part_id",
+    CatalogPartField.NAME: "name",
+    CatalogPartField.CATEGORY: "category",
+    CatalogPartField.BPNS: "bpns",
+    CatalogPartField.STATUS: "status",
+}
+
 class PartManagementService():
     """
     Service class for managing parts and their relationships in the system.
@@ -153,6 +197,155 @@ class PartManagementService():
         if total_share > 100:
             raise InvalidError(f"The share of materials ({total_share}%) is invalid. It must be between 0% and 100%.")
 
+    def upsert_catalog_parts(self, catalog_parts: List[CatalogPartCreate]) -> CatalogPartBatchRead:
+        """
+        Create or update many catalog parts, including their materials, dimensions and customer part IDs.
+
+        The catalog parts and their partner catalog parts are written with INSERT ... ON CONFLICT DO UPDATE
+        statements on their unique keys, with one transaction per chunk. Missing legal entities are created
+        like in create_catalog_part, customer part IDs of business partners not given are kept. Only the
+        changed rows are written, the result counts the created, updated and unchanged entries.
+        """
+        catalog_part_summary = UpsertSummary()
+        partner_catalog_part_summary = UpsertSummary()
+        errors: List[CatalogPartBatchError] = []
+
+        with RepositoryManagerFactory.create() as repos:
+            for start in range(0, len(catalog_parts), IMPORT_CHUNK_SIZE):
+                chunk = list(enumerate(catalog_parts[start:start + IMPORT_CHUNK_SIZE], start=start))
+                try:
+                    chunk_catalog_parts, chunk_partner_catalog_parts, chunk_errors = self._upsert_catalog_part_chunk(repos, chunk)
+                    repos.commit()
+                except Exception as e:
+                    repos.rollback()
+                    logger.error(f"Failed to upsert the catalog parts {chunk[0][0]} to {chunk[-1][0]}: {e}")
+                    errors.extend(self._batch_error(index, part, f"The chunk of the catalog part could not be stored: {e}") for index, part in chunk)
+                    continue
+                errors.extend(chunk_errors)
+                for summary, chunk_summary in ((catalog_part_summary, chunk_catalog_parts), (partner_catalog_part_summary, chunk_partner_catalog_parts)):
+                    summary.created += chunk_summary.created
+                    summary.updated += chunk_summary.updated
+                    summary.unchanged += chunk_summary.unchanged
+
+        errors.sort(key=lambda error: error.index)
+        return CatalogPartBatchRead(
+            catalogParts=catalog_part_summary,
+            partnerCatalogParts=partner_catalog_part_summary,
+            failed=len(errors),
+            errors=errors
+        )
+
+    def _upsert_catalog_part_chunk(
+        self,
+        repos: RepositoryManager,
+        chunk: List[Tuple[int, CatalogPartCreate]]
+    ) -> Tuple[UpsertSummary, UpsertSummary, List[CatalogPartBatchError]]:
+        """
+        Upsert one chunk of catalog parts with one query per kind of lookup and write.
+        """
+        catalog_part_summary = UpsertSummary()
+        partner_catalog_part_summary = UpsertSummary()
+        errors: List[CatalogPartBatchError] = []
+
+        # Step 1: Validate the catalog parts and resolve the business partners of their customer part IDs
+        business_partners: Dict[str, BusinessPartner] = {
+            db_business_partner.bpnl: db_business_partner
+            for db_business_partner in repos.business_partner_repository.find_by_bpnls(list({
+                business_partner.bpnl for _, part in chunk for business_partner in (part.customer_part_ids or {}).values()
+            }))
+        }
+        pending: List[Tuple[int, CatalogPartCreate]] = []
+        seen = set()
+        for index, part in chunk:
+            bpnls = [business_partner.bpnl for business_partner in (part.customer_part_ids or {}).values()]
+            try:
+                if (part.manufacturer_id, part.manufacturer_part_id) in seen:
+                    raise InvalidError("The catalog part is listed several times in the batch.")
+                if part.materials:
+                    self._manage_share_error(part)
+                for bpnl in bpnls:
+                    if bpnl not in business_partners:
+                        raise NotFoundError(f"Business partner '{bpnl}' does not exist. Please create it first.")
+                if len(set(bpnls)) != len(bpnls):
+                    raise InvalidError("Only one customer part ID can be mapped to each business partner.")
+            except (InvalidError, NotFoundError) as e:
+                errors.append(self._batch_error(index, part, str(e)))
+                continue
+            seen.add((part.manufacturer_id, part.manufacturer_part_id))
+            pending.append((index, part))
+
+        # Step 2: Legal entities of the whole chunk, creating the missing ones
+        legal_entities: Dict[str, LegalEntity] = {
+            db_legal_entity.bpnl: db_legal_entity
+            for db_legal_entity in repos.legal_entity_repository.find_by_bpnls(list({part.manufacturer_id for _, part in pending}))
+        }
+        missing_bpnls = sorted({part.manufacturer_id for _, part in pending} - legal_entities.keys())
+        if missing_bpnls:
+            logger.warning(f"Legal Entities with manufacturer BPNLs {missing_bpnls} not found. Creating them!")
+            for db_legal_entity in repos.legal_entity_repository.create_many([LegalEntity(bpnl=bpnl) for bpnl in missing_bpnls]):
+                legal_entities[db_legal_entity.bpnl] = db_legal_entity
+
+        # Step 3: Catalog parts, only writing the new and changed ones
+        def catalog_part_key(part: CatalogPartCreate) -> Tuple[int, str]:
+            return (legal_entities[part.manufacturer_id].id, part.manufacturer_part_id)
+
+        existing_catalog_parts: Dict[Tuple[int, str], CatalogPart] = {
+            (db_catalog_part.legal_entity_id, db_catalog_part.manufacturer_part_id): db_catalog_part
+            for db_catalog_part in repos.catalog_part_repository.find_by_legal_entity_id_manufacturer_part_ids(
+                [catalog_part_key(part) for _, part in pending]
+            )
+        }
+        catalog_part_ids: Dict[Tuple[int, str], int] = {key: db_catalog_part.id for key, db_catalog_part in existing_catalog_parts.items()}
+        catalog_part_rows = []
+        for _, part in pending:
+            key = catalog_part_key(part)
+            values = part.model_dump(mode="json", by_alias=False, include=set(_CATALOG_PART_UPSERT_COLUMNS))
+            values["materials"] = values["materials"] or []
+            db_catalog_part = existing_catalog_parts.get(key)
+            if db_catalog_part is None:
+                catalog_part_summary.created += 1
+            elif all(getattr(db_catalog_part, column) == values[column] for column in _CATALOG_PART_UPSERT_COLUMNS):
+                catalog_part_summary.unchanged += 1
+                continue
+            else:
+                catalog_part_summary.updated += 1
+            catalog_part_rows.append({"legal_entity_id": key[0], "manufacturer_part_id": key[1], **values})
+        for catalog_part_id, legal_entity_id, manufacturer_part_id in repos.catalog_part_repository.upsert_many(catalog_part_rows):
+            catalog_part_ids[(legal_entity_id, manufacturer_part_id)] = catalog_part_id
+
+        # Step 4: Partner catalog parts of the customer part IDs, only writing the new and changed ones
+        customer_part_ids: Dict[Tuple[int, int], str] = {
+            (catalog_part_ids[catalog_part_key(part)], business_partners[business_partner.bpnl].id): customer_part_id
+            for _, part in pending
+            for customer_part_id, business_partner in (part.customer_part_ids or {}).items()
+        }
+        existing_partner_catalog_parts: Dict[Tuple[int, int], PartnerCatalogPart] = {
+            (db_partner_catalog_part.catalog_part_id, db_partner_catalog_part.business_partner_id): db_partner_catalog_part
+            for db_partner_catalog_part in repos.partner_catalog_part_repository.find_by_catalog_part_id_business_partner_ids(list(customer_part_ids))
+        }
+        partner_catalog_part_rows = []
+        for (catalog_part_id, business_partner_id), customer_part_id in customer_part_ids.items():
+            db_partner_catalog_part = existing_partner_catalog_parts.get((catalog_part_id, business_partner_id))
+            if db_partner_catalog_part is None:
+                partner_catalog_part_summary.created += 1
+            elif db_partner_catalog_part.customer_part_id == customer_part_id:
+                partner_catalog_part_summary.unchanged += 1
+                continue
+            else:
+                partner_catalog_part_summary.updated += 1
+            partner_catalog_part_rows.append({
+                "catalog_part_id": catalog_part_id,
+                "business_partner_id": business_partner_id,
+                "customer_part_id": customer_part_id,
+            })
+        repos.partner_catalog_part_repository.upsert_many(partner_catalog_part_rows)
+
+        return catalog_part_summary, partner_catalog_part_summary, errors
+
+    @staticmethod
+    def _batch_error(index: int, part: CatalogPartCreate, error: str) -> CatalogPartBatchError:
+        return CatalogPartBatchError(index=index, manufacturerId=part.manufacturer_id, manufacturerPartId=part.manufacturer_part_id, error=error)
+
     def create_catalog_part_by_ids(self,
         manufacturer_id: str,
         manufacturer_part_id: str,
@@ -287,28 +480,142 @@ class PartManagementService():
             logger.info(f"Successfully updated catalog part '{manufacturer_id}/{manufacturer_part_id}'")
             return result
 
-    def get_catalog_parts(self, manufacturer_id: Optional[str] = None, manufacturer_part_id: Optional[str] = None) -> List[CatalogPartReadWithStatus]:
-        with RepositoryManagerFactory.create() as repos:
-            result = []
-            
+    def get_catalog_parts(self, manufacturer_id: Optional[str] = None, manufacturer_part_id: Optional[str] = None, status: Optional[SharingStatus] = None) -> List[CatalogPartReadWithStatus]:
+        with RepositoryManagerFactory.create_read_only() as repos:
             db_catalog_parts: List[tuple[CatalogPart, int]] = repos.catalog_part_repository.find_by_manufacturer_id_manufacturer_part_id(
-                manufacturer_id, manufacturer_part_id, join_partner_catalog_parts=True
+                manufacturer_id, manufacturer_part_id, join_partner_catalog_parts=True, status=status
             )
-            
-            if db_catalog_parts:
-                for db_catalog_part, status in db_catalog_parts:
-                    result.append(
-                        CatalogPartReadWithStatus(
-                            manufacturerId=db_catalog_part.legal_entity.bpnl,
-                            manufacturerPartId=db_catalog_part.manufacturer_part_id,
-                            name=db_catalog_part.name,
-                            category=db_catalog_part.category,
-                            bpns=db_catalog_part.bpns,
-                            status=status
-                        )
-                    )
-            
-            return result
+            return [PartManagementService._catalog_part_read_with_status(db_catalog_part, part_status) for db_catalog_part, part_status in db_catalog_parts]
+
+    async def get_catalog_part_list_async(self, query: CatalogPartListQuery = CatalogPartListQuery(), fields: Optional[List[str]] = None, sort: Optional[List[str]] = None) -> List[CatalogPartListRead]:
+        """
+        Retrieve the catalog parts filtered by the query, with only the given fields, sorted by the given keys.
+
+        The fields and the sort keys are names of CatalogPartField, a sort key starting with '-' sorts in
+        descending order. Each entry may hold several names separated by commas. All fields are returned
+        by default. Only the columns of the returned fields are read from the database.
+        """
+        selected, sort_columns = PartManagementService._catalog_part_listing_columns(fields, sort)
+        async with AsyncRepositoryManagerFactory.create_read_only() as repos:
+            rows = await repos.catalog_part_repository.find_listing(
+                [column for _, column in selected], query.manufacturer_id, query.manufacturer_part_id,
+                query.category, query.status, query.prefix, sort_columns
+            )
+            return [PartManagementService._catalog_part_list_read(row, selected) for row in rows]
+
+    @staticmethod
+    def _catalog_part_field(name: str) -> CatalogPartField:
+        try:
+            return CatalogPartField(name)
+        except ValueError:
+            raise InvalidError(f"Unknown catalog part field '{name}', expected one of: {', '.join(field.value for field in CatalogPartField)}.")
+
+    @staticmethod
+    def _catalog_part_listing_columns(fields: Optional[List[str]], sort: Optional[List[str]]) -> Tuple[List[Tuple[CatalogPartField, str]], List[Tuple[str, bool]]]:
+        """
+        Resolve the requested fields and sort keys to the repository columns of the catalog part listing.
+
+        Returns the selected (field, column) pairs, in the order of CatalogPartField, and the (column, descending) sort pairs.
+        """
+        names = [name.strip() for entry in fields or [] for name in entry.split(",") if name.strip()]
+        requested = {PartManagementService._catalog_part_field(name) for name in names}
+        selected = [(field, column) for field, column in _CATALOG_PART_LISTING_COLUMNS.items() if not requested or field in requested]
+
+        sort_columns = []
+        for key in (key.strip() for entry in sort or [] for key in entry.split(",") if key.strip()):
+            descending = key.startswith("-")
+            field = PartManagementService._catalog_part_field(key[1:] if descending else key)
+            sort_columns.append((_CATALOG_PART_LISTING_COLUMNS[field], descending))
+        return selected, sort_columns
+
+    @staticmethod
+    def _catalog_part_list_read(row: Dict, selected: List[Tuple[CatalogPartField, str]]) -> CatalogPartListRead:
+        return CatalogPartListRead(**{field.value: row[column] for field, column in selected})
+
+    def search_parts(self, text: str, limit: int = DEFAULT_SEARCH_PAGE_SIZE, offset: int = 0, part_type: Optional[PartSearchResultType] = None) -> List[PartSearchResult]:
+        """
+        Search the catalog parts and serialized parts by their names, descriptions and part IDs, ranked by relevance.
+
+        The values starting with the searched text rank first. Only when they do not fill the page, the values
+        containing the text or resembling it are searched too. Each part is returned once, for its best match,
+        with the ranges of the matched value to highlight. The results are paged with limit and offset.
+        """
+        text = text.strip() if text else ""
+        if len(text) < MIN_SEARCH_LENGTH:
+            raise InvalidError(f"The searched text must have at least {MIN_SEARCH_LENGTH} characters.")
+
+        with RepositoryManagerFactory.create_read_only() as repos:
+            # Every column returns its best matches up to the end of the page, the page is taken from all of them
+            best: Dict[Tuple[PartSearchResultType, int], tuple] = {}
+            for fuzzy in (False, True):
+                if fuzzy and len(best) >= offset + limit:
+                    break
+                for match in PartManagementService._search_part_matches(repos, text, offset + limit, part_type, fuzzy):
+                    key = match[:2]
+                    if key not in best or match[4] > best[key][4]:
+                        best[key] = match
+            page = sorted(best.values(), key=lambda match: (-match[4], match[3].lower(), match[0].value, match[1]))[offset:offset + limit]
+
+            catalog_parts = {
+                db_catalog_part.id: db_catalog_part for db_catalog_part in repos.catalog_part_repository.find_by_ids(
+                    [id for result_type, id, *_ in page if result_type == PartSearchResultType.CATALOG_PART])
+            }
+            serialized_parts = {
+                db_serialized_part.id: db_serialized_part for db_serialized_part in repos.serialized_part_repository.find_by_ids(
+                    [id for result_type, id, *_ in page if result_type == PartSearchResultType.SERIALIZED_PART])
+            }
+
+            results = []
+            for result_type, id, column, value, score in page:
+                if result_type == PartSearchResultType.CATALOG_PART:
+                    db_catalog_part = catalog_parts[id]
+                    twin = db_catalog_part.twin
+                    part_values = {"customerPartId": value if column == "customer_part_id" else None}
+                else:
+                    db_serialized_part = serialized_parts[id]
+                    db_catalog_part = db_serialized_part.partner_catalog_part.catalog_part
+                    twin = db_serialized_part.twin
+                    part_values = {
+                        "customerPartId": db_serialized_part.partner_catalog_part.customer_part_id,
+                        "partInstanceId": db_serialized_part.part_instance_id,
+                        "van": db_serialized_part.van,
+                    }
+                results.append(PartSearchResult(
+                    type=result_type,
+                    manufacturerId=db_catalog_part.legal_entity.bpnl,
+                    manufacturerPartId=db_catalog_part.manufacturer_part_id,
+                    name=db_catalog_part.name,
+                    category=db_catalog_part.category,
+                    bpns=db_catalog_part.bpns,
+                    globalId=twin.global_id if twin else None,
+                    matchedField=_PART_SEARCH_FIELDS[column],
+                    matchedValue=value,
+                    highlights=[PartSearchHighlight(start=start, end=end) for start, end in highlight(value, text)],
+                    score=score,
+                    **part_values
+                ))
+            return results
+
+    @staticmethod
+    def _search_part_matches(repos: RepositoryManager, text: str, limit: int, part_type: Optional[PartSearchResultType], fuzzy: bool) -> List[tuple]:
+        """Return the (type, ID, column, value, score) matches of the searched parts."""
+        matches = []
+        if part_type in (None, PartSearchResultType.CATALOG_PART):
+            matches += [(PartSearchResultType.CATALOG_PART, *match) for match in repos.catalog_part_repository.search(text, limit, fuzzy=fuzzy)]
+        if part_type in (None, PartSearchResultType.SERIALIZED_PART):
+            matches += [(PartSearchResultType.SERIALIZED_PART, *match) for match in repos.serialized_part_repository.search(text, limit, fuzzy=fuzzy)]
+        return matches
+
+    @staticmethod
+    def _catalog_part_read_with_status(db_catalog_part: CatalogPart, status: int) -> CatalogPartReadWithStatus:
+        return CatalogPartReadWithStatus(
+            manufacturerId=db_catalog_part.legal_entity.bpnl,
+            manufacturerPartId=db_catalog_part.manufacturer_part_id,
+            name=db_catalog_part.name,
+            category=db_catalog_part.category,
+            bpns=db_catalog_part.bpns,
+            status=status
+        )
 
     def get_catalog_part_details(self, manufacturer_id: str, manufacturer_part_id: str) -> Optional[CatalogPartDetailsReadWithStatus]:
         """
@@ -444,6 +751,184 @@ class PartManagementService():
                 bpns=db_catalog_part.bpns,
             )
 
+    def import_serialized_parts(
+        self,
+        content: bytes,
+        content_type: Optional[str],
+        auto_generate_catalog_part: bool = False,
+        auto_generate_partner_part: bool = False
+    ) -> SerializedPartImportRead:
+        """
+        Import many serialized parts from a JSON array, NDJSON or CSV document.
+
+        The rows follow the rules of create_serialized_part, but the business partners, legal entities,
+        catalog parts, partner catalog parts and existing serialized parts are looked up for a whole chunk
+        of rows at once and the new serialized parts are inserted with multi-row INSERTs. Each chunk is
+        committed on its own; a failing row does not prevent the import of the others.
+        """
+        results: List[SerializedPartImportResult] = []
+        rows: List[Tuple[int, SerializedPartCreate]] = []
+        for row_number, (record, error) in enumerate(parse_records(content, content_type), start=1):
+            if record is not None:
+                try:
+                    rows.append((row_number, SerializedPartCreate.model_validate(record)))
+                    continue
+                except PydanticValidationError as e:
+                    error = "; ".join(f"{'.'.join(str(loc) for loc in err['loc'])}: {err['msg']}" for err in e.errors())
+            results.append(self._import_result(row_number, ImportRowStatus.FAILED, record.get("partInstanceId") if record else None, error))
+
+        with RepositoryManagerFactory.create() as repos:
+            for start in range(0, len(rows), IMPORT_CHUNK_SIZE):
+                chunk = rows[start:start + IMPORT_CHUNK_SIZE]
+                try:
+                    results.extend(self._import_serialized_part_chunk(repos, chunk, auto_generate_catalog_part, auto_generate_partner_part))
+                    repos.commit()
+                except Exception as e:
+                    repos.rollback()
+                    logger.error(f"Failed to import serialized parts of rows {chunk[0][0]} to {chunk[-1][0]}: {e}")
+                    results.extend(
+                        self._import_result(row_number, ImportRowStatus.FAILED, part.part_instance_id, f"The chunk of the row could not be stored: {e}")
+                        for row_number, part in chunk
+                    )
+
+        results.sort(key=lambda result: result.row)
+        counts = {status: 0 for status in ImportRowStatus}
+        for result in results:
+            counts[result.status] += 1
+        return SerializedPartImportRead(
+            created=counts[ImportRowStatus.CREATED],
+            existing=counts[ImportRowStatus.EXISTING],
+            failed=counts[ImportRowStatus.FAILED],
+            results=results
+        )
+
+    def _import_serialized_part_chunk(
+        self,
+        repos: RepositoryManager,
+        chunk: List[Tuple[int, SerializedPartCreate]],
+        auto_generate_catalog_part: bool,
+        auto_generate_partner_part: bool
+    ) -> List[SerializedPartImportResult]:
+        """
+        Import one chunk of serialized parts with one query per kind of lookup.
+        """
+        results: List[SerializedPartImportResult] = []
+        pending: List[Tuple[int, SerializedPartCreate]] = list(chunk)
+
+        def fail(row_number: int, part: SerializedPartCreate, error: str):
+            results.append(self._import_result(row_number, ImportRowStatus.FAILED, part.part_instance_id, error))
+
+        # Step 1: Business partners and legal entities of the whole chunk
+        business_partners: Dict[str, BusinessPartner] = {
+            db_business_partner.bpnl: db_business_partner
+            for db_business_partner in repos.business_partner_repository.find_by_bpnls(list({part.business_partner_number for _, part in pending}))
+        }
+        legal_entities: Dict[str, LegalEntity] = {
+            db_legal_entity.bpnl: db_legal_entity
+            for db_legal_entity in repos.legal_entity_repository.find_by_bpnls(list({part.manufacturer_id for _, part in pending}))
+        }
+        remaining = []
+        for row_number, part in pending:
+            if part.business_partner_number not in business_partners:
+                fail(row_number, part, f"Business partner with BPNL '{part.business_partner_number}' does not exist. Please create it first.")
+            elif part.manufacturer_id not in legal_entities:
+                fail(row_number, part, f"Legal Entity with manufacturer BPNL '{part.manufacturer_id}' does not exist. Please create it first.")
+            else:
+                remaining.append((row_number, part))
+        pending = remaining
+
+        # Step 2: Catalog parts, generating the missing ones if requested
+        def catalog_part_key(part: SerializedPartCreate) -> Tuple[int, str]:
+            return (legal_entities[part.manufacturer_id].id, part.manufacturer_part_id)
+
+        catalog_parts: Dict[Tuple[int, str], CatalogPart] = {
+            (db_catalog_part.legal_entity_id, db_catalog_part.manufacturer_part_id): db_catalog_part
+            for db_catalog_part in repos.catalog_part_repository.find_by_legal_entity_id_manufacturer_part_ids(list({catalog_part_key(part) for _, part in pending}))
+        }
+        if auto_generate_catalog_part:
+            new_catalog_parts: Dict[Tuple[int, str], CatalogPart] = {}
+            for _, part in pending:
+                key = catalog_part_key(part)
+                if key not in catalog_parts and key not in new_catalog_parts:
+                    new_catalog_parts[key] = CatalogPart(
+                        legal_entity_id=key[0],
+                        manufacturer_part_id=part.manufacturer_part_id,
+                        name=part.name if part.name else part.manufacturer_part_id,  # Default name to part ID if not provided
+                        category=part.category,
+                        bpns=part.bpns,
+                    )
+            repos.catalog_part_repository.create_many(list(new_catalog_parts.values()))
+            catalog_parts.update(new_catalog_parts)
+        remaining = []
+        for row_number, part in pending:
+            if catalog_part_key(part) not in catalog_parts:
+                fail(row_number, part, f"Catalog part {part.manufacturer_id}/{part.manufacturer_part_id} not found.")
+            else:
+                remaining.append((row_number, part))
+        pending = remaining
+
+        # Step 3: Partner catalog parts, generating the missing ones if requested
+        def partner_catalog_part_key(part: SerializedPartCreate) -> Tuple[int, int]:
+            return (catalog_parts[catalog_part_key(part)].id, business_partners[part.business_partner_number].id)
+
+        partner_catalog_parts: Dict[Tuple[int, int], PartnerCatalogPart] = {
+            (db_partner_catalog_part.catalog_part_id, db_partner_catalog_part.business_partner_id): db_partner_catalog_part
+            for db_partner_catalog_part in repos.partner_catalog_part_repository.find_by_catalog_part_id_business_partner_ids(
+                list({partner_catalog_part_key(part) for _, part in pending})
+            )
+        }
+        if auto_generate_partner_part:
+            new_partner_catalog_parts: Dict[Tuple[int, int], PartnerCatalogPart] = {}
+            for _, part in pending:
+                key = partner_catalog_part_key(part)
+                if key not in partner_catalog_parts and key not in new_partner_catalog_parts:
+                    new_partner_catalog_parts[key] = PartnerCatalogPart(
+                        catalog_part_id=key[0],
+                        business_partner_id=key[1],
+                        customer_part_id=part.customer_part_id or f"{part.manufacturer_part_id}-{part.business_partner_number}"
+                    )
+            repos.partner_catalog_part_repository.create_many(list(new_partner_catalog_parts.values()))
+            partner_catalog_parts.update(new_partner_catalog_parts)
+        remaining = []
+        for row_number, part in pending:
+            db_partner_catalog_part = partner_catalog_parts.get(partner_catalog_part_key(part))
+            if not db_partner_catalog_part:
+                fail(row_number, part, "No shared partner catalog part found for the given catalog part and business partner.")
+            elif part.customer_part_id and db_partner_catalog_part.customer_part_id != part.customer_part_id:
+                fail(row_number, part, f"Customer part ID '{part.customer_part_id}' does not match existing partner catalog part with ID '{db_partner_catalog_part.customer_part_id}'.")
+            else:
+                remaining.append((row_number, part))
+        pending = remaining
+
+        # Step 4: Insert the serialized parts which do not exist yet, the first of duplicated rows wins
+        def serialized_part_key(part: SerializedPartCreate) -> Tuple[int, str]:
+            return (partner_catalog_parts[partner_catalog_part_key(part)].id, part.part_instance_id)
+
+        existing = set(repos.serialized_part_repository.find_by_partner_catalog_part_id_part_instance_ids(
+            list({serialized_part_key(part) for _, part in pending})
+        ))
+        created_date = datetime.utcnow()
+        new_rows = []
+        for row_number, part in pending:
+            key = serialized_part_key(part)
+            if key in existing:
+                results.append(self._import_result(row_number, ImportRowStatus.EXISTING, part.part_instance_id))
+                continue
+            existing.add(key)
+            new_rows.append({
+                "partner_catalog_part_id": key[0],
+                "part_instance_id": part.part_instance_id,
+                "van": part.van,
+                "created_date": created_date,
+            })
+            results.append(self._import_result(row_number, ImportRowStatus.CREATED, part.part_instance_id))
+        repos.serialized_part_repository.insert_many(new_rows)
+
+        return results
+
+    @staticmethod
+    def _import_result(row_number: int, status: ImportRowStatus, part_instance_id: Optional[str], error: Optional[str] = None) -> SerializedPartImportResult:
+        return SerializedPartImportResult(row=row_number, status=status, partInstanceId=part_instance_id, error=error)
 
     def delete_serialized_part(self, partner_catalog_part_id: int, part_instance_id: str) -> bool:
         """
@@ -540,36 +1025,80 @@ class PartManagementService():
         """
         Retrieves serialized parts from the system according to given parameters.
         """
-        with RepositoryManagerFactory.create() as repos:
+        serialized_parts, _ = self.get_serialized_parts_page(query, limit=None)
+        return serialized_parts
+
+    def get_serialized_parts_page(self, query: SerializedPartQuery = SerializedPartQuery(), limit: Optional[int] = DEFAULT_PAGE_SIZE, cursor: Optional[str] = None, status: Optional[SharingStatus] = None) -> Tuple[List[SerializedPartReadWithStatus], Optional[str]]:
+        """
+        Retrieves one page of serialized parts, from the newest to the oldest, optionally only those with the given status.
+
+        Returns the serialized parts and the cursor of the next page, None on the last page.
+        """
+        after = decode_cursor(cursor) if cursor else None
+        with RepositoryManagerFactory.create_read_only() as repos:
             db_serialized_parts: List[tuple[SerializedPart, int]] = repos.serialized_part_repository.find_with_status(
                 manufacturer_id=query.manufacturer_id,
                 manufacturer_part_id=query.manufacturer_part_id,
                 part_instance_id=query.part_instance_id,
                 business_partner_number=query.business_partner_number,
                 customer_part_id=query.customer_part_id,
-                van=query.van
+                van=query.van,
+                status=status,
+                # One more row tells whether there is a next page
+                limit=limit + 1 if limit is not None else None,
+                after=after
             )
+            return PartManagementService._serialized_parts_page(db_serialized_parts, limit)
 
-            result = []
-            for db_serialized_part, status in db_serialized_parts:
-                result.append(
-                    SerializedPartReadWithStatus(
-                        manufacturerId=db_serialized_part.partner_catalog_part.catalog_part.legal_entity.bpnl,
-                        manufacturerPartId=db_serialized_part.partner_catalog_part.catalog_part.manufacturer_part_id,
-                        name=db_serialized_part.partner_catalog_part.catalog_part.name,
-                        category=db_serialized_part.partner_catalog_part.catalog_part.category,
-                        bpns=db_serialized_part.partner_catalog_part.catalog_part.bpns,
-                        partInstanceId=db_serialized_part.part_instance_id,
-                        customerPartId=db_serialized_part.partner_catalog_part.customer_part_id,
-                        businessPartner=BusinessPartnerRead(
-                            name=db_serialized_part.partner_catalog_part.business_partner.name,
-                            bpnl=db_serialized_part.partner_catalog_part.business_partner.bpnl
-                        ),
-                        van=db_serialized_part.van,
-                        status=SharingStatus(status)
-                    )
+    async def get_serialized_parts_page_async(self, query: SerializedPartQuery = SerializedPartQuery(), limit: Optional[int] = DEFAULT_PAGE_SIZE, cursor: Optional[str] = None, status: Optional[SharingStatus] = None) -> Tuple[List[SerializedPartReadWithStatus], Optional[str]]:
+        """
+        Retrieves one page of serialized parts like get_serialized_parts_page, on the async engine.
+
+        Runs on the event loop while waiting for the database, instead of taking a database pool thread.
+        """
+        after = decode_cursor(cursor) if cursor else None
+        async with AsyncRepositoryManagerFactory.create_read_only() as repos:
+            db_serialized_parts: List[tuple[SerializedPart, int]] = await repos.serialized_part_repository.find_with_status(
+                manufacturer_id=query.manufacturer_id,
+                manufacturer_part_id=query.manufacturer_part_id,
+                part_instance_id=query.part_instance_id,
+                business_partner_number=query.business_partner_number,
+                customer_part_id=query.customer_part_id,
+                van=query.van,
+                status=status,
+                # One more row tells whether there is a next page
+                limit=limit + 1 if limit is not None else None,
+                after=after
+            )
+            return PartManagementService._serialized_parts_page(db_serialized_parts, limit)
+
+    @staticmethod
+    def _serialized_parts_page(db_serialized_parts: List[tuple[SerializedPart, int]], limit: Optional[int]) -> Tuple[List[SerializedPartReadWithStatus], Optional[str]]:
+        """Split the serialized parts read with one more row than the limit into the page and the cursor of the next one."""
+        db_serialized_parts, next_cursor = split_page(
+            db_serialized_parts, limit, lambda row: (row[0].created_date, row[0].id)
+        )
+
+        result = []
+        for db_serialized_part, status in db_serialized_parts:
+            result.append(
+                SerializedPartReadWithStatus(
+                    manufacturerId=db_serialized_part.partner_catalog_part.catalog_part.legal_entity.bpnl,
+                    manufacturerPartId=db_serialized_part.partner_catalog_part.catalog_part.manufacturer_part_id,
+                    name=db_serialized_part.partner_catalog_part.catalog_part.name,
+                    category=db_serialized_part.partner_catalog_part.catalog_part.category,
+                    bpns=db_serialized_part.partner_catalog_part.catalog_part.bpns,
+                    partInstanceId=db_serialized_part.part_instance_id,
+                    customerPartId=db_serialized_part.partner_catalog_part.customer_part_id,
+                    businessPartner=BusinessPartnerRead(
+                        name=db_serialized_part.partner_catalog_part.business_partner.name,
+                        bpnl=db_serialized_part.partner_catalog_part.business_partner.bpnl
+                    ),
+                    van=db_serialized_part.van,
+                    status=SharingStatus(status)
                 )
-            return result
+            )
+        return result, next_cursor
 
     def create_jis_part(self, jis_part_create: JISPartCreate) -> JISPartRead:
         """
@@ -208,6 +208,7 @@ class SharingService:
                 twin_id=db_twin.id,
                 data_exchange_agreement_id=db_data_exchange_agreement.id
             )
+            repo.twin_repository.refresh_status([db_twin.id])
             repo.commit()
 
     def _create_part_type_information_aspect_doc(self, global_id: UUID, manufacturer_part_id: str, name: str, bpns: Optional[str]):
@@ -23,7 +23,10 @@
 # SPDX-License-Identifier: Apache-2.0
 #################################################################################
 
-from typing import Optional, Dict, Any, List
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Optional, Dict, Any, Callable, List, Tuple
 from uuid import UUID, uuid4
 from datetime import datetime, timezone
 
@@ -33,8 +36,9 @@ from dtr import dtr_provider_manager
 from managers.submodels.submodel_document_generator import SubmodelDocumentGenerator, SEM_ID_PART_TYPE_INFORMATION_V1, SEM_ID_SERIAL_PART_V3
 from managers.config.config_manager import ConfigManager
 from managers.metadata_database.manager import RepositoryManagerFactory, RepositoryManager
+from managers.metadata_database.repositories import TwinLoadProfile
 from managers.enablement_services.submodel_service_manager import SubmodelServiceManager
-from models.services.provider.part_management import SerializedPartQuery
+from models.services.provider.part_management import SerializedPartQuery, SharingStatus
 from models.services.provider.partner_management import BusinessPartnerRead, DataExchangeAgreementRead
 from models.services.provider.twin_management import (
     CatalogPartTwinRead,
@@ -52,9 +56,17 @@ from models.services.provider.twin_management import (
     TwinAspectRegistrationStatus,
     TwinsAspectRegistrationMode,
     TwinDetailsReadBase,
+    SerializedPartTwinBatchCreate,
+    SerializedPartTwinShareBatchCreate,
+    SerializedPartTwinUnshareCreate,
+    BatchJobRead,
 )
-from models.metadata_database.provider.models import CatalogPart, EnablementServiceStack, Twin, BusinessPartner, TwinAspect, TwinAspectRegistration
-from tools.exceptions import NotFoundError, NotAvailableError
+from models.metadata_database.provider.models import CatalogPart, EnablementServiceStack, SerializedPart, Twin, TwinExchange, TwinRegistration, BusinessPartner, TwinAspect, TwinAspectRegistration
+from tools.exceptions import InvalidError, NotFoundError, NotAvailableError
+from tools.constants import DEFAULT_PAGE_SIZE, TWIN_BATCH_CHUNK_SIZE
+from utils.batch_jobs import BatchChunk, BatchJob, BatchJobs
+from utils.rate_limiter import RateLimiter
+from tools.pagination_tools import decode_cursor, split_page
 
 from managers.config.log_manager import LoggingManager
 
@@ -65,6 +77,15 @@ logger = LoggingManager.get_logger(__name__)
 CATALOG_DIGITAL_TWIN_TYPE = "PartType"
 INSTANCE_DIGITAL_TWIN_TYPE = "PartInstance"
 
+# Operations of the outbox messages, see TwinManagementService.outbox_handlers
+OUTBOX_REGISTER_TWIN = "register_twin"
+OUTBOX_REGISTER_TWIN_ASPECT = "register_twin_aspect"
+
+# Relationships read by _build_catalog_part_twin_details
+_CATALOG_PART_TWIN_DETAILS_LOAD = (
+    TwinLoadProfile.CATALOG_PART, TwinLoadProfile.SHARES, TwinLoadProfile.REGISTRATIONS, TwinLoadProfile.ASPECTS
+)
+
 class TwinManagementService:
     """
     Service class for managing twin-related operations (CRUD and Twin sharing).
@@ -141,6 +162,7 @@ class TwinManagementService:
                     twin_id=db_twin.id,
                     enablement_service_stack_id=db_enablement_service_stack.id
                 )
+                repo.twin_repository.refresh_status([db_twin.id])
                 repo.commit()
                 repo.refresh(db_twin_registration)
 
@@ -149,37 +171,15 @@ class TwinManagementService:
             # (if False => we need to register the twin in the DTR using the industry core SDK, then
             #  update the twin registration entity with the dtr_registered flag to True)
             
-            customer_part_ids = {partner_catalog_part.customer_part_id: partner_catalog_part.business_partner.bpnl 
-                                    for partner_catalog_part in db_catalog_part.partner_catalog_parts}
-
-            _id_short = None
-            if(create_input.id_short):
-                _id_short = create_input.id_short
-            elif db_catalog_part.name:
-                _id_short = db_catalog_part.name
-
-            # Normalize empty category to None for asset_type
-            asset_type_value = None
-            if db_catalog_part and getattr(db_catalog_part, 'category', None):
-                _cat = str(db_catalog_part.category).strip()
-                if _cat:
-                    asset_type_value = _cat
-
-            dtr_provider_manager.create_or_update_shell_descriptor(
-                global_id=db_twin.global_id,
-                aas_id=db_twin.aas_id,
-                asset_kind="Type",
-                display_name=db_catalog_part.name,
-                description=db_catalog_part.description,
-                id_short=_id_short,
-                manufacturer_id=create_input.manufacturer_id,
-                manufacturer_part_id=create_input.manufacturer_part_id,
-                customer_part_ids=customer_part_ids,
-                asset_type=asset_type_value,
-                digital_twin_type=CATALOG_DIGITAL_TWIN_TYPE
-            )
-
-            db_twin_registration.dtr_registered = True
+            if _outbox_enabled():
+                # The twin stays pending until the outbox worker registered it
+                self._enqueue_twin_registration(repo, db_twin_registration, id_short=create_input.id_short)
+            else:
+                dtr_provider_manager.create_or_update_shell_descriptor(
+                    **self._catalog_part_shell_descriptor(db_catalog_part, db_twin, id_short=create_input.id_short)
+                )
+                db_twin_registration.dtr_registered = True
+                repo.twin_repository.refresh_status([db_twin.id])
             repo.commit()
             
             ## Create part type information submodel when registering, if configured
@@ -212,11 +212,12 @@ class TwinManagementService:
         manufacturer_part_id: Optional[str] = None,
         include_data_exchange_agreements: bool = False) -> List[CatalogPartTwinRead]:
         
-        with RepositoryManagerFactory.create() as repo:
+        with RepositoryManagerFactory.create_read_only() as repo:
             db_twins = repo.twin_repository.find_catalog_part_twins(
                 manufacturer_id=manufacturer_id,
                 manufacturer_part_id=manufacturer_part_id,
-                include_data_exchange_agreements=include_data_exchange_agreements
+                include_data_exchange_agreements=include_data_exchange_agreements,
+                load=(TwinLoadProfile.CATALOG_PART, TwinLoadProfile.SHARES) if include_data_exchange_agreements else (TwinLoadProfile.CATALOG_PART,)
             )
             
             result = []
@@ -329,6 +330,7 @@ class TwinManagementService:
                     twin_id=db_twin.id,
                     enablement_service_stack_id=db_enablement_service_stack.id
                 )
+                repo.twin_repository.refresh_status([db_twin.id])
                 repo.commit()
 
             # Step 6: Check the dtr_registered flag on the twin registration entity
@@ -336,36 +338,15 @@ class TwinManagementService:
             # (if False => we need to register the twin in the DTR using the industry core SDK, then
             #  update the twin registration entity with the dtr_registered flag to True)
             
-            db_catalog_part = None
-            if db_serialized_part.partner_catalog_part.catalog_part:
-                db_catalog_part:CatalogPart = db_serialized_part.partner_catalog_part.catalog_part
-                
-            customer_part_ids = {db_serialized_part.partner_catalog_part.customer_part_id: db_serialized_part.partner_catalog_part.business_partner.bpnl}
-                                    
-            # Normalize empty category to None for asset_type
-            asset_type_value = None
-            if db_catalog_part and getattr(db_catalog_part, 'category', None):
-                _cat = str(db_catalog_part.category).strip()
-                if _cat:
-                    asset_type_value = _cat
-
-            dtr_provider_manager.create_or_update_shell_descriptor(
-                global_id=db_twin.global_id,
-                aas_id=db_twin.aas_id,
-                asset_kind="Instance",
-                display_name=db_catalog_part.name if db_catalog_part else None,
-                description=db_catalog_part.description if db_catalog_part else None,
-                id_short=db_catalog_part.name if db_catalog_part else None,
-                manufacturer_id=create_input.manufacturer_id,
-                manufacturer_part_id=create_input.manufacturer_part_id,
-                customer_part_ids=customer_part_ids,
-                asset_type=asset_type_value,
-                digital_twin_type=INSTANCE_DIGITAL_TWIN_TYPE,
-                van=db_serialized_part.van,
-                part_instance_id=create_input.part_instance_id
-            )
-
-            db_twin_registration.dtr_registered = True
+            if _outbox_enabled():
+                # The twin stays pending until the outbox worker registered it
+                self._enqueue_twin_registration(repo, db_twin_registration)
+            else:
+                dtr_provider_manager.create_or_update_shell_descriptor(**self._serialized_part_shell_descriptor(
+                    db_serialized_part, db_twin, create_input.manufacturer_id, create_input.manufacturer_part_id
+                ))
+                db_twin_registration.dtr_registered = True
+                repo.twin_repository.refresh_status([db_twin.id])
             repo.commit()
 
             ## Create serial part submodel when registering, if configured
@@ -397,12 +378,256 @@ class TwinManagementService:
                 modifiedDate=db_twin.modified_date
             )
 
+    @staticmethod
+    def _catalog_part_shell_descriptor(db_catalog_part: CatalogPart, db_twin: Twin, id_short: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Build the arguments of create_or_update_shell_descriptor for the twin of a catalog part.
+        """
+        customer_part_ids = {partner_catalog_part.customer_part_id: partner_catalog_part.business_partner.bpnl 
+                                for partner_catalog_part in db_catalog_part.partner_catalog_parts}
+
+        # Normalize empty category to None for asset_type
+        asset_type_value = None
+        if getattr(db_catalog_part, 'category', None):
+            _cat = str(db_catalog_part.category).strip()
+            if _cat:
+                asset_type_value = _cat
+
+        return dict(
+            global_id=db_twin.global_id,
+            aas_id=db_twin.aas_id,
+            asset_kind="Type",
+            display_name=db_catalog_part.name,
+            description=db_catalog_part.description,
+            id_short=id_short or db_catalog_part.name or None,
+            manufacturer_id=db_catalog_part.legal_entity.bpnl,
+            manufacturer_part_id=db_catalog_part.manufacturer_part_id,
+            customer_part_ids=customer_part_ids,
+            asset_type=asset_type_value,
+            digital_twin_type=CATALOG_DIGITAL_TWIN_TYPE
+        )
+
+    @staticmethod
+    def _serialized_part_shell_descriptor(db_serialized_part: SerializedPart, db_twin: Twin, manufacturer_id: str, manufacturer_part_id: str) -> Dict[str, Any]:
+        """
+        Build the arguments of create_or_update_shell_descriptor for the twin of a serialized part.
+        """
+        db_catalog_part = None
+        if db_serialized_part.partner_catalog_part.catalog_part:
+            db_catalog_part:CatalogPart = db_serialized_part.partner_catalog_part.catalog_part
+            
+        customer_part_ids = {db_serialized_part.partner_catalog_part.customer_part_id: db_serialized_part.partner_catalog_part.business_partner.bpnl}
+                                
+        # Normalize empty category to None for asset_type
+        asset_type_value = None
+        if db_catalog_part and getattr(db_catalog_part, 'category', None):
+            _cat = str(db_catalog_part.category).strip()
+            if _cat:
+                asset_type_value = _cat
+
+        return dict(
+            global_id=db_twin.global_id,
+            aas_id=db_twin.aas_id,
+            asset_kind="Instance",
+            display_name=db_catalog_part.name if db_catalog_part else None,
+            description=db_catalog_part.description if db_catalog_part else None,
+            id_short=db_catalog_part.name if db_catalog_part else None,
+            manufacturer_id=manufacturer_id,
+            manufacturer_part_id=manufacturer_part_id,
+            customer_part_ids=customer_part_ids,
+            asset_type=asset_type_value,
+            digital_twin_type=INSTANCE_DIGITAL_TWIN_TYPE,
+            van=db_serialized_part.van,
+            part_instance_id=db_serialized_part.part_instance_id
+        )
+
+    def create_serialized_part_twins_batch(self, batch_create: SerializedPartTwinBatchCreate) -> BatchJobRead:
+        """
+        Create and register the twins of many serialized parts in a background job.
+
+        The serialized parts are selected by the filters and/or the explicit list of the input. The job
+        creates the missing Twin and TwinRegistration rows with one INSERT per chunk of parts, registers
+        the shell descriptors in the DTR concurrently under the configured rate limit and marks the
+        registered twins with one UPDATE per chunk. The progress is polled with get_batch_job.
+        """
+        if not any([batch_create.manufacturer_id, batch_create.manufacturer_part_id, batch_create.business_partner_number,
+                    batch_create.customer_part_id, batch_create.parts]):
+            raise InvalidError("A filter or a list of serialized parts is required.")
+
+        job = BatchJobs.submit(
+            BatchJob(operation="create-serialized-part-twins"),
+            lambda job: self._run_serialized_part_twin_batch(job, batch_create)
+        )
+        return BatchJobRead(**job.snapshot())
+
+    @staticmethod
+    def get_batch_job(job_id: UUID) -> BatchJobRead:
+        """
+        Retrieve the progress of a batch job started by this backend process.
+        """
+        job = BatchJobs.get(job_id)
+        if not job:
+            raise NotFoundError(f"Batch job '{job_id}' not found.")
+        return BatchJobRead(**job.snapshot())
+
+    @staticmethod
+    def _dtr_batch_config() -> Tuple[int, int, Callable[..., Any]]:
+        """
+        Read the batch settings of the DTR.
+
+        Returns the chunk size, the number of parallel DTR requests and a function calling the DTR under the
+        rate limit with retries, shared by all the workers of the job.
+        """
+        batch_config = ConfigManager.get_config("provider.digitalTwinRegistry.batch", default={}) or {}
+        call_dtr = partial(
+            _call_with_retries,
+            rate_limiter=RateLimiter(float(batch_config.get("max_requests_per_second", 100))),
+            max_retries=max(0, int(batch_config.get("max_retries", 3))),
+            retry_delay=float(batch_config.get("retry_delay", 1))
+        )
+        return (
+            max(1, int(batch_config.get("chunk_size", TWIN_BATCH_CHUNK_SIZE))),
+            max(1, int(batch_config.get("max_parallel_requests", 20))),
+            call_dtr
+        )
+
+    def _run_serialized_part_twin_batch(self, job: BatchJob, batch_create: SerializedPartTwinBatchCreate) -> None:
+        chunk_size, max_parallel_requests, call_dtr = self._dtr_batch_config()
+
+        with RepositoryManagerFactory.create() as repo:
+            serialized_part_keys = repo.serialized_part_repository.find_keys(
+                manufacturer_id=batch_create.manufacturer_id,
+                manufacturer_part_id=batch_create.manufacturer_part_id,
+                business_partner_number=batch_create.business_partner_number,
+                customer_part_id=batch_create.customer_part_id,
+                keys=[(part.manufacturer_id, part.manufacturer_part_id, part.part_instance_id) for part in batch_create.parts] if batch_create.parts else None,
+                without_twin=batch_create.without_twin
+            )
+        serialized_part_ids = list(serialized_part_keys)
+        job.add_total(len(serialized_part_ids))
+        logger.info(f"[Batch job {job.id}] Creating the twins of {len(serialized_part_ids)} serialized parts")
+
+        enablement_service_stack_ids: Dict[str, int] = {}
+        with ThreadPoolExecutor(max_workers=max_parallel_requests, thread_name_prefix="twin-batch") as executor:
+            for start in range(0, len(serialized_part_ids), chunk_size):
+                chunk = serialized_part_ids[start:start + chunk_size]
+                outcomes = BatchChunk(job, ["/".join(serialized_part_keys[serialized_part_id]) for serialized_part_id in chunk])
+                try:
+                    self._create_serialized_part_twin_chunk(outcomes, chunk, executor, call_dtr, enablement_service_stack_ids)
+                except Exception as e:
+                    logger.error(f"[Batch job {job.id}] Failed to create the twins of serialized parts {chunk[0]} to {chunk[-1]}: {e}")
+                    outcomes.report(f"The chunk of the serialized part could not be stored: {e}")
+                else:
+                    outcomes.report("Serialized part not found.")
+                logger.info(f"[Batch job {job.id}] Processed {min(start + chunk_size, len(serialized_part_ids))}/{len(serialized_part_ids)} serialized parts")
+
+    def _create_serialized_part_twin_chunk(
+        self,
+        outcomes: BatchChunk,
+        serialized_part_ids: List[int],
+        executor: ThreadPoolExecutor,
+        call_dtr: Callable[..., Any],
+        enablement_service_stack_ids: Dict[str, int]
+    ) -> None:
+        """
+        Create, register and mark the twins of one chunk of serialized parts.
+
+        The outcome of each part is collected in outcomes, the parts only succeed once their twins are marked.
+        enablement_service_stack_ids caches the stack of each manufacturer over the chunks of the job.
+        """
+        with RepositoryManagerFactory.create() as repo:
+            db_serialized_parts = repo.serialized_part_repository.find_by_ids(serialized_part_ids)
+
+            # Step 1: Resolve the enablement service stacks of the manufacturers not seen in the previous chunks
+            manufacturer_ids = {db_serialized_part.partner_catalog_part.catalog_part.legal_entity.bpnl for db_serialized_part in db_serialized_parts}
+            if not manufacturer_ids.issubset(enablement_service_stack_ids):
+                for manufacturer_id in sorted(manufacturer_ids - enablement_service_stack_ids.keys()):
+                    enablement_service_stack_ids[manufacturer_id] = self.get_or_create_enablement_stack(repo=repo, manufacturer_id=manufacturer_id).id
+                # Creating a stack commits, reload the expired parts in one query
+                db_serialized_parts = repo.serialized_part_repository.find_by_ids(serialized_part_ids)
+
+            # Step 2: Create the missing twins with one INSERT
+            db_twins: Dict[int, Twin] = {
+                db_serialized_part.id: db_serialized_part.twin or Twin() for db_serialized_part in db_serialized_parts
+            }
+            new_twins = [db_twin for db_twin in db_twins.values() if db_twin.id is None]
+            repo.twin_repository.insert_many(new_twins)
+            for db_serialized_part in db_serialized_parts:
+                db_serialized_part.twin_id = db_twins[db_serialized_part.id].id
+
+            # Step 3: Create the missing registrations with one INSERT, collecting the shell descriptors to register
+            registered_keys = {
+                (db_twin_registration.twin_id, db_twin_registration.enablement_service_stack_id): db_twin_registration.dtr_registered
+                for db_twin_registration in repo.twin_registration_repository.find_by_twin_ids([db_twin.id for db_twin in db_twins.values()])
+            }
+            new_twin_registrations: List[TwinRegistration] = []
+            pending: Dict[Tuple[int, int], Tuple[str, Dict[str, Any]]] = {}
+            for db_serialized_part in db_serialized_parts:
+                db_catalog_part = db_serialized_part.partner_catalog_part.catalog_part
+                db_twin = db_twins[db_serialized_part.id]
+                key = (db_twin.id, enablement_service_stack_ids[db_catalog_part.legal_entity.bpnl])
+                part_key = f"{db_catalog_part.legal_entity.bpnl}/{db_catalog_part.manufacturer_part_id}/{db_serialized_part.part_instance_id}"
+                if key not in registered_keys:
+                    new_twin_registrations.append(TwinRegistration(twin_id=key[0], enablement_service_stack_id=key[1]))
+                elif registered_keys[key]:
+                    outcomes.skip(part_key)
+                    continue
+                pending[key] = (
+                    part_key,
+                    self._serialized_part_shell_descriptor(
+                        db_serialized_part, db_twin, db_catalog_part.legal_entity.bpnl, db_catalog_part.manufacturer_part_id
+                    )
+                )
+            repo.twin_registration_repository.create_many(new_twin_registrations)
+            repo.twin_repository.refresh_status([registration.twin_id for registration in new_twin_registrations])
+            repo.commit()
+
+            # Step 4: Register the shell descriptors concurrently, the DTR calls do not use the session
+            futures = {
+                executor.submit(call_dtr, dtr_provider_manager.create_or_update_shell_descriptor, **shell_descriptor): (key, part_key)
+                for key, (part_key, shell_descriptor) in pending.items()
+            }
+            registered: Dict[Tuple[int, int], str] = {}
+            for future, (key, part_key) in futures.items():
+                try:
+                    future.result()
+                    registered[key] = part_key
+                except Exception as e:
+                    outcomes.fail(part_key, f"DTR registration failed: {e}")
+
+            # Step 5: Mark the registered twins with one UPDATE
+            repo.twin_registration_repository.set_dtr_registered(list(registered))
+            repo.twin_repository.refresh_status([twin_id for twin_id, _ in registered])
+            repo.commit()
+            for part_key in registered.values():
+                outcomes.succeed(part_key)
+
     def get_serialized_part_twins(self,
         serialized_part_query: SerializedPartQuery = SerializedPartQuery(),
         global_id: Optional[UUID] = None,
         include_data_exchange_agreements: bool = False) -> List[SerializedPartTwinRead]:
         
-        with RepositoryManagerFactory.create() as repo:
+        twins, _ = self.get_serialized_part_twins_page(
+            serialized_part_query=serialized_part_query,
+            global_id=global_id,
+            include_data_exchange_agreements=include_data_exchange_agreements,
+            limit=None
+        )
+        return twins
+
+    def get_serialized_part_twins_page(self,
+        serialized_part_query: SerializedPartQuery = SerializedPartQuery(),
+        global_id: Optional[UUID] = None,
+        include_data_exchange_agreements: bool = False,
+        limit: Optional[int] = DEFAULT_PAGE_SIZE,
+        cursor: Optional[str] = None) -> Tuple[List[SerializedPartTwinRead], Optional[str]]:
+        """
+        Retrieves one page of serialized part twins, from the newest to the oldest.
+
+        Returns the twins and the cursor of the next page, None on the last page.
+        """
+        after = decode_cursor(cursor) if cursor else None
+        with RepositoryManagerFactory.create_read_only() as repo:
             db_twins = repo.twin_repository.find_serialized_part_twins(
                 manufacturer_id=serialized_part_query.manufacturer_id,
                 manufacturer_part_id=serialized_part_query.manufacturer_part_id,
@@ -411,8 +636,13 @@ class TwinManagementService:
                 customer_part_id=serialized_part_query.customer_part_id,
                 business_partner_number=serialized_part_query.business_partner_number,
                 global_id=global_id,
-                include_data_exchange_agreements=include_data_exchange_agreements
+                include_data_exchange_agreements=include_data_exchange_agreements,
+                load=(TwinLoadProfile.SERIALIZED_PART, TwinLoadProfile.SHARES) if include_data_exchange_agreements else (TwinLoadProfile.SERIALIZED_PART,),
+                # One more row tells whether there is a next page
+                limit=limit + 1 if limit is not None else None,
+                after=after
             )
+            db_twins, next_cursor = split_page(db_twins, limit, lambda db_twin: (db_twin.created_date, db_twin.id))
             
             result = []
             for db_twin in db_twins:
@@ -421,16 +651,18 @@ class TwinManagementService:
                     self._fill_shares(db_twin, twin_result)
                 result.append(twin_result)
             
-            return result
+            return result, next_cursor
 
     def get_serialized_part_twin_details(self, global_id: UUID) -> Optional[SerializedPartTwinDetailsRead]:
         with RepositoryManagerFactory.create() as repo:
             db_twins = repo.twin_repository.find_serialized_part_twins(
                 global_id=global_id,
                 include_data_exchange_agreements=True,
-                include_aspects=True,
-                include_registrations=True,
-                include_all_partner_catalog_parts=True
+                include_all_partner_catalog_parts=True,
+                load=(
+                    TwinLoadProfile.SERIALIZED_PART, TwinLoadProfile.CUSTOMER_PARTS, TwinLoadProfile.SHARES,
+                    TwinLoadProfile.REGISTRATIONS, TwinLoadProfile.ASPECTS
+                )
             )
             if not db_twins:
                 return None
@@ -479,6 +711,201 @@ class TwinManagementService:
                 db_business_partner=db_business_partner
             )
 
+    def part_twin_unshare(self, unshare_input: SerializedPartTwinUnshareCreate) -> bool:
+        """
+        Unshare a twin from the given business partners, in the DTR and in the twin exchanges.
+
+        Returns False if the twin was not shared with any of them.
+        """
+        with RepositoryManagerFactory.create() as repo:
+            db_twin = repo.twin_repository.find_by_aas_id(unshare_input.aas_id)
+            if not db_twin:
+                raise NotFoundError("Twin not found.")
+
+            data_exchange_agreement_ids = self._get_data_exchange_agreement_ids(repo, unshare_input.business_partner_number_to_unshare, share=False)
+
+            # The twins not registered yet have no shell descriptor to update
+            changed = db_twin.status >= SharingStatus.REGISTERED and dtr_provider_manager.update_shell_descriptor_shares(
+                aas_id=db_twin.aas_id,
+                manufacturer_id=unshare_input.manufacturer_id,
+                unshare_with=unshare_input.business_partner_number_to_unshare,
+                asset_id_names=unshare_input.asset_id_names_filter
+            )
+
+            if repo.twin_exchange_repository.delete_many([db_twin.id], data_exchange_agreement_ids):
+                repo.twin_repository.refresh_status([db_twin.id])
+                changed = True
+            repo.commit()
+            return changed
+
+    def share_serialized_part_twins_batch(self, batch_share: SerializedPartTwinShareBatchCreate) -> BatchJobRead:
+        """
+        Share the twins of many serialized parts with several business partners in a background job.
+
+        The business partners are added to the externalSubjectId of the specific asset IDs of each shell
+        descriptor with one DTR update per twin, run concurrently under the configured rate limit and retried
+        on failure. The twin exchanges of the updated twins are then created with one INSERT per chunk.
+        The progress is polled with get_batch_job.
+        """
+        return self._submit_twin_share_batch(batch_share, share=True)
+
+    def unshare_serialized_part_twins_batch(self, batch_share: SerializedPartTwinShareBatchCreate) -> BatchJobRead:
+        """
+        Unshare the twins of many serialized parts from several business partners in a background job.
+
+        Works like share_serialized_part_twins_batch, removing the business partners from the shell
+        descriptors and deleting the twin exchanges of the updated twins with one DELETE per chunk.
+        """
+        return self._submit_twin_share_batch(batch_share, share=False)
+
+    def _submit_twin_share_batch(self, batch_share: SerializedPartTwinShareBatchCreate, share: bool) -> BatchJobRead:
+        # Check the business partners before accepting the job
+        with RepositoryManagerFactory.create() as repo:
+            data_exchange_agreement_ids = self._get_data_exchange_agreement_ids(repo, batch_share.business_partner_numbers, share=share)
+
+        job = BatchJobs.submit(
+            BatchJob(operation="share-serialized-part-twins" if share else "unshare-serialized-part-twins"),
+            lambda job: self._run_twin_share_batch(job, batch_share, data_exchange_agreement_ids, share)
+        )
+        return BatchJobRead(**job.snapshot())
+
+    @staticmethod
+    def _get_data_exchange_agreement_ids(repo: RepositoryManager, business_partner_numbers: List[str], share: bool) -> List[int]:
+        """
+        Resolve the data exchange agreements of the given business partners.
+
+        Twins are shared under the first agreement of each business partner, like in _create_twin_exchange,
+        and unshared from all of them.
+        """
+        db_business_partners = repo.business_partner_repository.find_by_bpnls(business_partner_numbers)
+        missing_business_partner_numbers = set(business_partner_numbers) - {db_business_partner.bpnl for db_business_partner in db_business_partners}
+        if missing_business_partner_numbers:
+            raise NotFoundError(f"Business partner with number '{sorted(missing_business_partner_numbers)[0]}' not found.")
+
+        data_exchange_agreement_ids: Dict[int, List[int]] = {}
+        for db_data_exchange_agreement in repo.data_exchange_agreement_repository.find_by_business_partner_ids(
+            [db_business_partner.id for db_business_partner in db_business_partners]
+        ):
+            data_exchange_agreement_ids.setdefault(db_data_exchange_agreement.business_partner_id, []).append(db_data_exchange_agreement.id)
+
+        if not share:
+            return [agreement_id for agreement_ids in data_exchange_agreement_ids.values() for agreement_id in agreement_ids]
+        for db_business_partner in db_business_partners:
+            if db_business_partner.id not in data_exchange_agreement_ids:
+                raise NotFoundError(f"No data exchange agreement found for business partner '{db_business_partner.bpnl}'.")
+        return [agreement_ids[0] for agreement_ids in data_exchange_agreement_ids.values()]
+
+    def _run_twin_share_batch(self, job: BatchJob, batch_share: SerializedPartTwinShareBatchCreate, data_exchange_agreement_ids: List[int], share: bool) -> None:
+        chunk_size, max_parallel_requests, call_dtr = self._dtr_batch_config()
+        part_keys = list(dict.fromkeys(
+            (part.manufacturer_id, part.manufacturer_part_id, part.part_instance_id) for part in batch_share.parts
+        ))
+
+        with RepositoryManagerFactory.create() as repo:
+            serialized_part_keys = repo.serialized_part_repository.find_keys(keys=part_keys)
+        serialized_part_ids = list(serialized_part_keys)
+        job.add_total(len(part_keys))
+        logger.info(f"[Batch job {job.id}] {'Sharing' if share else 'Unsharing'} the twins of {len(serialized_part_ids)} serialized parts")
+
+        found_part_keys = set(serialized_part_keys.values())
+        for part_key in part_keys:
+            if part_key not in found_part_keys:
+                job.fail("/".join(part_key), "Serialized part not found.")
+
+        with ThreadPoolExecutor(max_workers=max_parallel_requests, thread_name_prefix="twin-share-batch") as executor:
+            for start in range(0, len(serialized_part_ids), chunk_size):
+                chunk = serialized_part_ids[start:start + chunk_size]
+                outcomes = BatchChunk(job, ["/".join(serialized_part_keys[serialized_part_id]) for serialized_part_id in chunk])
+                try:
+                    self._share_serialized_part_twin_chunk(
+                        outcomes, chunk, executor, call_dtr, batch_share, data_exchange_agreement_ids, share
+                    )
+                except Exception as e:
+                    logger.error(f"[Batch job {job.id}] Failed to update the shares of serialized parts {chunk[0]} to {chunk[-1]}: {e}")
+                    outcomes.report(f"The chunk of the serialized part could not be stored: {e}")
+                else:
+                    outcomes.report("Serialized part not found.")
+                logger.info(f"[Batch job {job.id}] Processed {min(start + chunk_size, len(serialized_part_ids))}/{len(serialized_part_ids)} serialized parts")
+
+    def _share_serialized_part_twin_chunk(
+        self,
+        outcomes: BatchChunk,
+        serialized_part_ids: List[int],
+        executor: ThreadPoolExecutor,
+        call_dtr: Callable[..., Any],
+        batch_share: SerializedPartTwinShareBatchCreate,
+        data_exchange_agreement_ids: List[int],
+        share: bool
+    ) -> None:
+        """
+        Update the shell descriptors and the twin exchanges of one chunk of serialized parts.
+
+        The outcome of each part is collected in outcomes, the parts only succeed once the twin exchanges are stored.
+        """
+        with RepositoryManagerFactory.create() as repo:
+            db_serialized_parts = repo.serialized_part_repository.find_by_ids(serialized_part_ids)
+
+            # Step 1: Collect the shell descriptor updates of the twins registered in the DTR
+            pending: Dict[int, Tuple[str, Dict[str, Any]]] = {}
+            for db_serialized_part in db_serialized_parts:
+                db_catalog_part = db_serialized_part.partner_catalog_part.catalog_part
+                part_key = f"{db_catalog_part.legal_entity.bpnl}/{db_catalog_part.manufacturer_part_id}/{db_serialized_part.part_instance_id}"
+                db_twin = db_serialized_part.twin
+                if not db_twin:
+                    outcomes.fail(part_key, "Serialized part has not yet a twin associated.")
+                elif db_twin.status < SharingStatus.REGISTERED:
+                    outcomes.fail(part_key, "Serialized part twin is not yet registered in the DTR.")
+                else:
+                    pending[db_twin.id] = (part_key, dict(
+                        aas_id=db_twin.aas_id,
+                        manufacturer_id=db_catalog_part.legal_entity.bpnl,
+                        share_with=batch_share.business_partner_numbers if share else None,
+                        unshare_with=None if share else batch_share.business_partner_numbers,
+                        asset_id_names=batch_share.asset_id_names_filter
+                    ))
+            existing_exchanges = {
+                (db_twin_exchange.twin_id, db_twin_exchange.data_exchange_agreement_id)
+                for db_twin_exchange in repo.twin_exchange_repository.find_by_twin_ids(list(pending))
+            }
+
+            # Step 2: Update the shell descriptors concurrently, the DTR calls do not use the session
+            futures = {
+                executor.submit(call_dtr, dtr_provider_manager.update_shell_descriptor_shares, **shell_update): (twin_id, part_key)
+                for twin_id, (part_key, shell_update) in pending.items()
+            }
+            changed_twin_ids = set()
+            updated_twin_ids: List[int] = []
+            for future, (twin_id, part_key) in futures.items():
+                try:
+                    if future.result():
+                        changed_twin_ids.add(twin_id)
+                    updated_twin_ids.append(twin_id)
+                except Exception as e:
+                    outcomes.fail(part_key, f"DTR update failed: {e}")
+
+            # Step 3: Apply the twin exchanges of the updated twins with one statement
+            exchanges = {
+                (twin_id, data_exchange_agreement_id)
+                for twin_id in updated_twin_ids for data_exchange_agreement_id in data_exchange_agreement_ids
+            }
+            if share:
+                new_exchanges = exchanges - existing_exchanges
+                repo.twin_exchange_repository.create_many([
+                    TwinExchange(twin_id=twin_id, data_exchange_agreement_id=data_exchange_agreement_id)
+                    for twin_id, data_exchange_agreement_id in sorted(new_exchanges)
+                ])
+                changed_twin_ids.update(twin_id for twin_id, _ in new_exchanges)
+            else:
+                repo.twin_exchange_repository.delete_many(updated_twin_ids, data_exchange_agreement_ids)
+                changed_twin_ids.update(twin_id for twin_id, _ in exchanges & existing_exchanges)
+            repo.twin_repository.refresh_status(sorted(changed_twin_ids))
+            repo.commit()
+            for twin_id in updated_twin_ids:
+                if twin_id in changed_twin_ids:
+                    outcomes.succeed(pending[twin_id][0])
+                else:
+                    outcomes.skip(pending[twin_id][0])
+
     def create_twin_aspect(self, twin_aspect_create: TwinAspectCreate) -> TwinAspectRead:
         """
         Create a new twin aspect for a give twin.
@@ -486,8 +913,8 @@ class TwinManagementService:
 
         with RepositoryManagerFactory.create() as repo:
             
-            # Step 1: Retrieve the twin entity according to the global_id
-            db_twin = repo.twin_repository.find_by_global_id(twin_aspect_create.global_id)
+            # Step 1: Retrieve the twin entity according to the global_id, with its manufacturer
+            db_twin = repo.twin_repository.find_by_global_id(twin_aspect_create.global_id, load=(TwinLoadProfile.MANUFACTURER,))
             if not db_twin:
                 raise NotFoundError(f"Twin for global ID '{twin_aspect_create.global_id}' not found.")
 
@@ -505,30 +932,20 @@ class TwinManagementService:
                 twin_aspect_create.semantic_id,
                 include_registrations=True
             )
-            if not db_twin_aspect:
+            new_twin_aspect = not db_twin_aspect
+            if new_twin_aspect:
                 # Step 3a: Create a new twin aspect entity in the database
                 db_twin_aspect = self._create_twin_aspect_entity_db(twin_aspect_create, repo, db_twin)
 
             # Step 4: Check if there is already a registration for the given enablement service stack and create it if not
             db_twin_aspect_registration = self._get_or_create_twin_aspect_registration(
-                repo, db_twin_aspect, db_enablement_service_stack
+                repo, db_twin_aspect, db_enablement_service_stack, new_twin_aspect=new_twin_aspect
             )
 
-            # Step 4b: Ensure DTR asset is registered
-            self._ensure_dtr_asset_registration()
-
-            # Step 5: Handle the submodel service
-            self._handle_submodel_service_upload(
-                repo, db_twin_aspect_registration, db_enablement_service_stack, db_twin_aspect, twin_aspect_create
+            # Steps 5 to 7: Store the document and register it in the EDC and DTR
+            return self._dispatch_twin_aspect_registration(
+                repo, db_twin_aspect_registration, db_enablement_service_stack, db_twin, db_twin_aspect, twin_aspect_create
             )
-            
-            # Step 6: Handle the EDC registration
-            asset_id = self._handle_edc_registration(repo, db_twin_aspect_registration, db_twin_aspect)
-            
-            # Step 7: Handle the DTR registration
-            self._handle_dtr_registration(repo, db_twin_aspect_registration, db_twin, db_twin_aspect, asset_id)
-
-            return self._create_twin_aspect_read_response(db_twin_aspect, db_enablement_service_stack, db_twin_aspect_registration)
         
     def create_or_update_twin_aspect_not_default(self, twin_aspect_create: TwinAspectCreate) -> TwinAspectRead:
         """
@@ -537,8 +954,8 @@ class TwinManagementService:
 
         with RepositoryManagerFactory.create() as repo:
             
-            # Step 1: Retrieve the twin entity according to the global_id
-            db_twin = repo.twin_repository.find_by_global_id(twin_aspect_create.global_id)
+            # Step 1: Retrieve the twin entity according to the global_id, with its manufacturer
+            db_twin = repo.twin_repository.find_by_global_id(twin_aspect_create.global_id, load=(TwinLoadProfile.MANUFACTURER,))
             if not db_twin:
                 raise NotFoundError(f"Twin for global ID '{twin_aspect_create.global_id}' not found.")
 
@@ -551,8 +968,10 @@ class TwinManagementService:
             db_enablement_service_stack = self.get_or_create_enablement_stack(repo=repo, manufacturer_id=manufacturer_id)
             
             # Step 3a: Create a new twin aspect entity in the database if a submodel_id is not provided
+            new_twin_aspect = False
             if not twin_aspect_create.submodel_id:
                 db_twin_aspect = self._create_twin_aspect_entity_db(twin_aspect_create, repo, db_twin)
+                new_twin_aspect = True
 
             # Step 3b: Retrieve a potentially existing twin aspect entity for the given twin_id, semantic_id and submodel_id. If not found, create it. Otherwise, update it.
             else:
@@ -563,53 +982,106 @@ class TwinManagementService:
                 )
                 if not db_twin_aspect:
                     db_twin_aspect = self._create_twin_aspect_entity_db(twin_aspect_create, repo, db_twin)
+                    new_twin_aspect = True
                 else:
                     # Update existing twin aspect
                     self._handle_submodel_service_update(
-                        repo, db_twin_aspect.registrations[0], db_enablement_service_stack, db_twin_aspect, twin_aspect_create
+                        db_twin_aspect.registrations[0], db_enablement_service_stack, db_twin_aspect, twin_aspect_create
                     )
+                    # Build the response before the commit expires the entities
+                    result = self._create_twin_aspect_read_response(db_twin_aspect, db_enablement_service_stack, db_twin_aspect.registrations[0])
                     repo.commit()
-                    repo.refresh(db_twin_aspect)
-                    return self._create_twin_aspect_read_response(db_twin_aspect, db_enablement_service_stack, db_twin_aspect.registrations[0])
+                    return result
             
 
             # Step 4: Check if there is already a registration for the given enablement service stack and create it if not
             db_twin_aspect_registration = self._get_or_create_twin_aspect_registration(
-                repo, db_twin_aspect, db_enablement_service_stack
+                repo, db_twin_aspect, db_enablement_service_stack, new_twin_aspect=new_twin_aspect
             )
 
+            # Steps 5 to 7: Store the document and register it in the EDC and DTR
+            return self._dispatch_twin_aspect_registration(
+                repo, db_twin_aspect_registration, db_enablement_service_stack, db_twin, db_twin_aspect, twin_aspect_create
+            )
+
+    def _dispatch_twin_aspect_registration(self, repo: RepositoryManager, db_twin_aspect_registration: TwinAspectRegistration, db_enablement_service_stack: EnablementServiceStack, db_twin: Twin, db_twin_aspect: TwinAspect, twin_aspect_create: TwinAspectCreate) -> TwinAspectRead:
+        """
+        Register the twin aspect right away, or enqueue its registration and return its current status when the outbox is enabled.
+        """
+        if not _outbox_enabled():
+            return self._register_twin_aspect(
+                repo, db_twin_aspect_registration, db_enablement_service_stack, db_twin, db_twin_aspect, twin_aspect_create
+            )
+
+        repo.outbox_message_repository.enqueue(
+            OUTBOX_REGISTER_TWIN_ASPECT,
+            f"{OUTBOX_REGISTER_TWIN_ASPECT}:{db_twin_aspect.id}:{db_enablement_service_stack.id}",
+            {"twinAspectId": db_twin_aspect.id, "enablementServiceStackId": db_enablement_service_stack.id, "payload": twin_aspect_create.payload}
+        )
+        # Build the response before the commit expires the entities
+        result = self._create_twin_aspect_read_response(db_twin_aspect, db_enablement_service_stack, db_twin_aspect_registration)
+        repo.commit()
+        return result
+
+    def _register_twin_aspect(self, repo: RepositoryManager, db_twin_aspect_registration: TwinAspectRegistration, db_enablement_service_stack: EnablementServiceStack, db_twin: Twin, db_twin_aspect: TwinAspect, twin_aspect_create: TwinAspectCreate) -> TwinAspectRead:
+        """
+        Advance the registration of a twin aspect from its current status to DTR_REGISTERED in one transaction.
+
+        Each step skips itself if the status shows it is done, and only moves the status on once its external
+        call succeeded. The status is committed once at the end, or once when a step fails, so the next call
+        resumes from the failed step.
+        """
+        try:
             # Step 4b: Ensure DTR asset is registered
             self._ensure_dtr_asset_registration()
 
             # Step 5: Handle the submodel service
             self._handle_submodel_service_upload(
-                repo, db_twin_aspect_registration, db_enablement_service_stack, db_twin_aspect, twin_aspect_create
+                db_twin_aspect_registration, db_enablement_service_stack, db_twin_aspect, twin_aspect_create
             )
-            
+
             # Step 6: Handle the EDC registration
-            asset_id = self._handle_edc_registration(repo, db_twin_aspect_registration, db_twin_aspect)
-            
+            asset_id = self._handle_edc_registration(db_twin_aspect_registration, db_twin_aspect)
+
             # Step 7: Handle the DTR registration
-            self._handle_dtr_registration(repo, db_twin_aspect_registration, db_twin, db_twin_aspect, asset_id)
+            self._handle_dtr_registration(db_twin_aspect_registration, db_twin, db_twin_aspect, asset_id)
+        except Exception:
+            self._commit_progress(repo)
+            raise
 
-            return self._create_twin_aspect_read_response(db_twin_aspect, db_enablement_service_stack, db_twin_aspect_registration)
+        # Build the response before the commit expires the entities
+        result = self._create_twin_aspect_read_response(db_twin_aspect, db_enablement_service_stack, db_twin_aspect_registration)
+        repo.commit()
+        return result
+
+    @staticmethod
+    def _commit_progress(repo: RepositoryManager) -> None:
+        """
+        Commit the twin aspect and the registration status reached before a step failed.
+        """
+        try:
+            repo.commit()
+        except Exception as e:
+            # The error of the step is more relevant, the transaction is rolled back when the session closes
+            logger.error(f"Failed to store the progress of the twin aspect registration: {e}")
 
-    def _get_or_create_twin_aspect_registration(self, repo: RepositoryManager, db_twin_aspect: TwinAspect, db_enablement_service_stack: EnablementServiceStack) -> TwinAspectRegistration:
+    def _get_or_create_twin_aspect_registration(self, repo: RepositoryManager, db_twin_aspect: TwinAspect, db_enablement_service_stack: EnablementServiceStack, new_twin_aspect: bool = False) -> TwinAspectRegistration:
         """
         Get or create a twin aspect registration for the given enablement service stack.
+
+        A twin aspect created in the current transaction has no registration yet, so its registrations are not loaded.
         """
-        db_twin_aspect_registration = db_twin_aspect.find_registration_by_stack_id(
-            db_enablement_service_stack.id
-        )
+        db_twin_aspect_registration = None
+        if not new_twin_aspect:
+            db_twin_aspect_registration = db_twin_aspect.find_registration_by_stack_id(
+                db_enablement_service_stack.id
+            )
         if not db_twin_aspect_registration:
             db_twin_aspect_registration = repo.twin_aspect_registration_repository.create_new(
                 twin_aspect_id=db_twin_aspect.id,
                 enablement_service_stack_id=db_enablement_service_stack.id,
                 registration_mode=TwinsAspectRegistrationMode.DISPATCHED.value, 
             )
-            repo.commit()
-            repo.refresh(db_twin_aspect_registration)
-            repo.refresh(db_twin_aspect)
         return db_twin_aspect_registration
 
     def _ensure_dtr_asset_registration(self) -> None:
@@ -629,7 +1101,7 @@ class TwinManagementService:
         if not dtr_asset_id:
             raise NotAvailableError("The Digital Twin Registry was not able to be registered, or was not found in the Connector!")
 
-    def _handle_submodel_service_upload(self, repo: RepositoryManager, db_twin_aspect_registration: TwinAspectRegistration, db_enablement_service_stack: EnablementServiceStack, db_twin_aspect: TwinAspect, twin_aspect_create: TwinAspectCreate) -> None:
+    def _handle_submodel_service_upload(self, db_twin_aspect_registration: TwinAspectRegistration, db_enablement_service_stack: EnablementServiceStack, db_twin_aspect: TwinAspect, twin_aspect_create: TwinAspectCreate) -> None:
         """
         Handle the upload of the twin aspect payload to the submodel service.
         """
@@ -645,10 +1117,8 @@ class TwinManagementService:
 
             # Update the registration status to STORED
             db_twin_aspect_registration.status = TwinAspectRegistrationStatus.STORED.value
-            repo.commit()
-            repo.refresh(db_twin_aspect_registration)
     
-    def _handle_submodel_service_update(self, repo: RepositoryManager, db_twin_aspect_registration: TwinAspectRegistration, db_enablement_service_stack: EnablementServiceStack, db_twin_aspect: TwinAspect, twin_aspect_create: TwinAspectCreate) -> None:
+    def _handle_submodel_service_update(self, db_twin_aspect_registration: TwinAspectRegistration, db_enablement_service_stack: EnablementServiceStack, db_twin_aspect: TwinAspect, twin_aspect_create: TwinAspectCreate) -> None:
         """
         Handle the update of the twin aspect payload to the submodel service.
         """
@@ -663,11 +1133,10 @@ class TwinManagementService:
             )
             # Update the registration modified date
             db_twin_aspect_registration.modified_date = datetime.now(timezone.utc)
-            repo.commit()
         else:
             raise NotAvailableError("Twin aspect document cannot be updated before it is stored in the submodel service.")
 
-    def _handle_edc_registration(self, repo: RepositoryManager, db_twin_aspect_registration: TwinAspectRegistration, db_twin_aspect: TwinAspect) -> str:
+    def _handle_edc_registration(self, db_twin_aspect_registration: TwinAspectRegistration, db_twin_aspect: TwinAspect) -> str:
         """
         Handle the EDC registration for the twin aspect and return the asset ID.
         """
@@ -679,11 +1148,10 @@ class TwinManagementService:
         if asset_id and db_twin_aspect_registration.status < TwinAspectRegistrationStatus.EDC_REGISTERED.value:
             # Update the registration status to EDC_REGISTERED
             db_twin_aspect_registration.status = TwinAspectRegistrationStatus.EDC_REGISTERED.value
-            repo.commit()
         
         return asset_id
 
-    def _handle_dtr_registration(self, repo: RepositoryManager, db_twin_aspect_registration: TwinAspectRegistration, db_twin: Twin, db_twin_aspect: TwinAspect, asset_id: str) -> None:
+    def _handle_dtr_registration(self, db_twin_aspect_registration: TwinAspectRegistration, db_twin: Twin, db_twin_aspect: TwinAspect, asset_id: str) -> None:
         """
         Handle the DTR registration for the twin aspect.
         """
@@ -698,7 +1166,6 @@ class TwinManagementService:
                 )
                 # Update the registration status to DTR_REGISTERED only on success
                 db_twin_aspect_registration.status = TwinAspectRegistrationStatus.DTR_REGISTERED.value
-                repo.commit()
             except Exception as e:
                 logger.error(f"Failed to create submodel descriptor: {e}")
                 raise e  # Re-raise the exception to prevent twin creation from completing
@@ -727,17 +1194,89 @@ class TwinManagementService:
                     semantic_id=twin_aspect_create.semantic_id,
                     submodel_id=twin_aspect_create.submodel_id
                 )
-        repo.commit()
-        repo.refresh(db_twin_aspect)
+        # Only flush to get the ID of the twin aspect, it is committed with its registration
+        repo.flush()
         return db_twin_aspect
             
+    def outbox_handlers(self) -> Dict[str, Callable[[RepositoryManager, Dict[str, Any]], None]]:
+        """
+        Return the handlers of the outbox messages enqueued by this service, by operation.
+        """
+        return {
+            OUTBOX_REGISTER_TWIN: self._apply_twin_registration,
+            OUTBOX_REGISTER_TWIN_ASPECT: self._apply_twin_aspect_registration,
+        }
+
+    @staticmethod
+    def _enqueue_twin_registration(repo: RepositoryManager, db_twin_registration: TwinRegistration, id_short: Optional[str] = None) -> None:
+        """
+        Enqueue the registration of the shell descriptor of a twin in the DTR of the enablement service stack.
+        """
+        repo.outbox_message_repository.enqueue(
+            OUTBOX_REGISTER_TWIN,
+            f"{OUTBOX_REGISTER_TWIN}:{db_twin_registration.twin_id}:{db_twin_registration.enablement_service_stack_id}",
+            {"twinId": db_twin_registration.twin_id, "enablementServiceStackId": db_twin_registration.enablement_service_stack_id, "idShort": id_short}
+        )
+
+    def _apply_twin_registration(self, repo: RepositoryManager, payload: Dict[str, Any]) -> None:
+        """
+        Register the shell descriptor of a twin in the DTR, built from the part as it is stored now.
+        """
+        db_twin_registration = repo.twin_registration_repository.get_by_twin_id_enablement_service_stack_id(
+            payload["twinId"], payload["enablementServiceStackId"]
+        )
+        if not db_twin_registration:
+            raise NotFoundError("Twin registration not found.")
+        db_twin = db_twin_registration.twin
+
+        if db_twin.catalog_part:
+            shell_descriptor = self._catalog_part_shell_descriptor(db_twin.catalog_part, db_twin, id_short=payload.get("idShort"))
+        elif db_twin.serialized_part:
+            db_catalog_part = db_twin.serialized_part.partner_catalog_part.catalog_part
+            shell_descriptor = self._serialized_part_shell_descriptor(
+                db_twin.serialized_part, db_twin, db_catalog_part.legal_entity.bpnl, db_catalog_part.manufacturer_part_id
+            )
+        else:
+            raise NotFoundError("Twin does not have a catalog part or serialized part associated.")
+
+        dtr_provider_manager.create_or_update_shell_descriptor(**shell_descriptor)
+        db_twin_registration.dtr_registered = True
+        repo.twin_repository.refresh_status([db_twin.id])
+
+    def _apply_twin_aspect_registration(self, repo: RepositoryManager, payload: Dict[str, Any]) -> None:
+        """
+        Store the document of a twin aspect and register it in the EDC and DTR, resuming from its current status.
+        """
+        db_twin_aspect_registration = repo.twin_aspect_registration_repository.get_by_twin_aspect_id_enablement_service_stack_id(
+            payload["twinAspectId"], payload["enablementServiceStackId"]
+        )
+        if not db_twin_aspect_registration:
+            raise NotFoundError("Twin aspect registration not found.")
+        db_twin_aspect = db_twin_aspect_registration.twin_aspect
+        db_twin = db_twin_aspect.twin
+
+        # The submodel descriptor needs the shell descriptor, which may still wait in the outbox
+        db_twin_registration = repo.twin_registration_repository.get_by_twin_id_enablement_service_stack_id(
+            db_twin.id, payload["enablementServiceStackId"]
+        )
+        if not db_twin_registration or not db_twin_registration.dtr_registered:
+            raise NotAvailableError("The twin is not registered in the DTR yet.")
+
+        self._register_twin_aspect(
+            repo,
+            db_twin_aspect_registration,
+            db_twin_aspect_registration.enablement_service_stack,
+            db_twin,
+            db_twin_aspect,
+            TwinAspectCreate(globalId=db_twin.global_id, semanticId=db_twin_aspect.semantic_id, submodelId=db_twin_aspect.submodel_id, payload=payload["payload"])
+        )
+
     def get_catalog_part_twin_details_id(self, global_id:UUID) -> Optional[CatalogPartTwinDetailsRead]:
         with RepositoryManagerFactory.create() as repo:
             db_twins = repo.twin_repository.find_catalog_part_twins(
                 global_id=global_id,
                 include_data_exchange_agreements=True,
-                include_aspects=True,
-                include_registrations=True
+                load=_CATALOG_PART_TWIN_DETAILS_LOAD
             )
             if not db_twins:
                 return None
@@ -751,8 +1290,7 @@ class TwinManagementService:
                 manufacturer_id=manufacturer_id,
                 manufacturer_part_id=manufacturer_part_id,
                 include_data_exchange_agreements=True,
-                include_aspects=True,
-                include_registrations=True
+                load=_CATALOG_PART_TWIN_DETAILS_LOAD
             )
             if not db_twins:
                 return None
@@ -915,12 +1453,38 @@ class TwinManagementService:
                     twin_id=db_twin.id,
                     data_exchange_agreement_id=db_data_exchange_agreement.id
                 )
+                repo.twin_repository.refresh_status([db_twin.id])
                 repo.commit()
                 return True
             else:
                 return False
 
 
+def _call_with_retries(call: Callable[..., Any], *, rate_limiter: RateLimiter, max_retries: int, retry_delay: float, **kwargs) -> Any:
+    """
+    Call the DTR under the rate limit, retrying a failed call up to max_retries times with exponential backoff.
+    """
+    for attempt in range(max_retries + 1):
+        rate_limiter.acquire()
+        try:
+            return call(**kwargs)
+        except Exception as e:
+            if attempt == max_retries:
+                raise
+            delay = retry_delay * 2 ** attempt
+            logger.warning(f"DTR call failed (attempt {attempt + 1}/{max_retries + 1}), retrying in {delay}s: {e}")
+            time.sleep(delay)
+
+
+def _outbox_enabled() -> bool:
+    """
+    Whether the DTR, EDC and submodel service calls are applied by the outbox worker instead of within the request.
+
+    Only enabled explicitly, the twin and aspect registrations then return with a pending status.
+    """
+    return ConfigManager.get_config("provider.outbox", {}).get("enabled", False) is True
+
+
 def _create_submodel_service_manager(connection_settings: Optional[Dict[str, Any]]) -> SubmodelServiceManager:
     """
     Create a new instance of the SubmodelServiceManager class.
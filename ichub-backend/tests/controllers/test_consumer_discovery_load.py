@@ -0,0 +1,117 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+
+import asyncio
+import threading
+import time
+from unittest.mock import Mock, patch
+
+import httpx
+
+from managers.config.config_manager import ConfigManager
+from utils.async_utils import AsyncManagerWrapper
+
+# The DTR and connector modules connect to the database on import
+with patch.dict('sys.modules', {
+    'dtr': Mock(),
+    'connector': Mock(),
+}):
+    from controllers.fastapi import app
+    from controllers.fastapi.routers.consumer.v1 import discovery_management
+
+DISCOVERY_CALLS = 50
+DISCOVERY_DELAY = 0.3
+HEALTH_SAMPLES = 40
+
+
+class SlowDtrConsumer:
+    """DTR consumer whose discovery blocks the calling thread like a slow EDC negotiation."""
+
+    def __init__(self):
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self._lock = threading.Lock()
+
+    def get_dtrs(self, bpn):
+        with self._lock:
+            self.in_flight += 1
+            self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        try:
+            time.sleep(DISCOVERY_DELAY)
+            return [{"asset_id": "dtr-asset", "connector_url": "https://edc.example/api/v1/dsp"}]
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+
+def _p99(latencies):
+    ordered = sorted(latencies)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))]
+
+
+class TestConsumerDiscoveryLoad:
+    """Load test for the event loop responsiveness while consumer discoveries are running."""
+
+    async def _measure(self, consumer):
+        transport = httpx.ASGITransport(app=app)
+        headers = {ConfigManager.get_config("authorization.api_key.key"): ConfigManager.get_config("authorization.api_key.value")}
+        async with httpx.AsyncClient(transport=transport, base_url="http://test", headers=headers) as client:
+            async def health_latencies():
+                latencies = []
+                for _ in range(HEALTH_SAMPLES):
+                    start = time.monotonic()
+                    response = await client.get("/health")
+                    latencies.append(time.monotonic() - start)
+                    assert response.status_code == 200
+                return latencies
+
+            idle = await health_latencies()
+
+            discoveries = [
+                asyncio.create_task(client.post("/v1/discover/registries", json={"counterPartyId": f"BPNL{i:012d}"}))
+                for i in range(DISCOVERY_CALLS)
+            ]
+            # Let the discovery requests reach the thread pool before sampling
+            for _ in range(100):
+                if consumer.in_flight > 0:
+                    break
+                await asyncio.sleep(0.01)
+            loaded = await health_latencies()
+            in_flight_after_sampling = consumer.in_flight
+            responses = await asyncio.gather(*discoveries)
+
+        return idle, loaded, in_flight_after_sampling, responses
+
+    def test_health_latency_stays_flat_during_discovery(self):
+        """Test that the p99 latency of /health is not affected by 50 in flight discovery calls."""
+        consumer = SlowDtrConsumer()
+
+        with patch.object(discovery_management, "async_dtr_consumer", AsyncManagerWrapper(consumer, "DTRConsumer")):
+            idle, loaded, in_flight_after_sampling, responses = asyncio.run(self._measure(consumer))
+
+        assert all(response.status_code == 200 for response in responses)
+        # The health checks were measured while the discoveries were still running
+        assert in_flight_after_sampling > 0
+        assert consumer.peak_in_flight > 1
+        # A blocking handler would delay the health check by at least one discovery call
+        assert _p99(loaded) < max(DISCOVERY_DELAY / 2, _p99(idle) * 5)
@@ -0,0 +1,83 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+
+import asyncio
+from unittest.mock import Mock, patch
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlmodel import Session, SQLModel, create_engine
+
+from managers.config.config_manager import ConfigManager
+from managers.metadata_database import async_manager as async_manager_module
+from models.metadata_database.provider.models import CatalogPart, LegalEntity
+
+# The DTR and connector modules connect to the database on import
+with patch.dict('sys.modules', {
+    'dtr': Mock(),
+    'connector': Mock(),
+}):
+    from controllers.fastapi import app
+
+CATALOG_PART_PATH = "/v1/part-management/catalog-part"
+
+
+class TestCatalogPartListRoute:
+    """Test suite for the listing of catalog parts through the API."""
+
+    @pytest.fixture(autouse=True)
+    def database(self, tmp_path, monkeypatch):
+        """Create one catalog part, read on the async engine."""
+        path = tmp_path / "catalog_parts.db"
+        engine = create_engine(f"sqlite:///{path}")
+        SQLModel.metadata.create_all(engine)
+        with Session(engine) as session:
+            legal_entity = LegalEntity(bpnl="BPNL000000000001")
+            session.add(legal_entity)
+            session.flush()
+            session.add(CatalogPart(manufacturer_part_id="PART", name="part", category="category", legal_entity_id=legal_entity.id))
+            session.commit()
+        engine.dispose()
+
+        self.async_engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+        monkeypatch.setattr(async_manager_module, "get_async_engine", lambda: self.async_engine)
+        headers = {ConfigManager.get_config("authorization.api_key.key"): ConfigManager.get_config("authorization.api_key.value")}
+        self.client = TestClient(app, headers=headers)
+        yield
+        asyncio.run(self.async_engine.dispose())
+
+    def test_list_returns_only_the_requested_fields(self):
+        """Test that the fields which are not requested are left out of the response instead of returned as null."""
+        response = self.client.get(CATALOG_PART_PATH, params={"fields": "manufacturerPartId,category"})
+
+        assert response.status_code == 200
+        assert response.json() == [{"manufacturerPartId": "PART", "category": "category"}]
+
+    @pytest.mark.parametrize("params, key", [({"fields": "materials"}, "materials"), ({"sort": "-width"}, "width")], ids=["fields", "sort"])
+    def test_list_rejects_unknown_keys(self, params, key):
+        """Test that an unknown field or sort key is answered with a bad request."""
+        response = self.client.get(CATALOG_PART_PATH, params=params)
+
+        assert response.status_code == 400
+        assert key in response.json()["message"]
@@ -0,0 +1,119 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+
+import asyncio
+import inspect
+import logging
+import time
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+# The DTR and connector modules connect to the database on import
+with patch.dict('sys.modules', {
+    'dtr': Mock(),
+    'connector': Mock(),
+}):
+    from controllers.fastapi.routers.provider.v1 import (
+        part_management,
+        partner_management,
+        twin_management,
+        submodel_dispatcher,
+        sharing_handler
+    )
+
+# Maximum time in seconds a single step of the event loop may take
+SLOW_CALLBACK_THRESHOLD = 0.05
+# Time in seconds every patched service call blocks the calling thread
+SERVICE_DELAY = 0.1
+
+ROUTERS = {
+    part_management: part_management.part_management_service,
+    partner_management: partner_management.partner_management_service,
+    twin_management: twin_management.twin_management_service,
+    submodel_dispatcher: submodel_dispatcher.submodel_dispatcher_service,
+    sharing_handler: sharing_handler.part_sharing_service,
+}
+
+
+def _blocking(*args, **kwargs):
+    time.sleep(SERVICE_DELAY)
+    return True
+
+
+def _blocking_page(*args, **kwargs):
+    time.sleep(SERVICE_DELAY)
+    return [], None
+
+
+async def _awaiting(*args, **kwargs):
+    await asyncio.sleep(SERVICE_DELAY)
+    return True
+
+
+async def _awaiting_page(*args, **kwargs):
+    await asyncio.sleep(SERVICE_DELAY)
+    return [], None
+
+
+def _service_mock(name, function):
+    """Mock of a service method, awaiting instead of blocking for the native async ones."""
+    page = name.endswith("_page") or name.endswith("_page_async")
+    if inspect.iscoroutinefunction(function):
+        return AsyncMock(side_effect=_awaiting_page if page else _awaiting)
+    return Mock(side_effect=_blocking_page if page else _blocking)
+
+
+def _route_params():
+    return [
+        pytest.param(service, route, id=route.endpoint.__name__)
+        for module, service in ROUTERS.items()
+        for route in module.router.routes
+    ]
+
+
+class TestProviderRoutersNonBlocking:
+    """Regression test for provider route handlers running blocking service calls on the event loop."""
+
+    @pytest.mark.parametrize("service,route", _route_params())
+    def test_handler_does_not_block_the_event_loop(self, service, route, caplog):
+        """Test that no step of the event loop takes longer than the slow callback threshold."""
+        methods = {
+            name: function for name, function in inspect.getmembers(type(service), inspect.isfunction)
+            if not name.startswith("_")
+        }
+        arguments = {name: None for name in inspect.signature(route.endpoint).parameters}
+
+        async def call_endpoint():
+            loop = asyncio.get_running_loop()
+            loop.slow_callback_duration = SLOW_CALLBACK_THRESHOLD
+            await route.endpoint(**arguments)
+
+        # Paginated service methods return the page and the cursor of the next one
+        mocks = {name: _service_mock(name, function) for name, function in methods.items()}
+        with patch.multiple(service, **mocks):
+            with caplog.at_level(logging.WARNING, logger="asyncio"):
+                asyncio.run(call_endpoint(), debug=True)
+
+        slow_callbacks = [record.getMessage() for record in caplog.records if record.name == "asyncio" and "took" in record.getMessage()]
+        assert slow_callbacks == []
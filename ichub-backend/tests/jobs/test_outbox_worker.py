@@ -0,0 +1,173 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+
+from datetime import datetime, timedelta
+from unittest.mock import Mock
+
+from sqlalchemy.pool import StaticPool
+from sqlmodel import Session, SQLModel, create_engine, select
+
+from jobs.outbox_worker import OutboxWorker
+from managers.metadata_database.manager import RepositoryManager
+from models.metadata_database.provider.models import OutboxMessage, OutboxMessageStatus
+
+
+class TestOutboxWorker:
+    """Test suite for the claiming, retries and idempotency of the outbox messages."""
+
+    def setup_method(self):
+        self.engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+        SQLModel.metadata.create_all(self.engine)
+        self.handler = Mock()
+        self.worker = self._worker()
+
+    def _worker(self, **kwargs):
+        return OutboxWorker({"operation": self.handler}, repository_manager_factory=self._repo, **kwargs)
+
+    def _repo(self):
+        return RepositoryManager(Session(self.engine))
+
+    def _enqueue(self, key="key", payload=None, operation="operation"):
+        with self._repo() as repo:
+            repo.outbox_message_repository.enqueue(operation, key, payload or {"value": 1})
+
+    def _message(self, key="key"):
+        with Session(self.engine) as session:
+            return session.exec(select(OutboxMessage).where(OutboxMessage.idempotency_key == key)).one()
+
+    def test_due_message_is_handled_once(self):
+        """Test that a handled message is done and not claimed again."""
+        self._enqueue()
+
+        assert self.worker.run_once() == 1
+        assert self.worker.run_once() == 0
+
+        self.handler.assert_called_once()
+        assert self.handler.call_args.args[1] == {"value": 1}
+        message = self._message()
+        assert message.status == OutboxMessageStatus.DONE
+        assert message.attempts == 1
+
+    def test_failed_message_is_retried_with_backoff(self):
+        """Test that a failed message is due again after the retry delay, doubled on each attempt."""
+        self.handler.side_effect = RuntimeError("DTR down")
+        self._enqueue()
+
+        before = datetime.utcnow()
+        self.worker.run_once()
+
+        message = self._message()
+        assert message.status == OutboxMessageStatus.PENDING
+        assert message.last_error == "DTR down"
+        assert message.next_attempt_date >= before + timedelta(seconds=5)
+        # Not due yet
+        assert self.worker.run_once() == 0
+        assert self.worker._retry_delay(3) == 20
+        assert self._worker(max_retry_delay=30)._retry_delay(10) == 30
+
+    def test_message_fails_after_max_attempts(self):
+        """Test that a message is no longer retried after its last attempt."""
+        self.handler.side_effect = RuntimeError("DTR down")
+        self._enqueue()
+        worker = self._worker(retry_delay=0, max_attempts=2)
+
+        assert worker.run_once() == 1
+        assert worker.run_once() == 1
+        assert worker.run_once() == 0
+
+        message = self._message()
+        assert message.status == OutboxMessageStatus.FAILED
+        assert message.attempts == 2
+
+    def test_unknown_operation_fails_right_away(self):
+        """Test that a message without handler is failed instead of retried."""
+        self._enqueue(operation="unknown")
+
+        self.worker.run_once()
+
+        message = self._message()
+        assert message.status == OutboxMessageStatus.FAILED
+        assert "unknown" in message.last_error
+
+    def test_enqueue_with_same_key_replaces_the_message(self):
+        """Test that the idempotency key keeps one message per side effect, due again with the latest payload."""
+        self._enqueue(payload={"value": 1})
+        self.worker.run_once()
+        self._enqueue(payload={"value": 2})
+        self._enqueue(payload={"value": 3})
+
+        assert self.worker.run_once() == 1
+
+        assert self.handler.call_args.args[1] == {"value": 3}
+        with Session(self.engine) as session:
+            assert len(session.exec(select(OutboxMessage)).all()) == 1
+
+    def test_message_of_dead_worker_is_claimed_after_its_lease(self):
+        """Test that a claimed message which was not finished is due again once its lease expired."""
+        self._enqueue()
+        with self._repo() as repo:
+            repo.outbox_message_repository.claim_due(10, lease_seconds=-1)
+
+        assert self.worker.run_once() == 1
+
+        message = self._message()
+        assert message.status == OutboxMessageStatus.DONE
+        assert message.attempts == 2
+
+    def test_enqueue_while_handled_runs_the_message_again(self):
+        """Test that a message enqueued again during its attempt is not marked done, but handled again with the latest payload."""
+        self._enqueue(payload={"value": 1})
+
+        def enqueue_during_first_attempt(repo, payload):
+            if payload == {"value": 1}:
+                self._enqueue(payload={"value": 2})
+        self.handler.side_effect = enqueue_during_first_attempt
+
+        assert self.worker.run_once() == 1
+        message = self._message()
+        assert message.status == OutboxMessageStatus.PENDING
+        assert message.payload == {"value": 2}
+        assert not message.rerun
+
+        assert self.worker.run_once() == 1
+        assert self.worker.run_once() == 0
+
+        assert [call.args[1] for call in self.handler.call_args_list] == [{"value": 1}, {"value": 2}]
+        assert self._message().status == OutboxMessageStatus.DONE
+
+    def test_attempt_outliving_its_lease_does_not_finish_the_message(self):
+        """Test that only the worker holding the latest claim of a message finishes it."""
+        self._enqueue()
+        with self._repo() as repo:
+            stale = repo.outbox_message_repository.claim_due(10, lease_seconds=-1)[0].claim_token
+        with self._repo() as repo:
+            current = repo.outbox_message_repository.claim_due(10, lease_seconds=300)[0].claim_token
+        message_id = self._message().id
+
+        self.worker._handle(message_id, "operation", 1, stale, {"value": 1})
+        message = self._message()
+        assert message.status == OutboxMessageStatus.PROCESSING
+        assert message.claim_token == current
+
+        self.worker._handle(message_id, "operation", 2, current, {"value": 1})
+        assert self._message().status == OutboxMessageStatus.DONE
@@ -0,0 +1,94 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+
+
+from sqlalchemy.pool import StaticPool
+from sqlmodel import Session, SQLModel, create_engine
+
+from jobs.part_status_job import PartStatusJob
+from managers.metadata_database.manager import RepositoryManager
+from managers.metadata_database.repositories import CatalogPartRepository
+from models.metadata_database.provider.models import (
+    BusinessPartner, CatalogPart, DataExchangeAgreement, EnablementServiceStack, LegalEntity,
+    Twin, TwinExchange, TwinRegistration
+)
+
+
+class TestPartStatusJob:
+    """Test suite for the backfill and the consistency check of the part status."""
+
+    def setup_method(self):
+        """Create one catalog part per status, with the stored status left at its default."""
+        self.engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+        SQLModel.metadata.create_all(self.engine)
+        with Session(self.engine) as session:
+            legal_entity = LegalEntity(bpnl="BPNL000000000001")
+            business_partner = BusinessPartner(name="partner", bpnl="BPNL000000000002")
+            session.add_all([legal_entity, business_partner])
+            session.flush()
+            stack = EnablementServiceStack(name="stack", legal_entity_id=legal_entity.id)
+            agreement = DataExchangeAgreement(name="agreement", business_partner_id=business_partner.id)
+            session.add_all([stack, agreement])
+            session.flush()
+            session.add(CatalogPart(manufacturer_part_id="DRAFT", legal_entity_id=legal_entity.id))
+            # Pending, registered and shared twins
+            for manufacturer_part_id, registered, shared in [("PENDING", False, False), ("REGISTERED", True, False), ("SHARED", True, True)]:
+                twin = Twin()
+                session.add(twin)
+                session.flush()
+                session.add(CatalogPart(manufacturer_part_id=manufacturer_part_id, legal_entity_id=legal_entity.id, twin_id=twin.id))
+                session.add(TwinRegistration(twin_id=twin.id, enablement_service_stack_id=stack.id, dtr_registered=registered))
+                if shared:
+                    session.add(TwinExchange(twin_id=twin.id, data_exchange_agreement_id=agreement.id))
+            session.commit()
+        self.job = PartStatusJob(repository_manager_factory=lambda: RepositoryManager(Session(self.engine)))
+
+    def _statuses(self, status=None):
+        with Session(self.engine) as session:
+            rows = CatalogPartRepository(session).find_by_manufacturer_id_manufacturer_part_id(None, None, status=status)
+            return {catalog_part.manufacturer_part_id: part_status for catalog_part, part_status in rows}
+
+    def test_backfill_derives_the_status_of_all_twins(self):
+        """Test that the backfill stores the status derived from the registrations and exchanges."""
+        assert self.job.backfill() == 3
+
+        assert self._statuses() == {"DRAFT": 0, "PENDING": 1, "REGISTERED": 2, "SHARED": 3}
+        assert self.job.check() == []
+
+    def test_status_filter_reads_the_stored_status(self):
+        """Test that the status filter is answered from the stored status."""
+        self.job.backfill()
+
+        assert self._statuses(status=0) == {"DRAFT": 0}
+        assert self._statuses(status=3) == {"SHARED": 3}
+
+    def test_check_reports_and_repairs_inconsistent_twins(self):
+        """Test that the check lists the stale twins and only fixes them when asked to."""
+        inconsistencies = self.job.check()
+
+        assert sorted((stored, derived) for _, stored, derived in inconsistencies) == [(0, 1), (0, 2), (0, 3)]
+        assert len(self.job.check()) == 3
+
+        self.job.check(repair=True)
+
+        assert self.job.check() == []
@@ -0,0 +1,152 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+
+import json
+from datetime import datetime, timedelta
+import logging
+from unittest.mock import MagicMock, Mock, patch
+
+from sqlalchemy.pool import StaticPool
+from sqlmodel import Session, create_engine
+
+from managers.enablement_services.consumer import DtrConsumerSyncPostgresMemoryManager, PostgresCacheInvalidationChannel
+
+
+class TestPostgresCacheInvalidationChannel:
+    """Test suite for the dispatching of the cross-process invalidation notifications."""
+
+    def setup_method(self):
+        """Set up test fixtures before each test method."""
+        self.channel = PostgresCacheInvalidationChannel(engine=MagicMock())
+
+    def _payload(self, topic, key=None, source="other-worker"):
+        return json.dumps({"source": source, "topic": topic, "key": key})
+
+    def test_notifications_are_dispatched_by_topic(self):
+        """Test that only the subscribers of the notified topic are called."""
+        dtrs, connectors = Mock(), Mock()
+        self.channel.subscribe("known_dtrs", dtrs)
+        self.channel.subscribe("known_connectors", connectors)
+
+        self.channel._dispatch(self._payload("known_dtrs", key="BPNL1"))
+
+        dtrs.assert_called_once_with("BPNL1")
+        connectors.assert_not_called()
+
+    def test_own_notifications_are_ignored(self):
+        """Test that a process does not reload the changes it published itself."""
+        callback = Mock()
+        self.channel.subscribe("known_dtrs", callback)
+
+        self.channel._dispatch(self._payload("known_dtrs", source=self.channel.instance_id))
+        self.channel._dispatch("not json")
+
+        callback.assert_not_called()
+
+    def test_failing_subscriber_does_not_stop_dispatching(self):
+        """Test that an error in one subscriber does not prevent the others from being called."""
+        failing, callback = Mock(side_effect=RuntimeError("db down")), Mock()
+        self.channel.subscribe("known_dtrs", failing)
+        self.channel.subscribe("known_dtrs", callback)
+
+        self.channel._dispatch(self._payload("known_dtrs"))
+
+        callback.assert_called_once_with(None)
+
+    def test_publish_sends_source_and_topic(self):
+        """Test that the notification carries the process ID so other processes can tell it apart."""
+        connection = self.channel.engine.connect.return_value.__enter__.return_value
+
+        assert self.channel.publish("known_connectors") is True
+
+        parameters = connection.execute.call_args[0][1]
+        assert parameters["channel"] == "ichub_consumer_cache"
+        assert json.loads(parameters["payload"]) == {"source": self.channel.instance_id, "topic": "known_connectors", "key": None}
+
+
+class TestDtrConsumerSyncInvalidation:
+    """Test suite for the cache invalidation of the synchronized DTR consumer manager."""
+
+    @classmethod
+    def setup_class(cls):
+        """Create one manager, the dynamic table model can only be declared once per process."""
+        cls.engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+        cls.channel = Mock()
+        with patch.object(DtrConsumerSyncPostgresMemoryManager, "_start_background_tasks"):
+            cls.manager = DtrConsumerSyncPostgresMemoryManager(
+                engine=cls.engine, connector_consumer_manager=Mock(),
+                logger=logging.getLogger(__name__), invalidation_channel=cls.channel
+            )
+
+    def setup_method(self):
+        """Reset the published notifications before each test method."""
+        self.channel.publish.reset_mock()
+
+    def test_manager_subscribes_to_its_table(self):
+        """Test that the manager reloads its table when another worker notifies a change."""
+        self.channel.subscribe.assert_called_once_with("known_dtrs", self.manager._on_invalidation)
+
+    def test_changes_are_published_once_saved(self):
+        """Test that a persisted change is published and an unchanged cache is not."""
+        with patch.object(self.manager, "_trigger_save"):
+            self.manager.add_dtr("BPNL1", "https://edc.example", "dtr-1", [{"policy": "p"}])
+
+        assert self.manager._save_to_db() == ["BPNL1"]
+        assert self.manager._save_to_db() == []
+        self.channel.publish.assert_called_once_with("known_dtrs", "BPNL1")
+
+    def test_purged_cache_is_published_without_key(self):
+        """Test that purging the whole cache lets the other workers reload everything."""
+        with patch.object(self.manager, "_trigger_save"):
+            self.manager.purge_cache()
+
+        assert self.manager._save_to_db() == [None]
+        self.channel.publish.assert_called_once_with("known_dtrs")
+
+    def test_invalidation_reloads_other_worker_changes(self):
+        """Test that the changes persisted by another worker are visible after the notification."""
+        with Session(self.engine) as session:
+            session.add(self.manager.KnownDtrsModel(
+                bpnl="BPNL2", edc_url="https://edc.example", asset_id="dtr-2",
+                policies=[{"policy": "p"}], expires_at=datetime.now() + timedelta(hours=1)
+            ))
+            session.commit()
+
+        self.manager._on_invalidation()
+
+        assert "dtr-2" in self.manager.known_dtrs["BPNL2"][self.manager.DTR_DATA_KEY]
+
+    def test_invalidation_with_key_reloads_only_that_bpn(self):
+        """Test that a notification for one BPN does not reload the other BPNs."""
+        with Session(self.engine) as session:
+            for bpn in ["BPNL3", "BPNL4"]:
+                session.add(self.manager.KnownDtrsModel(
+                    bpnl=bpn, edc_url="https://edc.example", asset_id="dtr-3",
+                    policies=[{"policy": "p"}], expires_at=datetime.now() + timedelta(hours=1)
+                ))
+            session.commit()
+
+        self.manager._on_invalidation("BPNL3")
+
+        assert "BPNL3" in self.manager.known_dtrs
+        assert "BPNL4" not in self.manager.known_dtrs
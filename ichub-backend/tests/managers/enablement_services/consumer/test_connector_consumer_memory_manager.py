@@ -0,0 +1,72 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock
+
+from managers.enablement_services.consumer.connector.memory import ConnectorConsumerMemoryManager
+
+
+class TestConnectorDiscoverySingleFlight:
+    """Test suite for the de-duplicated connector discovery."""
+
+    def _manager(self, stale_while_revalidate=False):
+        discovery = Mock()
+
+        def find_connector_by_bpn(bpn):
+            time.sleep(0.2)
+            return ["https://edc.example/api/v1/dsp"]
+
+        discovery.find_connector_by_bpn.side_effect = find_connector_by_bpn
+        manager = ConnectorConsumerMemoryManager(
+            connector_consumer_service=Mock(), connector_discovery=discovery,
+            logger=Mock(), stale_while_revalidate=stale_while_revalidate
+        )
+        return manager, discovery
+
+    def test_concurrent_get_connectors_discovers_once(self):
+        """Test that concurrent callers for an unknown BPN trigger a single discovery."""
+        manager, discovery = self._manager()
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(lambda _: manager.get_connectors("BPNL1"), range(8)))
+
+        assert discovery.find_connector_by_bpn.call_count == 1
+        assert all(result == ["https://edc.example/api/v1/dsp"] for result in results)
+
+    def test_stale_while_revalidate_returns_expired_entry(self):
+        """Test that expired connectors are served while one background refresh runs."""
+        manager, discovery = self._manager(stale_while_revalidate=True)
+        manager.known_connectors["BPNL1"] = {
+            manager.REFRESH_INTERVAL_KEY: 0,
+            manager.CONNECTOR_LIST_KEY: ["https://old-edc.example/api/v1/dsp"]
+        }
+
+        start = time.monotonic()
+        first = manager.get_connectors("BPNL1")
+        second = manager.get_connectors("BPNL1")
+
+        assert time.monotonic() - start < 0.15
+        assert first == second == ["https://old-edc.example/api/v1/dsp"]
+        time.sleep(0.3)
+        assert discovery.find_connector_by_bpn.call_count == 1
@@ -0,0 +1,223 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+import logging
+import time
+from datetime import datetime, timedelta
+from unittest.mock import Mock, patch
+
+from sqlalchemy import event, text, update
+from sqlalchemy.pool import StaticPool
+from sqlmodel import Session, create_engine, select
+
+from managers.enablement_services.consumer import ConsumerConnectorPostgresMemoryManager, ConsumerConnectorSyncPostgresMemoryManager
+
+BENCHMARK_BPNS = 10000
+BENCHMARK_CHANGED_BPNS = 10
+
+
+def _engine():
+    return create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+
+
+def _manager(engine, manager_class=ConsumerConnectorPostgresMemoryManager, **kwargs):
+    with patch.object(manager_class, "_trigger_save"), patch.object(manager_class, "_start_background_tasks", create=True):
+        manager = manager_class(
+            connector_consumer_service=Mock(), engine=engine, connector_discovery=Mock(),
+            logger=logging.getLogger(__name__), **kwargs
+        )
+    manager._trigger_save = Mock()
+    return manager
+
+
+class StatementCounter:
+    """Records the SQL statements executed on an engine."""
+
+    def __init__(self, engine):
+        self.engine = engine
+        self.statements = []
+        event.listen(engine, "before_cursor_execute", self._record)
+
+    def _record(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements.append(statement)
+
+    def close(self):
+        event.remove(self.engine, "before_cursor_execute", self._record)
+
+
+class TestConnectorConsumerPostgresMemoryManagerPersistence:
+    """Test suite for the incremental persistence of the connector consumer manager."""
+
+    def setup_method(self):
+        """Create a manager on an empty database and record the executed statements."""
+        self.engine = _engine()
+        self.manager = _manager(self.engine)
+        self.counter = StatementCounter(self.engine)
+
+    def teardown_method(self):
+        """Stop recording the statements after each test method."""
+        self.counter.close()
+
+    def _rows(self):
+        with Session(self.engine) as session:
+            return {row.bpnl: row.connectors for row in session.exec(select(self.manager.KnownConnectorsModel)).all()}
+
+    def test_only_changed_bpns_are_written(self):
+        """Test that a save does not touch the rows of unchanged BPNs."""
+        for bpn in ["BPNL1", "BPNL2", "BPNL3"]:
+            self.manager.add_connectors(bpn, [f"https://{bpn}.example"])
+        assert self.manager._save_to_db() == ["BPNL1", "BPNL2", "BPNL3"]
+        self.counter.statements.clear()
+
+        self.manager.delete_connector("BPNL2", "https://BPNL2.example")
+
+        assert self.manager._save_to_db() == ["BPNL2"]
+        assert not any(statement.lstrip().upper().startswith("DELETE") for statement in self.counter.statements)
+        assert self._rows() == {"BPNL1": ["https://BPNL1.example"], "BPNL2": [], "BPNL3": ["https://BPNL3.example"]}
+
+    def test_unchanged_cache_is_not_saved(self):
+        """Test that a save without changes does not execute any statement."""
+        self.manager.add_connectors("BPNL1", ["https://edc.example"])
+        self.manager._save_to_db()
+        self.counter.statements.clear()
+
+        assert self.manager._save_to_db() == []
+        assert self.counter.statements == []
+
+    def test_purged_bpns_are_deleted(self):
+        """Test that purging a BPN or the whole cache removes the rows."""
+        for bpn in ["BPNL1", "BPNL2"]:
+            self.manager.add_connectors(bpn, ["https://edc.example"])
+        self.manager._save_to_db()
+
+        self.manager.purge_bpn("BPNL1")
+        assert self.manager._save_to_db() == ["BPNL1"]
+        assert list(self._rows()) == ["BPNL2"]
+
+        self.manager.purge_cache()
+        assert self.manager._save_to_db() == [None]
+        assert self._rows() == {}
+
+    def test_changes_of_other_workers_are_loaded_incrementally(self):
+        """Test that a peer only reloads the BPNs changed since its last reload."""
+        peer = _manager(self.engine)
+        self.manager.add_connectors("BPNL1", ["https://edc.example"])
+        self.manager._save_to_db()
+        peer._last_loaded_at = datetime.now() - timedelta(hours=1)
+
+        assert peer._load_changes_from_db() == 1
+        assert peer.known_connectors["BPNL1"][peer.CONNECTOR_LIST_KEY] == ["https://edc.example"]
+
+    def test_outdated_table_is_recreated(self):
+        """Test that a table without the update time is replaced by the current layout."""
+        engine = _engine()
+        with engine.begin() as connection:
+            connection.execute(text("CREATE TABLE known_connectors (bpnl VARCHAR PRIMARY KEY, connectors JSON, expires_at DATETIME)"))
+
+        _manager(engine)
+
+        with engine.connect() as connection:
+            columns = [row[1] for row in connection.execute(text("PRAGMA table_info(known_connectors)"))]
+        assert "updated_at" in columns
+
+
+class TestConnectorConsumerSyncInvalidation:
+    """Test suite for the change notifications of the synchronized connector consumer manager."""
+
+    def setup_method(self):
+        """Set up test fixtures before each test method."""
+        self.engine = _engine()
+        self.channel = Mock()
+        self.manager = _manager(self.engine, ConsumerConnectorSyncPostgresMemoryManager, invalidation_channel=self.channel)
+
+    def test_saved_bpns_are_published(self):
+        """Test that each saved BPN is published so the peers only reload that BPN."""
+        self.manager.add_connectors("BPNL1", ["https://edc.example"])
+
+        self.manager._save_to_db()
+
+        self.channel.publish.assert_called_once_with("known_connectors", "BPNL1")
+
+    def test_large_changes_are_published_without_key(self):
+        """Test that many saved BPNs are published as one notification for the whole table."""
+        for i in range(self.manager.MAX_INVALIDATION_KEYS + 1):
+            self.manager.add_connectors(f"BPNL{i}", ["https://edc.example"])
+
+        self.manager._save_to_db()
+
+        self.channel.publish.assert_called_once_with("known_connectors")
+
+    def test_invalidation_with_key_reloads_only_that_bpn(self):
+        """Test that a notification for one BPN does not reload the other BPNs."""
+        writer = _manager(self.engine)
+        for bpn in ["BPNL1", "BPNL2"]:
+            writer.add_connectors(bpn, ["https://edc.example"])
+        writer._save_to_db()
+
+        self.manager._on_invalidation("BPNL1")
+
+        assert list(self.manager.known_connectors) == ["BPNL1"]
+
+
+class TestConnectorConsumerPersistenceBenchmark:
+    """Benchmark of one persistence cycle with a cache of 10k BPNs."""
+
+    def setup_method(self):
+        """Persist 10k BPNs and create a peer holding the same cache."""
+        self.engine = _engine()
+        self.writer = _manager(self.engine)
+        for i in range(BENCHMARK_BPNS):
+            self.writer.add_connectors(f"BPNL{i:012d}", [f"https://edc-{i}.example/api/v1/dsp"])
+        self.writer._save_to_db()
+        # The cache was filled well before the measured cycle
+        with Session(self.engine) as session:
+            model = self.writer.KnownConnectorsModel
+            session.exec(update(model).values(updated_at=datetime.now() - timedelta(hours=1)))
+            session.commit()
+        self.peer = _manager(self.engine)
+
+    def _cycle(self, reload):
+        """Change a few BPNs on the writer, save them and reload them on the peer."""
+        for i in range(BENCHMARK_CHANGED_BPNS):
+            self.writer.purge_bpn(f"BPNL{i:012d}")
+            self.writer.add_connectors(f"BPNL{i:012d}", ["https://changed.example/api/v1/dsp"])
+        counter = StatementCounter(self.engine)
+        start = time.perf_counter()
+        self.writer._save_to_db()
+        reload()
+        elapsed = time.perf_counter() - start
+        counter.close()
+        return elapsed, counter.statements
+
+    def test_incremental_cycle_cost(self):
+        """Test that a cycle only writes and reads the changed BPNs instead of the whole table."""
+        full_elapsed, _ = self._cycle(self.peer._load_from_db)
+        elapsed, statements = self._cycle(self.peer._load_changes_from_db)
+        logging.getLogger(__name__).info(
+            f"Persistence cycle with {BENCHMARK_BPNS} BPNs: {elapsed * 1000:.1f} ms incremental, {full_elapsed * 1000:.1f} ms with a full reload"
+        )
+
+        assert self.peer.known_connectors["BPNL000000000000"][self.peer.CONNECTOR_LIST_KEY] == ["https://changed.example/api/v1/dsp"]
+        assert len(self.peer.known_connectors) == BENCHMARK_BPNS
+        # One upsert, one query for the changed BPNs and one query for their rows
+        assert len(statements) <= 4
+        assert elapsed < full_elapsed
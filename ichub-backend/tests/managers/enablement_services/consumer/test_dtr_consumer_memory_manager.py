@@ -0,0 +1,281 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock
+
+import pytest
+
+from managers.enablement_services.consumer.dtr.memory import DtrConsumerMemoryManager
+from managers.enablement_services.consumer.dtr.pagination_manager import PaginationManager
+
+
+BPN = "BPNL0000000000AA"
+
+
+class TestDtrConsumerMemoryManagerDiscoverShells:
+    """Test suite for the concurrent DTR fan-out of discover_shells."""
+
+    @pytest.fixture
+    def manager(self):
+        """Create a memory manager with three cached DTRs."""
+        manager = DtrConsumerMemoryManager(
+            connector_consumer_manager=Mock(), logger=logging.getLogger(__name__), max_parallel_dtrs=3
+        )
+        for asset_id in ["dtr-1", "dtr-2", "dtr-3"]:
+            manager.add_dtr(bpn=BPN, connector_url=f"https://{asset_id}.example", asset_id=asset_id, policies=[{"policy": asset_id}])
+        return manager
+
+    @staticmethod
+    def _fake_process(delays, shells_per_dtr=2, cursors=None, calls=None):
+        """Build a replacement for _process_dtr_with_retry returning shells after a per DTR delay."""
+        def process(connector_service, counter_party_id, dtr, query_spec, dtr_policies, limit=None, cursor=None):
+            asset_id = dtr["asset_id"]
+            if calls is not None:
+                calls.append(asset_id)
+            time.sleep(delays.get(asset_id, 0))
+            shells = [f"{asset_id}-shell-{i}" for i in range(limit or shells_per_dtr)]
+            return {
+                "connectorUrl": dtr["connector_url"],
+                "assetId": asset_id,
+                "status": "connected",
+                "shellsFound": len(shells),
+                "shells": shells,
+                "paging_metadata": {"cursor": (cursors or {}).get(asset_id)}
+            }
+        return process
+
+    def test_results_are_merged_in_dtr_order(self, manager):
+        """Test that the slowest DTR finishing last does not change the result order."""
+        manager._process_dtr_with_retry = self._fake_process({"dtr-1": 0.2, "dtr-2": 0.1, "dtr-3": 0})
+
+        result = manager.discover_shells(BPN, query_spec=[])
+
+        assert [dtr["assetId"] for dtr in result["dtrs"]] == ["dtr-1", "dtr-2", "dtr-3"]
+
+    def test_dtrs_are_processed_concurrently(self, manager):
+        """Test that the DTRs are queried in parallel instead of one after the other."""
+        manager._process_dtr_with_retry = self._fake_process({"dtr-1": 0.3, "dtr-2": 0.3, "dtr-3": 0.3})
+
+        start = time.monotonic()
+        manager.discover_shells(BPN, query_spec=[])
+
+        assert time.monotonic() - start < 0.8
+
+    def test_max_parallel_dtrs_one_is_sequential(self, manager):
+        """Test that a pool size of one only runs a single DTR call at a time."""
+        manager.max_parallel_dtrs = 1
+        active = []
+        peak = []
+        lock = threading.Lock()
+        inner = self._fake_process({"dtr-1": 0.05, "dtr-2": 0.05, "dtr-3": 0.05})
+
+        def process(*args, **kwargs):
+            with lock:
+                active.append(1)
+                peak.append(len(active))
+            try:
+                return inner(*args, **kwargs)
+            finally:
+                with lock:
+                    active.pop()
+
+        manager._process_dtr_with_retry = process
+
+        manager.discover_shells(BPN, query_spec=[])
+
+        assert max(peak) == 1
+
+    def test_pagination_cursors_are_kept_per_dtr(self, manager):
+        """Test that the next page token contains the cursor of every DTR."""
+        manager._process_dtr_with_retry = self._fake_process(
+            {"dtr-1": 0.1}, cursors={"dtr-1": "c1", "dtr-3": "c3"}
+        )
+
+        result = manager.discover_shells(BPN, query_spec=[], limit=6)
+
+        page = PaginationManager.decode_page_token(result["pagination"]["next"])
+        assert page.dtr_states["dtr-1"].cursor == "c1"
+        assert page.dtr_states["dtr-2"].exhausted is True
+        assert page.dtr_states["dtr-3"].cursor == "c3"
+        assert len(result["dtrs"]) == 3
+
+    def test_limit_reached_cancels_outstanding_dtrs(self, manager):
+        """Test that the remaining DTR calls are cancelled once the limit is satisfied."""
+        manager.max_parallel_dtrs = 1
+        calls = []
+        manager._process_dtr_with_retry = self._fake_process({"dtr-2": 0.5}, calls=calls)
+
+        start = time.monotonic()
+        result = manager.discover_shells(BPN, query_spec=[], limit=1)
+
+        # The running call of dtr-2 is not awaited and dtr-3 never starts
+        assert time.monotonic() - start < 0.4
+        assert "dtr-3" not in calls
+        assert [dtr["assetId"] for dtr in result["dtrs"]] == ["dtr-1"]
+        page = PaginationManager.decode_page_token(result["pagination"]["next"])
+        assert page.dtr_states["dtr-3"].exhausted is False
+        assert page.dtr_states["dtr-3"].cursor is None
+
+    def test_deadline_reports_timeout_and_keeps_state(self, manager):
+        """Test that a DTR missing the deadline is reported and retried on the next page."""
+        manager._process_dtr_with_retry = self._fake_process({"dtr-2": 1.0}, cursors={"dtr-1": "c1"})
+
+        start = time.monotonic()
+        result = manager.discover_shells(BPN, query_spec=[], limit=6, timeout=0.3)
+
+        assert time.monotonic() - start < 0.9
+        statuses = {dtr["assetId"]: dtr["status"] for dtr in result["dtrs"]}
+        assert statuses == {"dtr-1": "connected", "dtr-2": "timeout", "dtr-3": "connected"}
+        page = PaginationManager.decode_page_token(result["pagination"]["next"])
+        assert page.dtr_states["dtr-2"].exhausted is False
+
+    def test_failing_dtr_does_not_break_discovery(self, manager):
+        """Test that an exception in one DTR call is reported as failed for that DTR only."""
+        inner = self._fake_process({})
+
+        def process(connector_service, counter_party_id, dtr, *args, **kwargs):
+            if dtr["asset_id"] == "dtr-2":
+                raise RuntimeError("boom")
+            return inner(connector_service, counter_party_id, dtr, *args, **kwargs)
+
+        manager._process_dtr_with_retry = process
+
+        result = manager.discover_shells(BPN, query_spec=[])
+
+        failed = [dtr for dtr in result["dtrs"] if dtr["status"] == "failed"]
+        assert len(failed) == 1
+        assert failed[0]["assetId"] == "dtr-2"
+        assert failed[0]["error"] == "boom"
+
+
+class TestDtrConsumerMemoryManagerShellDescriptors:
+    """Test suite for the shell descriptor fetching of the DTR consumer manager."""
+
+    def setup_method(self):
+        """Set up test fixtures before each test method."""
+        self.manager = DtrConsumerMemoryManager(connector_consumer_manager=Mock(), logger=logging.getLogger(__name__))
+
+    def teardown_method(self):
+        """Release the fetcher pool after each test method."""
+        self.manager.fetcher.close()
+
+    def test_fetch_shell_descriptors_reports_errors_per_shell(self):
+        """Test that failed shell fetches are reported by shell ID instead of being swallowed."""
+        def get(url, headers=None, timeout=None):
+            if url.endswith("c2hlbGwtMg=="):  # base64 of "shell-2"
+                return Mock(status_code=403)
+            if url.endswith("c2hlbGwtMw=="):  # base64 of "shell-3"
+                raise ConnectionError("connection reset")
+            return Mock(status_code=200, json=Mock(return_value={"id": "shell-1"}))
+
+        self.manager.fetcher.get = get
+
+        shells, errors = self.manager._fetch_shell_descriptors(
+            {"result": ["shell-1", "shell-2", "shell-3"]}, "https://dataplane.example", "token"
+        )
+
+        assert shells == [{"id": "shell-1"}]
+        assert errors == {"shell-2": "HTTP 403", "shell-3": "connection reset"}
+
+    def test_fetch_shell_descriptors_empty_lookup(self):
+        """Test that an empty lookup result does not schedule any request."""
+        self.manager.fetcher.get = Mock()
+
+        assert self.manager._fetch_shell_descriptors({"result": []}, "https://dataplane.example", "token") == ([], {})
+        self.manager.fetcher.get.assert_not_called()
+
+    def test_discover_shell_is_served_from_cache(self):
+        """Test that a cached shell skips the DSP negotiation with the DTRs."""
+        self.manager.add_dtr(bpn=BPN, connector_url="https://edc.example", asset_id="dtr-1", policies=[{"policy": "p"}])
+        connector_service = self.manager.connector_consumer_manager.connector_service
+        connector_service.do_dsp.return_value = ("https://dataplane.example", "token")
+        self.manager.fetcher.get = Mock(return_value=Mock(status_code=200, json=Mock(return_value={"id": "shell-1"})))
+
+        first = self.manager.discover_shell(BPN, "shell-1")
+        second = self.manager.discover_shell(BPN, "shell-1")
+
+        assert first == second
+        assert second["dtr"] == {"connectorUrl": "https://edc.example", "assetId": "dtr-1"}
+        connector_service.do_dsp.assert_called_once()
+        assert self.manager.get_shell_cache_stats()["hits"] == 1
+
+    def test_cached_shell_skips_the_dtr_discovery(self):
+        """Test that a cached shell is returned without looking up the DTRs of the partner."""
+        self.manager.shell_descriptors.put((BPN, "shell-1"), {"id": "shell-1"}, dtr={"connectorUrl": "https://edc.example", "assetId": "dtr-1"})
+        self.manager.get_dtrs = Mock(return_value=[])
+
+        result = self.manager.discover_shell(BPN, "shell-1")
+
+        assert result["shell_descriptor"] == {"id": "shell-1"}
+        self.manager.get_dtrs.assert_not_called()
+
+    def test_changing_a_response_does_not_change_the_cache(self):
+        """Test that the shell descriptors of the responses are copies of the cached ones."""
+        self.manager.add_dtr(bpn=BPN, connector_url="https://edc.example", asset_id="dtr-1", policies=[{"policy": "p"}])
+        self.manager.connector_consumer_manager.connector_service.do_dsp.return_value = ("https://dataplane.example", "token")
+        self.manager.fetcher.get = Mock(return_value=Mock(status_code=200, json=Mock(return_value={"id": "shell-1", "submodelDescriptors": []})))
+
+        self.manager.discover_shell(BPN, "shell-1")["shell_descriptor"]["submodelDescriptors"].append("fetched")
+        self.manager.discover_shell(BPN, "shell-1")["shell_descriptor"]["submodelDescriptors"].append("cached")
+
+        assert self.manager.discover_shell(BPN, "shell-1")["shell_descriptor"] == {"id": "shell-1", "submodelDescriptors": []}
+
+
+class TestDtrConsumerMemoryManagerGetDtrs:
+    """Test suite for the DTR discovery of the DTR consumer manager."""
+
+    def setup_method(self):
+        """Set up test fixtures before each test method."""
+        self.connector_manager = Mock()
+        self.connector_manager.get_connectors.return_value = ["https://edc.example/api/v1/dsp"]
+        self.manager = DtrConsumerMemoryManager(connector_consumer_manager=self.connector_manager, logger=logging.getLogger(__name__))
+        self.catalog_calls = []
+
+        def get_catalogs(**kwargs):
+            self.catalog_calls.append(kwargs["counter_party_id"])
+            time.sleep(0.2)
+            return {"https://edc.example/api/v1/dsp": {self.manager.DCAT_DATASET_KEY: [{self.manager.ID_KEY: "dtr-asset"}]}}
+
+        self.manager.get_catalogs_by_filter_expression = get_catalogs
+        self.manager._is_dtr_asset = Mock(return_value=True)
+        self.manager._extract_policies = Mock(return_value=[{"policy": "p"}])
+
+    def test_discovery_runs_without_verbose_logging(self):
+        """Test that the DTRs are discovered independently of the logging configuration."""
+        dtrs = self.manager.get_dtrs(BPN)
+
+        assert [dtr["asset_id"] for dtr in dtrs] == ["dtr-asset"]
+
+    def test_concurrent_get_dtrs_discovers_once(self):
+        """Test that concurrent callers for an unknown BPN share one discovery."""
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(lambda _: self.manager.get_dtrs(BPN), range(8)))
+
+        assert self.catalog_calls == [BPN]
+        assert all([dtr["asset_id"] for dtr in result] == ["dtr-asset"] for result in results)
+        # Every caller receives its own copy
+        results[0][0]["asset_id"] = "changed"
+        assert results[1][0]["asset_id"] == "dtr-asset"
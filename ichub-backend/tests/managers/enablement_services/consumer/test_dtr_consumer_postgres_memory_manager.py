@@ -0,0 +1,164 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+import logging
+from datetime import datetime, timedelta
+from unittest.mock import Mock, patch
+
+from sqlalchemy import event, text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.pool import StaticPool
+from sqlmodel import Session, create_engine, select
+
+from managers.enablement_services.consumer import DtrConsumerPostgresMemoryManager
+
+
+class TestDtrConsumerPostgresMemoryManagerPersistence:
+    """Test suite for the incremental persistence of the DTR consumer manager."""
+
+    def setup_method(self):
+        """Create a manager on an empty database and record the executed statements."""
+        self.engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+        with patch.object(DtrConsumerPostgresMemoryManager, "_trigger_save"):
+            self.manager = DtrConsumerPostgresMemoryManager(
+                engine=self.engine, connector_consumer_manager=Mock(), logger=logging.getLogger(__name__)
+            )
+        self.manager._trigger_save = Mock()
+        self.statements = []
+        event.listen(self.engine, "before_cursor_execute", self._record)
+
+    def teardown_method(self):
+        """Release the fetcher pool after each test method."""
+        event.remove(self.engine, "before_cursor_execute", self._record)
+        self.manager.fetcher.close()
+
+    def _record(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements.append(statement)
+
+    def _rows(self):
+        with Session(self.engine) as session:
+            return {(row.bpnl, row.asset_id) for row in session.exec(select(self.manager.KnownDtrsModel)).all()}
+
+    def _add_row(self, bpn, asset_id, updated_at=None):
+        with Session(self.engine) as session:
+            session.add(self.manager.KnownDtrsModel(
+                bpnl=bpn, edc_url="https://edc.example", asset_id=asset_id, policies=[{"policy": "p"}],
+                expires_at=datetime.now() + timedelta(hours=1), updated_at=updated_at or datetime.now()
+            ))
+            session.commit()
+
+    def test_several_dtrs_are_kept_per_bpn(self):
+        """Test that every DTR of a BPN is persisted instead of only the last one."""
+        self.manager.add_dtr("BPNL1", "https://edc.example", "dtr-1", [{"policy": "p"}])
+        self.manager.add_dtr("BPNL1", "https://edc.example", "dtr-2", [{"policy": "p"}])
+
+        assert self.manager._save_to_db() == ["BPNL1"]
+        assert self._rows() == {("BPNL1", "dtr-1"), ("BPNL1", "dtr-2")}
+
+    def test_only_changed_bpns_are_written(self):
+        """Test that a save does not touch the rows of unchanged BPNs."""
+        for bpn in ["BPNL1", "BPNL2", "BPNL3"]:
+            self.manager.add_dtr(bpn, "https://edc.example", "dtr-1", [{"policy": "p"}])
+        self.manager._save_to_db()
+        self.statements.clear()
+
+        self.manager.add_dtr("BPNL2", "https://edc.example", "dtr-2", [{"policy": "p"}])
+
+        assert self.manager._save_to_db() == ["BPNL2"]
+        written = [statement for statement in self.statements if not statement.lstrip().upper().startswith("SELECT")]
+        assert written and all("BPNL1" not in statement and "BPNL3" not in statement for statement in written)
+        assert not any(statement.lstrip().upper().startswith("DELETE") and "WHERE" not in statement.upper() for statement in written)
+        assert self._rows() == {("BPNL1", "dtr-1"), ("BPNL2", "dtr-1"), ("BPNL2", "dtr-2"), ("BPNL3", "dtr-1")}
+
+    def test_unchanged_cache_is_not_saved(self):
+        """Test that a save without changes does not execute any statement."""
+        self.manager.add_dtr("BPNL1", "https://edc.example", "dtr-1", [{"policy": "p"}])
+        self.manager._save_to_db()
+        self.statements.clear()
+
+        assert self.manager._save_to_db() == []
+        assert self.statements == []
+
+    def test_deleted_dtrs_and_bpns_are_removed(self):
+        """Test that deleting a DTR or purging a BPN only deletes their rows."""
+        self.manager.add_dtr("BPNL1", "https://edc.example", "dtr-1", [{"policy": "p"}])
+        self.manager.add_dtr("BPNL1", "https://edc.example", "dtr-2", [{"policy": "p"}])
+        self.manager.add_dtr("BPNL2", "https://edc.example", "dtr-1", [{"policy": "p"}])
+        self.manager._save_to_db()
+
+        self.manager.delete_dtr("BPNL1", "dtr-1")
+        self.manager.purge_bpn("BPNL2")
+
+        assert self.manager._save_to_db() == ["BPNL1", "BPNL2"]
+        assert self._rows() == {("BPNL1", "dtr-2")}
+
+    def test_purged_cache_empties_the_table(self):
+        """Test that purging the whole cache deletes every row."""
+        self.manager.add_dtr("BPNL1", "https://edc.example", "dtr-1", [{"policy": "p"}])
+        self.manager._save_to_db()
+
+        self.manager.purge_cache()
+
+        assert self.manager._save_to_db() == [None]
+        assert self._rows() == set()
+
+    def test_failed_save_is_retried(self):
+        """Test that the changes of a failed save are written by the next save."""
+        self.manager.add_dtr("BPNL1", "https://edc.example", "dtr-1", [{"policy": "p"}])
+        with patch.object(self.manager, "_upsert_rows", side_effect=OperationalError("INSERT", {}, Exception("connection lost"))):
+            assert self.manager._save_to_db() == []
+
+        assert self.manager._save_to_db() == ["BPNL1"]
+        assert self._rows() == {("BPNL1", "dtr-1")}
+
+    def test_changes_are_loaded_incrementally(self):
+        """Test that only the BPNs written since the last reload are loaded."""
+        self._add_row("BPNL1", "dtr-1", updated_at=datetime.now() - timedelta(hours=1))
+        self._add_row("BPNL2", "dtr-1")
+        self.manager._last_loaded_at = datetime.now() - timedelta(minutes=5)
+
+        assert self.manager._load_changes_from_db() == 1
+        assert list(self.manager.known_dtrs) == ["BPNL2"]
+
+    def test_reload_keeps_unsaved_changes(self):
+        """Test that reloading does not overwrite changes not yet persisted."""
+        self._add_row("BPNL1", "dtr-db")
+        self.manager.add_dtr("BPNL1", "https://edc.example", "dtr-memory", [{"policy": "p"}])
+
+        self.manager._load_from_db()
+        self.manager._load_bpns_from_db(["BPNL1"])
+
+        assert list(self.manager.known_dtrs["BPNL1"][self.manager.DTR_DATA_KEY]) == ["dtr-memory"]
+
+    def test_outdated_table_is_recreated(self):
+        """Test that a table keyed by the BPN only is replaced by the current layout."""
+        engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+        with engine.begin() as connection:
+            connection.execute(text("CREATE TABLE known_dtrs (bpnl VARCHAR PRIMARY KEY, edc_url VARCHAR, asset_id VARCHAR, policies JSON, expires_at DATETIME)"))
+
+        with patch.object(DtrConsumerPostgresMemoryManager, "_trigger_save"):
+            manager = DtrConsumerPostgresMemoryManager(engine=engine, connector_consumer_manager=Mock(), logger=logging.getLogger(__name__))
+        manager.fetcher.close()
+
+        with engine.connect() as connection:
+            columns = [row[1] for row in connection.execute(text("PRAGMA table_info(known_dtrs)"))]
+        assert "updated_at" in columns
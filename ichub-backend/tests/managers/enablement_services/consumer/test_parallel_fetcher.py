@@ -0,0 +1,99 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+import threading
+import time
+from unittest.mock import Mock, patch
+
+from managers.enablement_services.consumer.dtr.parallel_fetcher import ParallelFetcher
+
+
+class TestParallelFetcher:
+    """Test suite for the shared bounded fetcher of the consumer DTR manager."""
+
+    def setup_method(self):
+        """Set up test fixtures before each test method."""
+        self.fetcher = ParallelFetcher(max_workers=4, timeout=5)
+
+    def teardown_method(self):
+        """Release the pool after each test method."""
+        self.fetcher.close()
+
+    def test_run_all_is_bounded_by_max_workers(self):
+        """Test that no more than max_workers tasks run at the same time."""
+        active = []
+        peak = []
+        lock = threading.Lock()
+
+        def task():
+            with lock:
+                active.append(1)
+                peak.append(len(active))
+            time.sleep(0.02)
+            with lock:
+                active.pop()
+            return True
+
+        results = self.fetcher.run_all({str(i): task for i in range(40)})
+
+        assert len(results) == 40
+        assert max(peak) <= 4
+
+    def test_run_all_reports_errors_per_key(self):
+        """Test that a failing task is reported with its error instead of being dropped."""
+        def fail():
+            raise ValueError("HTTP 404")
+
+        results = self.fetcher.run_all({"a": lambda: 1, "b": fail, "c": lambda: 3})
+
+        assert list(results) == ["a", "b", "c"]
+        assert results["a"].ok and results["a"].value == 1
+        assert not results["b"].ok and results["b"].error == "HTTP 404"
+        assert results["c"].value == 3
+
+    def test_run_all_timeout(self):
+        """Test that tasks exceeding the timeout are reported as timed out."""
+        results = self.fetcher.run_all({"slow": lambda: time.sleep(0.5), "fast": lambda: "ok"}, timeout=0.1)
+
+        assert results["fast"].value == "ok"
+        assert not results["slow"].ok
+        assert "Timeout" in results["slow"].error
+
+    def test_sessions_are_reused_per_host(self):
+        """Test that one keep-alive session is kept per dataplane host."""
+        first = self.fetcher.get_session("https://dataplane-a.example/api/public/shell-descriptors/1")
+        second = self.fetcher.get_session("https://dataplane-a.example/api/public/shell-descriptors/2")
+        other = self.fetcher.get_session("https://dataplane-b.example/api/public")
+
+        assert first is second
+        assert first is not other
+
+    @patch('managers.enablement_services.consumer.dtr.parallel_fetcher.HttpTools.do_get_with_session')
+    def test_get_uses_pooled_session_and_default_timeout(self, mock_get):
+        """Test that GET requests go through the host session with the configured timeout."""
+        mock_get.return_value = Mock(status_code=200)
+
+        self.fetcher.get("https://dataplane-a.example/x", headers={"Authorization": "token"})
+
+        kwargs = mock_get.call_args.kwargs
+        assert kwargs["session"] is self.fetcher.get_session("https://dataplane-a.example")
+        assert kwargs["timeout"] == 5
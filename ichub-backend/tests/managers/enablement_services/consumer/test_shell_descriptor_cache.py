@@ -0,0 +1,98 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+from unittest.mock import patch
+
+from managers.enablement_services.consumer.dtr.shell_descriptor_cache import ShellDescriptorCache
+
+
+class TestShellDescriptorCache:
+    """Test suite for the bounded shell descriptor cache."""
+
+    def test_put_and_get(self):
+        """Test that a stored descriptor is returned together with its DTR."""
+        cache = ShellDescriptorCache()
+        cache.put(("BPNL1", "shell-1"), {"id": "shell-1"}, dtr={"connectorUrl": "https://edc", "assetId": "dtr"})
+
+        entry = cache.get_entry(("BPNL1", "shell-1"))
+
+        assert entry.descriptor == {"id": "shell-1"}
+        assert entry.dtr == {"connectorUrl": "https://edc", "assetId": "dtr"}
+        assert cache.get(("BPNL2", "shell-1")) is None
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+    def test_lru_eviction_by_entries(self):
+        """Test that the least recently used entry is evicted when max_entries is exceeded."""
+        cache = ShellDescriptorCache(max_entries=2)
+        cache.put("a", {"id": "a"})
+        cache.put("b", {"id": "b"})
+        cache.get("a")
+        cache.put("c", {"id": "c"})
+
+        assert "a" in cache
+        assert "b" not in cache
+        assert "c" in cache
+        assert cache.stats()["evictions"] == 1
+
+    def test_eviction_by_bytes(self):
+        """Test that entries are evicted until the total size fits into max_bytes."""
+        cache = ShellDescriptorCache(max_entries=100, max_bytes=100)
+        cache.put("a", {"payload": "x" * 40})
+        cache.put("b", {"payload": "y" * 40})
+        cache.put("c", {"payload": "z" * 40})
+
+        stats = cache.stats()
+        assert stats["bytes"] <= 100
+        assert "a" not in cache
+        assert "c" in cache
+
+    def test_descriptor_larger_than_limit_is_not_cached(self):
+        """Test that a single oversized descriptor does not flush the whole cache."""
+        cache = ShellDescriptorCache(max_bytes=50)
+        cache.put("small", {"id": "s"})
+        cache.put("huge", {"payload": "x" * 100})
+
+        assert "small" in cache
+        assert "huge" not in cache
+
+    def test_ttl_expiration(self):
+        """Test that expired entries are reported as misses and removed."""
+        cache = ShellDescriptorCache(ttl=10)
+        with patch('managers.enablement_services.consumer.dtr.shell_descriptor_cache.time.monotonic', return_value=100.0):
+            cache.put("a", {"id": "a"})
+        with patch('managers.enablement_services.consumer.dtr.shell_descriptor_cache.time.monotonic', return_value=111.0):
+            assert cache.get("a") is None
+
+        stats = cache.stats()
+        assert stats["entries"] == 0
+        assert stats["bytes"] == 0
+        assert stats["expirations"] == 1
+
+    def test_replacing_entry_keeps_size_consistent(self):
+        """Test that overwriting a key does not leak its previous size."""
+        cache = ShellDescriptorCache()
+        cache.put("a", {"payload": "x" * 10})
+        cache.put("a", {"payload": "x"})
+
+        assert len(cache) == 1
+        assert cache.stats()["bytes"] == len('{"payload":"x"}')
@@ -0,0 +1,94 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from managers.enablement_services.consumer.single_flight import SingleFlight
+
+
+class TestSingleFlight:
+    """Test suite for the per-key call de-duplication."""
+
+    def test_concurrent_callers_share_one_call(self):
+        """Test that concurrent calls for the same key run the function once."""
+        flight = SingleFlight()
+        calls = []
+
+        def slow(key):
+            calls.append(key)
+            time.sleep(0.2)
+            return [key]
+
+        with ThreadPoolExecutor(max_workers=10) as executor:
+            results = list(executor.map(lambda _: flight.do("BPNL1", slow, "BPNL1"), range(10)))
+
+        assert calls == ["BPNL1"]
+        assert all(result == ["BPNL1"] for result in results)
+        assert not flight.in_flight("BPNL1")
+
+    def test_different_keys_run_independently(self):
+        """Test that calls for different keys are not de-duplicated."""
+        flight = SingleFlight()
+        calls = []
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            list(executor.map(lambda key: flight.do(key, lambda: calls.append(key) or time.sleep(0.1)), ["a", "b"]))
+
+        assert sorted(calls) == ["a", "b"]
+
+    def test_error_is_shared_with_waiters(self):
+        """Test that the waiting callers receive the exception of the leader."""
+        flight = SingleFlight()
+        started = threading.Event()
+
+        def fail():
+            started.set()
+            time.sleep(0.1)
+            raise RuntimeError("discovery failed")
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            leader = executor.submit(flight.do, "k", fail)
+            started.wait()
+            waiter = executor.submit(flight.do, "k", fail)
+            with pytest.raises(RuntimeError):
+                leader.result()
+            with pytest.raises(RuntimeError):
+                waiter.result()
+
+    def test_do_async_starts_only_one_refresh(self):
+        """Test that a background call is not started twice for the same key."""
+        flight = SingleFlight()
+        release = threading.Event()
+
+        assert flight.do_async("k", release.wait) is True
+        assert flight.do_async("k", release.wait) is False
+        release.set()
+        for _ in range(50):
+            if not flight.in_flight("k"):
+                break
+            time.sleep(0.01)
+        assert not flight.in_flight("k")
+
@@ -0,0 +1,93 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+
+from unittest.mock import Mock
+from uuid import uuid4
+
+import pytest
+from tractusx_sdk.industry.models.aas.v3 import (
+    Reference, ReferenceKey, ReferenceKeyTypes, ReferenceTypes, Result, ShellDescriptor, SpecificAssetId
+)
+
+from managers.enablement_services.provider.dtr_provider_manager import DtrProviderManager
+from tools.exceptions import ExternalAPIError
+
+MANUFACTURER = "BPNL000000000001"
+
+
+def _asset_id(name, *bpns):
+    keys = [ReferenceKey(type=ReferenceKeyTypes.GLOBAL_REFERENCE, value=bpn) for bpn in bpns]
+    return SpecificAssetId(name=name, value=f"{name}-value", externalSubjectId=Reference(type=ReferenceTypes.EXTERNAL_REFERENCE, keys=keys))
+
+
+def _bpns(specific_asset_ids):
+    return {sa_id.name: [key.value for key in sa_id.external_subject_id.keys] for sa_id in specific_asset_ids}
+
+
+class TestUpdateShellDescriptorShares:
+    """Test suite for sharing and unsharing the specific asset IDs of a shell descriptor."""
+
+    def setup_method(self):
+        self.manager = DtrProviderManager.__new__(DtrProviderManager)
+        self.manager.aas_service = Mock()
+        self.shell = ShellDescriptor(id=uuid4().urn, specificAssetIds=[
+            _asset_id("manufacturerId", MANUFACTURER),
+            _asset_id("partInstanceId", MANUFACTURER, "BPNL000000000002"),
+            _asset_id("customerPartId", "BPNL000000000002"),
+        ])
+        self.manager.aas_service.get_asset_administration_shell_descriptor_by_id.return_value = self.shell
+
+    def test_share_adds_the_partners_except_to_customer_part_ids(self):
+        """Test that the partners are added once to every specific asset ID but the customerPartId."""
+        assert self.manager.update_shell_descriptor_shares(uuid4(), MANUFACTURER, share_with=["BPNL000000000002", "BPNL000000000003"])
+
+        assert _bpns(self.shell.specific_asset_ids) == {
+            "manufacturerId": [MANUFACTURER, "BPNL000000000002", "BPNL000000000003"],
+            "partInstanceId": [MANUFACTURER, "BPNL000000000002", "BPNL000000000003"],
+            "customerPartId": ["BPNL000000000002"],
+        }
+        self.manager.aas_service.update_asset_administration_shell_descriptor.assert_called_once()
+
+    def test_unchanged_shell_is_not_updated(self):
+        """Test that no update is sent to the DTR when the specific asset IDs do not change."""
+        assert not self.manager.update_shell_descriptor_shares(uuid4(), MANUFACTURER, share_with=["BPNL000000000002"], asset_id_names=["partInstanceId"])
+        assert not self.manager.update_shell_descriptor_shares(uuid4(), MANUFACTURER, unshare_with=["BPNL000000000009"])
+
+        self.manager.aas_service.update_asset_administration_shell_descriptor.assert_not_called()
+
+    def test_unshare_keeps_the_manufacturer(self):
+        """Test that unsharing never removes the manufacturer and falls back to it on the last partner."""
+        assert self.manager.update_shell_descriptor_shares(uuid4(), MANUFACTURER, unshare_with=["BPNL000000000002", MANUFACTURER])
+
+        assert _bpns(self.shell.specific_asset_ids) == {
+            "manufacturerId": [MANUFACTURER],
+            "partInstanceId": [MANUFACTURER],
+            "customerPartId": [MANUFACTURER],
+        }
+
+    def test_missing_shell_raises(self):
+        """Test that a shell descriptor missing in the DTR is reported."""
+        self.manager.aas_service.get_asset_administration_shell_descriptor_by_id.return_value = Mock(spec=Result, **{"to_json_string.return_value": "{}"})
+
+        with pytest.raises(ExternalAPIError):
+            self.manager.update_shell_descriptor_shares(uuid4(), MANUFACTURER, share_with=["BPNL000000000002"])
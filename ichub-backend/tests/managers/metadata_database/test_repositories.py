@@ -0,0 +1,405 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+from datetime import datetime, timedelta
+from unittest.mock import Mock, patch
+
+import pytest
+
+from sqlalchemy.pool import StaticPool
+from sqlmodel import Session, SQLModel, create_engine
+
+from managers.metadata_database.repositories import (
+    CatalogPartRepository, SerializedPartRepository, TwinRepository, BusinessPartnerRepository, TwinExchangeRepository, TwinRegistrationRepository
+)
+from models.metadata_database.provider.models import (
+    BusinessPartner, CatalogPart, DataExchangeAgreement, EnablementServiceStack, LegalEntity,
+    PartnerCatalogPart, SerializedPart, Twin, TwinAspect, TwinAspectRegistration, TwinExchange, TwinRegistration
+)
+from models.services.provider.part_management import PartSearchField, PartSearchResultType
+from tests.managers.metadata_database.statement_counter import count_statements
+
+# The DTR and connector modules connect to the database on import
+with patch.dict('sys.modules', {'dtr': Mock(), 'connector': Mock()}):
+    from managers.metadata_database.manager import RepositoryManager
+    from services.provider import part_management_service, twin_management_service
+
+PARTS = 25
+CREATED = datetime(2025, 1, 1)
+
+
+class TestKeysetPagination:
+    """Test suite for the keyset pagination of the provider repositories."""
+
+    @classmethod
+    def setup_class(cls):
+        """Create the serialized parts, several of them sharing the same creation date."""
+        cls.engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+        SQLModel.metadata.create_all(cls.engine)
+        with Session(cls.engine) as session:
+            legal_entity = LegalEntity(bpnl="BPNL000000000001")
+            business_partner = BusinessPartner(name="partner", bpnl="BPNL000000000002")
+            session.add_all([legal_entity, business_partner])
+            session.flush()
+            catalog_part = CatalogPart(manufacturer_part_id="PART", legal_entity_id=legal_entity.id)
+            session.add(catalog_part)
+            session.flush()
+            partner_catalog_part = PartnerCatalogPart(business_partner_id=business_partner.id, catalog_part_id=catalog_part.id, customer_part_id="CUST")
+            stack = EnablementServiceStack(name="stack", legal_entity_id=legal_entity.id)
+            agreement = DataExchangeAgreement(name="agreement", business_partner_id=business_partner.id)
+            session.add_all([partner_catalog_part, stack, agreement])
+            session.flush()
+            for i in range(PARTS):
+                # Groups of three parts share a creation date so the ID has to break the ties
+                created_date = CREATED + timedelta(minutes=i // 3)
+                twin = Twin(created_date=created_date)
+                session.add(twin)
+                session.flush()
+                session.add(SerializedPart(
+                    partner_catalog_part_id=partner_catalog_part.id, part_instance_id=f"SN{i:03d}",
+                    twin_id=twin.id, created_date=created_date
+                ))
+                # Every twin is registered in two stacks and shared twice, the joins must not duplicate rows
+                session.add(TwinRegistration(twin_id=twin.id, enablement_service_stack_id=stack.id, dtr_registered=True))
+                session.add(TwinExchange(twin_id=twin.id, data_exchange_agreement_id=agreement.id))
+            TwinRepository(session).refresh_status()
+            session.commit()
+
+    def _pages(self, fetch, keyset, limit):
+        """Fetch all pages with limit + 1 rows, as the services do."""
+        pages, after = [], None
+        while True:
+            rows = fetch(limit=limit + 1, after=after)
+            pages.append(rows[:limit])
+            if len(rows) <= limit:
+                return pages
+            after = keyset(rows[limit - 1])
+
+    def test_serialized_parts_are_paged_without_gaps_or_duplicates(self):
+        """Test that walking the pages returns every serialized part once, newest first."""
+        with Session(self.engine) as session:
+            repository = SerializedPartRepository(session)
+            pages = self._pages(repository.find_with_status, lambda row: (row[0].created_date, row[0].id), limit=4)
+            part_instance_ids = [part.part_instance_id for page in pages for part, _ in page]
+            statuses = {status for page in pages for _, status in page}
+
+        assert len(pages) == 7
+        assert part_instance_ids == [f"SN{i:03d}" for i in reversed(range(PARTS))]
+        assert statuses == {3}
+
+    def test_serialized_part_twins_are_paged_without_gaps_or_duplicates(self):
+        """Test that the twin listing is paged on the same keyset."""
+        with Session(self.engine) as session:
+            repository = TwinRepository(session)
+
+            def fetch(limit, after):
+                return repository.find_serialized_part_twins(limit=limit, after=after, include_data_exchange_agreements=True)
+
+            pages = self._pages(fetch, lambda twin: (twin.created_date, twin.id), limit=10)
+            twin_ids = [twin.id for page in pages for twin in page]
+
+        assert [len(page) for page in pages] == [10, 10, 5]
+        assert twin_ids == sorted(twin_ids, reverse=True)
+        assert len(set(twin_ids)) == PARTS
+
+    def test_page_query_uses_keyset_instead_of_offset(self):
+        """Test that a deep page is requested by keyset and not by skipping rows."""
+        with count_statements(self.engine) as statements:
+            with Session(self.engine) as session:
+                SerializedPartRepository(session).find_with_status(limit=5, after=(CREATED + timedelta(minutes=5), 10))
+
+        assert "(serialized_part.created_date, serialized_part.id) < (?, ?)" in statements[0]
+        assert "DISTINCT" not in statements[0].upper()
+
+    def test_find_all_continues_after_the_last_id(self):
+        """Test that the generic listing pages by ID."""
+        with Session(self.engine) as session:
+            repository = BusinessPartnerRepository(session)
+            first = repository.find_all(limit=1)
+
+            assert [partner.bpnl for partner in first] == ["BPNL000000000002"]
+            assert repository.find_all(limit=1, after_id=first[0].id) == []
+
+
+class TestTwinStatus:
+    """Test suite for the status maintained on the twins."""
+
+    def test_status_follows_the_transitions(self):
+        """Test that refreshing after each transition moves the loaded twin from draft to shared."""
+        engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+        SQLModel.metadata.create_all(engine)
+        with Session(engine) as session:
+            legal_entity = LegalEntity(bpnl="BPNL000000000001")
+            business_partner = BusinessPartner(name="partner", bpnl="BPNL000000000002")
+            session.add_all([legal_entity, business_partner])
+            session.flush()
+            stack = EnablementServiceStack(name="stack", legal_entity_id=legal_entity.id)
+            agreement = DataExchangeAgreement(name="agreement", business_partner_id=business_partner.id)
+            twin = Twin()
+            session.add_all([stack, agreement, twin])
+            session.flush()
+            twin_repository = TwinRepository(session)
+            statuses = [twin.status]
+
+            registration = TwinRegistrationRepository(session).create_new(twin_id=twin.id, enablement_service_stack_id=stack.id)
+            twin_repository.refresh_status([twin.id])
+            statuses.append(twin.status)
+
+            registration.dtr_registered = True
+            twin_repository.refresh_status([twin.id])
+            statuses.append(twin.status)
+
+            TwinExchangeRepository(session).create_new(twin_id=twin.id, data_exchange_agreement_id=agreement.id)
+            twin_repository.refresh_status([twin.id])
+            statuses.append(twin.status)
+
+        assert statuses == [0, 1, 2, 3]
+
+    def test_parts_are_filtered_on_the_stored_status(self):
+        """Test that the status filter reads twin.status, parts without a twin being drafts."""
+        engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+        SQLModel.metadata.create_all(engine)
+        with Session(engine) as session:
+            legal_entity = LegalEntity(bpnl="BPNL000000000001")
+            draft_twin, registered_twin = Twin(), Twin(status=2)
+            session.add_all([legal_entity, draft_twin, registered_twin])
+            session.flush()
+            session.add_all([
+                CatalogPart(manufacturer_part_id="NO-TWIN", legal_entity_id=legal_entity.id),
+                CatalogPart(manufacturer_part_id="DRAFT", legal_entity_id=legal_entity.id, twin_id=draft_twin.id),
+                CatalogPart(manufacturer_part_id="REGISTERED", legal_entity_id=legal_entity.id, twin_id=registered_twin.id),
+            ])
+            session.commit()
+
+            repository = CatalogPartRepository(session)
+            with count_statements(engine) as statements:
+                listing = {
+                    status: [row["manufacturer_part_id"] for row in repository.find_listing(["manufacturer_part_id", "status"], status=status)]
+                    for status in range(4)
+                }
+            parts = {part.manufacturer_part_id: status for part, status in repository.find_by_manufacturer_id_manufacturer_part_id(None, None, status=0)}
+
+        assert listing == {0: ["NO-TWIN", "DRAFT"], 1: [], 2: ["REGISTERED"], 3: []}
+        assert parts == {"NO-TWIN": 0, "DRAFT": 0}
+        # The CASE deriving the status is only selected, the filter compares the indexed column
+        assert all(statement.upper().count("CASE") == 1 for statement in statements)
+        assert "twin.status = ?" in statements[0]
+
+
+TWINS = 1000
+
+
+class TestTwinLoadProfiles:
+    """Test suite for the number of queries needed to list the twins."""
+
+    @classmethod
+    def setup_class(cls):
+        """Create catalog part twins and serialized part twins, each shared, registered and with an aspect."""
+        cls.engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+        SQLModel.metadata.create_all(cls.engine)
+        with Session(cls.engine) as session:
+            legal_entity = LegalEntity(bpnl="BPNL000000000001")
+            business_partners = [BusinessPartner(name=f"partner{i}", bpnl=f"BPNL00000000001{i}") for i in range(3)]
+            session.add(legal_entity)
+            session.add_all(business_partners)
+            session.flush()
+            stack = EnablementServiceStack(name="stack", legal_entity_id=legal_entity.id)
+            agreements = [DataExchangeAgreement(name="agreement", business_partner_id=partner.id) for partner in business_partners]
+            session.add(stack)
+            session.add_all(agreements)
+            session.flush()
+
+            partner_catalog_parts = []
+            for i in range(10):
+                catalog_twin = Twin()
+                session.add(catalog_twin)
+                session.flush()
+                catalog_part = CatalogPart(manufacturer_part_id=f"PART{i}", legal_entity_id=legal_entity.id, twin_id=catalog_twin.id)
+                session.add(catalog_part)
+                session.flush()
+                for partner in business_partners:
+                    partner_catalog_part = PartnerCatalogPart(business_partner_id=partner.id, catalog_part_id=catalog_part.id, customer_part_id=f"CUST{i}-{partner.id}")
+                    session.add(partner_catalog_part)
+                    partner_catalog_parts.append(partner_catalog_part)
+                cls._decorate(session, catalog_twin, stack, agreements[i % 3])
+            session.flush()
+
+            for i in range(TWINS):
+                twin = Twin()
+                session.add(twin)
+                session.flush()
+                session.add(SerializedPart(
+                    partner_catalog_part_id=partner_catalog_parts[i % len(partner_catalog_parts)].id,
+                    part_instance_id=f"SN{i:04d}", twin_id=twin.id
+                ))
+                cls._decorate(session, twin, stack, agreements[i % 3])
+            session.commit()
+
+    @staticmethod
+    def _decorate(session, twin, stack, agreement):
+        twin_aspect = TwinAspect(semantic_id="urn:samm:io.catenax.serial_part:3.0.0#SerialPart", twin_id=twin.id)
+        session.add_all([
+            twin_aspect,
+            TwinExchange(twin_id=twin.id, data_exchange_agreement_id=agreement.id),
+            TwinRegistration(twin_id=twin.id, enablement_service_stack_id=stack.id, dtr_registered=True),
+        ])
+        session.flush()
+        session.add(TwinAspectRegistration(twin_aspect_id=twin_aspect.id, enablement_service_stack_id=stack.id))
+
+    def _count(self, call):
+        """Run a service call on the test database and return its result and the statements it sent."""
+        service = twin_management_service.TwinManagementService()
+        with patch.object(twin_management_service, "RepositoryManagerFactory") as factory:
+            factory.create.side_effect = factory.create_read_only.side_effect = lambda: RepositoryManager(Session(self.engine))
+            with count_statements(self.engine) as statements:
+                result = call(service)
+        return result, statements
+
+    def test_catalog_part_twins_are_listed_in_constant_queries(self):
+        """Test that the catalog part twin listing does not query per twin."""
+        twins, statements = self._count(lambda service: service.get_catalog_part_twins(include_data_exchange_agreements=True))
+
+        assert len(twins) == 10
+        assert all(len(twin.customer_part_ids) == 3 and len(twin.shares) == 1 for twin in twins)
+        # The twins, their catalog parts, their partner catalog parts and their shares
+        assert len(statements) == 4
+
+    def test_serialized_part_twins_are_listed_in_constant_queries(self):
+        """Test that listing 1,000 twins takes as many queries as listing 10."""
+        (small, _), small_statements = self._count(
+            lambda service: service.get_serialized_part_twins_page(include_data_exchange_agreements=True, limit=10)
+        )
+        (twins, next_cursor), statements = self._count(
+            lambda service: service.get_serialized_part_twins_page(include_data_exchange_agreements=True, limit=TWINS)
+        )
+
+        assert len(small) == 10
+        assert len(twins) == TWINS and next_cursor is None
+        assert all(twin.business_partner.bpnl.startswith("BPNL") and len(twin.shares) == 1 for twin in twins)
+        # The twins, their serialized parts and their shares, the last two in batches of 500 IDs
+        assert len(small_statements) == 3
+        assert len(statements) == 5
+
+    def test_twin_details_are_loaded_in_constant_queries(self):
+        """Test that the details of a twin are loaded without lazy loading per relationship."""
+        global_id = self._count(lambda service: service.get_serialized_part_twins_page(limit=1))[0][0][0].global_id
+
+        details, statements = self._count(lambda service: service.get_serialized_part_twin_details(global_id))
+
+        assert len(details.customer_part_ids) == 3
+        assert details.registrations == {"stack": True}
+        assert len(details.aspects) == 1
+        # One query per loaded relationship level, whatever the number of shares, registrations and aspects
+        assert len(statements) == 7
+
+
+class TestPartSearch:
+    """Test suite for the search of catalog parts and serialized parts."""
+
+    @classmethod
+    def setup_class(cls):
+        """Create catalog parts with a customer part ID and serialized parts of the first one."""
+        cls.engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+        SQLModel.metadata.create_all(cls.engine)
+        with Session(cls.engine) as session:
+            legal_entity = LegalEntity(bpnl="BPNL000000000001")
+            business_partner = BusinessPartner(name="partner", bpnl="BPNL000000000002")
+            session.add_all([legal_entity, business_partner])
+            session.flush()
+            catalog_parts = [
+                CatalogPart(manufacturer_part_id="HOUSING", name="Housing", legal_entity_id=legal_entity.id),
+                CatalogPart(manufacturer_part_id="MPN-2", name="Housing cover", description="Cover of the housing", legal_entity_id=legal_entity.id),
+                CatalogPart(manufacturer_part_id="MPN-3", name="Rear housing", legal_entity_id=legal_entity.id),
+                CatalogPart(manufacturer_part_id="MPN-4", name="Bracket", legal_entity_id=legal_entity.id),
+            ]
+            session.add_all(catalog_parts)
+            session.flush()
+            partner_catalog_part = PartnerCatalogPart(business_partner_id=business_partner.id, catalog_part_id=catalog_parts[3].id, customer_part_id="HOUSING-BRACKET")
+            session.add(partner_catalog_part)
+            session.flush()
+            for i in range(3):
+                twin = Twin()
+                session.add(twin)
+                session.flush()
+                session.add(SerializedPart(partner_catalog_part_id=partner_catalog_part.id, part_instance_id=f"SN-HOUSING-{i}", van=f"VAN{i}", twin_id=twin.id))
+            session.commit()
+            cls.catalog_part_ids = [catalog_part.id for catalog_part in catalog_parts]
+
+    def _search(self, text, **kwargs):
+        with patch.object(part_management_service.RepositoryManagerFactory, "create_read_only", side_effect=lambda: RepositoryManager(Session(self.engine))):
+            return part_management_service.PartManagementService().search_parts(text, **kwargs)
+
+    def test_repository_ranks_exact_matches_before_prefixes(self):
+        """Test that every column returns its first prefix matches, the customer part ID for its catalog part."""
+        with Session(self.engine) as session:
+            matches = CatalogPartRepository(session).search("housing", limit=2)
+
+        by_column = {}
+        for id, column, value, score in matches:
+            by_column.setdefault(column, []).append((id, value, score))
+        assert by_column["name"] == [(self.catalog_part_ids[0], "Housing", 4), (self.catalog_part_ids[1], "Housing cover", 3)]
+        assert by_column["manufacturer_part_id"] == [(self.catalog_part_ids[0], "HOUSING", 4)]
+        assert by_column["customer_part_id"] == [(self.catalog_part_ids[3], "HOUSING-BRACKET", 3)]
+
+    def test_fuzzy_search_returns_the_other_values_containing_the_text(self):
+        """Test that the fuzzy search leaves out the prefix matches and also searches the descriptions."""
+        with Session(self.engine) as session:
+            matches = CatalogPartRepository(session).search("housing", limit=10, fuzzy=True)
+
+        assert sorted((column, value, score) for _, column, value, score in matches) == [
+            ("description", "Cover of the housing", 1), ("name", "Rear housing", 1)
+        ]
+
+    def test_short_text_only_matches_prefixes(self):
+        """Test that a text shorter than a trigram is looked up as a prefix only."""
+        with Session(self.engine) as session:
+            matches = SerializedPartRepository(session).search("VA", limit=10)
+            assert SerializedPartRepository(session).search("AN", limit=10, fuzzy=True) == []
+
+        assert sorted(value for _, _, value, _ in matches) == ["VAN0", "VAN1", "VAN2"]
+
+    def test_results_are_ranked_once_per_part_and_paged(self):
+        """Test that each part is returned once for its best field, prefixes before fuzzy matches, with the highlighted ranges."""
+        results = self._search("housing")
+
+        assert [(result.type, result.matched_field) for result in results[:2]] == [
+            (PartSearchResultType.CATALOG_PART, PartSearchField.NAME),
+            (PartSearchResultType.CATALOG_PART, PartSearchField.NAME),
+        ]
+        assert [result.manufacturer_part_id for result in results if result.type == PartSearchResultType.CATALOG_PART] == ["HOUSING", "MPN-2", "MPN-4", "MPN-3"]
+        assert len(results) == 7
+        assert [(highlight.start, highlight.end) for highlight in results[2].highlights] == [(0, 7)]
+        assert [result.manufacturer_part_id for result in self._search("housing", limit=2, offset=1)] == ["MPN-2", "MPN-4"]
+
+    def test_results_are_filtered_by_type(self):
+        """Test that only the serialized parts are returned when asked for, with their catalog part and twin."""
+        results = self._search("sn-housing", part_type=PartSearchResultType.SERIALIZED_PART)
+
+        assert [result.part_instance_id for result in results] == ["SN-HOUSING-0", "SN-HOUSING-1", "SN-HOUSING-2"]
+        assert {result.manufacturer_part_id for result in results} == {"MPN-4"}
+        assert {result.customer_part_id for result in results} == {"HOUSING-BRACKET"}
+        assert all(result.global_id is not None for result in results)
+
+    def test_too_short_text_is_rejected(self):
+        """Test that a single character is not searched."""
+        with pytest.raises(part_management_service.InvalidError):
+            self._search(" a ")
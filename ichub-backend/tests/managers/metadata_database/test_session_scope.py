@@ -0,0 +1,129 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+
+import threading
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import create_engine
+from sqlmodel import Session, SQLModel, select
+
+from managers.metadata_database import manager as manager_module
+from managers.metadata_database.manager import RepositoryManagerFactory
+from models.metadata_database.provider.models import LegalEntity
+from utils.connection_pool import MonitoredQueuePool
+from utils.replica_router import FALLBACK_READ_YOUR_WRITES, Replica, ReplicaRouter
+
+
+class TestSessionScope:
+    """Test suite for the session shared by the nested repository managers of a session scope."""
+
+    @pytest.fixture(autouse=True)
+    def database(self, tmp_path):
+        self.engine = create_engine(f"sqlite:///{tmp_path / 'scope.db'}", poolclass=MonitoredQueuePool, pool_size=5)
+        SQLModel.metadata.create_all(self.engine)
+        with patch.object(manager_module, "engine", self.engine):
+            yield
+        self.engine.dispose()
+
+    def _create_nested(self):
+        """Create a legal entity, then a nested call reads the legal entities while the first transaction is open."""
+        with RepositoryManagerFactory.create() as repo:
+            repo.legal_entity_repository.create(LegalEntity(bpnl="BPNL000000000001"))
+            repo.flush()
+            with RepositoryManagerFactory.create() as nested_repo:
+                seen = len(nested_repo.legal_entity_repository.find_all())
+            # The nested manager committed, the outer one is still usable
+            repo.legal_entity_repository.create(LegalEntity(bpnl="BPNL000000000002"))
+        return seen
+
+    def _bpnls(self):
+        with Session(self.engine) as session:
+            return sorted(session.exec(select(LegalEntity.bpnl)).all())
+
+    def test_nested_calls_share_one_connection(self):
+        """Test that the nested repository managers of a scope reuse its session instead of checking out a connection each."""
+        with RepositoryManagerFactory.session_scope():
+            seen = self._create_nested()
+
+        # The nested call sees the changes of the outer one
+        assert seen == 1
+        assert self._bpnls() == ["BPNL000000000001", "BPNL000000000002"]
+        assert self.engine.pool.stats()["peakCheckedOut"] == 1
+
+    def test_nested_calls_without_scope_check_out_a_connection_each(self):
+        """Test that without a scope every repository manager has its own session."""
+        seen = self._create_nested()
+
+        assert seen == 0
+        assert len(self._bpnls()) == 2
+        assert self.engine.pool.stats()["peakCheckedOut"] == 2
+
+    def test_scope_is_bound_to_its_thread(self):
+        """Test that a repository manager created by another thread does not use the session of the scope."""
+        with RepositoryManagerFactory.session_scope():
+            scoped = RepositoryManagerFactory.create()
+            other = []
+            thread = threading.Thread(target=lambda: other.append(RepositoryManagerFactory.create()))
+            thread.start()
+            thread.join()
+
+            assert RepositoryManagerFactory.create()._session is scoped._session
+            assert other[0]._session is not scoped._session
+        other[0].close()
+        assert RepositoryManagerFactory.create()._session is not scoped._session
+
+    def _replica_router(self, tmp_path):
+        replica_engine = create_engine(f"sqlite:///{tmp_path / 'replica.db'}", poolclass=MonitoredQueuePool)
+        SQLModel.metadata.create_all(replica_engine)
+        router = ReplicaRouter([Replica("replica-0", replica_engine)], lag_reader=lambda engine: 0)
+        router.check_lag()
+        return router
+
+    def test_read_only_managers_read_from_the_replica(self, tmp_path):
+        """Test that a read-only repository manager uses a session on the replica, a regular one on the primary."""
+        router = self._replica_router(tmp_path)
+        with patch.object(manager_module, "replica_router", router):
+            with RepositoryManagerFactory.create_read_only() as repo:
+                assert repo._session.get_bind() is router.replicas[0].engine
+            with RepositoryManagerFactory.create() as repo:
+                assert repo._session.get_bind() is self.engine
+
+        assert router.stats()["replicaReads"] == 1
+        router.replicas[0].engine.dispose()
+
+    def test_read_only_managers_read_the_writes_of_their_scope(self, tmp_path):
+        """Test that once the session of a scope wrote, the read-only managers of the scope read from it on the primary."""
+        router = self._replica_router(tmp_path)
+        with patch.object(manager_module, "replica_router", router):
+            with RepositoryManagerFactory.session_scope():
+                with RepositoryManagerFactory.create_read_only() as repo:
+                    assert repo._session.get_bind() is router.replicas[0].engine
+                with RepositoryManagerFactory.create() as repo:
+                    repo.legal_entity_repository.create(LegalEntity(bpnl="BPNL000000000001"))
+                with RepositoryManagerFactory.create_read_only() as repo:
+                    assert len(repo.legal_entity_repository.find_all()) == 1
+
+        assert router.stats()["primaryReads"] == {FALLBACK_READ_YOUR_WRITES: 1}
+        router.replicas[0].engine.dispose()
+
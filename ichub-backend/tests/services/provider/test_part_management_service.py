@@ -20,13 +20,21 @@
 # SPDX-License-Identifier: Apache-2.0
 ###############################################################
 
+import asyncio
+import json
 import pytest
+from datetime import datetime
 from unittest.mock import Mock, patch
 
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import StaticPool
+from sqlmodel import Session, SQLModel, create_engine, select
+
 from services.provider.part_management_service import PartManagementService
 from models.services.provider.part_management import (
     CatalogPartCreate,
     CatalogPartDetailsReadWithStatus,
+    CatalogPartListQuery,
     CatalogPartReadWithStatus,
     SerializedPartCreate,
     SerializedPartRead,
@@ -34,9 +42,15 @@ from models.services.provider.part_management import (
     PartnerCatalogPartCreate,
     PartnerCatalogPartRead,
     PartnerCatalogPartBase,
+    SharingStatus,
 )
-from models.metadata_database.provider.models import CatalogPart, SerializedPart, LegalEntity
+from models.metadata_database.provider.models import BusinessPartner, CatalogPart, PartnerCatalogPart, SerializedPart, LegalEntity
+from managers.metadata_database import async_manager as async_manager_module
+from managers.metadata_database.manager import RepositoryManager
+from tests.managers.metadata_database.statement_counter import count_statements
 from tools.exceptions import InvalidError, NotFoundError, AlreadyExistsError
+from tools.pagination_tools import decode_cursor, encode_cursor
+from tools.query_plan_tools import capture_statements
 
 
 class TestPartManagementService:
@@ -351,6 +365,39 @@ class TestPartManagementService:
         assert result[0].manufacturer_id == "BPNL123456789012"
         assert result[0].part_instance_id == "INST001"
 
+    @patch('services.provider.part_management_service.RepositoryManagerFactory.create')
+    def test_get_serialized_parts_page_returns_next_cursor(self, mock_repo_factory, mock_repos):
+        """Test that a full page returns the cursor after its last serialized part."""
+        mock_repo_factory.return_value.__enter__.return_value = mock_repos
+        serialized_parts = []
+        for i in range(3):
+            serialized_part = Mock(spec=SerializedPart)
+            serialized_part.id = 3 - i
+            serialized_part.created_date = datetime(2025, 1, 3 - i)
+            serialized_part.part_instance_id = f"INST00{i}"
+            serialized_part.van = None
+            serialized_part.partner_catalog_part = Mock(customer_part_id="CUST001")
+            serialized_part.partner_catalog_part.catalog_part = Mock(manufacturer_part_id="PART001", category=None, bpns=None)
+            serialized_part.partner_catalog_part.catalog_part.name = "Test Part"
+            serialized_part.partner_catalog_part.catalog_part.legal_entity = Mock(bpnl="BPNL123456789012")
+            serialized_part.partner_catalog_part.business_partner = Mock(bpnl="BPNL987654321098")
+            serialized_part.partner_catalog_part.business_partner.name = "Test Partner"
+            serialized_parts.append((serialized_part, 0))
+        mock_repos.serialized_part_repository.find_with_status.return_value = serialized_parts
+
+        result, next_cursor = self.service.get_serialized_parts_page(limit=2, cursor=encode_cursor(datetime(2025, 1, 4), 4))
+
+        assert [part.part_instance_id for part in result] == ["INST000", "INST001"]
+        assert decode_cursor(next_cursor) == (datetime(2025, 1, 2), 2)
+        call = mock_repos.serialized_part_repository.find_with_status.call_args
+        assert call.kwargs["limit"] == 3
+        assert call.kwargs["after"] == (datetime(2025, 1, 4), 4)
+
+    def test_get_serialized_parts_page_rejects_invalid_cursor(self):
+        """Test that a tampered cursor is rejected before querying the database."""
+        with pytest.raises(InvalidError):
+            self.service.get_serialized_parts_page(cursor="not-a-cursor")
+
     @patch('services.provider.part_management_service.RepositoryManagerFactory.create')
     def test_create_partner_catalog_part_mapping_success(self, mock_repo_factory, mock_repos, sample_legal_entity, sample_catalog_part, sample_business_partner):
         """Test successful partner catalog part mapping creation."""
@@ -726,3 +773,277 @@ class TestPartManagementService:
             
             # Assert
             assert result == []
+
+
+class TestSerializedPartImport:
+    """Test suite for the bulk import of serialized parts on a real database."""
+
+    def setup_method(self):
+        """Create a manufacturer with one catalog part shared with one business partner and one serialized part."""
+        self.engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+        SQLModel.metadata.create_all(self.engine)
+        with Session(self.engine) as session:
+            legal_entity = LegalEntity(bpnl="BPNL000000000001")
+            business_partner = BusinessPartner(name="partner", bpnl="BPNL000000000002")
+            session.add_all([legal_entity, business_partner])
+            session.flush()
+            catalog_part = CatalogPart(manufacturer_part_id="PART", name="Part", legal_entity_id=legal_entity.id)
+            session.add(catalog_part)
+            session.flush()
+            partner_catalog_part = PartnerCatalogPart(business_partner_id=business_partner.id, catalog_part_id=catalog_part.id, customer_part_id="CUST")
+            session.add(partner_catalog_part)
+            session.flush()
+            session.add(SerializedPart(partner_catalog_part_id=partner_catalog_part.id, part_instance_id="SN-EXISTING"))
+            session.commit()
+        self.service = PartManagementService()
+
+    def _import(self, content, content_type, **kwargs):
+        with patch('services.provider.part_management_service.RepositoryManagerFactory.create') as create:
+            create.side_effect = lambda: RepositoryManager(Session(self.engine))
+            return self.service.import_serialized_parts(content, content_type, **kwargs)
+
+    @staticmethod
+    def _row(part_instance_id, manufacturer_part_id="PART", business_partner_number="BPNL000000000002", **kwargs):
+        return {
+            "manufacturerId": "BPNL000000000001", "manufacturerPartId": manufacturer_part_id,
+            "businessPartnerNumber": business_partner_number, "partInstanceId": part_instance_id, **kwargs
+        }
+
+    def _part_instance_ids(self):
+        with Session(self.engine) as session:
+            return set(session.exec(select(SerializedPart.part_instance_id)).all())
+
+    def test_import_reports_each_row(self):
+        """Test that each row is created, found existing or failed with the reason."""
+        rows = [
+            self._row("SN-1", van="VAN-1"),
+            self._row("SN-EXISTING"),
+            self._row("SN-1"),
+            self._row("SN-2", business_partner_number="BPNL000000000099"),
+            self._row("SN-3", customerPartId="OTHER"),
+            self._row("SN-4", manufacturer_part_id="UNKNOWN"),
+            {"manufacturerId": "BPNL000000000001"},
+        ]
+
+        result = self._import(json.dumps(rows).encode(), "application/json")
+
+        assert [(r.row, r.status.value) for r in result.results] == [
+            (1, "created"), (2, "existing"), (3, "existing"), (4, "failed"), (5, "failed"), (6, "failed"), (7, "failed")
+        ]
+        assert (result.created, result.existing, result.failed) == (1, 2, 4)
+        assert "BPNL000000000099" in result.results[3].error
+        assert "OTHER" in result.results[4].error
+        assert "partInstanceId" in result.results[6].error
+        assert self._part_instance_ids() == {"SN-EXISTING", "SN-1"}
+
+    def test_import_generates_missing_catalog_and_partner_parts(self):
+        """Test that the missing catalog and partner catalog parts are created once for all their rows."""
+        content = "manufacturerId,manufacturerPartId,businessPartnerNumber,partInstanceId,customerPartId,van\n" + "".join(
+            f"BPNL000000000001,NEW,BPNL000000000002,SN-NEW-{i},,\n" for i in range(3)
+        )
+
+        result = self._import(content.encode(), "text/csv; charset=utf-8", auto_generate_catalog_part=True, auto_generate_partner_part=True)
+
+        assert result.created == 3
+        with Session(self.engine) as session:
+            catalog_part = session.exec(select(CatalogPart).where(CatalogPart.manufacturer_part_id == "NEW")).one()
+            partner_catalog_part = session.exec(select(PartnerCatalogPart).where(PartnerCatalogPart.catalog_part_id == catalog_part.id)).one()
+        assert catalog_part.name == "NEW"
+        assert partner_catalog_part.customer_part_id == "NEW-BPNL000000000002"
+
+    def test_import_reports_malformed_ndjson_lines(self):
+        """Test that a malformed line only fails its own row."""
+        content = "\n".join([json.dumps(self._row("SN-1")), "{not json", json.dumps(self._row("SN-2"))])
+
+        result = self._import(content.encode(), "application/x-ndjson")
+
+        assert [r.status.value for r in result.results] == ["created", "failed", "created"]
+
+    def test_import_rejects_unsupported_documents(self):
+        """Test that a document which cannot be parsed at all is rejected."""
+        with pytest.raises(InvalidError):
+            self._import(b"<parts/>", "application/xml")
+        with pytest.raises(InvalidError):
+            self._import(b'{"partInstanceId": "SN-1"}', "application/json")
+
+    def test_import_queries_do_not_grow_with_the_rows(self):
+        """Test that the lookups are done per chunk and not per row."""
+        def run(count, prefix):
+            rows = [self._row(f"{prefix}-{i}") for i in range(count)]
+            with count_statements(self.engine) as statements:
+                result = self._import(json.dumps(rows).encode(), "application/json")
+            assert result.created == count
+            return len(statements)
+
+        with patch('services.provider.part_management_service.IMPORT_CHUNK_SIZE', 1000):
+            assert run(10, "SMALL") == run(1000, "LARGE")
+            # A second chunk repeats the lookups once
+            assert run(1500, "CHUNKED") > run(10, "SMALL-AGAIN")
+
+
+
+class TestCatalogPartBatchUpsert:
+    """Test suite for the batch upsert of catalog parts on a real database."""
+
+    def setup_method(self):
+        """Create a manufacturer with one catalog part mapped to one of two business partners."""
+        self.engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+        SQLModel.metadata.create_all(self.engine)
+        with Session(self.engine) as session:
+            legal_entity = LegalEntity(bpnl="BPNL000000000001")
+            session.add_all([
+                legal_entity,
+                BusinessPartner(name="partner", bpnl="BPNL000000000002"),
+                BusinessPartner(name="other", bpnl="BPNL000000000003"),
+            ])
+            session.flush()
+            catalog_part = CatalogPart(manufacturer_part_id="PART", name="Part", legal_entity_id=legal_entity.id, materials=[{"name": "steel", "share": 100.0}])
+            session.add(catalog_part)
+            session.flush()
+            session.add(PartnerCatalogPart(business_partner_id=1, catalog_part_id=catalog_part.id, customer_part_id="CUST"))
+            session.commit()
+        self.service = PartManagementService()
+
+    def _upsert(self, parts):
+        with patch('services.provider.part_management_service.RepositoryManagerFactory.create') as create:
+            create.side_effect = lambda: RepositoryManager(Session(self.engine))
+            return self.service.upsert_catalog_parts([CatalogPartCreate.model_validate(part) for part in parts])
+
+    @staticmethod
+    def _part(manufacturer_part_id, manufacturer_id="BPNL000000000001", **kwargs):
+        return {
+            "manufacturerId": manufacturer_id, "manufacturerPartId": manufacturer_part_id, "name": "Part",
+            "materials": [{"name": "steel", "share": 100.0}], **kwargs
+        }
+
+    @staticmethod
+    def _partner(bpnl="BPNL000000000002"):
+        return {"name": "partner", "bpnl": bpnl}
+
+    def test_upsert_reports_created_updated_and_unchanged(self):
+        """Test that only new and changed catalog parts and customer part IDs are counted as written."""
+        result = self._upsert([
+            self._part("PART", customerPartIds={"CUST": self._partner(), "OTHER-CUST": self._partner("BPNL000000000003")}),
+            self._part("NEW", width={"value": 10.5, "unit": "mm"}, customerPartIds={"NEW-CUST": self._partner()}),
+        ])
+
+        assert result.catalog_parts.model_dump() == {"created": 1, "updated": 0, "unchanged": 1}
+        assert result.partner_catalog_parts.model_dump() == {"created": 2, "updated": 0, "unchanged": 1}
+        assert result.failed == 0
+
+        result = self._upsert([
+            self._part("PART", description="changed", customerPartIds={"CUST-2": self._partner()}),
+            self._part("NEW", width={"value": 10.5, "unit": "mm"}, customerPartIds={"NEW-CUST": self._partner()}),
+        ])
+
+        assert result.catalog_parts.model_dump() == {"created": 0, "updated": 1, "unchanged": 1}
+        assert result.partner_catalog_parts.model_dump() == {"created": 0, "updated": 1, "unchanged": 1}
+        with Session(self.engine) as session:
+            catalog_parts = {part.manufacturer_part_id: part for part in session.exec(select(CatalogPart)).all()}
+            customer_part_ids = {(mapping.catalog_part_id, mapping.business_partner_id): mapping.customer_part_id for mapping in session.exec(select(PartnerCatalogPart)).all()}
+        assert catalog_parts["PART"].description == "changed"
+        assert catalog_parts["NEW"].width == {"value": 10.5, "unit": "mm"}
+        # Customer part IDs of business partners which are not given are kept
+        assert customer_part_ids == {
+            (catalog_parts["PART"].id, 1): "CUST-2",
+            (catalog_parts["PART"].id, 2): "OTHER-CUST",
+            (catalog_parts["NEW"].id, 1): "NEW-CUST",
+        }
+
+    def test_upsert_reports_invalid_catalog_parts(self):
+        """Test that invalid catalog parts are reported without preventing the others."""
+        result = self._upsert([
+            self._part("A"),
+            self._part("A"),
+            self._part("B", materials=[{"name": "steel", "share": 101.0}]),
+            self._part("C", customerPartIds={"CUST": self._partner("BPNL000000000099")}),
+            self._part("D", customerPartIds={"CUST-1": self._partner(), "CUST-2": self._partner()}),
+            self._part("E", manufacturer_id="BPNL000000000004"),
+        ])
+
+        assert result.catalog_parts.created == 2
+        assert [(error.index, error.manufacturer_part_id) for error in result.errors] == [(1, "A"), (2, "B"), (3, "C"), (4, "D")]
+        assert result.failed == 4
+        assert "BPNL000000000099" in result.errors[2].error
+        with Session(self.engine) as session:
+            # The missing legal entity was created
+            assert session.exec(select(LegalEntity).where(LegalEntity.bpnl == "BPNL000000000004")).one()
+
+    def test_upsert_queries_do_not_grow_with_the_catalog_parts(self):
+        """Test that the lookups and writes are done per chunk and not per catalog part."""
+        def run(count, prefix):
+            parts = [self._part(f"{prefix}-{i}", customerPartIds={f"{prefix}-CUST-{i}": self._partner()}) for i in range(count)]
+            with count_statements(self.engine) as statements:
+                result = self._upsert(parts)
+            assert result.catalog_parts.created == count
+            return len(statements)
+
+        with patch('services.provider.part_management_service.IMPORT_CHUNK_SIZE', 1000):
+            assert run(10, "SMALL") == run(1000, "LARGE")
+            # A second chunk repeats the lookups and writes once
+            assert run(1500, "CHUNKED") > run(10, "SMALL-AGAIN")
+
+
+class TestCatalogPartList:
+    """Test suite for the listing of catalog parts on a real database, read on the async engine."""
+
+    @pytest.fixture(autouse=True)
+    def database(self, tmp_path, monkeypatch):
+        """Create two catalog parts of one manufacturer, the first mapped to a business partner."""
+        path = tmp_path / "catalog_parts.db"
+        engine = create_engine(f"sqlite:///{path}")
+        SQLModel.metadata.create_all(engine)
+        with Session(engine) as session:
+            legal_entity = LegalEntity(bpnl="BPNL000000000001")
+            business_partner = BusinessPartner(name="partner", bpnl="BPNL000000000002")
+            session.add_all([legal_entity, business_partner])
+            session.flush()
+            catalog_parts = [CatalogPart(manufacturer_part_id=f"PART{i}", name=f"part {i}", category="category", bpns="BPNS000000000001", legal_entity_id=legal_entity.id) for i in range(2)]
+            session.add_all(catalog_parts)
+            session.flush()
+            session.add(PartnerCatalogPart(business_partner_id=business_partner.id, catalog_part_id=catalog_parts[0].id, customer_part_id="CUST"))
+            session.commit()
+        engine.dispose()
+
+        self.async_engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+        monkeypatch.setattr(async_manager_module, "get_async_engine", lambda: self.async_engine)
+        yield
+        asyncio.run(self.async_engine.dispose())
+
+    @staticmethod
+    def _list(*args, **kwargs):
+        return asyncio.run(PartManagementService().get_catalog_part_list_async(*args, **kwargs))
+
+    def test_catalog_part_list_reads_only_the_selected_columns(self):
+        """Test that the listing selects only the columns of the requested fields."""
+        with capture_statements(self.async_engine.sync_engine) as statements:
+            catalog_parts = self._list(fields=["manufacturerPartId,status"], sort=["-manufacturerPartId"])
+
+        assert [part.model_dump(by_alias=True, exclude_unset=True) for part in catalog_parts] == [
+            {"manufacturerPartId": "PART1", "status": SharingStatus.DRAFT},
+            {"manufacturerPartId": "PART0", "status": SharingStatus.DRAFT},
+        ]
+        assert self._list(fields=["manufacturerPartId", "status"], sort=["-manufacturerPartId"]) == catalog_parts
+        listing = statements[-1][0]
+        assert "materials" not in listing and "legal_entity" not in listing
+
+    def test_catalog_part_list_is_filtered(self):
+        """Test that the listing is filtered by manufacturer, category, status and a prefix of the name or manufacturer part ID."""
+        def manufacturer_part_ids(**query):
+            return [part.manufacturer_part_id for part in self._list(CatalogPartListQuery(**query), sort=["manufacturerPartId"])]
+
+        assert manufacturer_part_ids(manufacturerId="BPNL000000000001", category="category") == ["PART0", "PART1"]
+        assert manufacturer_part_ids(manufacturerId="BPNL000000000002") == []
+        assert manufacturer_part_ids(prefix="Part 1") == ["PART1"]
+        assert manufacturer_part_ids(prefix="part1") == ["PART1"]
+        assert manufacturer_part_ids(prefix="PART%") == []
+        assert manufacturer_part_ids(status=SharingStatus.DRAFT) == ["PART0", "PART1"]
+        assert manufacturer_part_ids(status=SharingStatus.SHARED) == []
+        assert self._list(CatalogPartListQuery(prefix="part 0"))[0].manufacturer_id == "BPNL000000000001"
+
+    def test_catalog_part_list_rejects_unknown_fields(self):
+        """Test that an unknown field or sort key is reported as invalid input."""
+        with pytest.raises(InvalidError):
+            self._list(fields=["materials"])
+        with pytest.raises(InvalidError):
+            self._list(sort=["-width"])
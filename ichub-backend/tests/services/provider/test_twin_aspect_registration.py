@@ -0,0 +1,159 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+
+from contextlib import ExitStack
+from unittest.mock import Mock, patch
+
+import pytest
+from sqlalchemy.pool import StaticPool
+from sqlmodel import Session, SQLModel, create_engine, select
+
+import managers.metadata_database.repositories  # noqa: F401 - imported before the patched modules below
+from jobs.outbox_worker import OutboxWorker
+from models.metadata_database.provider.models import CatalogPart, EnablementServiceStack, LegalEntity, OutboxMessage, OutboxMessageStatus, Twin, TwinAspect, TwinAspectRegistration, TwinRegistration
+from models.services.provider.twin_management import TwinAspectCreate, TwinAspectRegistrationStatus
+from tests.managers.metadata_database.statement_counter import count_statements
+
+# The DTR and connector modules connect to the database on import
+with patch.dict('sys.modules', {'dtr': Mock(), 'connector': Mock()}):
+    from managers.metadata_database.manager import RepositoryManager
+    from services.provider import twin_management_service
+
+SEMANTIC_ID = "urn:samm:io.catenax.part_type_information:1.0.0#PartTypeInformation"
+DTR_CONFIG = {"hostname": "https://dtr", "uri": "/api", "apiPath": "/v3", "policy": {}, "asset_config": {"dct_type": "test"}}
+
+
+class TestTwinAspectRegistration:
+    """Test suite for the registration steps of a twin aspect on a real database."""
+
+    def setup_method(self):
+        """Create a catalog part twin of a manufacturer with an enablement service stack."""
+        self.engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+        SQLModel.metadata.create_all(self.engine)
+        with Session(self.engine) as session:
+            legal_entity = LegalEntity(bpnl="BPNL000000000001")
+            twin = Twin()
+            session.add_all([legal_entity, twin])
+            session.flush()
+            stack = EnablementServiceStack(name="stack", legal_entity_id=legal_entity.id)
+            session.add(stack)
+            session.add(CatalogPart(manufacturer_part_id="PART", name="PART", legal_entity_id=legal_entity.id, twin_id=twin.id))
+            session.flush()
+            session.add(TwinRegistration(twin_id=twin.id, enablement_service_stack_id=stack.id))
+            session.commit()
+            self.global_id = twin.global_id
+        self.outbox_config = {}
+        self.service = twin_management_service.TwinManagementService()
+        self.connector_manager = Mock()
+        self.connector_manager.provider.register_dtr_offer.return_value = ("dtr-asset", None, None, None)
+        self.connector_manager.provider.register_submodel_bundle_circular_offer.return_value = ("asset", "usage", "access", "contract")
+        self.dtr_provider_manager = Mock()
+        self.submodel_service_manager = Mock()
+
+    def _repo(self):
+        return RepositoryManager(Session(self.engine))
+
+    def _patched(self):
+        stack = ExitStack()
+        stack.enter_context(patch.object(twin_management_service.RepositoryManagerFactory, 'create', side_effect=self._repo))
+        stack.enter_context(patch.object(twin_management_service, 'connector_manager', self.connector_manager))
+        stack.enter_context(patch.object(twin_management_service, 'dtr_provider_manager', self.dtr_provider_manager))
+        stack.enter_context(patch.object(twin_management_service, '_create_submodel_service_manager', return_value=self.submodel_service_manager))
+        stack.enter_context(patch.object(twin_management_service.ConfigManager, 'get_config',
+                                         side_effect=lambda key, default=None: self.outbox_config if key == "provider.outbox" else DTR_CONFIG))
+        return stack
+
+    def _create(self):
+        with self._patched():
+            return self.service.create_twin_aspect(TwinAspectCreate(globalId=self.global_id, semanticId=SEMANTIC_ID, payload={"a": 1}))
+
+    def _status(self):
+        with Session(self.engine) as session:
+            return session.exec(select(TwinAspectRegistration.status).join(TwinAspect)).all()
+
+    def test_new_aspect_is_registered_with_few_round_trips(self):
+        """Test that all the steps of a new aspect are written by one transaction."""
+        with count_statements(self.engine, commits=True) as statements:
+            result = self._create()
+
+        assert result.registrations["stack"].status == TwinAspectRegistrationStatus.DTR_REGISTERED
+        assert self._status() == [TwinAspectRegistrationStatus.DTR_REGISTERED.value]
+        assert statements.count("COMMIT") == 1
+        # The twin with its manufacturer, the stack, the aspect lookup, two inserts and the commit
+        assert len(statements) <= 7, statements
+
+    def test_failed_step_is_resumed(self):
+        """Test that the status reached before a failing step is stored and the next call resumes from it."""
+        self.dtr_provider_manager.create_submodel_descriptor.side_effect = RuntimeError("DTR down")
+        with pytest.raises(RuntimeError):
+            self._create()
+        assert self._status() == [TwinAspectRegistrationStatus.EDC_REGISTERED.value]
+
+        self.dtr_provider_manager.create_submodel_descriptor.side_effect = None
+        result = self._create()
+
+        assert result.registrations["stack"].status == TwinAspectRegistrationStatus.DTR_REGISTERED
+        assert self._status() == [TwinAspectRegistrationStatus.DTR_REGISTERED.value]
+        # The document is not uploaded again
+        self.submodel_service_manager.upload_twin_aspect_document.assert_called_once()
+
+    def test_outbox_defers_the_registration_to_the_worker(self):
+        """Test that the request only writes the outbox message, and the worker registers the aspect once the twin is in the DTR."""
+        self.outbox_config = {"enabled": True}
+        worker = OutboxWorker(self.service.outbox_handlers(), repository_manager_factory=self._repo, retry_delay=0)
+
+        result = self._create()
+
+        assert result.registrations["stack"].status == TwinAspectRegistrationStatus.PLANNED
+        self.submodel_service_manager.upload_twin_aspect_document.assert_not_called()
+        self.connector_manager.provider.register_submodel_bundle_circular_offer.assert_not_called()
+
+        with self._patched():
+            # The shell descriptor of the twin is not registered yet
+            assert worker.run_once() == 1
+            assert self._status() == [TwinAspectRegistrationStatus.PLANNED.value]
+            with Session(self.engine) as session:
+                session.exec(select(TwinRegistration)).one().dtr_registered = True
+                session.commit()
+            assert worker.run_once() == 1
+
+        assert self._status() == [TwinAspectRegistrationStatus.DTR_REGISTERED.value]
+        self.submodel_service_manager.upload_twin_aspect_document.assert_called_once_with(result.submodel_id, SEMANTIC_ID, {"a": 1})
+        with Session(self.engine) as session:
+            message = session.exec(select(OutboxMessage)).one()
+            assert (message.status, message.attempts) == (OutboxMessageStatus.DONE, 2)
+
+    def test_outbox_registers_the_twin_from_the_stored_part(self):
+        """Test that the twin registration message builds the shell descriptor from the part and marks the twin registered."""
+        worker = OutboxWorker(self.service.outbox_handlers(), repository_manager_factory=self._repo)
+        with self._repo() as repo:
+            self.service._enqueue_twin_registration(repo, repo.twin_registration_repository.find_by_twin_ids([1])[0], id_short="short")
+
+        with self._patched():
+            assert worker.run_once() == 1
+
+        shell_descriptor = self.dtr_provider_manager.create_or_update_shell_descriptor.call_args.kwargs
+        assert (shell_descriptor["manufacturer_id"], shell_descriptor["manufacturer_part_id"], shell_descriptor["id_short"]) == ("BPNL000000000001", "PART", "short")
+        with Session(self.engine) as session:
+            assert session.exec(select(TwinRegistration.dtr_registered)).one() is True
+            assert session.exec(select(Twin.status)).one() == 2
@@ -0,0 +1,348 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+
+import time
+from contextlib import ExitStack
+from unittest.mock import Mock, patch
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.pool import StaticPool
+from sqlmodel import Session, SQLModel, create_engine, select
+
+from managers.metadata_database.repositories import TwinExchangeRepository, TwinRegistrationRepository  # imported before the patched modules below
+from models.metadata_database.provider.models import (
+    BusinessPartner, CatalogPart, DataExchangeAgreement, EnablementServiceStack, LegalEntity, PartnerCatalogPart, SerializedPart,
+    Twin, TwinExchange, TwinRegistration
+)
+from models.services.provider.part_management import SerializedPartBase
+from models.services.provider.twin_management import (
+    SerializedPartTwinBatchCreate, SerializedPartTwinShareBatchCreate, SerializedPartTwinUnshareCreate
+)
+from tests.managers.metadata_database.statement_counter import count_statements
+from utils.batch_jobs import BatchJob, BatchJobStatus
+
+# The DTR and connector modules connect to the database on import
+with patch.dict('sys.modules', {'dtr': Mock(), 'connector': Mock()}):
+    from managers.metadata_database.manager import RepositoryManager
+    from services.provider import twin_management_service
+
+InvalidError = twin_management_service.InvalidError
+NotFoundError = twin_management_service.NotFoundError
+
+
+class _TwinBatchTestBase:
+    """Database and service setup shared by the batch job test suites."""
+
+    def setup_method(self):
+        """Create a manufacturer with two catalog parts shared with one business partner."""
+        self.engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+        SQLModel.metadata.create_all(self.engine)
+        with Session(self.engine) as session:
+            legal_entity = LegalEntity(bpnl="BPNL000000000001")
+            business_partner = BusinessPartner(name="partner", bpnl="BPNL000000000002")
+            other_business_partner = BusinessPartner(name="other", bpnl="BPNL000000000003")
+            session.add_all([legal_entity, business_partner, other_business_partner])
+            session.flush()
+            session.add_all([
+                DataExchangeAgreement(name="agreement", business_partner_id=business_partner.id),
+                DataExchangeAgreement(name="agreement", business_partner_id=other_business_partner.id),
+            ])
+            session.add(EnablementServiceStack(name="stack", legal_entity_id=legal_entity.id))
+            for manufacturer_part_id in ("PART", "OTHER"):
+                catalog_part = CatalogPart(manufacturer_part_id=manufacturer_part_id, name=manufacturer_part_id, category="component", legal_entity_id=legal_entity.id)
+                session.add(catalog_part)
+                session.flush()
+                session.add(PartnerCatalogPart(business_partner_id=business_partner.id, catalog_part_id=catalog_part.id, customer_part_id=f"CUST-{manufacturer_part_id}"))
+            session.commit()
+        self.service = twin_management_service.TwinManagementService()
+        self.dtr_provider_manager = Mock()
+
+    def _add_serialized_parts(self, count, manufacturer_part_id="PART", prefix="SN"):
+        with Session(self.engine) as session:
+            partner_catalog_part = session.exec(select(PartnerCatalogPart).join(CatalogPart).where(CatalogPart.manufacturer_part_id == manufacturer_part_id)).one()
+            session.add_all([SerializedPart(partner_catalog_part_id=partner_catalog_part.id, part_instance_id=f"{prefix}-{i}", van=f"VAN-{i}") for i in range(count)])
+            session.commit()
+
+    def _patched(self, config=None):
+        stack = ExitStack()
+        stack.enter_context(patch.object(twin_management_service.RepositoryManagerFactory, 'create', side_effect=lambda: RepositoryManager(Session(self.engine))))
+        stack.enter_context(patch.object(twin_management_service, 'dtr_provider_manager', self.dtr_provider_manager))
+        stack.enter_context(patch.object(twin_management_service.ConfigManager, 'get_config', return_value={"max_requests_per_second": 0, "retry_delay": 0} if config is None else config))
+        return stack
+
+    @staticmethod
+    def _parts(*part_instance_ids):
+        return [SerializedPartBase(manufacturerId="BPNL000000000001", manufacturerPartId="PART", partInstanceId=part_instance_id) for part_instance_id in part_instance_ids]
+
+    def _run(self, **kwargs):
+        job = BatchJob(operation="test")
+        with self._patched():
+            self.service._run_serialized_part_twin_batch(job, SerializedPartTwinBatchCreate(**kwargs))
+        return job
+
+    def _registrations(self):
+        with Session(self.engine) as session:
+            return {
+                part_instance_id: (dtr_registered, status)
+                for part_instance_id, dtr_registered, status in session.exec(
+                    select(SerializedPart.part_instance_id, TwinRegistration.dtr_registered, Twin.status)
+                    .join(Twin, Twin.id == SerializedPart.twin_id)
+                    .join(TwinRegistration, TwinRegistration.twin_id == Twin.id)
+                ).all()
+            }
+
+
+class TestSerializedPartTwinBatch(_TwinBatchTestBase):
+    """Test suite for the batch creation and DTR registration of serialized part twins on a real database."""
+
+    def test_batch_creates_and_registers_the_selected_twins(self):
+        """Test that only the selected parts get a twin, registered in the DTR with the descriptor of the single creation."""
+        self._add_serialized_parts(3)
+        self._add_serialized_parts(2, manufacturer_part_id="OTHER", prefix="OTHER")
+
+        job = self._run(manufacturerPartId="PART")
+
+        assert (job.total, job.succeeded, job.skipped, job.failed) == (3, 3, 0, 0)
+        assert self._registrations() == {f"SN-{i}": (True, 2) for i in range(3)}
+        descriptors = {call.kwargs["part_instance_id"]: call.kwargs for call in self.dtr_provider_manager.create_or_update_shell_descriptor.call_args_list}
+        assert set(descriptors) == {"SN-0", "SN-1", "SN-2"}
+        assert descriptors["SN-1"]["manufacturer_id"] == "BPNL000000000001"
+        assert descriptors["SN-1"]["customer_part_ids"] == {"CUST-PART": "BPNL000000000002"}
+        assert descriptors["SN-1"]["asset_type"] == "component"
+        assert descriptors["SN-1"]["van"] == "VAN-1"
+
+        # The parts with a twin are not selected anymore, unless requested
+        assert self._run(manufacturerPartId="PART").total == 0
+        job = self._run(manufacturerPartId="PART", withoutTwin=False)
+        assert (job.total, job.skipped) == (3, 3)
+
+    def test_batch_selects_the_explicit_parts(self):
+        """Test that the explicit list of parts is combined with the filters."""
+        self._add_serialized_parts(3)
+
+        job = self._run(parts=[
+            SerializedPartBase(manufacturerId="BPNL000000000001", manufacturerPartId="PART", partInstanceId="SN-0"),
+            SerializedPartBase(manufacturerId="BPNL000000000001", manufacturerPartId="PART", partInstanceId="SN-2"),
+            SerializedPartBase(manufacturerId="BPNL000000000001", manufacturerPartId="PART", partInstanceId="UNKNOWN"),
+        ])
+
+        assert job.succeeded == 2
+        assert set(self._registrations()) == {"SN-0", "SN-2"}
+
+    def test_batch_keeps_failed_registrations_for_the_next_run(self):
+        """Test that a failed DTR registration is reported and retried by the next run."""
+        self._add_serialized_parts(3)
+        self.dtr_provider_manager.create_or_update_shell_descriptor.side_effect = lambda **kwargs: (
+            (_ for _ in ()).throw(RuntimeError("DTR unavailable")) if kwargs["part_instance_id"] == "SN-1" else None
+        )
+
+        job = self._run(manufacturerPartId="PART")
+
+        assert (job.succeeded, job.failed) == (2, 1)
+        assert job.errors == {"BPNL000000000001/PART/SN-1": "DTR registration failed: DTR unavailable"}
+        # The failed registration was retried before giving up
+        assert [call.kwargs["part_instance_id"] for call in self.dtr_provider_manager.create_or_update_shell_descriptor.call_args_list].count("SN-1") == 4
+        # The twin exists with a pending registration
+        assert self._registrations()["SN-1"] == (False, 1)
+
+        self.dtr_provider_manager.create_or_update_shell_descriptor.side_effect = None
+        job = self._run(manufacturerPartId="PART", withoutTwin=False)
+
+        assert (job.succeeded, job.skipped) == (1, 2)
+        assert self._registrations()["SN-1"] == (True, 2)
+
+    def test_batch_counts_the_parts_of_a_failed_chunk_once(self):
+        """Test that a chunk failing after some of its parts got an outcome fails only the others, under their part keys."""
+        self._add_serialized_parts(3)
+        assert self._run(parts=self._parts("SN-0")).succeeded == 1
+        self.dtr_provider_manager.create_or_update_shell_descriptor.side_effect = lambda **kwargs: (
+            (_ for _ in ()).throw(RuntimeError("DTR unavailable")) if kwargs["part_instance_id"] == "SN-1" else None
+        )
+
+        with patch.object(TwinRegistrationRepository, "set_dtr_registered", side_effect=RuntimeError("database unavailable")):
+            job = self._run(manufacturerPartId="PART", withoutTwin=False)
+
+        assert (job.total, job.succeeded, job.skipped, job.failed) == (3, 0, 1, 2)
+        assert job.errors == {
+            "BPNL000000000001/PART/SN-1": "DTR registration failed: DTR unavailable",
+            "BPNL000000000001/PART/SN-2": "The chunk of the serialized part could not be stored: database unavailable",
+        }
+
+    def test_batch_statements_do_not_grow_with_the_parts(self):
+        """Test that the rows of a chunk are read and written set-wise and not per part."""
+        def run(count, prefix):
+            self._add_serialized_parts(count, prefix=prefix)
+            with count_statements(self.engine) as statements:
+                job = self._run(manufacturerPartId="PART")
+            assert job.succeeded == count
+            return len(statements)
+
+        assert run(5, "SMALL") == run(500, "LARGE")
+
+    def test_batch_job_runs_in_the_background(self):
+        """Test that the job is submitted with its progress and polled until it completes."""
+        self._add_serialized_parts(2)
+        with self._patched(config={}):
+            with pytest.raises(InvalidError):
+                self.service.create_serialized_part_twins_batch(SerializedPartTwinBatchCreate())
+
+            job = self.service.create_serialized_part_twins_batch(SerializedPartTwinBatchCreate(manufacturerId="BPNL000000000001"))
+            deadline = time.monotonic() + 10
+            while job.status not in (BatchJobStatus.COMPLETED, BatchJobStatus.FAILED) and time.monotonic() < deadline:
+                time.sleep(0.01)
+                job = self.service.get_batch_job(job.job_id)
+
+        assert job.status == BatchJobStatus.COMPLETED
+        assert (job.total, job.processed, job.succeeded) == (2, 2, 2)
+        with pytest.raises(NotFoundError):
+            self.service.get_batch_job(uuid4())
+
+
+class TestSerializedPartTwinShareBatch(_TwinBatchTestBase):
+    """Test suite for the batch sharing and unsharing of serialized part twins on a real database."""
+
+    PARTNERS = ["BPNL000000000002", "BPNL000000000003"]
+
+    def setup_method(self):
+        """Create registered twins for three serialized parts."""
+        super().setup_method()
+        self._add_serialized_parts(3)
+        assert self._run(manufacturerPartId="PART").succeeded == 3
+        self.dtr_provider_manager.update_shell_descriptor_shares.return_value = True
+
+    def _share(self, part_instance_ids, business_partner_numbers=PARTNERS, share=True):
+        batch_share = SerializedPartTwinShareBatchCreate(parts=self._parts(*part_instance_ids), businessPartnerNumbers=business_partner_numbers)
+        job = BatchJob(operation="test")
+        with self._patched():
+            with RepositoryManager(Session(self.engine)) as repo:
+                data_exchange_agreement_ids = self.service._get_data_exchange_agreement_ids(repo, business_partner_numbers, share=share)
+            self.service._run_twin_share_batch(job, batch_share, data_exchange_agreement_ids, share)
+        return job
+
+    def _shares(self):
+        with Session(self.engine) as session:
+            rows = session.exec(
+                select(SerializedPart.part_instance_id, BusinessPartner.bpnl)
+                .join(TwinExchange, TwinExchange.twin_id == SerializedPart.twin_id)
+                .join(DataExchangeAgreement, DataExchangeAgreement.id == TwinExchange.data_exchange_agreement_id)
+                .join(BusinessPartner, BusinessPartner.id == DataExchangeAgreement.business_partner_id)
+            ).all()
+            statuses = dict(session.exec(select(SerializedPart.part_instance_id, Twin.status).join(Twin, Twin.id == SerializedPart.twin_id)).all())
+        return sorted(rows), statuses
+
+    def test_share_batch_updates_the_shells_and_exchanges(self):
+        """Test that every twin is shared with all the partners with one DTR update per twin."""
+        job = self._share(["SN-0", "SN-1", "UNKNOWN"])
+
+        assert (job.total, job.succeeded, job.failed) == (3, 2, 1)
+        assert job.errors == {"BPNL000000000001/PART/UNKNOWN": "Serialized part not found."}
+        shares, statuses = self._shares()
+        assert shares == [(part_instance_id, bpnl) for part_instance_id in ("SN-0", "SN-1") for bpnl in self.PARTNERS]
+        assert statuses == {"SN-0": 3, "SN-1": 3, "SN-2": 2}
+        updates = self.dtr_provider_manager.update_shell_descriptor_shares.call_args_list
+        assert len(updates) == 2
+        assert updates[0].kwargs["manufacturer_id"] == "BPNL000000000001"
+        assert updates[0].kwargs["share_with"] == self.PARTNERS
+
+        # Sharing again changes nothing
+        self.dtr_provider_manager.update_shell_descriptor_shares.return_value = False
+        job = self._share(["SN-0", "SN-1"])
+        assert (job.succeeded, job.skipped) == (0, 2)
+
+    def test_share_batch_retries_and_reports_failed_dtr_updates(self):
+        """Test that a failing DTR update is retried, reported and leaves the twin unshared."""
+        self.dtr_provider_manager.update_shell_descriptor_shares.side_effect = RuntimeError("DTR unavailable")
+
+        job = self._share(["SN-0"])
+
+        assert (job.succeeded, job.failed) == (0, 1)
+        assert job.errors == {"BPNL000000000001/PART/SN-0": "DTR update failed: DTR unavailable"}
+        assert self.dtr_provider_manager.update_shell_descriptor_shares.call_count == 4
+        assert self._shares()[0] == []
+
+    def test_share_batch_counts_the_parts_of_a_failed_chunk_once(self):
+        """Test that the parts of a chunk which could not be stored are failed once, under their part keys."""
+        with patch.object(TwinExchangeRepository, "create_many", side_effect=RuntimeError("database unavailable")):
+            job = self._share(["SN-0", "SN-1", "UNKNOWN"])
+
+        assert (job.total, job.succeeded, job.failed) == (3, 0, 3)
+        assert job.errors == {
+            "BPNL000000000001/PART/UNKNOWN": "Serialized part not found.",
+            "BPNL000000000001/PART/SN-0": "The chunk of the serialized part could not be stored: database unavailable",
+            "BPNL000000000001/PART/SN-1": "The chunk of the serialized part could not be stored: database unavailable",
+        }
+        assert self._shares()[0] == []
+
+    def test_share_batch_statements_do_not_grow_with_the_parts(self):
+        """Test that the exchanges of a chunk are read and written set-wise and not per twin."""
+        def run(count, prefix):
+            self._add_serialized_parts(count, prefix=prefix)
+            self._run(manufacturerPartId="PART")
+            with count_statements(self.engine) as statements:
+                job = self._share([f"{prefix}-{i}" for i in range(count)])
+            assert job.succeeded == count
+            return len(statements)
+
+        assert run(5, "SMALL") == run(200, "LARGE")
+
+    def test_unshare_batch_removes_the_partners(self):
+        """Test that unsharing deletes the exchanges of the given partners only and updates the status."""
+        self._share(["SN-0", "SN-1"])
+        # The twins are counted as changed by their deleted exchanges even if the shells did not change
+        self.dtr_provider_manager.update_shell_descriptor_shares.return_value = False
+
+        job = self._share(["SN-0", "SN-1", "SN-2"], business_partner_numbers=["BPNL000000000002"], share=False)
+
+        assert (job.succeeded, job.skipped) == (2, 1)
+        shares, statuses = self._shares()
+        assert shares == [("SN-0", "BPNL000000000003"), ("SN-1", "BPNL000000000003")]
+        assert self.dtr_provider_manager.update_shell_descriptor_shares.call_args.kwargs["unshare_with"] == ["BPNL000000000002"]
+
+        self._share(["SN-0"], business_partner_numbers=["BPNL000000000003"], share=False)
+        assert self._shares()[1]["SN-0"] == 2
+
+    def test_part_twin_unshare(self):
+        """Test that a single twin is unshared in the DTR and in the exchanges."""
+        self._share(["SN-0"])
+        with Session(self.engine) as session:
+            aas_id = session.exec(select(Twin.aas_id).join(SerializedPart, SerializedPart.twin_id == Twin.id).where(SerializedPart.part_instance_id == "SN-0")).one()
+        unshare = SerializedPartTwinUnshareCreate(aasId=aas_id, businessPartnerNumberToUnshare=self.PARTNERS, manufacturerId="BPNL000000000001")
+
+        with self._patched():
+            assert self.service.part_twin_unshare(unshare) is True
+            assert self._shares() == ([], {"SN-0": 2, "SN-1": 2, "SN-2": 2})
+
+            self.dtr_provider_manager.update_shell_descriptor_shares.return_value = False
+            assert self.service.part_twin_unshare(unshare) is False
+
+            with pytest.raises(NotFoundError):
+                self.service.part_twin_unshare(unshare.model_copy(update={"aas_id": uuid4()}))
+
+    def test_share_batch_checks_the_partners_before_submitting(self):
+        """Test that an unknown partner is rejected before the job is submitted."""
+        with self._patched():
+            with pytest.raises(NotFoundError):
+                self.service.share_serialized_part_twins_batch(SerializedPartTwinShareBatchCreate(
+                    parts=self._parts("SN-0"), businessPartnerNumbers=["BPNL000000000002", "BPNL00000000000X"]
+                ))
@@ -281,7 +281,7 @@ class TestTwinManagementService:
         with pytest.raises(Exception):  # Changed from NotFoundError since it's mocked
             self.service.create_catalog_part_twin(create_input)
 
-    @patch('services.provider.twin_management_service.RepositoryManagerFactory.create')
+    @patch('services.provider.twin_management_service.RepositoryManagerFactory.create_read_only')
     def test_get_catalog_part_twins_success(self, mock_repo_factory, mock_twin, mock_catalog_part):
         """Test successful retrieval of catalog part twins."""
         # Arrange
@@ -381,7 +381,7 @@ class TestTwinManagementService:
             assert result.global_id == sample_global_id
             mock_dtr_provider.create_or_update_shell_descriptor.assert_called_once()
 
-    @patch('services.provider.twin_management_service.RepositoryManagerFactory.create')
+    @patch('services.provider.twin_management_service.RepositoryManagerFactory.create_read_only')
     def test_get_serialized_part_twins_success(self, mock_repo_factory, mock_twin):
         """Test successful retrieval of serialized part twins."""
         # Arrange
@@ -976,8 +976,8 @@ class TestTwinManagementService:
         # Assert
         assert result == mock_new_registration
         mock_repo.twin_aspect_registration_repository.create_new.assert_called_once()
-        mock_repo.commit.assert_called()
-        mock_repo.refresh.assert_called()
+        # The registration is committed together with the registration steps
+        mock_repo.commit.assert_not_called()
 
     @patch('services.provider.twin_management_service.ConfigManager')
     @patch('services.provider.twin_management_service.connector_manager')
@@ -1064,5 +1064,5 @@ class TestTwinManagementService:
             semantic_id=sample_semantic_id,
             submodel_id=None
         )
-        mock_repo.commit.assert_called_once()
-        mock_repo.refresh.assert_called_once_with(mock_new_aspect)
+        mock_repo.flush.assert_called_once()
+        mock_repo.commit.assert_not_called()
@@ -0,0 +1,63 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+
+
+import pytest
+
+from tools import import_tools
+from tools.import_tools import parse_records
+
+# Other test modules replace tools.exceptions by a mock, use the class the module raises
+InvalidError = import_tools.InvalidError
+
+
+class TestParseRecords:
+    """Test suite for the parsing of the bulk import documents."""
+
+    def test_json_array(self):
+        """Test that each object of a JSON array is one record and other values fail their row."""
+        assert parse_records(b'[{"van": "V1"}, 3]', "application/json") == [({"van": "V1"}, None), (None, "The row must be an object.")]
+
+    def test_ndjson_skips_blank_lines(self):
+        """Test that each non-blank line is one record."""
+        records = parse_records(b'{"van": "V1"}\n\n{"van": "V2"}\nnot json\n', "application/x-ndjson")
+
+        assert [record for record, _ in records] == [{"van": "V1"}, {"van": "V2"}, None]
+        assert "not valid JSON" in records[2][1]
+
+    def test_csv_empty_cells_are_missing_values(self):
+        """Test that the header names the fields and empty cells are None."""
+        content = "\ufeffpartInstanceId,van\r\nSN-1,\r\nSN-2,V2\r\n".encode("utf-8")
+
+        assert parse_records(content, "text/csv") == [({"partInstanceId": "SN-1", "van": None}, None), ({"partInstanceId": "SN-2", "van": "V2"}, None)]
+
+    @pytest.mark.parametrize("content,content_type", [
+        (b"[]", "application/xml"),
+        (b'{"van": "V1"}', "application/json"),
+        (b"[", "application/json"),
+        (b"\xff", "text/csv"),
+    ])
+    def test_invalid_documents_are_rejected(self, content, content_type):
+        """Test that a document which cannot be split into rows is rejected as a whole."""
+        with pytest.raises(InvalidError):
+            parse_records(content, content_type)
@@ -0,0 +1,66 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+from datetime import datetime
+
+import pytest
+
+from tools import pagination_tools
+from tools.pagination_tools import decode_cursor, encode_cursor, split_page
+
+# Other test modules replace tools.exceptions by a mock, use the class the module raises
+InvalidError = pagination_tools.InvalidError
+
+
+class TestPaginationTools:
+    """Test suite for the opaque keyset cursors."""
+
+    def test_cursor_round_trip(self):
+        """Test that a cursor decodes to the keyset it was created from."""
+        created_date = datetime(2025, 6, 1, 12, 30, 15, 123456)
+
+        cursor = encode_cursor(created_date, 42)
+
+        assert "=" not in cursor
+        assert decode_cursor(cursor) == (created_date, 42)
+
+    @pytest.mark.parametrize("cursor", ["not-a-cursor", "", "WzFd", encode_cursor(datetime(2025, 1, 1), 1)[:-3]])
+    def test_invalid_cursor_is_rejected(self, cursor):
+        """Test that a tampered cursor is reported as invalid input."""
+        with pytest.raises(InvalidError):
+            decode_cursor(cursor)
+
+    def test_split_page_returns_next_cursor_for_extra_row(self):
+        """Test that the extra row is removed and the cursor points after the last returned row."""
+        rows = [(datetime(2025, 1, 3), 3), (datetime(2025, 1, 2), 2), (datetime(2025, 1, 1), 1)]
+
+        page, cursor = split_page(rows, 2, lambda row: row)
+
+        assert page == rows[:2]
+        assert decode_cursor(cursor) == rows[1]
+
+    def test_split_page_last_page_has_no_cursor(self):
+        """Test that a page with at most limit rows is the last one."""
+        rows = [(datetime(2025, 1, 1), 1)]
+
+        assert split_page(rows, 2, lambda row: row) == (rows, None)
+        assert split_page(rows, None, lambda row: row) == (rows, None)
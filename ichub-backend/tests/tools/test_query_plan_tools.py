@@ -0,0 +1,67 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+
+from sqlalchemy import create_engine, text
+
+from tools.query_plan_tools import SequentialScan, capture_statements, find_sequential_scans, is_explained
+
+
+class TestQueryPlanTools:
+    """Test suite for the helpers of the index advisor."""
+
+    def test_find_sequential_scans_of_analyzed_plan(self):
+        """Test that the scans of nested plans are found, with the rows read over all loops."""
+        plan = {
+            "Node Type": "Nested Loop",
+            "Plans": [
+                {"Node Type": "Index Scan", "Relation Name": "twin", "Index Name": "twin_pkey", "Actual Rows": 1, "Actual Loops": 10},
+                {
+                    "Node Type": "Hash",
+                    "Plans": [{
+                        "Node Type": "Seq Scan", "Relation Name": "serialized_part", "Filter": "(van = 'VAN1')",
+                        "Actual Rows": 1, "Rows Removed by Filter": 99, "Actual Loops": 2
+                    }]
+                }
+            ]
+        }
+
+        assert find_sequential_scans(plan) == [SequentialScan("serialized_part", 200, "(van = 'VAN1')")]
+
+    def test_find_sequential_scans_of_estimated_plan(self):
+        """Test that the estimated rows are used when the plan was not analyzed."""
+        plan = {"Node Type": "Seq Scan", "Relation Name": "twin", "Plan Rows": 5000}
+
+        assert find_sequential_scans(plan) == [SequentialScan("twin", 5000, None)]
+
+    def test_capture_statements_records_only_within_context(self):
+        """Test that the statements are recorded while the context is open, and only the queries are explained."""
+        engine = create_engine("sqlite://")
+        with engine.connect() as connection:
+            connection.execute(text("CREATE TABLE part (id INTEGER PRIMARY KEY)"))
+            with capture_statements(engine) as statements:
+                connection.execute(text("INSERT INTO part (id) VALUES (:id)"), {"id": 1})
+                connection.execute(text("SELECT id FROM part WHERE id = :id"), {"id": 1})
+            connection.execute(text("SELECT id FROM part"))
+
+        assert [statement for statement, _ in statements] == ["INSERT INTO part (id) VALUES (?)", "SELECT id FROM part WHERE id = ?"]
+        assert [is_explained(statement) for statement, _ in statements] == [False, True]
@@ -0,0 +1,45 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+
+from tools.search_tools import highlight
+
+
+class TestSearchTools:
+    """Test suite for the highlighting of the search results."""
+
+    def test_occurrences_of_the_text_are_highlighted(self):
+        """Test that every occurrence of the searched text is highlighted, ignoring case."""
+        assert highlight("Housing of the rear HOUSING", "housing") == [(0, 7), (20, 27)]
+
+    def test_adjacent_occurrences_are_merged(self):
+        """Test that the ranges do not overlap or touch."""
+        assert highlight("aaaa", "aa") == [(0, 4)]
+
+    def test_terms_are_highlighted_when_the_text_does_not_occur(self):
+        """Test that the terms of the text are highlighted one by one."""
+        assert highlight("Aluminium housing left", "housing alu") == [(0, 3), (10, 17)]
+
+    def test_similar_words_are_highlighted_for_fuzzy_matches(self):
+        """Test that a word of the value similar to a term is highlighted, and nothing else."""
+        assert highlight("Aluminium housing", "alumnium") == [(0, 9)]
+        assert highlight("Bracket", "housing") == []
@@ -0,0 +1,120 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+
+import threading
+import time
+
+from utils.batch_jobs import BatchChunk, BatchJob, BatchJobs, BatchJobStatus
+
+
+def _wait(job, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not job.done and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+
+class TestBatchJob:
+    """Test suite for the progress tracking of a batch job."""
+
+    def test_snapshot_reports_the_progress(self):
+        """Test that the counters add up to the processed items."""
+        job = BatchJob(operation="test", total=5)
+        job.succeed(2)
+        job.skip()
+        job.fail("item-4", "broken")
+
+        snapshot = job.snapshot()
+        assert snapshot["status"] == BatchJobStatus.PENDING
+        assert (snapshot["total"], snapshot["processed"], snapshot["succeeded"], snapshot["skipped"], snapshot["failed"]) == (5, 4, 2, 1, 1)
+        assert snapshot["errors"] == [{"key": "item-4", "error": "broken"}]
+
+    def test_errors_are_limited(self):
+        """Test that only the first errors are kept while all failures are counted."""
+        job = BatchJob(operation="test")
+        for i in range(BatchJob.MAX_ERRORS + 10):
+            job.fail(f"item-{i}", "broken")
+
+        assert job.failed == BatchJob.MAX_ERRORS + 10
+        assert len(job.errors) == BatchJob.MAX_ERRORS
+
+    def test_chunk_reports_every_item_once(self):
+        """Test that the outcomes of a chunk are reported together, the items without outcome failed with the error of the chunk."""
+        job = BatchJob(operation="test", total=4)
+        chunk = BatchChunk(job, ["item-1", "item-2", "item-3", "item-4"])
+        chunk.succeed("item-1")
+        chunk.skip("item-2")
+        chunk.fail("item-3", "broken")
+        assert job.snapshot()["processed"] == 0
+
+        chunk.report("chunk not stored")
+
+        assert (job.succeeded, job.skipped, job.failed) == (1, 1, 2)
+        assert job.errors == {"item-3": "broken", "item-4": "chunk not stored"}
+
+
+class TestBatchJobs:
+    """Test suite for the registry running the batch jobs in the background."""
+
+    def test_job_runs_in_the_background(self):
+        """Test that the submitted job is running until its function returns."""
+        release = threading.Event()
+
+        def run(job):
+            job.add_total(1)
+            release.wait(5)
+            job.succeed()
+
+        job = BatchJobs.submit(BatchJob(operation="test"), run)
+        assert BatchJobs.get(job.id) is job
+        assert not job.done
+
+        release.set()
+        _wait(job)
+        assert job.status == BatchJobStatus.COMPLETED
+        assert job.succeeded == 1
+        assert job.finished_date >= job.started_date
+
+    def test_failing_job_reports_the_error(self):
+        """Test that an exception aborts the job with its message."""
+        def run(job):
+            raise RuntimeError("database unavailable")
+
+        job = BatchJobs.submit(BatchJob(operation="test"), run)
+        _wait(job)
+
+        assert job.status == BatchJobStatus.FAILED
+        assert job.error == "database unavailable"
+
+    def test_only_the_last_finished_jobs_are_kept(self, monkeypatch):
+        """Test that the oldest finished jobs are evicted when new jobs are submitted."""
+        monkeypatch.setattr(BatchJobs, "MAX_FINISHED_JOBS", 2)
+        jobs = []
+        for _ in range(4):
+            jobs.append(BatchJobs.submit(BatchJob(operation="test"), lambda job: None))
+            _wait(jobs[-1])
+
+        BatchJobs.submit(BatchJob(operation="test"), lambda job: None)
+
+        assert BatchJobs.get(jobs[0].id) is None
+        assert BatchJobs.get(jobs[1].id) is None
+        assert BatchJobs.get(jobs[3].id) is jobs[3]
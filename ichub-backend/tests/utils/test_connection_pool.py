@@ -0,0 +1,64 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+
+from utils.connection_pool import MonitoredQueuePool
+
+
+class TestMonitoredQueuePool:
+    """Test suite for the usage statistics of the monitored connection pool."""
+
+    def setup_method(self):
+        self.engine = create_engine("sqlite://", poolclass=MonitoredQueuePool, pool_size=1, max_overflow=1, pool_timeout=0.05)
+
+    def teardown_method(self):
+        self.engine.dispose()
+
+    def test_stats_report_checkouts_and_overflow(self):
+        """Test that the checked out and overflow connections are reported while the pool is saturated."""
+        with self.engine.connect() as first, self.engine.connect() as second:
+            first.execute(text("SELECT 1"))
+            second.execute(text("SELECT 1"))
+
+            stats = self.engine.pool.stats()
+            assert stats["checkedOut"] == 2
+            assert stats["overflow"] == 1
+            assert stats["saturation"] == 1.0
+
+        stats = self.engine.pool.stats()
+        assert stats["checkedOut"] == 0
+        assert stats["peakCheckedOut"] == 2
+        assert stats["checkouts"] == 2
+
+    def test_timeouts_are_counted(self):
+        """Test that a checkout failing because the pool and its overflow are exhausted is counted."""
+        with self.engine.connect(), self.engine.connect():
+            with pytest.raises(PoolTimeoutError):
+                self.engine.connect()
+
+            stats = self.engine.pool.stats()
+            assert stats["timeouts"] == 1
+            assert stats["checkouts"] == 2
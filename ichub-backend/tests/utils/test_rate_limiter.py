@@ -0,0 +1,75 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+
+from utils.rate_limiter import RateLimiter
+
+
+class FakeClock:
+    """Clock advanced by the sleeps of the limiter."""
+
+    def __init__(self):
+        self.now = 100.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(round(seconds, 6))
+        self.now += seconds
+
+
+class TestRateLimiter:
+    """Test suite for the spacing of calls by the rate limiter."""
+
+    def test_calls_are_spaced_by_the_interval(self):
+        """Test that a burst of calls is spread over time at the configured rate."""
+        clock = FakeClock()
+        limiter = RateLimiter(rate=4, clock=clock, sleep=clock.sleep)
+
+        for _ in range(4):
+            limiter.acquire()
+
+        assert clock.sleeps == [0.25, 0.25, 0.25]
+
+    def test_idle_time_is_not_saved_up(self):
+        """Test that a pause does not allow a burst above the rate afterwards."""
+        clock = FakeClock()
+        limiter = RateLimiter(rate=2, clock=clock, sleep=clock.sleep)
+
+        limiter.acquire()
+        clock.now += 10
+        limiter.acquire()
+        limiter.acquire()
+
+        assert clock.sleeps == [0.5]
+
+    def test_zero_rate_disables_the_limit(self):
+        """Test that a rate of 0 never waits."""
+        clock = FakeClock()
+        limiter = RateLimiter(rate=0, clock=clock, sleep=clock.sleep)
+
+        for _ in range(10):
+            limiter.acquire()
+
+        assert clock.sleeps == []
@@ -0,0 +1,100 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+
+from unittest.mock import patch
+
+from sqlalchemy import create_engine
+
+from utils.connection_pool import MonitoredQueuePool
+from utils.replica_router import (
+    FALLBACK_LAGGING, FALLBACK_NOT_CONFIGURED, FALLBACK_UNAVAILABLE, Replica, ReplicaRouter
+)
+
+
+class TestReplicaRouter:
+    """Test suite for the lag-aware routing of the read-only sessions to the read replicas."""
+
+    def setup_method(self):
+        self.lags = {}
+        self.replicas = [
+            Replica(f"replica-{index}", create_engine("sqlite://", poolclass=MonitoredQueuePool))
+            for index in range(2)
+        ]
+        self.router = ReplicaRouter(self.replicas, max_lag=5, check_interval=10, lag_reader=self._read_lag)
+
+    def teardown_method(self):
+        for replica in self.replicas:
+            replica.engine.dispose()
+
+    def _read_lag(self, engine):
+        lag = self.lags[engine]
+        if isinstance(lag, Exception):
+            raise lag
+        return lag
+
+    def _set_lags(self, *lags):
+        self.lags = {replica.engine: lag for replica, lag in zip(self.replicas, lags)}
+        self.router.check_lag()
+
+    def test_reads_are_spread_over_the_replicas_within_the_lag(self):
+        """Test that the reads go round robin to the replicas lagging less than max_lag."""
+        self._set_lags(0.5, 2)
+
+        routed = [self.router.route().name for _ in range(4)]
+
+        assert routed == ["replica-0", "replica-1", "replica-0", "replica-1"]
+        assert self.router.stats()["replicaReads"] == 4
+
+    def test_lagging_replica_is_skipped(self):
+        """Test that a replica lagging more than max_lag receives no reads, and that all of them lagging falls back to the primary."""
+        self._set_lags(30, 1)
+        assert {self.router.route().name for _ in range(3)} == {"replica-1"}
+
+        self._set_lags(30, None)
+        assert self.router.route() is None
+        assert self.router.stats()["primaryReads"] == {FALLBACK_LAGGING: 1}
+
+    def test_unavailable_replicas_fall_back_to_the_primary(self):
+        """Test that the reads go to the primary when the lag of no replica can be read."""
+        self._set_lags(ConnectionError("down"), ConnectionError("down"))
+
+        assert self.router.route() is None
+        stats = self.router.stats()
+        assert stats["primaryReads"] == {FALLBACK_UNAVAILABLE: 1}
+        assert [replica["available"] for replica in stats["replicas"]] == [False, False]
+
+    def test_stale_lag_check_falls_back_to_the_primary(self):
+        """Test that a replica is not used once its last lag check is older than three check intervals."""
+        self._set_lags(0, 0)
+
+        with patch("utils.replica_router.time.monotonic", return_value=self.replicas[0].checked_at + 31):
+            assert self.router.route() is None
+
+    def test_no_replica_configured(self):
+        """Test that without replicas every read goes to the primary and the lag is never checked."""
+        router = ReplicaRouter([], lag_reader=self._read_lag)
+        router.start()
+
+        assert router.route() is None
+        assert router._thread is None
+        assert router.stats()["primaryReads"] == {FALLBACK_NOT_CONFIGURED: 1}
@@ -0,0 +1,127 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+
+import asyncio
+import threading
+from contextlib import contextmanager
+
+import pytest
+
+from utils.async_utils import AsyncManagerWrapper, run_in_pool
+from utils.thread_pools import ThreadPools, MonitoredThreadPoolExecutor, DEFAULT_POOL, DATABASE_POOL, HTTP_POOL, FILE_IO_POOL
+
+
+class TestMonitoredThreadPoolExecutor:
+    """Test suite for the usage statistics of the monitored pool."""
+
+    def test_stats_report_active_queued_and_saturation(self):
+        """Test that running and waiting tasks are reported while the pool is saturated."""
+        pool = MonitoredThreadPoolExecutor(name="test", max_workers=2)
+        release = threading.Event()
+        started = threading.Semaphore(0)
+
+        def task():
+            started.release()
+            release.wait()
+
+        try:
+            futures = [pool.submit(task) for _ in range(5)]
+            started.acquire()
+            started.acquire()
+
+            stats = pool.stats()
+            assert stats["maxWorkers"] == 2
+            assert stats["active"] == 2
+            assert stats["queued"] == 3
+            assert stats["saturation"] == 1.0
+        finally:
+            release.set()
+            pool.shutdown(wait=True)
+
+        assert all(future.done() for future in futures)
+        stats = pool.stats()
+        assert stats["active"] == 0
+        assert stats["queued"] == 0
+        assert stats["completed"] == 5
+        assert stats["peakActive"] == 2
+
+
+class TestThreadPools:
+    """Test suite for the named thread pool registry."""
+
+    def teardown_method(self):
+        """Shut down the pools after each test method."""
+        ThreadPools.shutdown()
+
+    def test_pools_are_sized_from_configuration(self):
+        """Test that the worker threads size the default pool and the pools section the named ones."""
+        ThreadPools.start({"worker_threads": 8, "pools": {DATABASE_POOL: 3, HTTP_POOL: 4}})
+
+        stats = ThreadPools.stats()
+        assert stats[DEFAULT_POOL]["maxWorkers"] == 8
+        assert stats[DATABASE_POOL]["maxWorkers"] == 3
+        assert stats[HTTP_POOL]["maxWorkers"] == 4
+        assert stats[FILE_IO_POOL]["maxWorkers"] == ThreadPools.DEFAULT_SIZES[FILE_IO_POOL]
+
+    def test_get_without_started_pools(self):
+        """Test that no pool is returned before start, so the loop default executor is used."""
+        assert ThreadPools.get(DATABASE_POOL) is None
+
+    def test_unknown_pool_resolves_to_default(self):
+        """Test that an unknown pool name falls back to the default pool."""
+        ThreadPools.start({})
+
+        assert ThreadPools.get("unknown") is ThreadPools.get(DEFAULT_POOL)
+
+    def test_wrapper_runs_in_named_pool(self):
+        """Test that the async manager wrapper runs its calls in the configured pool."""
+        ThreadPools.start({"pools": {FILE_IO_POOL: 1}})
+
+        class Manager:
+            def thread_name(self):
+                return threading.current_thread().name
+
+        wrapper = AsyncManagerWrapper(Manager(), "Manager", pool=FILE_IO_POOL)
+
+        assert asyncio.run(wrapper.thread_name()).startswith(f"pool-{FILE_IO_POOL}")
+        assert asyncio.run(run_in_pool(HTTP_POOL, lambda: threading.current_thread().name)).startswith(f"pool-{HTTP_POOL}")
+        assert ThreadPools.stats()[FILE_IO_POOL]["completed"] == 1
+
+    def test_wrapper_runs_calls_in_scope(self):
+        """Test that the async manager wrapper enters its scope in the pool thread around each call."""
+        ThreadPools.start({"pools": {DATABASE_POOL: 1}})
+        scope_threads = []
+
+        @contextmanager
+        def scope():
+            scope_threads.append(threading.current_thread().name)
+            yield
+
+        class Manager:
+            def thread_name(self):
+                return threading.current_thread().name
+
+        wrapper = AsyncManagerWrapper(Manager(), "Manager", pool=DATABASE_POOL, scope=scope)
+
+        assert scope_threads == []
+        assert [asyncio.run(wrapper.thread_name())] == scope_threads
@@ -35,3 +35,23 @@ VAN_DESCRIPTION = "The optional VAN (Vehicle Assembly Number) of the serialized
 
 # ==================== API VERSIONS =========================
 API_V1 = "v1"
+
+# ==================== PAGINATION =========================
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+# ==================== SEARCH =========================
+MIN_SEARCH_LENGTH = 2
+DEFAULT_SEARCH_PAGE_SIZE = 20
+MAX_SEARCH_PAGE_SIZE = 100
+# The results of a search are ranked and paged with an offset, deeper pages are not served
+MAX_SEARCH_OFFSET = 1000
+
+# ==================== BULK IMPORT =========================
+IMPORT_CHUNK_SIZE = 5000
+CSV_CONTENT_TYPE = "text/csv"
+NDJSON_CONTENT_TYPE = "application/x-ndjson"
+JSON_CONTENT_TYPE = "application/json"
+# Default number of serialized parts whose twins are written in one transaction by a batch job
+TWIN_BATCH_CHUNK_SIZE = 1000
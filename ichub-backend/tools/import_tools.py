@@ -0,0 +1,82 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+import csv
+import io
+import json
+from typing import Any, Dict, List, Optional, Tuple
+
+from tools.constants import CSV_CONTENT_TYPE, JSON_CONTENT_TYPE, NDJSON_CONTENT_TYPE
+from tools.exceptions import InvalidError
+
+Record = Tuple[Optional[Dict[str, Any]], Optional[str]]
+
+def parse_records(content: bytes, content_type: Optional[str]) -> List[Record]:
+    """
+    Parse an uploaded document into records, according to its content type.
+
+    Accepts a JSON array of objects, newline delimited JSON objects or CSV with a header row.
+    Returns one (record, error) tuple per row, so a malformed row does not reject the whole document.
+    """
+    media_type = (content_type or JSON_CONTENT_TYPE).split(";")[0].strip().lower()
+    try:
+        text = content.decode("utf-8-sig")
+    except UnicodeDecodeError as e:
+        raise InvalidError(f"The document is not UTF-8 encoded: {e}")
+
+    if media_type == CSV_CONTENT_TYPE:
+        return _parse_csv(text)
+    if media_type in (NDJSON_CONTENT_TYPE, "application/ndjson", "application/jsonl"):
+        return _parse_ndjson(text)
+    if media_type == JSON_CONTENT_TYPE:
+        return _parse_json(text)
+    raise InvalidError(f"Unsupported content type '{media_type}', expected {JSON_CONTENT_TYPE}, {NDJSON_CONTENT_TYPE} or {CSV_CONTENT_TYPE}.")
+
+def _parse_json(text: str) -> List[Record]:
+    try:
+        document = json.loads(text)
+    except json.JSONDecodeError as e:
+        raise InvalidError(f"The document is not valid JSON: {e}")
+    if not isinstance(document, list):
+        raise InvalidError("The document must be a JSON array of objects.")
+    return [_record(item) for item in document]
+
+def _parse_ndjson(text: str) -> List[Record]:
+    records = []
+    for line in text.splitlines():
+        if not line.strip():
+            continue
+        try:
+            records.append(_record(json.loads(line)))
+        except json.JSONDecodeError as e:
+            records.append((None, f"The line is not valid JSON: {e}"))
+    return records
+
+def _parse_csv(text: str) -> List[Record]:
+    reader = csv.DictReader(io.StringIO(text))
+    # Empty cells stand for missing optional values
+    return [({key: value if value != "" else None for key, value in row.items() if key}, None) for row in reader]
+
+def _record(item: Any) -> Record:
+    if not isinstance(item, dict):
+        return None, "The row must be an object."
+    return item, None
@@ -0,0 +1,87 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Callable, List, Optional, Tuple, TypeVar
+
+from tools.exceptions import InvalidError
+
+T = TypeVar("T")
+
+
+def encode_cursor(created_date: datetime, id: int) -> str:
+    """
+    Encodes the keyset of the last returned row into an opaque cursor.
+
+    Args:
+        created_date: The creation date of the last returned row
+        id: The ID of the last returned row
+
+    Returns:
+        The URL safe cursor pointing after the given row
+    """
+    payload = json.dumps([created_date.isoformat(), id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """
+    Decodes a cursor created by encode_cursor.
+
+    Args:
+        cursor: The cursor received from the client
+
+    Returns:
+        The creation date and the ID of the row the next page starts after
+
+    Raises:
+        InvalidError: If the cursor was not created by encode_cursor
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_date, id = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        if not isinstance(id, int) or isinstance(id, bool):
+            raise ValueError("The cursor ID must be an integer")
+        return datetime.fromisoformat(created_date), id
+    except (binascii.Error, UnicodeError, TypeError, ValueError) as e:
+        raise InvalidError(f"Invalid pagination cursor: {cursor}") from e
+
+
+def split_page(rows: List[T], limit: Optional[int], keyset: Callable[[T], Tuple[datetime, int]]) -> Tuple[List[T], Optional[str]]:
+    """
+    Splits the rows fetched with limit + 1 into the requested page and the cursor of the next one.
+
+    Args:
+        rows: The rows fetched from the database, at most limit + 1
+        limit: The requested page size, None if the rows were not paginated
+        keyset: Returns the (created_date, id) of a row
+
+    Returns:
+        The rows of the page and the cursor of the next page, None if this is the last page
+    """
+    if limit is None or len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    return rows, encode_cursor(*keyset(rows[-1]))
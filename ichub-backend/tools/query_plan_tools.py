@@ -0,0 +1,106 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+
+import json
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Connection, Engine
+
+SEQ_SCAN = "Seq Scan"
+
+# Statements whose plan is checked, inserts are not planned against the indexes
+EXPLAINED_STATEMENTS = ("SELECT", "WITH", "UPDATE", "DELETE")
+
+
+class SequentialScan(NamedTuple):
+    """A sequential scan found in a query plan."""
+
+    relation: str
+    rows: float
+    filter: Optional[str]
+
+
+@contextmanager
+def capture_statements(engine: Engine) -> Iterator[List[Tuple[str, Any]]]:
+    """
+    Record the statements and their parameters sent to the database while the context is open.
+
+    Usage:
+        with capture_statements(engine) as statements:
+            repository.find(...)
+        for statement, parameters in statements:
+            ...
+    """
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        # The statements of executemany are inserts of many rows, which have no plan to check
+        if not executemany:
+            statements.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+
+def is_explained(statement: str) -> bool:
+    """Whether the plan of the statement is checked."""
+    return statement.lstrip().upper().startswith(EXPLAINED_STATEMENTS)
+
+
+def explain(connection: Connection, statement: str, parameters: Any = None, analyze: bool = True) -> Dict[str, Any]:
+    """
+    Return the plan of a statement, as the root node of EXPLAIN (FORMAT JSON).
+
+    With analyze the statement is executed, the caller has to roll back the changes of the
+    updates and deletes.
+    """
+    options = "ANALYZE, FORMAT JSON" if analyze else "FORMAT JSON"
+    result = connection.exec_driver_sql(f"EXPLAIN ({options}) {statement}", parameters or {}).scalar()
+    plans = json.loads(result) if isinstance(result, str) else result
+    return plans[0]["Plan"]
+
+
+def find_sequential_scans(plan: Dict[str, Any]) -> List[SequentialScan]:
+    """
+    Return the sequential scans of a plan and of all its sub plans.
+
+    The rows are the ones read by the scan: the rows it returned and removed by its filter
+    over all its loops when the plan was analyzed, the estimated rows otherwise.
+    """
+    scans = []
+    nodes = [plan]
+    while nodes:
+        node = nodes.pop()
+        if node.get("Node Type") == SEQ_SCAN:
+            if "Actual Rows" in node:
+                rows = (node["Actual Rows"] + node.get("Rows Removed by Filter", 0)) * node.get("Actual Loops", 1)
+            else:
+                rows = node.get("Plan Rows", 0)
+            scans.append(SequentialScan(node.get("Relation Name", ""), rows, node.get("Filter")))
+        nodes.extend(node.get("Plans", []))
+    return scans
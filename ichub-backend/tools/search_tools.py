@@ -0,0 +1,80 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+
+import re
+from difflib import SequenceMatcher
+from typing import List, Tuple
+
+# Similarity from which a word of a value is highlighted as a fuzzy match of a searched term
+FUZZY_HIGHLIGHT_RATIO = 0.6
+
+WORD = re.compile(r"\w+")
+
+
+def _occurrences(value: str, term: str) -> List[Tuple[int, int]]:
+    ranges = []
+    start = value.find(term)
+    while start >= 0 and term:
+        ranges.append((start, start + len(term)))
+        start = value.find(term, start + len(term))
+    return ranges
+
+
+def _merge(ranges: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
+    merged: List[Tuple[int, int]] = []
+    for start, end in sorted(ranges):
+        if merged and start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(end, merged[-1][1]))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def highlight(value: str, text: str) -> List[Tuple[int, int]]:
+    """
+    Returns the character ranges of a value matching a searched text, ignoring case.
+
+    The occurrences of the whole text are highlighted, else the occurrences of its terms, else the
+    words of the value similar to one of the terms, for values matched despite a typo.
+
+    Args:
+        value: The value found by the search
+        text: The searched text
+
+    Returns:
+        The sorted, non overlapping (start, end) ranges of the value to highlight
+    """
+    value, text = value.lower(), text.strip().lower()
+    ranges = _occurrences(value, text)
+    if ranges:
+        return _merge(ranges)
+
+    terms = text.split()
+    ranges = [occurrence for term in terms for occurrence in _occurrences(value, term)]
+    if ranges:
+        return _merge(ranges)
+
+    return [
+        word.span() for word in WORD.finditer(value)
+        if any(SequenceMatcher(None, word.group(), term).ratio() >= FUZZY_HIGHLIGHT_RATIO for term in terms)
+    ]
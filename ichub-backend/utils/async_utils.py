@@ -23,9 +23,11 @@
 import asyncio
 import functools
 from functools import wraps
-from typing import Callable, Any
+from typing import Callable, Any, ContextManager, Optional
 import logging
 
+from utils.thread_pools import ThreadPools
+
 logger = logging.getLogger(__name__)
 
 def async_blocking(func: Callable) -> Callable:
@@ -46,10 +48,7 @@ def async_blocking(func: Callable) -> Callable:
     """
     @wraps(func)
     async def wrapper(*args, **kwargs):
-        loop = asyncio.get_event_loop()
-        # Use functools.partial to bind keyword arguments
-        bound_func = functools.partial(func, *args, **kwargs)
-        return await loop.run_in_executor(None, bound_func)
+        return await run_in_pool(None, func, *args, **kwargs)
     return wrapper
 
 async def run_blocking(func: Callable, *args, **kwargs) -> Any:
@@ -59,10 +58,21 @@ async def run_blocking(func: Callable, *args, **kwargs) -> Any:
     Usage:
         result = await run_blocking(blocking_function, arg1, arg2, kwarg1=value1)
     """
-    loop = asyncio.get_event_loop()
+    return await run_in_pool(None, func, *args, **kwargs)
+
+async def run_in_pool(pool: Optional[str], func: Callable, *args, **kwargs) -> Any:
+    """
+    Utility function to run any blocking function in a named thread pool.
+
+    Falls back to the default executor of the loop if the thread pools are not started.
+    
+    Usage:
+        result = await run_in_pool(HTTP_POOL, blocking_function, arg1, kwarg1=value1)
+    """
+    loop = asyncio.get_running_loop()
     # Use functools.partial to bind keyword arguments
     bound_func = functools.partial(func, *args, **kwargs)
-    return await loop.run_in_executor(None, bound_func)
+    return await loop.run_in_executor(ThreadPools.get(pool), bound_func)
 
 class AsyncManagerWrapper:
     """
@@ -78,11 +88,25 @@ class AsyncManagerWrapper:
         
         # Or use the more direct approach
         result = await async_manager.some_method(arg1, arg2)
+
+        # Run the methods in a named thread pool
+        async_manager = AsyncManagerWrapper(some_manager, pool=DATABASE_POOL)
+
+        # Run each method call within a scope entered in the pool thread, e.g. one database session per request
+        async_manager = AsyncManagerWrapper(some_manager, pool=DATABASE_POOL, scope=RepositoryManagerFactory.session_scope)
     """
     
-    def __init__(self, manager, name: str = "Manager"):
+    def __init__(self, manager, name: str = "Manager", pool: Optional[str] = None, scope: Optional[Callable[[], ContextManager]] = None):
         self._manager = manager
         self._name = name
+        self._pool = pool
+        self._scope = scope
+
+    def _run(self, method: Callable, *args, **kwargs):
+        if self._scope is None:
+            return method(*args, **kwargs)
+        with self._scope():
+            return method(*args, **kwargs)
     
     async def call_method(self, method_name: str, *args, **kwargs):
         """Generic method caller that runs any method in thread pool."""
@@ -90,10 +114,7 @@ class AsyncManagerWrapper:
             raise AttributeError(f"{self._name} has no method '{method_name}'")
         
         method = getattr(self._manager, method_name)
-        loop = asyncio.get_event_loop()
-        # Use functools.partial to bind keyword arguments
-        bound_method = functools.partial(method, *args, **kwargs)
-        return await loop.run_in_executor(None, bound_method)
+        return await run_in_pool(self._pool, self._run, method, *args, **kwargs)
     
     def __getattr__(self, name):
         """Dynamically create async versions of manager methods."""
@@ -101,10 +122,7 @@ class AsyncManagerWrapper:
             original_method = getattr(self._manager, name)
             if callable(original_method):
                 async def async_method(*args, **kwargs):
-                    loop = asyncio.get_event_loop()
-                    # Use functools.partial to bind keyword arguments
-                    bound_method = functools.partial(original_method, *args, **kwargs)
-                    return await loop.run_in_executor(None, bound_method)
+                    return await run_in_pool(self._pool, self._run, original_method, *args, **kwargs)
                 return async_method
         raise AttributeError(f"'{self._name}' object has no attribute '{name}'")
 
@@ -0,0 +1,213 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+
+import enum
+import threading
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from uuid import UUID, uuid4
+import logging
+
+logger = logging.getLogger(__name__)
+
+class BatchJobStatus(str, enum.Enum):
+    """The state of a batch job."""
+
+    PENDING = "pending"
+    """The job is registered but did not start yet."""
+
+    RUNNING = "running"
+    """The job is processing its items."""
+
+    COMPLETED = "completed"
+    """All the items were processed, some of them may have failed."""
+
+    FAILED = "failed"
+    """The job was aborted, see the error of the job."""
+
+class BatchJob:
+    """
+    Progress of one batch job, updated by the threads processing its items.
+
+    Every item ends up succeeded, skipped (nothing to do) or failed. The errors of
+    the failed items are kept by item key, up to MAX_ERRORS of them.
+    """
+
+    MAX_ERRORS = 1000
+
+    def __init__(self, operation: str, total: int = 0):
+        self.id: UUID = uuid4()
+        self.operation = operation
+        self.status = BatchJobStatus.PENDING
+        self.total = total
+        self.succeeded = 0
+        self.skipped = 0
+        self.failed = 0
+        self.errors: Dict[str, str] = {}
+        self.error: Optional[str] = None
+        self.created_date = datetime.now(timezone.utc)
+        self.started_date: Optional[datetime] = None
+        self.finished_date: Optional[datetime] = None
+        self._lock = threading.Lock()
+
+    def add_total(self, count: int) -> None:
+        with self._lock:
+            self.total += count
+
+    def succeed(self, count: int = 1) -> None:
+        with self._lock:
+            self.succeeded += count
+
+    def skip(self, count: int = 1) -> None:
+        with self._lock:
+            self.skipped += count
+
+    def fail(self, key: str, error: str) -> None:
+        with self._lock:
+            self.failed += 1
+            if len(self.errors) < self.MAX_ERRORS:
+                self.errors[key] = error
+
+    def start(self) -> None:
+        with self._lock:
+            self.status = BatchJobStatus.RUNNING
+            self.started_date = datetime.now(timezone.utc)
+
+    def finish(self, error: Optional[str] = None) -> None:
+        with self._lock:
+            self.status = BatchJobStatus.FAILED if error else BatchJobStatus.COMPLETED
+            self.error = error
+            self.finished_date = datetime.now(timezone.utc)
+
+    @property
+    def done(self) -> bool:
+        return self.status in (BatchJobStatus.COMPLETED, BatchJobStatus.FAILED)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return a consistent copy of the progress of the job."""
+        with self._lock:
+            return {
+                "jobId": self.id,
+                "operation": self.operation,
+                "status": self.status,
+                "total": self.total,
+                "processed": self.succeeded + self.skipped + self.failed,
+                "succeeded": self.succeeded,
+                "skipped": self.skipped,
+                "failed": self.failed,
+                "errors": [{"key": key, "error": error} for key, error in self.errors.items()],
+                "error": self.error,
+                "createdDate": self.created_date,
+                "startedDate": self.started_date,
+                "finishedDate": self.finished_date,
+            }
+
+class BatchChunk:
+    """
+    Outcomes of the items of one chunk of a batch job, reported to the job once the chunk is stored.
+
+    The items whose outcome is not known when the chunk is reported, e.g. because storing
+    the chunk failed, are failed with the given error, so every item is counted once.
+    """
+
+    def __init__(self, job: BatchJob, keys: List[str]):
+        self.job = job
+        self.keys = keys
+        self._outcomes: Dict[str, Tuple[str, Optional[str]]] = {}
+
+    def succeed(self, key: str) -> None:
+        self._outcomes[key] = ("succeeded", None)
+
+    def skip(self, key: str) -> None:
+        self._outcomes[key] = ("skipped", None)
+
+    def fail(self, key: str, error: str) -> None:
+        self._outcomes[key] = ("failed", error)
+
+    def report(self, error: str) -> None:
+        """Report the outcome of every item of the chunk to the job, failing the items without outcome with the error."""
+        for key in self.keys:
+            outcome, item_error = self._outcomes.get(key, ("failed", error))
+            if outcome == "succeeded":
+                self.job.succeed()
+            elif outcome == "skipped":
+                self.job.skip()
+            else:
+                self.job.fail(key, item_error)
+
+class BatchJobs:
+    """
+    Registry of the batch jobs of this process, each running in its own background thread.
+
+    The jobs only live in memory: their progress is lost on restart and only visible on
+    the replica which started them. The jobs are written so that running them again picks
+    up the items which were not processed. Only the last MAX_FINISHED_JOBS finished jobs are kept.
+    """
+
+    MAX_FINISHED_JOBS = 100
+
+    _jobs: "OrderedDict[UUID, BatchJob]" = OrderedDict()
+    _lock = threading.Lock()
+
+    @classmethod
+    def submit(cls, job: BatchJob, run: Callable[[BatchJob], None]) -> BatchJob:
+        """
+        Register the job and run it in a background thread.
+
+        Args:
+            job (BatchJob): The job to track
+            run (Callable[[BatchJob], None]): Processes the items of the job, reporting the progress on it.
+                                              An exception aborts the job with its message as error.
+
+        Returns:
+            BatchJob: The submitted job
+        """
+        with cls._lock:
+            cls._jobs[job.id] = job
+            cls._evict()
+
+        def target():
+            job.start()
+            try:
+                run(job)
+            except Exception as e:
+                logger.error(f"[BatchJobs] Job {job.id} ({job.operation}) failed: {e}", exc_info=True)
+                job.finish(str(e))
+                return
+            job.finish()
+            logger.info(f"[BatchJobs] Job {job.id} ({job.operation}) completed: {job.succeeded} succeeded, {job.skipped} skipped, {job.failed} failed")
+
+        threading.Thread(target=target, name=f"batch-job-{job.operation}", daemon=True).start()
+        return job
+
+    @classmethod
+    def get(cls, job_id: UUID) -> Optional[BatchJob]:
+        with cls._lock:
+            return cls._jobs.get(job_id)
+
+    @classmethod
+    def _evict(cls) -> None:
+        finished = [job_id for job_id, job in cls._jobs.items() if job.done]
+        for job_id in finished[:max(0, len(finished) - cls.MAX_FINISHED_JOBS)]:
+            del cls._jobs[job_id]
@@ -0,0 +1,103 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+
+import threading
+import time
+from typing import Any, Dict
+
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+
+class MonitoredQueuePool(QueuePool):
+    """
+    Connection pool which keeps track of its checkouts and of the time spent waiting for a connection.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._stats_lock = threading.Lock()
+        self._checkouts = 0
+        self._waits = 0
+        self._timeouts = 0
+        self._wait_seconds = 0.0
+        self._max_wait_seconds = 0.0
+        self._peak_checked_out = 0
+
+    def recreate(self) -> "MonitoredQueuePool":
+        # Keep the counters of the pool replaced after an invalidation
+        pool = super().recreate()
+        with self._stats_lock:
+            pool._checkouts, pool._waits, pool._timeouts = self._checkouts, self._waits, self._timeouts
+            pool._wait_seconds, pool._max_wait_seconds = self._wait_seconds, self._max_wait_seconds
+            pool._peak_checked_out = self._peak_checked_out
+        return pool
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except PoolTimeoutError:
+            with self._stats_lock:
+                self._timeouts += 1
+            raise
+        waited = time.perf_counter() - start
+        with self._stats_lock:
+            self._checkouts += 1
+            # A checkout taking more than a millisecond waited for a free slot or opened a new connection
+            if waited > 0.001:
+                self._waits += 1
+            self._wait_seconds += waited
+            self._max_wait_seconds = max(self._max_wait_seconds, waited)
+            self._peak_checked_out = max(self._peak_checked_out, self.checkedout())
+        return connection
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Return the current usage of the pool.
+
+        Returns:
+            Dict[str, Any]: Size, checked out and overflow connections, and the checkouts with the time waited for them
+        """
+        capacity = self.size() + max(0, self._max_overflow)
+        with self._stats_lock:
+            return {
+                "size": self.size(),
+                "maxOverflow": self._max_overflow,
+                "checkedOut": self.checkedout(),
+                "checkedIn": self.checkedin(),
+                "overflow": max(0, self.overflow()),
+                "peakCheckedOut": self._peak_checked_out,
+                "checkouts": self._checkouts,
+                "waits": self._waits,
+                "timeouts": self._timeouts,
+                "waitSecondsTotal": round(self._wait_seconds, 3),
+                "waitSecondsMax": round(self._max_wait_seconds, 3),
+                "saturation": round(self.checkedout() / capacity, 3) if capacity else 0.0
+            }
+
+
+class MonitoredAsyncQueuePool(MonitoredQueuePool, AsyncAdaptedQueuePool):
+    """
+    Monitored connection pool of the async engine, waiting for a free connection without blocking the event loop.
+    """
@@ -0,0 +1,230 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+
+import itertools
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from sqlalchemy import Engine, text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from managers.config.log_manager import LoggingManager
+
+logger = LoggingManager.get_logger(__name__)
+
+# Why a read was routed to the primary instead of a replica
+FALLBACK_NOT_CONFIGURED = "notConfigured"
+FALLBACK_LAGGING = "lagging"
+FALLBACK_UNAVAILABLE = "unavailable"
+FALLBACK_READ_YOUR_WRITES = "readYourWrites"
+
+# Seconds the replica is behind the primary, 0 when it replayed everything it received
+REPLICATION_LAG_QUERY = text("""
+    SELECT CASE
+        WHEN NOT pg_is_in_recovery() THEN 0
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp())
+    END
+""")
+
+def read_replication_lag(engine: Engine) -> Optional[float]:
+    """Return the replication lag of the replica in seconds, None if it is unknown."""
+    with engine.connect() as connection:
+        lag = connection.execute(REPLICATION_LAG_QUERY).scalar()
+    return float(lag) if lag is not None else None
+
+
+class Replica:
+    """A read replica with the state of its last lag check and the reads routed to it."""
+
+    def __init__(self, name: str, engine: Engine, async_engine_factory: Optional[Callable[[Engine], AsyncEngine]] = None):
+        self.name = name
+        self.engine = engine
+        self.lag: Optional[float] = None
+        self.available = False
+        self.checked_at: Optional[float] = None
+        self.reads = 0
+        self._async_engine_factory = async_engine_factory
+        self._async_engine: Optional[AsyncEngine] = None
+
+    @property
+    def async_engine(self) -> AsyncEngine:
+        """The async engine of the replica, created on first use."""
+        if self._async_engine is None:
+            if self._async_engine_factory is None:
+                raise RuntimeError(f"No async engine configured for the replica {self.name}")
+            self._async_engine = self._async_engine_factory(self.engine)
+        return self._async_engine
+
+
+class ReplicaRouter:
+    """
+    Routes the read-only sessions to the read replicas lagging behind the primary less than max_lag.
+
+    A background thread checks the lag of every replica each check_interval seconds. The reads are
+    spread round robin over the replicas within the lag; they go to the primary when no replica is
+    configured, when all replicas lag or are unreachable, and when the last check is older than
+    three check intervals. Every routing decision is counted, see stats.
+    """
+
+    def __init__(self,
+        replicas: List[Replica],
+        max_lag: float = 5,
+        check_interval: float = 5,
+        lag_reader: Callable[[Engine], Optional[float]] = read_replication_lag
+    ):
+        """
+        Initialize the replica router.
+
+        Args:
+            replicas: The read replicas.
+            max_lag (float): Seconds a replica may lag behind the primary and still receive reads.
+            check_interval (float): Seconds between two lag checks.
+            lag_reader: Function returning the lag of a replica in seconds, None if it is unknown.
+        """
+        self.replicas = replicas
+        self.max_lag = max_lag
+        self.check_interval = check_interval
+        self.lag_reader = lag_reader
+        self._lock = threading.Lock()
+        self._round_robin = itertools.count()
+        self._primary_reads: Dict[str, int] = {}
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @classmethod
+    def from_config(cls,
+        replicas_config: Dict[str, Any],
+        engine_factory: Callable[[str], Engine],
+        async_engine_factory: Optional[Callable[[Engine], AsyncEngine]] = None
+    ) -> "ReplicaRouter":
+        """Create the router from the "database.replicas" configuration, with one engine per connection string."""
+        replicas = [
+            Replica(f"replica-{index}", engine_factory(connection_string), async_engine_factory)
+            for index, connection_string in enumerate(replicas_config.get("connectionStrings") or [])
+        ]
+        return cls(replicas, **{key: replicas_config[key] for key in ("max_lag", "check_interval") if key in replicas_config})
+
+    def start(self) -> None:
+        """Start the background thread checking the lag of the replicas."""
+        if not self.replicas or (self._thread and self._thread.is_alive()):
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run_loop, name="replica-lag-check", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the background thread, the reads go to the primary once the last check is stale."""
+        self._stop_event.set()
+        if self._thread:
+            self._thread.join(timeout=self.check_interval + 1)
+
+    def _run_loop(self) -> None:
+        while not self._stop_event.is_set():
+            self.check_lag()
+            self._stop_event.wait(self.check_interval)
+
+    def check_lag(self) -> None:
+        """Check the lag of every replica."""
+        for replica in self.replicas:
+            try:
+                lag, available = self.lag_reader(replica.engine), True
+            except Exception as e:
+                lag, available = None, False
+                if replica.available or replica.checked_at is None:
+                    logger.warning(f"[ReplicaRouter] The replica {replica.name} is not available: {e}")
+            with self._lock:
+                was_usable = self._usable(replica)
+                replica.lag, replica.available, replica.checked_at = lag, available, time.monotonic()
+                usable = self._usable(replica)
+            if available and was_usable and not usable:
+                logger.warning(f"[ReplicaRouter] The replica {replica.name} lags {lag} seconds behind, reading from the primary.")
+
+    def _usable(self, replica: Replica) -> bool:
+        return (
+            replica.available and replica.lag is not None and replica.lag <= self.max_lag
+            and replica.checked_at is not None and time.monotonic() - replica.checked_at <= 3 * self.check_interval
+        )
+
+    def route(self) -> Optional[Replica]:
+        """
+        Choose the replica to read from.
+
+        Returns:
+            Optional[Replica]: The replica, None when the read goes to the primary.
+        """
+        with self._lock:
+            usable = [replica for replica in self.replicas if self._usable(replica)]
+            if usable:
+                replica = usable[next(self._round_robin) % len(usable)]
+                replica.reads += 1
+                return replica
+            if not self.replicas:
+                reason = FALLBACK_NOT_CONFIGURED
+            elif any(replica.available for replica in self.replicas):
+                reason = FALLBACK_LAGGING
+            else:
+                reason = FALLBACK_UNAVAILABLE
+        self.record_primary_read(reason)
+        return None
+
+    def record_primary_read(self, reason: str) -> None:
+        """Count a read sent to the primary without asking the router, e.g. to read the writes of the session."""
+        with self._lock:
+            self._primary_reads[reason] = self._primary_reads.get(reason, 0) + 1
+
+    async def dispose_async_engines(self) -> None:
+        """Close the connections of the async engines of the replicas."""
+        for replica in self.replicas:
+            if replica._async_engine is not None:
+                await replica._async_engine.dispose()
+                replica._async_engine = None
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Return the routing decisions and the state of the replicas.
+
+        Returns:
+            Dict[str, Any]: The reads per replica with its lag, and the reads sent to the primary per reason
+        """
+        with self._lock:
+            now = time.monotonic()
+            return {
+                "maxLag": self.max_lag,
+                "replicas": [
+                    {
+                        "name": replica.name,
+                        "host": replica.engine.url.host,
+                        "available": replica.available,
+                        "lagSeconds": round(replica.lag, 3) if replica.lag is not None else None,
+                        "usable": self._usable(replica),
+                        "secondsSinceCheck": round(now - replica.checked_at, 3) if replica.checked_at is not None else None,
+                        "reads": replica.reads,
+                        "pool": replica.engine.pool.stats() if hasattr(replica.engine.pool, "stats") else None
+                    }
+                    for replica in self.replicas
+                ],
+                "replicaReads": sum(replica.reads for replica in self.replicas),
+                "primaryReads": dict(self._primary_reads)
+            }
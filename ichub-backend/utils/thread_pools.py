@@ -0,0 +1,167 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+import logging
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_POOL = "default"
+DATABASE_POOL = "database"
+HTTP_POOL = "http"
+FILE_IO_POOL = "file_io"
+
+class MonitoredThreadPoolExecutor(ThreadPoolExecutor):
+    """
+    Thread pool executor which keeps track of its queued and running tasks.
+    """
+
+    def __init__(self, name: str, max_workers: int):
+        super().__init__(max_workers=max_workers, thread_name_prefix=f"pool-{name}")
+        self.name = name
+        self.max_workers = max_workers
+        self._stats_lock = threading.Lock()
+        self._queued = 0
+        self._active = 0
+        self._completed = 0
+        self._peak_active = 0
+
+    def submit(self, fn: Callable, /, *args, **kwargs) -> Future:
+        with self._stats_lock:
+            self._queued += 1
+        try:
+            return super().submit(self._run, fn, *args, **kwargs)
+        except Exception:
+            with self._stats_lock:
+                self._queued -= 1
+            raise
+
+    def _run(self, fn: Callable, *args, **kwargs) -> Any:
+        with self._stats_lock:
+            self._queued -= 1
+            self._active += 1
+            self._peak_active = max(self._peak_active, self._active)
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            with self._stats_lock:
+                self._active -= 1
+                self._completed += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Return the current usage of the pool.
+
+        Returns:
+            Dict[str, Any]: Size, running and queued tasks and the saturation (running tasks / size)
+        """
+        with self._stats_lock:
+            return {
+                "maxWorkers": self.max_workers,
+                "active": self._active,
+                "peakActive": self._peak_active,
+                "queued": self._queued,
+                "completed": self._completed,
+                "saturation": round(self._active / self.max_workers, 3)
+            }
+
+class ThreadPools:
+    """
+    Registry of the named thread pools used to run blocking calls outside the event loop.
+
+    Separate pools for database work, EDC/DTR HTTP work and file I/O keep one class of slow
+    calls from starving the others. The pools are created in the application lifespan, so
+    they belong to the event loop uvicorn actually runs.
+    """
+
+    DEFAULT_SIZES = {
+        DEFAULT_POOL: 200,
+        DATABASE_POOL: 50,
+        HTTP_POOL: 100,
+        FILE_IO_POOL: 20
+    }
+
+    _pools: Dict[str, MonitoredThreadPoolExecutor] = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    def start(cls, workers_config: Optional[Dict] = None) -> Dict[str, MonitoredThreadPoolExecutor]:
+        """
+        Create the named pools from the "server.workers" configuration.
+
+        Args:
+            workers_config (Optional[Dict]): The worker configuration, "worker_threads" sizes the default
+                                             pool and "pools" the database, http and file_io pools.
+
+        Returns:
+            Dict[str, MonitoredThreadPoolExecutor]: The created pools by name
+        """
+        workers_config = workers_config or {}
+        sizes = dict(cls.DEFAULT_SIZES)
+        sizes[DEFAULT_POOL] = workers_config.get("worker_threads", sizes[DEFAULT_POOL])
+        sizes.update(workers_config.get("pools") or {})
+
+        with cls._lock:
+            cls._shutdown_pools(wait=False)
+            cls._pools = {
+                name: MonitoredThreadPoolExecutor(name=name, max_workers=max(1, int(size)))
+                for name, size in sizes.items()
+            }
+            logger.info(f"[ThreadPools] Started thread pools: {', '.join(f'{name}={pool.max_workers}' for name, pool in cls._pools.items())}")
+            return dict(cls._pools)
+
+    @classmethod
+    def get(cls, name: Optional[str] = None) -> Optional[MonitoredThreadPoolExecutor]:
+        """
+        Return the pool with the given name.
+
+        Args:
+            name (Optional[str]): Name of the pool, defaults to the default pool
+
+        Returns:
+            Optional[MonitoredThreadPoolExecutor]: The pool, None if the pools are not started.
+                                                   Unknown names resolve to the default pool.
+        """
+        with cls._lock:
+            return cls._pools.get(name or DEFAULT_POOL, cls._pools.get(DEFAULT_POOL))
+
+    @classmethod
+    def stats(cls) -> Dict[str, Dict[str, Any]]:
+        """Return the usage of every pool by name."""
+        with cls._lock:
+            pools = dict(cls._pools)
+        return {name: pool.stats() for name, pool in pools.items()}
+
+    @classmethod
+    def shutdown(cls, wait: bool = True) -> None:
+        """Shut down all the pools."""
+        with cls._lock:
+            cls._shutdown_pools(wait=wait)
+
+    @classmethod
+    def _shutdown_pools(cls, wait: bool) -> None:
+        for pool in cls._pools.values():
+            pool.shutdown(wait=wait, cancel_futures=not wait)
+        cls._pools = {}
@@ -35,14 +35,36 @@ let twinEndpointUnavailable = false;
 
 // For cached GET requests we just pass a Cache-Control header per request instead of a separate instance
 
+const NEXT_CURSOR_HEADER = 'x-next-cursor';
+const PAGE_SIZE = 1000;
+
+// The listings are paginated, follow the cursor of each page until the last one
+const fetchAllPages = async <T>(url: string, params: URLSearchParams, headers?: Record<string, string>): Promise<T[]> => {
+  const items: T[] = [];
+  let cursor: string | undefined;
+  do {
+    const pageParams = new URLSearchParams(params);
+    pageParams.set('limit', String(PAGE_SIZE));
+    if (cursor) {
+      pageParams.set('cursor', cursor);
+    }
+    const response = await httpClient.get<T[]>(`${url}?${pageParams.toString()}`, { headers });
+    if (!Array.isArray(response.data)) {
+      break;
+    }
+    items.push(...response.data);
+    cursor = response.headers?.[NEXT_CURSOR_HEADER];
+  } while (cursor);
+  return items;
+};
+
 export const fetchAllSerializedParts = async (): Promise<SerializedPart[]> => {
   try {
     if (!backendUrl) {
       console.warn('Backend URL not configured, returning empty serialized parts list');
       return [];
     }
-  const response = await httpClient.get<SerializedPart[]>(`${backendUrl}${SERIALIZED_PART_READ_BASE_PATH}`);
-    return Array.isArray(response.data) ? response.data : [];
+    return await fetchAllPages<SerializedPart>(`${backendUrl}${SERIALIZED_PART_READ_BASE_PATH}`, new URLSearchParams());
   } catch (error) {
     console.error('Failed to fetch serialized parts:', error);
     return []; // Return empty array instead of throwing
@@ -138,12 +160,11 @@ export const fetchAllSerializedPartTwins = async (): Promise<SerializedPartTwinR
     // Fetch all twins without any filters using browser caching
     const params = new URLSearchParams();
     params.append('include_data_exchange_agreements', 'true');
-    const response = await httpClient.get<SerializedPartTwinRead[]>(
-      `${backendUrl}${SERIALIZED_PART_TWIN_BASE_PATH}?${params.toString()}`,
-      { headers: { 'Cache-Control': 'max-age=300' } }
+    return await fetchAllPages<SerializedPartTwinRead>(
+      `${backendUrl}${SERIALIZED_PART_TWIN_BASE_PATH}`,
+      params,
+      { 'Cache-Control': 'max-age=300' }
     );
-    
-    return Array.isArray(response.data) ? response.data : [];
   } catch (error: unknown) {
     // Handle 404 specifically - endpoint might not be available
     if (axios.isAxiosError(error) && error?.response?.status === 404) {
@@ -173,12 +194,11 @@ export const fetchSerializedPartTwinsForCatalogPart = async (
   params.append('include_data_exchange_agreements', 'true');
   params.append('manufacturerId', manufacturerId);
   params.append('manufacturerPartId', manufacturerPartId);
-  const response = await httpClient.get<SerializedPartTwinRead[]>(
-    `${backendUrl}${SERIALIZED_PART_TWIN_BASE_PATH}?${params.toString()}`,
-    { headers: { 'Cache-Control': 'max-age=300' } }
+  return fetchAllPages<SerializedPartTwinRead>(
+    `${backendUrl}${SERIALIZED_PART_TWIN_BASE_PATH}`,
+    params,
+    { 'Cache-Control': 'max-age=300' }
   );
-  
-  return response.data;
 };
 
 export const unshareSerializedPartTwin = async (